@@ -7,7 +7,7 @@ Application configuration using Pydantic Settings.
 
 import re
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -63,6 +63,92 @@ class Settings(BaseSettings):
     # Build reconciliation settings
     build_reconciliation_interval: int = 30  # seconds between reconciliation scans
     enable_build_reconciliation: bool = True  # enable/disable the reconciliation loop
+    build_reconciliation_watch: bool = True  # react to BuildRun watch events instead of polling
+    build_reconciliation_resync_interval: int = 600  # seconds between full resyncs when watching
+    build_reconciliation_workers: int = 4
+    build_reconciliation_backoff_base: float = 1.0  # seconds; doubles per consecutive failure
+    build_reconciliation_backoff_max: float = 300.0
+    # Lease-based leader election so only one backend replica reconciles
+    build_reconciliation_leader_election: bool = False
+    leader_election_lease_name: str = "kagenti-backend-reconciler"
+    leader_election_namespace: str = ""  # defaults to POD_NAMESPACE / service account namespace
+    leader_election_lease_duration: float = 15.0  # seconds a standby waits before taking over
+    leader_election_renew_deadline: float = 10.0  # seconds the leader may fail to renew
+    leader_election_retry_period: float = 2.0  # seconds between acquire/renew attempts
+
+    # Kubernetes read cache (watch-backed informers, see services/kube_cache.py)
+    kube_cache_enabled: bool = False
+    kube_cache_max_staleness: int = 60  # seconds before cached reads fall back to the API
+
+    # Kubernetes API executor (blocking client calls run off the event loop)
+    kube_executor_workers: int = 16
+    kube_executor_max_queue: int = 256  # waiting calls beyond this are rejected with 503
+    kube_call_timeout: float = 30.0  # seconds per call, including queue wait
+    kube_fanout_deadline: float = 10.0  # shared deadline for concurrent multi-kind lookups
+    api_discovery_refresh_interval: int = 300  # seconds API group/CRD discovery is cached
+
+    # Agent/tool Service port cache used to build A2A and MCP URLs
+    service_port_cache_ttl: int = 300  # seconds; 0 disables caching
+    service_port_cache_watch: bool = True  # invalidate entries from a watch on agent/tool Services
+
+    # Pooled HTTP clients for A2A calls to agents (one pool per agent upstream)
+    agent_http_max_connections: int = 100  # per upstream
+    agent_http_max_keepalive: int = 20  # idle connections kept per upstream
+    agent_http_keepalive_expiry: float = 30.0  # seconds an idle connection is kept
+    agent_http_client_idle_timeout: float = 600.0  # seconds before an unused client is closed
+    agent_http2: bool = True  # negotiate HTTP/2 over TLS when the h2 package is installed
+    agent_http_connect_timeout: float = 5.0
+    agent_http_default_timeout: float = 60.0
+    agent_card_timeout: float = 10.0
+    agent_send_timeout: float = 60.0
+    agent_stream_timeout: float = 120.0  # per read while relaying an SSE stream
+
+    # Server-side agent card cache (see services/agent_cards.py)
+    agent_card_cache_ttl: float = 60.0  # seconds a card is served without contacting the agent
+    agent_card_stale_ttl: float = 300.0  # further seconds a stale card is served while revalidating
+    agent_card_cache_max_entries: int = 1024
+    agent_card_bulk_concurrency: int = 16  # concurrent card loads per bulk request
+    workload_generation_ttl: float = 5.0  # seconds a rollout generation is cached; 0 disables
+
+    # Resumable chat streams (see services/stream_replay.py)
+    chat_replay_buffer_events: int = 1000  # events kept in memory per stream
+    chat_replay_max_runs: int = 256  # finished streams kept resumable
+    chat_replay_ttl: float = 600.0  # seconds a finished stream stays resumable
+    chat_replay_spill: bool = False  # write events evicted from memory to the events table
+    chat_stream_grace: float = 30.0  # seconds a stream outlives its last client, for resuming
+    chat_max_detached_runs: int = 64  # concurrent ?detach=true runs
+    chat_run_persist_events: bool = True  # write every event of a detached run to the events table
+    chat_persist_events: bool = False  # write every event of every chat stream to the events table
+    chat_subscribe_max_sessions: int = 50  # sessions per GET /chat/{ns}/subscribe
+    chat_subscribe_heartbeat: float = 15.0  # seconds of idle before a keep-alive comment
+
+    # Batched writes to the events table (see services/event_writer.py)
+    event_writer_queue_size: int = 10000  # queued rows beyond this are dropped
+    event_writer_batch_size: int = 500  # rows per INSERT batch
+    event_writer_flush_interval: float = 0.05  # seconds a partial batch waits to fill
+    event_writer_retry_after: float = 30.0  # seconds a namespace is skipped after a failed batch
+
+    # Per-namespace session DB pools (see services/session_db.py)
+    session_db_max_connections: int = 200  # connection budget across all namespace pools
+    session_db_pool_min_size: int = 1
+    session_db_pool_max_size: int = 10  # per namespace unless overridden below
+    session_db_pool_sizes: Dict[str, int] = {}  # per-namespace max_size, e.g. {"team1": 20}
+    session_db_pool_idle_timeout: float = 600.0  # seconds before an unused pool is closed
+    session_db_secret_cache_ttl: float = 300.0  # seconds DB credentials are reused; 0 disables
+    session_db_secret_watch: bool = True  # drop cached credentials when the Secret changes
+
+    # Pooled MCP sessions to tool servers (see services/mcp_sessions.py)
+    mcp_session_pool_enabled: bool = True
+    mcp_session_max: int = 64  # open sessions across all tools
+    mcp_session_idle_timeout: float = 300.0  # seconds before an unused session is closed
+    mcp_session_health_check_interval: float = 30.0  # ping sessions idle longer than this
+    mcp_session_connect_timeout: float = 30.0  # transport setup + initialize, and pings
+    mcp_tool_catalog_ttl: float = 3600.0  # re-list servers that never send tools/list_changed
+    mcp_batch_max_calls: int = 100  # calls per POST /tools/{ns}/{name}/invoke-batch
+    mcp_batch_default_concurrency: int = 4
+    mcp_batch_max_concurrency: int = 16
+    mcp_batch_call_timeout: float = 60.0  # seconds per call unless the request sets timeout
+    mcp_stream_max_bytes: int = 10 * 1024 * 1024  # content bytes sent by invoke-stream
 
     # Migration settings (Phase 4: Agent CRD to Deployment migration)
     # When True, list_agents will also include legacy Agent CRDs that haven't been migrated
@@ -79,6 +165,7 @@ class Settings(BaseSettings):
     kagenti_feature_flag_sidecars: bool = (
         False  # sidecar agents (looper, hallucination, context guardian)
     )
+    sidecar_event_buffer_size: int = 1000  # pending session events per sidecar
 
     # Label settings
     kagenti_label_prefix: str = "kagenti.io/"
@@ -95,6 +182,8 @@ class Settings(BaseSettings):
 
     # Authentication settings - from kagenti-ui-oauth-secret
     enable_auth: bool = False  # Set to True to enable Keycloak auth
+    # Require kagenti-operator on GET /metrics; scrapers then need a bearer token
+    metrics_require_auth: bool = False
     # AUTH_ENDPOINT format: http://keycloak.localtest.me:8080/realms/kagenti/protocol/openid-connect/auth
     auth_endpoint: Optional[str] = None
     # REDIRECT_URI format: http://kagenti-ui.localtest.me:8080/oauth2/callback
@@ -71,6 +71,13 @@ WORKLOAD_TYPE_STATEFULSET = "statefulset"
 WORKLOAD_TYPE_JOB = "job"
 WORKLOAD_TYPE_SANDBOX = "sandbox"
 
+# Pagination for cross-namespace (allNamespaces) agent/tool listing
+DEFAULT_LIST_PAGE_LIMIT = 500
+MAX_LIST_PAGE_LIMIT = 5000
+CONTINUE_TOKEN_EXPIRED_DETAIL = (
+    "The continue token has expired; restart the listing without 'continue'"
+)
+
 # agent-sandbox CRD coordinates (kubernetes-sigs/agent-sandbox)
 AGENT_SANDBOX_CRD_GROUP = "agents.x-k8s.io"
 AGENT_SANDBOX_CRD_VERSION = "v1alpha1"
@@ -11,8 +11,10 @@ exposing endpoints for managing agents, tools, and platform configuration.
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
@@ -30,7 +32,17 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
         return response
 
 
+from app.core.auth import (  # pylint: disable=wrong-import-position
+    ROLE_OPERATOR,
+    get_required_user,
+    require_roles,
+    security,
+)
 from app.core.config import settings  # pylint: disable=wrong-import-position
+from app.core.metrics import (  # pylint: disable=wrong-import-position
+    CONTENT_TYPE_LATEST,
+    registry as metrics_registry,
+)
 from app.routers import (  # pylint: disable=wrong-import-position
     agents,
     tools,
@@ -56,7 +68,6 @@ if settings.kagenti_feature_flag_sandbox:
             models,
             llm_keys,
         )
-        from app.services.session_db import close_all_pools  # noqa: E402
 
         _sandbox_modules_loaded = True
     except ImportError:
@@ -113,16 +124,60 @@ async def lifespan(app: FastAPI):
     logger.info(f"Domain: {settings.domain_name}")
     logger.info(f"ENABLE_AUTH environment variable set to: {settings.enable_auth}")
 
+    # Warm the Kubernetes read cache (informers start lazily per namespace)
+    if settings.kube_cache_enabled:
+        from app.services.kubernetes import get_kubernetes_service
+
+        get_kubernetes_service().cache.start()
+        logger.info(
+            "Kubernetes read cache enabled (max staleness: %ds)",
+            settings.kube_cache_max_staleness,
+        )
+
+    # Agent/tool Service port cache, invalidated by a Service watch
+    if settings.service_port_cache_watch and settings.service_port_cache_ttl > 0:
+        from kubernetes.config import ConfigException
+
+        from app.services.kubernetes import get_kubernetes_service
+        from app.utils.routes import get_service_port_cache
+
+        try:
+            get_service_port_cache().start_watch(get_kubernetes_service())
+        except ConfigException:
+            logger.warning("Could not load Kubernetes config; Service port watch disabled")
+
+    # Shared connection pools for A2A calls to agents
+    from app.services.agent_http import get_agent_http_clients
+
+    get_agent_http_clients().start()
+
+    # Long-lived MCP sessions to tool servers
+    from app.services.mcp_sessions import get_mcp_session_pool
+
+    get_mcp_session_pool().start()
+
     # Start build reconciliation loop
     reconciliation_task = None
     if settings.enable_build_reconciliation:
         from app.services.reconciliation import run_reconciliation_loop
 
         reconciliation_task = asyncio.create_task(run_reconciliation_loop())
-        logger.info(
-            "Build reconciliation started (interval: %ds)",
-            settings.build_reconciliation_interval,
-        )
+        if settings.build_reconciliation_leader_election:
+            logger.info(
+                "Build reconciliation leader election enabled (lease: %s)",
+                settings.leader_election_lease_name,
+            )
+        if settings.build_reconciliation_watch:
+            logger.info(
+                "Build reconciliation started (BuildRun watch, resync: %ds, workers: %d)",
+                settings.build_reconciliation_resync_interval,
+                settings.build_reconciliation_workers,
+            )
+        else:
+            logger.info(
+                "Build reconciliation started (interval: %ds)",
+                settings.build_reconciliation_interval,
+            )
     else:
         logger.info("Build reconciliation disabled (ENABLE_BUILD_RECONCILIATION=false)")
 
@@ -136,14 +191,47 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    if settings.kube_cache_enabled:
+        from app.services.kubernetes import get_kubernetes_service
+
+        get_kubernetes_service().cache.stop()
+
+    from app.services.kubernetes_async import shutdown_kube_executor
+
+    shutdown_kube_executor()
+
+    from app.utils.routes import get_service_port_cache
+
+    get_service_port_cache().stop_watch()
+
+    # Cancel detached chat runs before closing the agent connections they use
+    from app.services.stream_replay import close_stream_replay_store
+
+    await close_stream_replay_store()
+
+    # Write the event rows those runs queued before the DB pools close
+    from app.services.event_writer import close_event_writer
+
+    await close_event_writer()
+
+    from app.services.agent_http import close_agent_http_clients
+
+    await close_agent_http_clients()
+
+    from app.services.mcp_sessions import close_mcp_session_pool
+
+    await close_mcp_session_pool()
+
     # Shutdown sandbox services (only if enabled and loaded)
     if _sandbox_modules_loaded:
         from app.services.sidecar_manager import get_sidecar_manager  # pylint: disable=import-error,no-name-in-module
 
         await get_sidecar_manager().shutdown()
 
-        # Close session DB pools
-        await close_all_pools()  # pylint: disable=used-before-assignment
+    # Close session DB pools (event writes, session history, sidecar state)
+    from app.services.session_db import close_all_pools
+
+    await close_all_pools()
 
     logger.info("Shutting down Kagenti Backend API")
 
@@ -215,9 +303,35 @@ async def health_check():
 
 @app.get("/ready", tags=["health"])
 async def readiness_check():
-    """Readiness check endpoint."""
+    """Readiness check endpoint, including this replica's reconciliation role."""
     # Could add kubernetes client connectivity check here
-    return {"status": "ready"}
+    from app.services.reconciliation import reconciliation_status
+
+    return {"status": "ready", "reconciliation": reconciliation_status()}
+
+
+_metrics_role = require_roles(ROLE_OPERATOR)
+
+
+async def metrics_access(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> None:
+    """Require kagenti-operator on /metrics when METRICS_REQUIRE_AUTH is set."""
+    if settings.metrics_require_auth:
+        await _metrics_role(await get_required_user(credentials))
+
+
+@app.get(
+    "/metrics", tags=["health"], include_in_schema=False, dependencies=[Depends(metrics_access)]
+)
+async def metrics():
+    """Prometheus metrics endpoint.
+
+    Label values name namespaces, agents and upstreams. Unless
+    METRICS_REQUIRE_AUTH is set, the endpoint must only be reachable from
+    inside the cluster (it is not exposed through the UI route).
+    """
+    return Response(content=metrics_registry.render(), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
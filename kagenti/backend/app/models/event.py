@@ -12,7 +12,8 @@ Uses raw asyncpg (matching session_db.py pattern) rather than SQLAlchemy
 ORM, because the sessions database is managed via asyncpg pools.
 """
 
-# Schema DDL — executed via _ensure_events_schema() on pool creation.
+# Schema DDL — applied once per database by session_db.SCHEMA_MIGRATIONS.
+# Add schema changes as a new migration there rather than editing this.
 EVENTS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS events (
     id BIGSERIAL PRIMARY KEY,
@@ -28,4 +29,5 @@ CREATE TABLE IF NOT EXISTS events (
 );
 CREATE INDEX IF NOT EXISTS idx_events_ctx_idx ON events(context_id, event_index);
 CREATE INDEX IF NOT EXISTS idx_events_task ON events(task_id, event_index);
+CREATE INDEX IF NOT EXISTS idx_events_ctx_id ON events(context_id, id);
 """
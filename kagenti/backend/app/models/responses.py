@@ -30,9 +30,21 @@ class AgentSummary(BaseModel):
 
 
 class AgentListResponse(BaseModel):
-    """Response for listing agents."""
+    """Response for listing agents.
+
+    When some workload kinds could not be listed (API error or deadline), the
+    remaining kinds are still returned and the failed ones are named in
+    ``failedKinds``.
+
+    In allNamespaces mode each kind pages independently, so name clashes
+    between kinds (and migrated legacy Agent CRDs) are only resolved within a
+    page: the same namespace/name can appear again on a later page.
+    """
 
     items: List[AgentSummary]
+    failedKinds: List[str] = []
+    # Set in allNamespaces mode when more results are available
+    continueToken: Optional[str] = None
 
 
 class ToolSummary(BaseModel):
@@ -51,6 +63,9 @@ class ToolListResponse(BaseModel):
     """Response for listing tools."""
 
     items: List[ToolSummary]
+    failedKinds: List[str] = []
+    # Set in allNamespaces mode when more results are available
+    continueToken: Optional[str] = None
 
 
 class NamespaceListResponse(BaseModel):
@@ -0,0 +1,48 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Table schema for persisted sidecar state.
+
+Sidecar handles used to be stored as a ``sidecar_state`` key inside the
+newest ``tasks`` row's metadata, rewritten in full (every observation
+included) on each enable/disable/config change, on a row the A2A task
+store also writes. Instead:
+
+- ``sidecar_handles`` holds one row per (session, sidecar type): flags,
+  config and pending interventions, written with an upsert.
+- ``sidecar_observations`` is append-only; each observation is inserted
+  once.
+
+Uses raw asyncpg (matching session_db.py pattern), like models/event.py.
+"""
+
+# Schema DDL — applied once per database by session_db.SCHEMA_MIGRATIONS.
+# Add schema changes as a new migration there rather than editing this.
+SIDECAR_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sidecar_handles (
+    parent_context_id TEXT NOT NULL,
+    sidecar_type TEXT NOT NULL,
+    context_id TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    enabled BOOLEAN NOT NULL DEFAULT FALSE,
+    auto_approve BOOLEAN NOT NULL DEFAULT FALSE,
+    config JSONB NOT NULL DEFAULT '{}',
+    pending_interventions JSONB NOT NULL DEFAULT '[]',
+    created_at DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (parent_context_id, sidecar_type)
+);
+CREATE TABLE IF NOT EXISTS sidecar_observations (
+    id BIGSERIAL PRIMARY KEY,
+    parent_context_id TEXT NOT NULL,
+    sidecar_type TEXT NOT NULL,
+    observation_id TEXT NOT NULL,
+    timestamp DOUBLE PRECISION NOT NULL,
+    message TEXT NOT NULL,
+    severity TEXT NOT NULL DEFAULT 'info',
+    requires_approval BOOLEAN NOT NULL DEFAULT FALSE
+);
+CREATE INDEX IF NOT EXISTS idx_sidecar_obs_session ON sidecar_observations(parent_context_id, id);
+"""
@@ -6,6 +6,7 @@
 Agent API endpoints.
 """
 
+import functools
 import json
 import logging
 import re
@@ -25,7 +26,10 @@ from pydantic import BaseModel, Field, field_validator
 from app.core.auth import ROLE_OPERATOR, ROLE_VIEWER, require_roles
 from app.utils.routes import get_agent_url
 from app.core.constants import (
+    CONTINUE_TOKEN_EXPIRED_DETAIL,
     CRD_GROUP,
+    DEFAULT_LIST_PAGE_LIMIT,
+    MAX_LIST_PAGE_LIMIT,
     CRD_VERSION,
     AGENTS_PLURAL,
     AGENTRUNTIMES_PLURAL,
@@ -90,7 +94,14 @@ from app.models.responses import (
     ResourceLabels,
     DeleteResponse,
 )
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kubernetes import KubernetesService
+from app.services.kubernetes_async import (
+    AsyncKubernetesService,
+    as_async,
+    gather_with_deadline,
+    get_async_kubernetes_service,
+    list_page_across_kinds,
+)
 from app.utils.routes import (
     create_route_for_agent_or_tool,
     detect_platform,
@@ -541,271 +552,305 @@ def _extract_labels(labels: dict) -> ResourceLabels:
     )
 
 
-@router.get(
-    "", response_model=AgentListResponse, dependencies=[Depends(require_roles(ROLE_VIEWER))]
-)
-async def list_agents(
-    namespace: str = Query(default="default", description="Kubernetes namespace"),
-    kube: KubernetesService = Depends(get_kubernetes_service),
-) -> AgentListResponse:
-    """
-    List all agents in the specified namespace.
+# Legacy Agent CRDs are reported under this kind in AgentListResponse.failedKinds
+LEGACY_AGENT_CRD_KIND = "agent-crd"
 
-    Returns agents deployed as Deployments, StatefulSets, Jobs, or Sandboxes with the
-    kagenti.io/type=agent label.
-    During migration period, also includes legacy Agent CRDs that haven't been
-    migrated yet (controlled by enable_legacy_agent_crd setting).
+# Kinds whose CRD may legitimately be absent; 404/403 on them is not a failure
+_OPTIONAL_AGENT_KINDS = (WORKLOAD_TYPE_SANDBOX, LEGACY_AGENT_CRD_KIND)
+
+# (description, status) extractors per workload kind
+_AGENT_WORKLOAD_SUMMARIZERS = {
+    WORKLOAD_TYPE_DEPLOYMENT: (_get_deployment_description, _is_deployment_ready),
+    WORKLOAD_TYPE_STATEFULSET: (_get_statefulset_description, _is_statefulset_ready),
+    WORKLOAD_TYPE_JOB: (_get_job_description, _get_job_status),
+    WORKLOAD_TYPE_SANDBOX: (_get_sandbox_description, _is_sandbox_ready),
+}
+
+
+async def _agent_workload_kinds(kube: AsyncKubernetesService) -> List[str]:
+    """Workload kinds that can back an agent, in name-precedence order.
+
+    Sandboxes are skipped when API discovery (cached) shows the CRD is absent.
     """
-    try:
-        label_selector = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_AGENT}"
+    kinds = [WORKLOAD_TYPE_DEPLOYMENT, WORKLOAD_TYPE_STATEFULSET, WORKLOAD_TYPE_JOB]
+    if settings.kagenti_feature_flag_agent_sandbox and await kube.sandboxes_served():
+        kinds.append(WORKLOAD_TYPE_SANDBOX)
+    return kinds
 
-        agents = []
-        agent_names = set()
 
-        # Query Deployments with agent label
-        deployments = kube.list_deployments(
-            namespace=namespace,
-            label_selector=label_selector,
-        )
+def _workload_agent_summary(workload: dict, workload_type: str, namespace: str) -> AgentSummary:
+    """Build an AgentSummary from a Deployment/StatefulSet/Job/Sandbox."""
+    metadata = workload.get("metadata", {})
+    describe, status = _AGENT_WORKLOAD_SUMMARIZERS[workload_type]
+    return AgentSummary(
+        name=metadata.get("name", ""),
+        namespace=metadata.get("namespace", namespace),
+        description=describe(workload),
+        status=status(workload),
+        labels=_extract_labels(metadata.get("labels", {})),
+        workloadType=workload_type,
+        createdAt=_format_timestamp(
+            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
+        ),
+    )
 
-        for deployment in deployments:
-            metadata = deployment.get("metadata", {})
-            name = metadata.get("name", "")
-            agent_names.add(name)
-            labels = metadata.get("labels", {})
 
-            agents.append(
-                AgentSummary(
-                    name=name,
-                    namespace=metadata.get("namespace", namespace),
-                    description=_get_deployment_description(deployment),
-                    status=_is_deployment_ready(deployment),
-                    labels=_extract_labels(labels),
-                    workloadType=WORKLOAD_TYPE_DEPLOYMENT,
-                    createdAt=_format_timestamp(
-                        metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                    ),
-                )
-            )
+def _legacy_agent_crd_summary(agent_crd: dict, namespace: str) -> AgentSummary:
+    """Build an AgentSummary from a legacy (not yet migrated) Agent CRD."""
+    metadata = agent_crd.get("metadata", {})
+    spec = agent_crd.get("spec", {})
+    status = agent_crd.get("status", {})
 
-        # Query StatefulSets with agent label
-        statefulsets = kube.list_statefulsets(
-            namespace=namespace,
-            label_selector=label_selector,
-        )
+    # Determine status from Agent CRD
+    agent_status = "Not Ready"
+    for cond in status.get("conditions") or []:
+        if cond.get("type") == "Ready" and cond.get("status") == "True":
+            agent_status = "Ready"
+            break
 
-        for statefulset in statefulsets:
-            metadata = statefulset.get("metadata", {})
-            name = metadata.get("name", "")
-            if name in agent_names:
-                logger.warning(
-                    f"Duplicate agent name '{name}' detected: StatefulSet skipped because "
-                    f"a Deployment with the same name already exists in namespace '{namespace}'. "
-                    "This may indicate a configuration issue."
-                )
-                continue
-            agent_names.add(name)
-            labels = metadata.get("labels", {})
+    # Get description
+    description = spec.get("description") or metadata.get("annotations", {}).get(
+        KAGENTI_DESCRIPTION_ANNOTATION, "No description"
+    )
 
-            agents.append(
-                AgentSummary(
-                    name=name,
-                    namespace=metadata.get("namespace", namespace),
-                    description=_get_statefulset_description(statefulset),
-                    status=_is_statefulset_ready(statefulset),
-                    labels=_extract_labels(labels),
-                    workloadType=WORKLOAD_TYPE_STATEFULSET,
-                    createdAt=_format_timestamp(
-                        metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                    ),
-                )
-            )
+    return AgentSummary(
+        name=metadata.get("name", ""),
+        namespace=metadata.get("namespace", namespace),
+        description=description,
+        status=agent_status,
+        labels=_extract_labels(metadata.get("labels", {})),
+        workloadType=WORKLOAD_TYPE_DEPLOYMENT,
+        createdAt=_format_timestamp(
+            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
+        ),
+    )
 
-        # Query Jobs with agent label
-        jobs = kube.list_jobs(
-            namespace=namespace,
-            label_selector=label_selector,
+
+def _list_error_to_http(e: ApiException) -> HTTPException:
+    """Map a list-call ApiException to the HTTPException list endpoints return."""
+    if e.status == 403:
+        return HTTPException(
+            status_code=403,
+            detail="Permission denied. Check RBAC configuration.",
         )
+    return HTTPException(status_code=e.status, detail=str(e.reason))
 
-        for job in jobs:
-            metadata = job.get("metadata", {})
+
+def _skipped_kind(kind: str, result: Any) -> bool:
+    """An optional kind whose CRD is not installed or not accessible."""
+    return (
+        kind in _OPTIONAL_AGENT_KINDS
+        and isinstance(result, ApiException)
+        and result.status in (404, 403)
+    )
+
+
+def _merge_agent_results(
+    results: Dict[str, Any],
+    namespace: Optional[str],
+    enabled_namespaces: Optional[set] = None,
+) -> tuple:
+    """Merge per-kind list results into AgentSummaries.
+
+    Results keep the precedence order of the calls: on a name clash within a
+    namespace the earlier kind wins (Deployment > StatefulSet > Job > Sandbox
+    > Agent CRD). When ``enabled_namespaces`` is given, items outside it are
+    dropped (cluster-wide list calls see every namespace).
+
+    Only the results passed in are de-duplicated; in allNamespaces mode that
+    is one page, and a clash with an item from an earlier page is kept.
+
+    Returns (agents, errors, failed_kinds).
+    """
+    agents = []
+    agent_names = set()
+    errors: List[ApiException] = []
+    failed_kinds: List[str] = []
+
+    for kind, result in results.items():
+        if isinstance(result, ApiException):
+            if _skipped_kind(kind, result):
+                # CRD not installed or not accessible - that's fine, just skip
+                logger.debug(f"Skipping {kind} agents: {result.status} {result.reason}")
+                continue
+            logger.warning(f"Failed to list {kind} agents: {result.reason}")
+            errors.append(result)
+            failed_kinds.append(kind)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+
+        for item in result:
+            metadata = item.get("metadata", {})
             name = metadata.get("name", "")
-            if name in agent_names:
-                logger.warning(
-                    f"Duplicate agent name '{name}' detected: Job skipped because "
-                    f"a Deployment or StatefulSet with the same name already exists in namespace '{namespace}'. "
-                    "This may indicate a configuration issue."
-                )
+            item_namespace = metadata.get("namespace", namespace)
+            if enabled_namespaces is not None and item_namespace not in enabled_namespaces:
                 continue
-            agent_names.add(name)
-            labels = metadata.get("labels", {})
+            if (item_namespace, name) in agent_names:
+                # Legacy CRDs that already have a workload have been migrated
+                if kind != LEGACY_AGENT_CRD_KIND:
+                    logger.warning(
+                        f"Duplicate agent name '{name}' detected: {kind} skipped because "
+                        f"a workload with the same name already exists in namespace "
+                        f"'{item_namespace}'. This may indicate a configuration issue."
+                    )
+                continue
+            agent_names.add((item_namespace, name))
+            if kind == LEGACY_AGENT_CRD_KIND:
+                agents.append(_legacy_agent_crd_summary(item, item_namespace))
+            else:
+                agents.append(_workload_agent_summary(item, kind, item_namespace))
 
-            agents.append(
-                AgentSummary(
-                    name=name,
-                    namespace=metadata.get("namespace", namespace),
-                    description=_get_job_description(job),
-                    status=_get_job_status(job),
-                    labels=_extract_labels(labels),
-                    workloadType=WORKLOAD_TYPE_JOB,
-                    createdAt=_format_timestamp(
-                        metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                    ),
-                )
-            )
+    return agents, errors, failed_kinds
 
-        # Query Sandboxes with agent label (feature-flagged)
-        if settings.kagenti_feature_flag_agent_sandbox:
-            try:
-                sandboxes = kube.list_sandboxes(
-                    namespace=namespace,
-                    label_selector=label_selector,
-                )
-                for sandbox in sandboxes:
-                    metadata = sandbox.get("metadata", {})
-                    name = metadata.get("name", "")
-                    if name in agent_names:
-                        logger.warning(
-                            f"Duplicate agent name '{name}' detected: Sandbox skipped "
-                            f"because a workload with the same name already exists in "
-                            f"namespace '{namespace}'. This may indicate a configuration issue."
-                        )
-                        continue
-                    agent_names.add(name)
-                    labels = metadata.get("labels", {})
-
-                    agents.append(
-                        AgentSummary(
-                            name=name,
-                            namespace=metadata.get("namespace", namespace),
-                            description=_get_sandbox_description(sandbox),
-                            status=_is_sandbox_ready(sandbox),
-                            labels=_extract_labels(labels),
-                            workloadType=WORKLOAD_TYPE_SANDBOX,
-                            createdAt=_format_timestamp(
-                                metadata.get("creation_timestamp")
-                                or metadata.get("creationTimestamp")
-                            ),
-                        )
-                    )
-            except ApiException as e:
-                if e.status == 404:
-                    logger.debug("Sandbox CRD not installed")
-                elif e.status == 403:
-                    logger.debug("Sandbox RBAC: insufficient permissions")
-                else:
-                    logger.warning(f"Failed to list Sandboxes: {e.reason}")
 
+@router.get(
+    "", response_model=AgentListResponse, dependencies=[Depends(require_roles(ROLE_VIEWER))]
+)
+async def list_agents(
+    namespace: str = Query(default="default", description="Kubernetes namespace"),
+    all_namespaces: bool = Query(
+        default=False,
+        alias="allNamespaces",
+        description="If true, list agents in all kagenti-enabled namespaces (paginated)",
+    ),
+    limit: int = Query(
+        default=DEFAULT_LIST_PAGE_LIMIT,
+        ge=1,
+        le=MAX_LIST_PAGE_LIMIT,
+        description="Page size in allNamespaces mode",
+    ),
+    continue_token: Optional[str] = Query(
+        default=None,
+        alias="continue",
+        description="continueToken from the previous page (allNamespaces mode)",
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+) -> AgentListResponse:
+    """
+    List all agents in the specified namespace.
+
+    Returns agents deployed as Deployments, StatefulSets, Jobs, or Sandboxes with the
+    kagenti.io/type=agent label.
+    During migration period, also includes legacy Agent CRDs that haven't been
+    migrated yet (controlled by enable_legacy_agent_crd setting).
+
+    All kinds are listed concurrently under a shared deadline
+    (KUBE_FANOUT_DEADLINE). Kinds that fail or miss the deadline are named in
+    ``failedKinds`` and the rest are still returned; the request only fails
+    when every kind does.
+
+    With ``allNamespaces=true`` each kind is listed with a single cluster-scoped,
+    label-selected call, results are grouped by namespace, and at most ``limit``
+    items are returned per page. Pass ``continueToken`` back as ``continue`` to
+    fetch the next page. Kinds page independently, so same-name workloads of
+    different kinds (and migrated legacy Agent CRDs) are de-duplicated only
+    within a page; clients merging pages should key agents by namespace/name.
+    """
+    label_selector = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_AGENT}"
+    workload_kinds = await _agent_workload_kinds(kube)
+
+    if all_namespaces:
+        listers = {
+            WORKLOAD_TYPE_DEPLOYMENT: kube.list_deployments_all_namespaces,
+            WORKLOAD_TYPE_STATEFULSET: kube.list_statefulsets_all_namespaces,
+            WORKLOAD_TYPE_JOB: kube.list_jobs_all_namespaces,
+            WORKLOAD_TYPE_SANDBOX: kube.list_sandboxes_all_namespaces,
+        }
+        calls = {
+            kind: functools.partial(listers[kind], label_selector=label_selector)
+            for kind in workload_kinds
+        }
+        if settings.enable_legacy_agent_crd:
+            calls[LEGACY_AGENT_CRD_KIND] = functools.partial(
+                kube.list_custom_resources_all_namespaces,
+                group=CRD_GROUP,
+                version=CRD_VERSION,
+                plural=AGENTS_PLURAL,
+            )
+        try:
+            enabled_namespaces = set(await kube.list_enabled_namespaces())
+            results, next_token = await list_page_across_kinds(calls, limit, continue_token)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ApiException as e:
+            raise _list_error_to_http(e)
+    else:
+        listers = {
+            WORKLOAD_TYPE_DEPLOYMENT: kube.list_deployments,
+            WORKLOAD_TYPE_STATEFULSET: kube.list_statefulsets,
+            WORKLOAD_TYPE_JOB: kube.list_jobs,
+            WORKLOAD_TYPE_SANDBOX: kube.list_sandboxes,
+        }
+        calls = {
+            kind: listers[kind](namespace=namespace, label_selector=label_selector)
+            for kind in workload_kinds
+        }
         # Backward compatibility: Also list legacy Agent CRDs (during migration period)
         if settings.enable_legacy_agent_crd:
-            try:
-                agent_crds = kube.list_custom_resources(
-                    group=CRD_GROUP,
-                    version=CRD_VERSION,
-                    namespace=namespace,
-                    plural=AGENTS_PLURAL,
-                )
-                for agent_crd in agent_crds:
-                    metadata = agent_crd.get("metadata", {})
-                    name = metadata.get("name", "")
-                    # Skip if already listed via workload (already migrated)
-                    if name in agent_names:
-                        continue
-
-                    labels = metadata.get("labels", {})
-                    spec = agent_crd.get("spec", {})
-                    status = agent_crd.get("status", {})
-
-                    # Determine status from Agent CRD
-                    agent_status = "Not Ready"
-                    for cond in status.get("conditions") or []:
-                        if cond.get("type") == "Ready" and cond.get("status") == "True":
-                            agent_status = "Ready"
-                            break
-
-                    # Get description
-                    description = spec.get("description") or metadata.get("annotations", {}).get(
-                        KAGENTI_DESCRIPTION_ANNOTATION, "No description"
-                    )
+            calls[LEGACY_AGENT_CRD_KIND] = kube.list_custom_resources(
+                group=CRD_GROUP,
+                version=CRD_VERSION,
+                namespace=namespace,
+                plural=AGENTS_PLURAL,
+            )
+        results = await gather_with_deadline(calls)
+        enabled_namespaces = None
+        next_token = None
 
-                    agents.append(
-                        AgentSummary(
-                            name=name,
-                            namespace=metadata.get("namespace", namespace),
-                            description=description,
-                            status=agent_status,
-                            labels=_extract_labels(labels),
-                            workloadType=WORKLOAD_TYPE_DEPLOYMENT,
-                            createdAt=_format_timestamp(
-                                metadata.get("creation_timestamp")
-                                or metadata.get("creationTimestamp")
-                            ),
-                        )
-                    )
-            except ApiException as e:
-                # CRD not installed or not accessible - that's fine, just skip
-                if e.status not in (404, 403):
-                    logger.warning(f"Failed to list legacy Agent CRDs: {e.reason}")
+    agents, errors, failed_kinds = _merge_agent_results(results, namespace, enabled_namespaces)
 
-        return AgentListResponse(items=agents)
+    expired = next((e for e in errors if e.status == 410), None)
+    if expired is not None:
+        raise HTTPException(status_code=410, detail=CONTINUE_TOKEN_EXPIRED_DETAIL)
+    queried = [kind for kind, result in results.items() if not _skipped_kind(kind, result)]
+    if errors and len(errors) == len(queried):
+        raise _list_error_to_http(errors[0])
 
-    except ApiException as e:
-        if e.status == 403:
-            raise HTTPException(
-                status_code=403,
-                detail="Permission denied. Check RBAC configuration.",
-            )
-        raise HTTPException(status_code=e.status, detail=str(e.reason))
+    if all_namespaces:
+        agents.sort(key=lambda a: (a.namespace, a.name))
+    return AgentListResponse(items=agents, failedKinds=failed_kinds, continueToken=next_token)
 
 
 @router.get("/{namespace}/{name}", dependencies=[Depends(require_roles(ROLE_VIEWER))])
 async def get_agent(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> Any:
     """Get detailed information about a specific agent.
 
     Returns workload details (Deployment, StatefulSet, or Job) along with
     associated Service information.
+
+    Every workload kind and the Service are fetched concurrently; the first
+    kind in precedence order (Deployment > StatefulSet > Job > Sandbox) that
+    exists wins, as with the former one-by-one 404 probing.
     """
+    getters = {
+        WORKLOAD_TYPE_DEPLOYMENT: kube.get_deployment,
+        WORKLOAD_TYPE_STATEFULSET: kube.get_statefulset,
+        WORKLOAD_TYPE_JOB: kube.get_job,
+        WORKLOAD_TYPE_SANDBOX: kube.get_sandbox,
+    }
+    workload_kinds = await _agent_workload_kinds(kube)
+    calls = {kind: getters[kind](namespace=namespace, name=name) for kind in workload_kinds}
+    calls["service"] = kube.get_service(namespace=namespace, name=name)
+    results = await gather_with_deadline(calls)
+
     workload = None
     workload_type = None
-
-    # Try to get Deployment first
-    try:
-        workload = kube.get_deployment(namespace=namespace, name=name)
-        workload_type = WORKLOAD_TYPE_DEPLOYMENT
-    except ApiException as e:
-        if e.status != 404:
-            raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # If not found, try StatefulSet
-    if workload is None:
-        try:
-            workload = kube.get_statefulset(namespace=namespace, name=name)
-            workload_type = WORKLOAD_TYPE_STATEFULSET
-        except ApiException as e:
-            if e.status != 404:
-                raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # If still not found, try Job
-    if workload is None:
-        try:
-            workload = kube.get_job(namespace=namespace, name=name)
-            workload_type = WORKLOAD_TYPE_JOB
-        except ApiException as e:
-            if e.status != 404:
-                raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # If still not found, try Sandbox (feature-flagged)
-    if workload is None and settings.kagenti_feature_flag_agent_sandbox:
-        try:
-            workload = kube.get_sandbox(namespace=namespace, name=name)
-            workload_type = WORKLOAD_TYPE_SANDBOX
-        except ApiException as e:
-            if e.status != 404:
-                raise HTTPException(status_code=e.status, detail=str(e.reason))
+    for kind in workload_kinds:
+        result = results[kind]
+        if isinstance(result, ApiException):
+            if result.status != 404:
+                raise HTTPException(status_code=result.status, detail=str(result.reason))
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        workload = result
+        workload_type = kind
+        break
 
     if workload is None:
         raise HTTPException(
@@ -813,14 +858,16 @@ async def get_agent(
             detail=f"Agent '{name}' not found in namespace '{namespace}'",
         )
 
-    # Try to get the associated Service (not applicable for Jobs)
+    # The associated Service (not applicable for Jobs)
     service = None
     if workload_type not in (WORKLOAD_TYPE_JOB, WORKLOAD_TYPE_SANDBOX):
-        try:
-            service = kube.get_service(namespace=namespace, name=name)
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Failed to get Service for agent '{name}': {e.reason}")
+        service = results["service"]
+        if isinstance(service, ApiException):
+            if service.status != 404:
+                logger.warning(f"Failed to get Service for agent '{name}': {service.reason}")
+            service = None
+        elif isinstance(service, BaseException):
+            raise service
 
     # Build response with workload info and optional Service info
     metadata = workload.get("metadata", {})
@@ -873,10 +920,10 @@ async def get_agent(
 async def get_agent_route_status(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> dict:
     """Check if an HTTPRoute or Route exists for the agent."""
-    exists = route_exists(kube, name, namespace)
+    exists = await kube.run(route_exists, kube.sync, name, namespace)
     return {"hasRoute": exists}
 
 
@@ -888,7 +935,7 @@ async def get_agent_route_status(
 async def delete_agent(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> DeleteResponse:
     """Delete an agent and its associated resources from the cluster.
 
@@ -905,7 +952,7 @@ async def delete_agent(
 
     # Delete the Deployment (if exists)
     try:
-        kube.delete_deployment(namespace=namespace, name=name)
+        await kube.delete_deployment(namespace=namespace, name=name)
         messages.append(f"Deployment '{name}' deleted")
     except ApiException as e:
         if e.status == 404:
@@ -915,7 +962,7 @@ async def delete_agent(
 
     # Delete the StatefulSet (if exists)
     try:
-        kube.delete_statefulset(namespace=namespace, name=name)
+        await kube.delete_statefulset(namespace=namespace, name=name)
         messages.append(f"StatefulSet '{name}' deleted")
     except ApiException as e:
         if e.status == 404:
@@ -925,7 +972,7 @@ async def delete_agent(
 
     # Delete the Job (if exists)
     try:
-        kube.delete_job(namespace=namespace, name=name)
+        await kube.delete_job(namespace=namespace, name=name)
         messages.append(f"Job '{name}' deleted")
     except ApiException as e:
         if e.status == 404:
@@ -934,9 +981,9 @@ async def delete_agent(
             logger.warning("Failed to delete Job '%s': %s", safe_name, e.reason)
 
     # Delete the Sandbox (if exists)
-    if settings.kagenti_feature_flag_agent_sandbox:
+    if settings.kagenti_feature_flag_agent_sandbox and await kube.sandboxes_served():
         try:
-            kube.delete_sandbox(namespace=namespace, name=name)
+            await kube.delete_sandbox(namespace=namespace, name=name)
             messages.append(f"Sandbox '{name}' deleted")
         except ApiException as e:
             if e.status == 404:
@@ -946,7 +993,7 @@ async def delete_agent(
 
     # Delete the Service
     try:
-        kube.delete_service(namespace=namespace, name=name)
+        await kube.delete_service(namespace=namespace, name=name)
         messages.append(f"Service '{name}' deleted")
     except ApiException as e:
         if e.status == 404:
@@ -957,7 +1004,7 @@ async def delete_agent(
 
     # Delete the HTTPRoute (if exists)
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group="gateway.networking.k8s.io",
             version="v1",
             namespace=namespace,
@@ -974,7 +1021,7 @@ async def delete_agent(
 
     # Delete the OpenShift Route (if exists)
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group="route.openshift.io",
             version="v1",
             namespace=namespace,
@@ -991,7 +1038,7 @@ async def delete_agent(
 
     # Delete the AgentRuntime CR (if exists)
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=namespace,
@@ -1007,7 +1054,7 @@ async def delete_agent(
 
     # Legacy cleanup: Delete the Agent CR if it exists
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=namespace,
@@ -1024,7 +1071,7 @@ async def delete_agent(
 
     # Delete Shipwright BuildRuns associated with the build
     try:
-        buildruns = kube.list_custom_resources(
+        buildruns = await kube.list_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1035,7 +1082,7 @@ async def delete_agent(
             buildrun_name = buildrun.get("metadata", {}).get("name")
             if buildrun_name:
                 try:
-                    kube.delete_custom_resource(
+                    await kube.delete_custom_resource(
                         group=SHIPWRIGHT_CRD_GROUP,
                         version=SHIPWRIGHT_CRD_VERSION,
                         namespace=namespace,
@@ -1056,7 +1103,7 @@ async def delete_agent(
 
     # Delete the Shipwright Build CR if it exists
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1088,7 +1135,7 @@ async def delete_agent(
 )
 async def list_migratable_agents(
     namespace: str = Query(default="default", description="Kubernetes namespace"),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ListMigratableAgentsResponse:
     """
     List all Agent CRDs in a namespace that can be migrated to Deployments.
@@ -1098,7 +1145,7 @@ async def list_migratable_agents(
     """
     try:
         # List legacy Agent CRDs
-        agent_crds = kube.list_custom_resources(
+        agent_crds = await kube.list_custom_resources(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=namespace,
@@ -1112,7 +1159,7 @@ async def list_migratable_agents(
 
     # Get list of existing Deployments to check for already-migrated agents
     try:
-        existing_deployments = kube.list_deployments(
+        existing_deployments = await kube.list_deployments(
             namespace=namespace,
             label_selector=f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_AGENT}",
         )
@@ -1175,7 +1222,7 @@ async def migrate_agent(
     namespace: str,
     name: str,
     request: MigrateAgentRequest = MigrateAgentRequest(),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> MigrateAgentResponse:
     """
     Migrate an Agent CRD to a Deployment.
@@ -1198,7 +1245,7 @@ async def migrate_agent(
 
     # Step 1: Get the Agent CRD
     try:
-        agent = kube.get_custom_resource(
+        agent = await kube.get_custom_resource(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=namespace,
@@ -1217,7 +1264,7 @@ async def migrate_agent(
     deployment_exists = False
     deployment_managed_by_operator = False
     try:
-        existing_deployment = kube.get_deployment(namespace=namespace, name=name)
+        existing_deployment = await kube.get_deployment(namespace=namespace, name=name)
         deployment_exists = True
         # Check if it was created by kagenti-operator
         dep_labels = existing_deployment.get("metadata", {}).get("labels", {})
@@ -1235,7 +1282,7 @@ async def migrate_agent(
     # Step 3: Check if Service already exists
     service_exists = False
     try:
-        kube.get_service(namespace=namespace, name=name)
+        await kube.get_service(namespace=namespace, name=name)
         service_exists = True
         logger.info(f"Service '{name}' already exists")
     except ApiException as e:
@@ -1259,7 +1306,7 @@ async def migrate_agent(
                         },
                     }
                 }
-                kube.patch_deployment(namespace=namespace, name=name, body=patch)
+                await kube.patch_deployment(namespace=namespace, name=name, body=patch)
                 logger.info(f"Patched Deployment '{name}' with migration annotations")
             except ApiException as e:
                 logger.warning(f"Failed to patch Deployment '{name}': {e.reason}")
@@ -1272,9 +1319,9 @@ async def migrate_agent(
     else:
         # Create new Deployment from Agent CRD spec
         deployment_manifest = _build_deployment_from_agent_crd(agent)
-        kube.ensure_service_account(namespace=namespace, name=name)
+        await kube.ensure_service_account(namespace=namespace, name=name)
         try:
-            kube.create_deployment(namespace=namespace, body=deployment_manifest)
+            await kube.create_deployment(namespace=namespace, body=deployment_manifest)
             deployment_created = True
             logger.info(f"Created Deployment '{name}' from Agent CRD")
         except ApiException as e:
@@ -1287,14 +1334,14 @@ async def migrate_agent(
     if not service_exists:
         service_manifest = _build_service_from_agent_crd(agent)
         try:
-            kube.create_service(namespace=namespace, body=service_manifest)
+            await kube.create_service(namespace=namespace, body=service_manifest)
             service_created = True
             logger.info(f"Created Service '{name}' from Agent CRD")
         except ApiException as e:
             # If Deployment was created, try to clean up
             if deployment_created:
                 try:
-                    kube.delete_deployment(namespace=namespace, name=name)
+                    await kube.delete_deployment(namespace=namespace, name=name)
                 except Exception as cleanup_error:
                     logger.warning(
                         "Failed to clean up Deployment '%s' after Service creation error: %s",
@@ -1309,7 +1356,7 @@ async def migrate_agent(
     # Step 6: Delete the Agent CRD (if requested)
     if request.delete_old:
         try:
-            kube.delete_custom_resource(
+            await kube.delete_custom_resource(
                 group=CRD_GROUP,
                 version=CRD_VERSION,
                 namespace=namespace,
@@ -1360,7 +1407,7 @@ async def migrate_all_agents(
     namespace: str = Query(default="default", description="Kubernetes namespace"),
     delete_old: bool = Query(default=False, description="Delete Agent CRDs after migration"),
     dry_run: bool = Query(default=True, description="If True, only show what would be migrated"),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> Dict[str, Any]:
     """
     Migrate all Agent CRDs in a namespace to Deployments.
@@ -1616,14 +1663,14 @@ def _build_service_from_agent_crd(agent: dict) -> dict:
     dependencies=[Depends(require_roles(ROLE_VIEWER))],
 )
 async def list_build_strategies(
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ClusterBuildStrategiesResponse:
     """List available ClusterBuildStrategies for Shipwright builds.
 
     Returns the list of ClusterBuildStrategy resources available in the cluster.
     """
     try:
-        response = kube.list_cluster_custom_resources(
+        response = await kube.list_cluster_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             plural=SHIPWRIGHT_CLUSTER_BUILD_STRATEGIES_PLURAL,
@@ -1669,12 +1716,12 @@ async def list_agent_shipwright_builds(
         alias="allNamespaces",
         description="If true, list builds in all kagenti-enabled namespaces",
     ),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ShipwrightBuildListResponse:
     """List Shipwright Build resources for agents only (kagenti.io/type=agent)."""
     namespaces_to_scan: List[str] = []
     if all_namespaces:
-        namespaces_to_scan = kube.list_enabled_namespaces()
+        namespaces_to_scan = await kube.list_enabled_namespaces()
     else:
         if not namespace or not namespace.strip():
             raise HTTPException(
@@ -1684,8 +1731,12 @@ async def list_agent_shipwright_builds(
         namespaces_to_scan = [namespace.strip()]
 
     try:
-        items = collect_kagenti_shipwright_builds(
-            kube, namespaces_to_scan, RESOURCE_TYPE_AGENT, logger
+        items = await kube.run(
+            collect_kagenti_shipwright_builds,
+            kube.sync,
+            namespaces_to_scan,
+            RESOURCE_TYPE_AGENT,
+            logger,
         )
     except ApiException as e:
         raise HTTPException(status_code=e.status, detail=str(e.reason))
@@ -1701,7 +1752,7 @@ async def list_agent_shipwright_builds(
 async def get_shipwright_build_status(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ShipwrightBuildStatusResponse:
     """Get the Shipwright Build status for an agent.
 
@@ -1709,7 +1760,7 @@ async def get_shipwright_build_status(
     and ready for BuildRuns.
     """
     try:
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1750,7 +1801,7 @@ async def get_shipwright_build_status(
 async def get_shipwright_buildrun_status(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ShipwrightBuildRunStatusResponse:
     """Get the latest Shipwright BuildRun status for an agent build.
 
@@ -1759,7 +1810,7 @@ async def get_shipwright_buildrun_status(
     """
     try:
         # List BuildRuns with label selector for this build
-        items = kube.list_custom_resources(
+        items = await kube.list_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1844,7 +1895,7 @@ async def get_shipwright_buildrun_status(
 async def trigger_shipwright_buildrun(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> Dict[str, Any]:
     """Trigger a new Shipwright BuildRun for an existing Build.
 
@@ -1852,7 +1903,7 @@ async def trigger_shipwright_buildrun(
     """
     try:
         # First verify the Build exists
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1876,7 +1927,7 @@ async def trigger_shipwright_buildrun(
         )
 
         # Create the BuildRun
-        created_buildrun = kube.create_custom_resource(
+        created_buildrun = await kube.create_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1909,7 +1960,7 @@ async def trigger_shipwright_buildrun(
 async def get_shipwright_build_info(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> AgentShipwrightBuildInfoResponse:
     """Get full Shipwright Build information including agent config and BuildRun status.
 
@@ -1920,7 +1971,7 @@ async def get_shipwright_build_info(
     """
     try:
         # Get the Build resource
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1958,7 +2009,7 @@ async def get_shipwright_build_info(
 
         # Try to get the latest BuildRun
         try:
-            items = kube.list_custom_resources(
+            items = await kube.list_custom_resources(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=namespace,
@@ -2922,7 +2973,7 @@ def _build_sandbox_manifest(
 )
 async def create_agent(
     request: CreateAgentRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> CreateAgentResponse:
     """
     Create a new agent.
@@ -2953,18 +3004,20 @@ async def create_agent(
 
             # Ensure a dedicated ServiceAccount exists so the webhook's
             # SPIFFE identity uses the workload name, not the ReplicaSet hash.
-            kube.ensure_service_account(namespace=request.namespace, name=request.name)
+            await kube.ensure_service_account(namespace=request.namespace, name=request.name)
 
             # Ensure AuthBridge ConfigMaps exist in the target namespace
             if request.authBridgeEnabled:
-                _ensure_authbridge_configmaps(
-                    kube=kube,
+                await kube.run(
+                    _ensure_authbridge_configmaps,
+                    kube=kube.sync,
                     namespace=request.namespace,
                     spire_enabled=request.spireEnabled,
                 )
                 if request.outboundRoutes:
-                    _ensure_authproxy_routes(
-                        kube=kube,
+                    await kube.run(
+                        _ensure_authproxy_routes,
+                        kube=kube.sync,
                         namespace=request.namespace,
                         routes=request.outboundRoutes,
                     )
@@ -2972,7 +3025,7 @@ async def create_agent(
                     extra_config = {
                         "DEFAULT_OUTBOUND_POLICY": request.defaultOutboundPolicy,
                     }
-                    kube.upsert_configmap(
+                    await kube.upsert_configmap(
                         namespace=request.namespace,
                         name="authbridge-config",
                         data=extra_config,
@@ -2980,7 +3033,9 @@ async def create_agent(
 
             # On OpenShift, ensure the AuthBridge SCC RoleBinding exists
             if request.authBridgeEnabled:
-                _ensure_authbridge_scc_rolebinding(kube=kube, namespace=request.namespace)
+                await kube.run(
+                    _ensure_authbridge_scc_rolebinding, kube=kube.sync, namespace=request.namespace
+                )
 
             # Create card-unsigned ConfigMap so the webhook injects
             # the sign-agentcard init container at Deployment admission.
@@ -2990,8 +3045,9 @@ async def create_agent(
                     if request.servicePorts
                     else DEFAULT_IN_CLUSTER_PORT
                 )
-                _ensure_card_unsigned_configmap(
-                    kube=kube,
+                await kube.run(
+                    _ensure_card_unsigned_configmap,
+                    kube=kube.sync,
                     name=request.name,
                     namespace=request.namespace,
                     service_port=service_port,
@@ -3003,7 +3059,7 @@ async def create_agent(
                     request=request,
                     image=request.containerImage,
                 )
-                kube.create_deployment(
+                await kube.create_deployment(
                     namespace=request.namespace,
                     body=workload_manifest,
                 )
@@ -3015,7 +3071,7 @@ async def create_agent(
                     request=request,
                     image=request.containerImage,
                 )
-                kube.create_statefulset(
+                await kube.create_statefulset(
                     namespace=request.namespace,
                     body=workload_manifest,
                 )
@@ -3027,7 +3083,7 @@ async def create_agent(
                     request=request,
                     image=request.containerImage,
                 )
-                kube.create_job(
+                await kube.create_job(
                     namespace=request.namespace,
                     body=workload_manifest,
                 )
@@ -3037,7 +3093,7 @@ async def create_agent(
                     request=request,
                     image=request.containerImage,
                 )
-                kube.create_sandbox(
+                await kube.create_sandbox(
                     namespace=request.namespace,
                     body=sandbox_manifest,
                 )
@@ -3046,7 +3102,7 @@ async def create_agent(
             # Create Service (not needed for Jobs or Sandboxes)
             if request.workloadType not in (WORKLOAD_TYPE_JOB, WORKLOAD_TYPE_SANDBOX):
                 service_manifest = _build_service_manifest(request)
-                kube.create_service(
+                await kube.create_service(
                     namespace=request.namespace,
                     body=service_manifest,
                 )
@@ -3054,8 +3110,9 @@ async def create_agent(
 
             # Create AgentRuntime CR so the webhook injects sidecars on pod rollout
             if request.workloadType not in (WORKLOAD_TYPE_JOB, WORKLOAD_TYPE_SANDBOX):
-                _ensure_agentruntime(
-                    kube=kube,
+                await kube.run(
+                    _ensure_agentruntime,
+                    kube=kube.sync,
                     name=request.name,
                     namespace=request.namespace,
                     workload_type=request.workloadType,
@@ -3072,8 +3129,9 @@ async def create_agent(
                     request.servicePorts,
                     default_port=DEFAULT_OFF_CLUSTER_PORT,
                 )
-                create_route_for_agent_or_tool(
-                    kube=kube,
+                await kube.run(
+                    create_route_for_agent_or_tool,
+                    kube=kube.sync,
                     name=request.name,
                     namespace=request.namespace,
                     service_name=request.name,
@@ -3090,11 +3148,13 @@ async def create_agent(
                 )
 
             # Step 1: Create Shipwright Build CR
-            clone_secret = resolve_clone_secret(kube.core_api, request.namespace)
+            clone_secret = await kube.run(
+                resolve_clone_secret, kube.sync.core_api, request.namespace
+            )
             build_manifest = _build_agent_shipwright_build_manifest(
                 request, clone_secret_name=clone_secret
             )
-            kube.create_custom_resource(
+            await kube.create_custom_resource(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -3113,7 +3173,7 @@ async def create_agent(
                 namespace=request.namespace,
                 labels=build_labels,
             )
-            created_buildrun = kube.create_custom_resource(
+            created_buildrun = await kube.create_custom_resource(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -3197,7 +3257,7 @@ async def finalize_shipwright_build(
     namespace: str,
     name: str,
     request: FinalizeShipwrightBuildRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> CreateAgentResponse:
     """
     Finalize a Shipwright build by creating the Deployment and Service.
@@ -3209,11 +3269,13 @@ async def finalize_shipwright_build(
     Agent configuration can be provided in the request body, or it will be read from
     the Build's kagenti.io/agent-config annotation (stored during build creation).
     """
+    # The reconciliation loop calls this directly with the blocking service
+    kube = as_async(kube)
     logger.info(f"Finalizing Shipwright build '{name}' in namespace '{namespace}'")
 
     try:
         # Step 1: Get the latest BuildRun status to get the output image
-        items = kube.list_custom_resources(
+        items = await kube.list_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -3254,7 +3316,7 @@ async def finalize_shipwright_build(
             )
 
         # Get Build resource for labels and stored agent config (needed for workload type check)
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -3282,7 +3344,7 @@ async def finalize_shipwright_build(
         workload_exists = False
         existing_workload_type = None
         try:
-            kube.get_deployment(namespace=namespace, name=name)
+            await kube.get_deployment(namespace=namespace, name=name)
             workload_exists = True
             existing_workload_type = WORKLOAD_TYPE_DEPLOYMENT
         except ApiException as e:
@@ -3290,7 +3352,7 @@ async def finalize_shipwright_build(
                 raise
         if not workload_exists:
             try:
-                kube.get_statefulset(namespace=namespace, name=name)
+                await kube.get_statefulset(namespace=namespace, name=name)
                 workload_exists = True
                 existing_workload_type = WORKLOAD_TYPE_STATEFULSET
             except ApiException as e:
@@ -3298,15 +3360,19 @@ async def finalize_shipwright_build(
                     raise
         if not workload_exists:
             try:
-                kube.get_job(namespace=namespace, name=name)
+                await kube.get_job(namespace=namespace, name=name)
                 workload_exists = True
                 existing_workload_type = WORKLOAD_TYPE_JOB
             except ApiException as e:
                 if e.status != 404:
                     raise
-        if not workload_exists and settings.kagenti_feature_flag_agent_sandbox:
+        if (
+            not workload_exists
+            and settings.kagenti_feature_flag_agent_sandbox
+            and await kube.sandboxes_served()
+        ):
             try:
-                kube.get_sandbox(namespace=namespace, name=name)
+                await kube.get_sandbox(namespace=namespace, name=name)
                 workload_exists = True
                 existing_workload_type = WORKLOAD_TYPE_SANDBOX
             except ApiException as e:
@@ -3472,25 +3538,27 @@ async def finalize_shipwright_build(
 
         # Ensure a dedicated ServiceAccount exists so the webhook's
         # SPIFFE identity uses the workload name, not the ReplicaSet hash.
-        kube.ensure_service_account(namespace=namespace, name=name)
+        await kube.ensure_service_account(namespace=namespace, name=name)
 
         # Ensure AuthBridge ConfigMaps exist in the target namespace
         if final_auth_bridge:
-            _ensure_authbridge_configmaps(
-                kube=kube,
+            await kube.run(
+                _ensure_authbridge_configmaps,
+                kube=kube.sync,
                 namespace=namespace,
                 spire_enabled=final_spire_enabled,
             )
             if final_outbound_routes:
-                _ensure_authproxy_routes(
-                    kube=kube,
+                await kube.run(
+                    _ensure_authproxy_routes,
+                    kube=kube.sync,
                     namespace=namespace,
                     routes=final_outbound_routes,
                 )
 
         # On OpenShift, ensure the AuthBridge SCC RoleBinding exists
         if final_auth_bridge:
-            _ensure_authbridge_scc_rolebinding(kube=kube, namespace=namespace)
+            await kube.run(_ensure_authbridge_scc_rolebinding, kube=kube.sync, namespace=namespace)
 
         # Create card-unsigned ConfigMap so the webhook injects
         # the sign-agentcard init container at Deployment admission.
@@ -3498,8 +3566,9 @@ async def finalize_shipwright_build(
             service_port = (
                 final_service_ports[0].port if final_service_ports else DEFAULT_IN_CLUSTER_PORT
             )
-            _ensure_card_unsigned_configmap(
-                kube=kube,
+            await kube.run(
+                _ensure_card_unsigned_configmap,
+                kube=kube.sync,
                 name=name,
                 namespace=namespace,
                 service_port=service_port,
@@ -3520,7 +3589,7 @@ async def finalize_shipwright_build(
             workload_manifest["spec"]["template"]["metadata"]["labels"].update(
                 {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
             )
-            kube.create_deployment(namespace=namespace, body=workload_manifest)
+            await kube.create_deployment(namespace=namespace, body=workload_manifest)
             logger.info(
                 f"Created Deployment '{name}' with image '{container_image}' in namespace '{namespace}'"
             )
@@ -3538,7 +3607,7 @@ async def finalize_shipwright_build(
             workload_manifest["spec"]["template"]["metadata"]["labels"].update(
                 {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
             )
-            kube.create_statefulset(namespace=namespace, body=workload_manifest)
+            await kube.create_statefulset(namespace=namespace, body=workload_manifest)
             logger.info(
                 f"Created StatefulSet '{name}' with image '{container_image}' in namespace '{namespace}'"
             )
@@ -3556,7 +3625,7 @@ async def finalize_shipwright_build(
             workload_manifest["spec"]["template"]["metadata"]["labels"].update(
                 {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
             )
-            kube.create_job(namespace=namespace, body=workload_manifest)
+            await kube.create_job(namespace=namespace, body=workload_manifest)
             logger.info(
                 f"Created Job '{name}' with image '{container_image}' in namespace '{namespace}'"
             )
@@ -3573,7 +3642,7 @@ async def finalize_shipwright_build(
             sandbox_manifest["spec"]["podTemplate"]["metadata"]["labels"].update(
                 kagenti_build_labels
             )
-            kube.create_sandbox(namespace=namespace, body=sandbox_manifest)
+            await kube.create_sandbox(namespace=namespace, body=sandbox_manifest)
             logger.info(f"Created Sandbox '{name}' in namespace '{namespace}' from build")
 
         # Create Service (not needed for Jobs or Sandboxes)
@@ -3583,7 +3652,7 @@ async def finalize_shipwright_build(
             service_manifest["metadata"]["labels"].update(
                 {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
             )
-            kube.create_service(namespace=namespace, body=service_manifest)
+            await kube.create_service(namespace=namespace, body=service_manifest)
             logger.info(f"Created Service '{name}' in namespace '{namespace}'")
 
         # Create AgentRuntime CR so the webhook injects sidecars on pod rollout
@@ -3593,8 +3662,9 @@ async def finalize_shipwright_build(
             final_workload_type not in (WORKLOAD_TYPE_JOB, WORKLOAD_TYPE_SANDBOX)
             and resource_type == RESOURCE_TYPE_AGENT
         ):
-            _ensure_agentruntime(
-                kube=kube,
+            await kube.run(
+                _ensure_agentruntime,
+                kube=kube.sync,
                 name=name,
                 namespace=namespace,
                 workload_type=final_workload_type,
@@ -3611,8 +3681,9 @@ async def finalize_shipwright_build(
                 final_service_ports,
                 default_port=DEFAULT_OFF_CLUSTER_PORT,
             )
-            create_route_for_agent_or_tool(
-                kube=kube,
+            await kube.run(
+                create_route_for_agent_or_tool,
+                kube=kube.sync,
                 name=name,
                 namespace=namespace,
                 service_name=name,
@@ -3877,7 +3948,7 @@ if settings.kagenti_feature_flag_authbridge_api:
     async def get_agent_identity_config(
         namespace: str,
         name: str,
-        kube: KubernetesService = Depends(get_kubernetes_service),
+        kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
     ) -> dict:
         """
         Fetch the AuthBridge configuration for an Agent.
@@ -3887,7 +3958,9 @@ if settings.kagenti_feature_flag_authbridge_api:
         name = sanitize_log(name)
 
         try:
-            addresses = _get_service_endpoints(kube=kube, namespace=namespace, name=name)
+            addresses = await kube.run(
+                _get_service_endpoints, kube=kube.sync, namespace=namespace, name=name
+            )
         except ApiException as e:
             raise HTTPException(status_code=502, detail=e.reason)
 
@@ -3917,7 +3990,7 @@ if settings.kagenti_feature_flag_authbridge_api:
     async def get_agent_identity_status(
         namespace: str,
         name: str,
-        kube: KubernetesService = Depends(get_kubernetes_service),
+        kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
     ) -> dict:
         """
         Fetch the AuthBridge statistics and status for an Agent.
@@ -3927,7 +4000,9 @@ if settings.kagenti_feature_flag_authbridge_api:
         name = sanitize_log(name)
 
         try:
-            addresses = _get_service_endpoints(kube=kube, namespace=namespace, name=name)
+            addresses = await kube.run(
+                _get_service_endpoints, kube=kube.sync, namespace=namespace, name=name
+            )
         except ApiException as e:
             raise HTTPException(status_code=502, detail=e.reason)
 
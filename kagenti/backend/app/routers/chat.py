@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 # Copyright 2025 IBM Corp.
 # Licensed under the Apache License, Version 2.0
 
@@ -7,25 +8,44 @@ A2A Chat API endpoints.
 Provides endpoints for chatting with A2A agents using the Agent-to-Agent protocol.
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Callable, Optional, List, Tuple
 from uuid import uuid4
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-
-from app.core.auth import require_roles, get_required_user, ROLE_VIEWER, ROLE_OPERATOR, TokenData
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from kubernetes.client import ApiException
+from pydantic import BaseModel, Field
+
+from app.core.auth import (
+    require_roles,
+    get_required_user,
+    ROLE_ADMIN,
+    ROLE_VIEWER,
+    ROLE_OPERATOR,
+    TokenData,
+)
 from app.core.config import settings
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.agent_cards import CardEntry, get_agent_card_cache
+from app.services import event_history, session_db, session_query, sse_relay, stream_mux
+from app.services.agent_http import get_agent_http_clients
+from app.services.kubernetes_async import (
+    AsyncKubernetesService,
+    get_async_kubernetes_service,
+    workload_generation,
+)
+from app.services.sse_relay import A2ARelay
+from app.services.stream_replay import StreamRun, get_stream_replay_store, parse_event_id
 from app.utils.routes import resolve_agent_url
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# A2A protocol constants
-A2A_AGENT_CARD_PATH = "/.well-known/agent-card.json"
+# Upper bound on agents per bulk agent-card request
+MAX_BULK_AGENT_CARDS = 200
 
 
 class ChatMessage(BaseModel):
@@ -62,56 +82,54 @@ class ChatResponse(BaseModel):
     username: Optional[str] = None
 
 
-@router.get(
-    "/{namespace}/{name}/agent-card",
-    response_model=AgentCardResponse,
-    dependencies=[Depends(require_roles(ROLE_VIEWER))],
-)
-async def get_agent_card(
-    namespace: str,
-    name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
-) -> AgentCardResponse:
-    """
-    Fetch the A2A agent card for an agent.
+def _card_response(card_data: dict, name: str, agent_url: str) -> AgentCardResponse:
+    """Build the simplified AgentCardResponse from a raw A2A agent card."""
+    # Parse capabilities
+    capabilities = card_data.get("capabilities", {})
+    streaming = capabilities.get("streaming", False)
+
+    # Parse skills
+    skills = []
+    for skill in card_data.get("skills", []):
+        skills.append(
+            {
+                "id": skill.get("id", ""),
+                "name": skill.get("name", ""),
+                "description": skill.get("description", ""),
+                "examples": skill.get("examples", []),
+            }
+        )
 
-    The agent card describes the agent's capabilities, skills, and metadata.
-    All agents are reached via their cluster-internal URL through AuthBridge.
-    """
-    agent_url = resolve_agent_url(name, namespace, kube)
-    card_url = f"{agent_url}{A2A_AGENT_CARD_PATH}"
+    return AgentCardResponse(
+        name=card_data.get("name", name),
+        description=card_data.get("description"),
+        version=card_data.get("version", "unknown"),
+        url=card_data.get("url", agent_url),
+        streaming=streaming,
+        skills=skills,
+    )
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(card_url)
-            response.raise_for_status()
-            card_data = response.json()
-
-            # Parse capabilities
-            capabilities = card_data.get("capabilities", {})
-            streaming = capabilities.get("streaming", False)
-
-            # Parse skills
-            skills = []
-            for skill in card_data.get("skills", []):
-                skills.append(
-                    {
-                        "id": skill.get("id", ""),
-                        "name": skill.get("name", ""),
-                        "description": skill.get("description", ""),
-                        "examples": skill.get("examples", []),
-                    }
-                )
 
-            return AgentCardResponse(
-                name=card_data.get("name", name),
-                description=card_data.get("description"),
-                version=card_data.get("version", "unknown"),
-                url=card_data.get("url", agent_url),
-                streaming=streaming,
-                skills=skills,
-            )
+async def _load_agent_card(
+    kube: AsyncKubernetesService, namespace: str, name: str
+) -> Tuple[CardEntry, str]:
+    """Return the (possibly cached) card entry and URL for an agent.
 
+    Raises HTTPException on agent errors, mirroring the single-card endpoint.
+    """
+    agent_url = ""
+    try:
+        agent_url, generation = await asyncio.gather(
+            kube.run(resolve_agent_url, name, namespace, kube.sync),
+            workload_generation(kube, namespace, name),
+        )
+        return await get_agent_card_cache().get(namespace, name, agent_url, generation), agent_url
+    except ApiException as e:
+        logger.error(f"Kubernetes error resolving agent {namespace}/{name}: {e.reason}")
+        raise HTTPException(
+            status_code=e.status or 500,
+            detail=f"Failed to resolve agent: {e.reason}",
+        )
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching agent card: {e}")
         raise HTTPException(
@@ -132,6 +150,139 @@ async def get_agent_card(
         )
 
 
+@router.get(
+    "/{namespace}/{name}/agent-card",
+    response_model=AgentCardResponse,
+    dependencies=[Depends(require_roles(ROLE_VIEWER))],
+)
+async def get_agent_card(
+    namespace: str,
+    name: str,
+    request: Request,
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+):
+    """
+    Fetch the A2A agent card for an agent.
+
+    The agent card describes the agent's capabilities, skills, and metadata.
+    All agents are reached via their cluster-internal URL through AuthBridge.
+
+    Cards are served from a server-side cache (see services/agent_cards.py).
+    The response carries an ``ETag``; sending it back as ``If-None-Match``
+    returns ``304 Not Modified`` while the card is unchanged.
+    """
+    entry, agent_url = await _load_agent_card(kube, namespace, name)
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("If-None-Match") == entry.etag:
+        return Response(status_code=304, headers=headers)
+    card = _card_response(entry.card, name, agent_url)
+    return JSONResponse(content=card.model_dump(), headers=headers)
+
+
+class AgentRef(BaseModel):
+    """Reference to an agent by namespace and name."""
+
+    namespace: str
+    name: str
+
+
+class AgentCardsRequest(BaseModel):
+    """Agents whose cards should be returned by the bulk endpoint."""
+
+    agents: List[AgentRef] = Field(..., max_length=MAX_BULK_AGENT_CARDS)
+
+
+class AgentCardResult(BaseModel):
+    """Card (or error) for one agent in a bulk response."""
+
+    namespace: str
+    name: str
+    card: Optional[AgentCardResponse] = None
+    status: int = 200
+    error: Optional[str] = None
+
+
+class AgentCardsResponse(BaseModel):
+    """Bulk agent card response, in request order."""
+
+    items: List[AgentCardResult]
+
+
+@router.get(
+    "/{namespace}/subscribe",
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def subscribe_sessions(
+    namespace: str,
+    session_id: List[str] = Query(
+        ...,
+        description="Session to follow; repeat the parameter for each session",
+    ),
+    user: TokenData = Depends(get_required_user),
+):
+    """
+    Follow the chat streams of many sessions over one SSE connection.
+
+    Each event is tagged with its ``session_id``, ``run_id`` and ``seq``
+    (see services/stream_mux.py). Viewers of the same session share its
+    single upstream agent connection.
+    """
+    if len(set(session_id)) > settings.chat_subscribe_max_sessions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.chat_subscribe_max_sessions} sessions per subscription",
+        )
+    return StreamingResponse(
+        stream_mux.subscribe(
+            get_stream_replay_store(),
+            session_id,
+            lambda run: _can_read_run(run, namespace, user),
+            heartbeat_interval=settings.chat_subscribe_heartbeat,
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
+@router.post(
+    "/agent-cards",
+    response_model=AgentCardsResponse,
+    dependencies=[Depends(require_roles(ROLE_VIEWER))],
+)
+async def get_agent_cards(
+    request: AgentCardsRequest,
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+) -> AgentCardsResponse:
+    """
+    Fetch agent cards for many agents in one request.
+
+    Cards are resolved concurrently (at most AGENT_CARD_BULK_CONCURRENCY at a
+    time) through the same cache as the single-card endpoint. A failure for
+    one agent is reported in its item and does not fail the request.
+    """
+    semaphore = asyncio.Semaphore(settings.agent_card_bulk_concurrency)
+
+    async def load(ref: AgentRef) -> AgentCardResult:
+        async with semaphore:
+            try:
+                entry, agent_url = await _load_agent_card(kube, ref.namespace, ref.name)
+            except HTTPException as e:
+                return AgentCardResult(
+                    namespace=ref.namespace, name=ref.name, status=e.status_code, error=e.detail
+                )
+        return AgentCardResult(
+            namespace=ref.namespace,
+            name=ref.name,
+            card=_card_response(entry.card, ref.name, agent_url),
+        )
+
+    items = await asyncio.gather(*(load(ref) for ref in request.agents))
+    return AgentCardsResponse(items=list(items))
+
+
 @router.post(
     "/{namespace}/{name}/send",
     response_model=ChatResponse,
@@ -143,7 +294,7 @@ async def send_message(
     request: ChatRequest,
     http_request: Request,
     user: TokenData = Depends(get_required_user),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ChatResponse:
     """
     Send a message to an A2A agent and get the response.
@@ -154,7 +305,7 @@ async def send_message(
     Forwards the Authorization header from the client to the agent for
     authenticated requests.
     """
-    agent_url = resolve_agent_url(name, namespace, kube)
+    agent_url = await kube.run(resolve_agent_url, name, namespace, kube.sync)
     session_id = request.session_id or uuid4().hex
 
     # Build A2A message payload. When the frontend supplied a session_id
@@ -185,12 +336,16 @@ async def send_message(
         headers["Authorization"] = authorization
         logger.info("Forwarding Authorization header to agent")
 
+    agent_http = get_agent_http_clients()
+    client = agent_http.client_for(agent_url)
+
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with agent_http.track(agent_url):
             response = await client.post(
                 agent_url,
                 json=message_payload,
                 headers=headers,
+                timeout=settings.agent_send_timeout,
             )
             response.raise_for_status()
             result = response.json()
@@ -253,64 +408,45 @@ async def send_message(
         )
 
 
-def _extract_text_from_parts(parts: list) -> str:
-    """Extract text content from A2A message parts."""
-    import json as json_module
-
-    content = ""
-    for part in parts:
-        if isinstance(part, dict):
-            # Handle simple text field
-            if "text" in part:
-                content += part["text"]
-            # Handle kind=text format
-            elif part.get("kind") == "text":
-                content += part.get("text", "")
-            # Handle data field (for JSON, images, etc.)
-            elif "data" in part:
-                data = part["data"]
-                if isinstance(data, dict):
-                    if "content_type" in data and "content" in data:
-                        content_type = data.get("content_type", "")
-                        content_value = data.get("content", "")
-                        if content_type == "application/json" and content_value:
-                            try:
-                                json_data = json_module.loads(content_value)
-                                formatted = json_module.dumps(json_data, indent=2)
-                                content += f"\n```json\n{formatted}\n```\n"
-                            except json_module.JSONDecodeError:
-                                content += f"\n{content_value}\n"
-                        elif not content_type.startswith("image/"):
-                            content += f"\n{content_value}\n"
-                    else:
-                        formatted = json_module.dumps(data, indent=2)
-                        content += f"\n```json\n{formatted}\n```\n"
-                elif isinstance(data, str):
-                    try:
-                        json_data = json_module.loads(data)
-                        formatted = json_module.dumps(json_data, indent=2)
-                        content += f"\n```json\n{formatted}\n```\n"
-                    except (json_module.JSONDecodeError, TypeError):
-                        content += f"\n{data}\n"
-                elif isinstance(data, (list, int, float, bool)):
-                    formatted = json_module.dumps(data, indent=2)
-                    content += f"\n```json\n{formatted}\n```\n"
-    return content
+def _sidecar_fan_out() -> Optional[Callable[[str, dict], None]]:
+    """Return the sidecar manager's fan-out hook when sidecars are enabled."""
+    if getattr(settings, "kagenti_feature_flag_sidecars", False):
+        try:
+            from app.services.sidecar_manager import get_sidecar_manager
+
+            return get_sidecar_manager().fan_out_event
+        except ImportError:
+            pass
+    return None
 
 
 async def _stream_from_response(
-    client: httpx.AsyncClient,
     response: httpx.Response,
     session_id: str,
     username: Optional[str] = None,
     caller_supplied_session_id: bool = False,
+    run: Optional[StreamRun] = None,
+    tracking: Optional[AsyncExitStack] = None,
 ):
     """Stream SSE events from an already-connected agent response.
 
-    Owns closing both the response and client when done.
+    Owns closing the response, and ending its ``tracking`` (see
+    AgentHttpClients.track), when done; the pooled client stays open.
+    Translation is done by A2ARelay (see services/sse_relay.py). With a
+    ``run``, every event is recorded for Last-Event-ID replay and sent with
+    its SSE id (see services/stream_replay.py).
     """
-    import json
+    relay = A2ARelay(
+        session_id,
+        username,
+        caller_supplied_session_id=caller_supplied_session_id,
+        on_chunk=_sidecar_fan_out(),
+    )
+
+    def emit(event: str) -> str:
+        return run.append(event, relay.session_id, relay.event_type) if run else event
 
+    ended = False
     try:
         if response.status_code >= 400:
             try:
@@ -319,150 +455,414 @@ async def _stream_from_response(
             except Exception:
                 detail = str(response.status_code)
             logger.error("Agent error: %d: %s", response.status_code, detail.replace("\n", " "))
-            payload = {"error": f"Agent error: {response.status_code}", "session_id": session_id}
-            yield f"data: {json.dumps(payload)}\n\n"
+            ended = True
+            yield emit(relay.error_event(f"Agent error: {response.status_code}"))
             return
 
         logger.debug("Connected to agent, status=%d", response.status_code)
 
-        _sidecar_mgr = None
-        if getattr(settings, "kagenti_feature_flag_sidecars", False):
-            try:
-                from app.services.sidecar_manager import get_sidecar_manager
-
-                _sidecar_mgr = get_sidecar_manager()
-            except ImportError:
-                pass
-
         async for line in response.aiter_lines():
             if not line:
                 continue
-
-            if line.startswith("data: "):
-                data = line[6:]
-                if data == "[DONE]":
-                    done_payload = {"done": True, "session_id": session_id}
-                    if username:
-                        done_payload["username"] = username
-                    yield f"data: {json.dumps(done_payload)}\n\n"
-                    break
-
-                try:
-                    chunk = json.loads(data)
-
-                    if _sidecar_mgr is not None:
-                        try:
-                            _sidecar_mgr.fan_out_event(session_id, chunk)
-                        except Exception:
-                            logger.debug("Sidecar fan-out failed", exc_info=True)
-
-                    if "result" not in chunk:
-                        continue
-
-                    result = chunk["result"]
-                    # Adopt the agent's contextId only on the first turn (when
-                    # the caller had no session_id yet). Some A2A SDKs mint a
-                    # fresh contextId on every response even when the client
-                    # supplied one; adopting that new ID every turn would
-                    # churn the UI's sessionId state and split telemetry
-                    # across a new authbridge bucket per message.
-                    if not caller_supplied_session_id:
-                        agent_ctx = result.get("contextId") or result.get("sessionId")
-                        if agent_ctx and agent_ctx != session_id:
-                            session_id = agent_ctx
-                    payload = {"session_id": session_id}
-                    if username:
-                        payload["username"] = username
-
-                    if "artifact" in result:
-                        artifact = result.get("artifact", {})
-                        parts = artifact.get("parts", [])
-                        content = _extract_text_from_parts(parts)
-                        payload["event"] = {
-                            "type": "artifact",
-                            "taskId": result.get("taskId", ""),
-                            "name": artifact.get("name"),
-                            "index": artifact.get("index"),
-                        }
-                        if content:
-                            payload["content"] = content
-                        yield f"data: {json.dumps(payload)}\n\n"
-
-                    elif "status" in result and "taskId" in result:
-                        status = result["status"]
-                        is_final = result.get("final", False)
-                        state = status.get("state", "UNKNOWN")
-
-                        status_message = ""
-                        if "message" in status and status["message"]:
-                            parts = status["message"].get("parts", [])
-                            status_message = _extract_text_from_parts(parts)
-
-                        event_type = "status"
-                        if state == "INPUT_REQUIRED":
-                            event_type = "hitl_request"
-
-                        payload["event"] = {
-                            "type": event_type,
-                            "taskId": result.get("taskId", ""),
-                            "state": state,
-                            "final": is_final,
-                            "message": status_message if status_message else None,
-                        }
-                        if is_final or state in ["COMPLETED", "FAILED"]:
-                            if status_message:
-                                payload["content"] = status_message
-                        yield f"data: {json.dumps(payload)}\n\n"
-
-                    elif "id" in result and "status" in result:
-                        task_status = result["status"]
-                        state = task_status.get("state", "UNKNOWN")
-                        payload["event"] = {
-                            "type": "status",
-                            "taskId": result.get("id", ""),
-                            "state": state,
-                            "final": state in ["COMPLETED", "FAILED"],
-                        }
-                        if state in ["COMPLETED", "FAILED"]:
-                            if "message" in task_status and task_status["message"]:
-                                parts = task_status["message"].get("parts", [])
-                                content = _extract_text_from_parts(parts)
-                                if content:
-                                    payload["content"] = content
-                        yield f"data: {json.dumps(payload)}\n\n"
-
-                    elif "parts" in result:
-                        content = _extract_text_from_parts(result["parts"])
-                        message_id = result.get("messageId", "")
-                        payload["event"] = {
-                            "type": "status",
-                            "taskId": message_id,
-                            "state": "WORKING",
-                            "final": False,
-                            "message": content if content else None,
-                        }
-                        if content:
-                            payload["content"] = content
-                        yield f"data: {json.dumps(payload)}\n\n"
-
-                    else:
-                        logger.warning("Unknown result structure: keys=%s", list(result.keys()))
-
-                except json.JSONDecodeError as e:
-                    logger.warning("Failed to parse SSE data: %.200s, error: %s", data, e)
-                    continue
+            event, done = relay.translate(line)
+            if event is not None:
+                yield emit(event)
+            if done:
+                break
+        ended = True
 
     except httpx.RequestError as e:
         error_msg = f"Connection error: {str(e)}"
         logger.error(error_msg)
-        yield f"data: {json.dumps({'error': error_msg, 'session_id': session_id})}\n\n"
+        ended = True
+        yield emit(relay.error_event(error_msg))
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         logger.error(error_msg, exc_info=True)
-        yield f"data: {json.dumps({'error': error_msg, 'session_id': session_id})}\n\n"
+        ended = True
+        yield emit(relay.error_event(error_msg))
+    finally:
+        if run is not None:
+            run.finish(interrupted=not ended)
+        await response.aclose()
+        if tracking is not None:
+            await tracking.aclose()
+
+
+async def _passthrough_from_response(
+    response: httpx.Response,
+    session_id: str,
+    tracking: Optional[AsyncExitStack] = None,
+):
+    """Forward the agent's SSE stream unchanged, for clients that parse raw A2A events.
+
+    Bytes are relayed as received; chunks are only decoded when sidecars
+    need to observe them. Closes the response and ends ``tracking``.
+    """
+    fan_out = _sidecar_fan_out()
+    try:
+        if fan_out is None:
+            async for chunk in response.aiter_raw():
+                yield chunk
+            return
+        async for line in response.aiter_lines():
+            if line.startswith("data: ") and line != "data: [DONE]":
+                try:
+                    fan_out(session_id, sse_relay.loads(line[6:]))
+                except Exception:
+                    logger.debug("Sidecar fan-out failed", exc_info=True)
+            yield f"{line}\n"
+    except httpx.RequestError as e:
+        logger.error("Connection error: %s", e)
+        yield f"event: error\ndata: {sse_relay.dumps({'error': f'Connection error: {e}'})}\n\n"
     finally:
         await response.aclose()
-        await client.aclose()
+        if tracking is not None:
+            await tracking.aclose()
+
+
+class ChatRun(BaseModel):
+    """A chat stream that can be resumed or attached to."""
+
+    run_id: str
+    session_id: str
+    state: str  # running, completed, interrupted or cancelled
+    detached: bool
+    events: int
+    viewers: int
+    created_at: float
+
+
+def _can_read_run(run: StreamRun, namespace: str, user: TokenData) -> bool:
+    """Runs are readable by the user who started them, and by admins."""
+    return run.namespace == namespace and (
+        not run.username or run.username == user.username or user.has_role(ROLE_ADMIN)
+    )
+
+
+def _get_run(namespace: str, name: str, run_id: str, user: TokenData) -> StreamRun:
+    """Look up a run of this agent that ``user`` may read (its owner, or an admin)."""
+    run = get_stream_replay_store().get(run_id)
+    if run is None or run.agent_name != name or not _can_read_run(run, namespace, user):
+        raise HTTPException(
+            status_code=404,
+            detail="Stream is no longer resumable; reload the session history",
+        )
+    return run
+
+
+def _run_stream_response(run: StreamRun, after: int) -> StreamingResponse:
+    """Stream a run's events after ``after`` and follow it while it runs."""
+    return StreamingResponse(
+        run.replay(after),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Session-Id": run.session_id,
+            "X-Run-Id": run.run_id,
+        },
+    )
+
+
+def _resume_stream(
+    namespace: str, name: str, last_event_id: str, user: TokenData
+) -> StreamingResponse:
+    """Replay a chat stream after ``last_event_id`` and follow it while it runs."""
+    parsed = parse_event_id(last_event_id)
+    if parsed is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Stream is no longer resumable; reload the session history",
+        )
+    run = _get_run(namespace, name, parsed[0], user)
+    return _run_stream_response(run, parsed[1])
+
+
+@router.get(
+    "/{namespace}/{name}/stream",
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def resume_stream(
+    namespace: str,
+    name: str,
+    http_request: Request,
+    last_event_id: Optional[str] = Query(
+        default=None,
+        alias="lastEventId",
+        description="Resume after this event id when the Last-Event-ID header is not set",
+    ),
+    user: TokenData = Depends(get_required_user),
+):
+    """
+    Resume a chat stream started with POST /stream, without invoking the agent.
+
+    Sends the events after ``Last-Event-ID`` (header, as sent by EventSource
+    on reconnect, or the ``lastEventId`` query parameter) and then follows
+    the stream until it ends. Returns 404 once the stream has expired.
+    """
+    event_id = http_request.headers.get("Last-Event-ID") or last_event_id
+    if not event_id:
+        raise HTTPException(status_code=400, detail="Last-Event-ID is required")
+    return _resume_stream(namespace, name, event_id, user)
+
+
+@router.get(
+    "/{namespace}/{name}/runs",
+    response_model=List[ChatRun],
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def list_runs(
+    namespace: str,
+    name: str,
+    user: TokenData = Depends(get_required_user),
+) -> List[ChatRun]:
+    """List this agent's recent chat streams (all users' for admins), newest first."""
+    username = None if user.has_role(ROLE_ADMIN) else user.username
+    runs = get_stream_replay_store().list_runs(namespace, name, username)
+    return [ChatRun(**run.to_dict()) for run in runs]
+
+
+@router.get(
+    "/{namespace}/{name}/runs/{run_id}/stream",
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def attach_run(
+    namespace: str,
+    name: str,
+    run_id: str,
+    http_request: Request,
+    user: TokenData = Depends(get_required_user),
+):
+    """
+    Attach to a chat stream: its events from the start (or after the
+    ``Last-Event-ID`` header), then the live stream until the run ends.
+
+    Disconnecting only detaches this client; a detached run keeps going.
+    """
+    run = _get_run(namespace, name, run_id, user)
+    after = 0
+    parsed = parse_event_id(http_request.headers.get("Last-Event-ID", ""))
+    if parsed is not None and parsed[0] == run_id:
+        after = parsed[1]
+    return _run_stream_response(run, after)
+
+
+@router.delete(
+    "/{namespace}/{name}/runs/{run_id}",
+    status_code=204,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def cancel_run(
+    namespace: str,
+    name: str,
+    run_id: str,
+    user: TokenData = Depends(get_required_user),
+) -> Response:
+    """Stop a detached run; attached clients receive a final error event."""
+    run = _get_run(namespace, name, run_id, user)
+    await get_stream_replay_store().cancel(run)
+    return Response(status_code=204)
+
+
+class HistoryEvent(BaseModel):
+    """One persisted chat event (a row of the events table)."""
+
+    id: int
+    task_id: str
+    event_index: int
+    event_type: str
+    event_category: Optional[str] = None
+    langgraph_node: Optional[str] = None
+    payload: dict
+    created_at: Optional[str] = None
+
+
+class HistoryPage(BaseModel):
+    """A window of a session's events, oldest first."""
+
+    events: List[HistoryEvent]
+    has_more: bool  # more events in the paging direction
+
+
+class HistoryTurn(BaseModel):
+    """One turn (A2A task or stream run) of a session with its first events."""
+
+    task_id: str
+    events: List[HistoryEvent]
+    has_more: bool  # the turn has more events (see GET .../turns/{task_id}/events)
+
+
+class HistoryTurns(BaseModel):
+    """A session's turns, newest first."""
+
+    turns: List[HistoryTurn]
+    before: Optional[int] = None  # cursor for older turns; None when there are none
+
+
+class SessionSummary(BaseModel):
+    """One row of the sessions table."""
+
+    context_id: str
+    agent_name: str
+    title: str
+    owner: str
+    visibility: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: str
+    last_message_at: Optional[str] = None
+
+
+class SessionList(BaseModel):
+    """A page of sessions, most recently updated first."""
+
+    sessions: List[SessionSummary]
+    next_cursor: Optional[str] = None  # cursor for the next page; None on the last page
+
+
+@asynccontextmanager
+async def _session_connection(namespace: str):
+    """Connection to the namespace's session DB (HTTP 503 when it is unavailable)."""
+    try:
+        pool = await session_db.get_session_pool(namespace)
+    except Exception as e:
+        logger.error("Session database unavailable for namespace=%s: %s", namespace, e)
+        raise HTTPException(status_code=503, detail="Session database unavailable")
+    async with pool.acquire() as conn:
+        yield conn
+
+
+@asynccontextmanager
+async def _history_connection(namespace: str, session_id: str, user: TokenData):
+    """Connection to the namespace's session DB, after checking ``user`` may read the session."""
+    async with _session_connection(namespace) as conn:
+        if not await event_history.session_readable(
+            conn, session_id, user.username, user.has_role(ROLE_ADMIN)
+        ):
+            raise HTTPException(status_code=404, detail="Session not found")
+        yield conn
+
+
+@router.get(
+    "/{namespace}/sessions",
+    response_model=SessionList,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def list_sessions(
+    namespace: str,
+    owner: Optional[str] = Query(default=None, description="Only sessions of this owner"),
+    visibility: Optional[str] = Query(default=None, description="private or namespace"),
+    agent_name: Optional[str] = Query(default=None, description="Only sessions of this agent"),
+    search: Optional[str] = Query(default=None, max_length=200, description="Title substring"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page"),
+    limit: int = Query(
+        default=session_query.DEFAULT_PAGE_SIZE, ge=1, le=session_query.MAX_PAGE_SIZE
+    ),
+    user: TokenData = Depends(get_required_user),
+) -> SessionList:
+    """
+    The namespace's sessions visible to the user, most recently updated first.
+
+    Non-admins see their own sessions and shared ones. Pass the returned
+    ``next_cursor`` to load the next page.
+    """
+    async with _session_connection(namespace) as conn:
+        try:
+            sessions, next_cursor = await session_query.list_sessions(
+                conn,
+                namespace,
+                user.username,
+                user.has_role(ROLE_ADMIN),
+                owner=owner,
+                visibility=visibility,
+                agent_name=agent_name,
+                search=search,
+                cursor=cursor,
+                limit=limit,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return SessionList(sessions=sessions, next_cursor=next_cursor)
+
+
+@router.get(
+    "/{namespace}/sessions/{session_id}/events",
+    response_model=HistoryPage,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def get_session_events(
+    namespace: str,
+    session_id: str,
+    after: Optional[int] = Query(default=None, description="Events after this event id"),
+    before: Optional[int] = Query(default=None, description="Events before this event id"),
+    limit: int = Query(
+        default=event_history.DEFAULT_PAGE_SIZE, ge=1, le=event_history.MAX_PAGE_SIZE
+    ),
+    user: TokenData = Depends(get_required_user),
+) -> HistoryPage:
+    """
+    A window of a session's persisted events, oldest first.
+
+    Without a cursor this is the newest ``limit`` events. Page backwards
+    with ``before`` (the first event's ``id``) or forwards with ``after``
+    (the last event's ``id``); ``has_more`` tells whether that direction
+    has more events.
+    """
+    async with _history_connection(namespace, session_id, user) as conn:
+        events, has_more = await event_history.events_page(
+            conn, session_id, after=after, before=before, limit=limit
+        )
+    return HistoryPage(events=events, has_more=has_more)
+
+
+@router.get(
+    "/{namespace}/sessions/{session_id}/turns",
+    response_model=HistoryTurns,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def get_session_turns(
+    namespace: str,
+    session_id: str,
+    before: Optional[int] = Query(default=None, description="Cursor from a previous page"),
+    limit: int = Query(default=event_history.DEFAULT_TURNS, ge=1, le=event_history.MAX_TURNS),
+    events_per_turn: int = Query(
+        default=event_history.DEFAULT_PAGE_SIZE, ge=1, le=event_history.MAX_PAGE_SIZE
+    ),
+    user: TokenData = Depends(get_required_user),
+) -> HistoryTurns:
+    """
+    A session's turns, newest first, each with its first ``events_per_turn`` events.
+
+    Pass the returned ``before`` cursor to load older turns.
+    """
+    async with _history_connection(namespace, session_id, user) as conn:
+        turns, cursor = await event_history.latest_turns(
+            conn, session_id, before=before, limit=limit, events_per_turn=events_per_turn
+        )
+    return HistoryTurns(turns=turns, before=cursor)
+
+
+@router.get(
+    "/{namespace}/sessions/{session_id}/turns/{task_id}/events",
+    response_model=HistoryPage,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def get_turn_events(
+    namespace: str,
+    session_id: str,
+    task_id: str,
+    after: int = Query(default=0, ge=0, description="Events after this event_index"),
+    limit: int = Query(
+        default=event_history.DEFAULT_PAGE_SIZE, ge=1, le=event_history.MAX_PAGE_SIZE
+    ),
+    user: TokenData = Depends(get_required_user),
+) -> HistoryPage:
+    """The events of one turn in order, paged by ``event_index``."""
+    async with _history_connection(namespace, session_id, user) as conn:
+        events, has_more = await event_history.turn_events(
+            conn, session_id, task_id, after=after, limit=limit
+        )
+    return HistoryPage(events=events, has_more=has_more)
 
 
 @router.post("/{namespace}/{name}/stream", dependencies=[Depends(require_roles(ROLE_OPERATOR))])
@@ -471,8 +871,16 @@ async def stream_message(
     name: str,
     request: ChatRequest,
     http_request: Request,
+    passthrough: bool = Query(
+        default=False,
+        description="Forward the agent's raw A2A SSE events instead of translated chat events",
+    ),
+    detach: bool = Query(
+        default=False,
+        description="Run the agent stream in the background, independent of this connection",
+    ),
     user: TokenData = Depends(get_required_user),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ):
     """
     Send a message to an A2A agent and stream the response.
@@ -485,70 +893,134 @@ async def stream_message(
 
     Returns HTTP 401 directly when the agent rejects the token, enabling
     the frontend to trigger token refresh and retry transparently.
-    """
-    agent_url = resolve_agent_url(name, namespace, kube)
-    session_id = request.session_id or uuid4().hex
-
-    # Extract Authorization header if present
-    authorization = http_request.headers.get("Authorization")
-
-    # Pre-flight: open the streaming connection and check for auth errors
-    # before committing to the StreamingResponse (which locks HTTP 200).
-    # This allows the frontend to see a real HTTP 401 and trigger token
-    # refresh (e.g., when a new agent's audience scope was added after login).
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "text/event-stream",
-    }
-    if authorization:
-        headers["Authorization"] = authorization
 
-    # See /send handler: forward the client's session_id as params.contextId
-    # so multi-turn conversations stay in one A2A context.
-    stream_params: dict = {
-        "message": {
-            "role": "user",
-            "parts": [{"kind": "text", "text": request.message}],
-            "messageId": uuid4().hex,
-        },
-    }
-    if request.session_id:
-        stream_params["contextId"] = request.session_id
+    Every translated event carries an SSE id. A request with a
+    ``Last-Event-ID`` header resumes that stream instead of sending the
+    message again (see GET /stream). The agent stream is kept open for
+    ``chat_stream_grace`` seconds after the client disconnects, so it can
+    be resumed without losing events.
 
-    message_payload = {
-        "jsonrpc": "2.0",
-        "id": str(uuid4()),
-        "method": "message/stream",
-        "params": stream_params,
-    }
+    With ``detach=true`` the backend consumes the agent stream to the end
+    in a background task; this response is just the first attached client
+    (see GET /runs/{run_id}/stream), and disconnecting does not stop the run.
 
-    client = httpx.AsyncClient(timeout=120.0)
+    With ``passthrough=true`` the agent's SSE stream is relayed byte for
+    byte; the session id is returned in the ``X-Session-Id`` header.
+    Passthrough streams are not resumable and cannot be detached.
+    """
+    if passthrough and detach:
+        raise HTTPException(status_code=400, detail="Passthrough streams cannot be detached")
+    last_event_id = http_request.headers.get("Last-Event-ID")
+    if last_event_id and not passthrough:
+        return _resume_stream(namespace, name, last_event_id, user)
+
+    store = get_stream_replay_store()
+    # Hold a slot while the agent is being connected, so concurrent requests
+    # cannot all pass the limit before any of them is detached.
+    if detach and not store.reserve_detached(settings.chat_max_detached_runs):
+        raise HTTPException(status_code=429, detail="Too many background agent runs")
     try:
-        response = await client.send(
-            client.build_request("POST", agent_url, json=message_payload, headers=headers),
-            stream=True,
-        )
-    except httpx.RequestError as e:
-        await client.aclose()
-        logger.error("Cannot connect to agent at %s: %s", agent_url, e)
-        raise HTTPException(status_code=503, detail="Cannot connect to agent")
-
-    if response.status_code == 401:
-        await response.aclose()
-        await client.aclose()
-        raise HTTPException(status_code=401, detail="Agent rejected token (audience mismatch)")
+        agent_url = await kube.run(resolve_agent_url, name, namespace, kube.sync)
+        session_id = request.session_id or uuid4().hex
+
+        # Extract Authorization header if present
+        authorization = http_request.headers.get("Authorization")
+
+        # Pre-flight: open the streaming connection and check for auth errors
+        # before committing to the StreamingResponse (which locks HTTP 200).
+        # This allows the frontend to see a real HTTP 401 and trigger token
+        # refresh (e.g., when a new agent's audience scope was added after login).
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream",
+        }
+        if authorization:
+            headers["Authorization"] = authorization
+
+        # See /send handler: forward the client's session_id as params.contextId
+        # so multi-turn conversations stay in one A2A context.
+        stream_params: dict = {
+            "message": {
+                "role": "user",
+                "parts": [{"kind": "text", "text": request.message}],
+                "messageId": uuid4().hex,
+            },
+        }
+        if request.session_id:
+            stream_params["contextId"] = request.session_id
+
+        message_payload = {
+            "jsonrpc": "2.0",
+            "id": str(uuid4()),
+            "method": "message/stream",
+            "params": stream_params,
+        }
+
+        agent_http = get_agent_http_clients()
+        client = agent_http.client_for(agent_url)
+        try:
+            # The request stays tracked until the stream generator has read the body
+            async with AsyncExitStack() as stack:
+                await stack.enter_async_context(agent_http.track(agent_url))
+                response = await client.send(
+                    client.build_request(
+                        "POST",
+                        agent_url,
+                        json=message_payload,
+                        headers=headers,
+                        timeout=settings.agent_stream_timeout,
+                    ),
+                    stream=True,
+                )
+                tracking = stack.pop_all()
+        except httpx.RequestError as e:
+            logger.error("Cannot connect to agent at %s: %s", agent_url, e)
+            raise HTTPException(status_code=503, detail="Cannot connect to agent")
+
+        if response.status_code == 401:
+            await response.aclose()
+            await tracking.aclose()
+            raise HTTPException(status_code=401, detail="Agent rejected token (audience mismatch)")
+
+        if passthrough:
+            if response.status_code >= 400:
+                # Raw A2A clients get the failure as an HTTP error, not a 200 stream
+                await response.aclose()
+                await tracking.aclose()
+                logger.error("Agent error: %d", response.status_code)
+                raise HTTPException(status_code=502, detail=f"Agent error: {response.status_code}")
+            return StreamingResponse(
+                _passthrough_from_response(response, session_id, tracking),
+                media_type="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                    "X-Session-Id": session_id,
+                },
+            )
 
-    return StreamingResponse(
-        _stream_from_response(
-            client,
+        run = store.create(
+            session_id,
+            namespace,
+            name,
+            user.username,
+            persist=settings.chat_persist_events or (detach and settings.chat_run_persist_events),
+        )
+        events = _stream_from_response(
             response,
             session_id,
             user.username,
             caller_supplied_session_id=bool(request.session_id),
-        ),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            run=run,
+            tracking=tracking,
+        )
+        # The run consumes the agent stream itself, so a client that loses its
+        # connection can resume (Last-Event-ID) without the rest being lost.
+        if detach:
+            store.detach(run, events)
+        else:
+            store.follow(run, events, settings.chat_stream_grace)
+        return _run_stream_response(run, 0)
+    finally:
+        if detach:
+            store.release_detached()
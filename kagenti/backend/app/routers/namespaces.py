@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Query
 
 from app.core.auth import require_roles, ROLE_VIEWER
 from app.models.responses import NamespaceListResponse
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kubernetes_async import AsyncKubernetesService, get_async_kubernetes_service
 
 router = APIRouter(prefix="/namespaces", tags=["namespaces"])
 
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/namespaces", tags=["namespaces"])
 )
 async def list_namespaces(
     enabled_only: bool = Query(default=True, description="Only return enabled namespaces"),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> NamespaceListResponse:
     """
     List available Kubernetes namespaces.
@@ -27,8 +27,8 @@ async def list_namespaces(
     If enabled_only is True, returns only namespaces with the kagenti-enabled=true label.
     """
     if enabled_only:
-        namespaces = kube.list_enabled_namespaces()
+        namespaces = await kube.list_enabled_namespaces()
     else:
-        namespaces = kube.list_namespaces()
+        namespaces = await kube.list_namespaces()
 
     return NamespaceListResponse(namespaces=namespaces)
@@ -18,7 +18,7 @@ from app.core.constants import (
     SHIPWRIGHT_BUILDS_LIST_SCOPE_ALL,
 )
 from app.models.shipwright import ShipwrightBuildListResponse
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kubernetes_async import AsyncKubernetesService, get_async_kubernetes_service
 from app.services.shipwright_builds import collect_kagenti_shipwright_builds
 
 logger = logging.getLogger(__name__)
@@ -53,7 +53,7 @@ async def list_shipwright_builds(
         alias="for",
         description="List builds for agents only, tools only, or both (agents | tools | all)",
     ),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ShipwrightBuildListResponse:
     """
     List Shipwright Build CRs created for Kagenti agents and/or tools.
@@ -62,7 +62,7 @@ async def list_shipwright_builds(
     """
     namespaces_to_scan: List[str] = []
     if all_namespaces:
-        namespaces_to_scan = kube.list_enabled_namespaces()
+        namespaces_to_scan = await kube.list_enabled_namespaces()
     else:
         if not namespace or not namespace.strip():
             raise HTTPException(
@@ -72,8 +72,12 @@ async def list_shipwright_builds(
         namespaces_to_scan = [namespace.strip()]
 
     try:
-        items = collect_kagenti_shipwright_builds(
-            kube, namespaces_to_scan, _SHIPWRIGHT_BUILDS_FOR_QUERY[builds_for], logger
+        items = await kube.run(
+            collect_kagenti_shipwright_builds,
+            kube.sync,
+            namespaces_to_scan,
+            _SHIPWRIGHT_BUILDS_FOR_QUERY[builds_for],
+            logger,
         )
     except ApiException as e:
         raise HTTPException(status_code=e.status, detail=str(e.reason))
@@ -29,7 +29,8 @@ from app.core.constants import (
     APP_KUBERNETES_IO_MANAGED_BY,
     APP_KUBERNETES_IO_NAME,
 )
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kubernetes import KubernetesService
+from app.services.kubernetes_async import AsyncKubernetesService, get_async_kubernetes_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/skills", tags=["skills"])
@@ -261,7 +262,7 @@ async def list_skills(
     q: Optional[str] = Query(
         None, description="Search query (keyword match over name, description, content)"
     ),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> SkillListResponse:
     """List skills (ConfigMaps labeled as skills) in a namespace.
 
@@ -269,7 +270,7 @@ async def list_skills(
     the name, description, category, and SKILL.md content.
     """
     try:
-        cms = kube.core_api.list_namespaced_config_map(
+        cms = await kube.list_configmaps(
             namespace=namespace,
             label_selector=f"{SKILL_TYPE_LABEL}={SKILL_TYPE_VALUE}",
         )
@@ -282,7 +283,7 @@ async def list_skills(
         raise HTTPException(status_code=exc.status or 500, detail=str(exc))
 
     skills_with_content = []
-    for cm in cms.items:
+    for cm in cms:
         data = cm.data or {}
 
         # Try to get SKILL.md - check both original and sanitized keys
@@ -324,10 +325,10 @@ async def list_skills(
 async def get_skill(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> SkillDetail:
     """Get detailed information about a specific skill, including SKILL.md content."""
-    cm = _get_cm(kube, namespace, name)
+    cm = await kube.run(_get_cm, kube.sync, namespace, name)
     return _configmap_to_skill_detail(cm)
 
 
@@ -338,7 +339,7 @@ async def get_skill(
 )
 async def create_skill(
     request: CreateSkillRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> CreateSkillResponse:
     """Create a new skill from files or URL.
 
@@ -404,7 +405,9 @@ async def create_skill(
     }
 
     try:
-        kube.core_api.create_namespaced_config_map(namespace=request.namespace, body=body)
+        await kube.run(
+            kube.sync.core_api.create_namespaced_config_map, namespace=request.namespace, body=body
+        )
         return CreateSkillResponse(
             success=True,
             name=display_name,
@@ -433,17 +436,19 @@ async def create_skill(
 async def increment_usage(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> Skill:
     """Increment the usage count for a skill."""
-    cm = _get_cm(kube, namespace, name)
+    cm = await kube.run(_get_cm, kube.sync, namespace, name)
     annos = cm.metadata.annotations or {}
     try:
         current = int(annos.get(SKILL_USAGE_ANNOTATION, "0"))
     except Exception:
         current = 0
-    _patch_annotations(kube, namespace, name, {SKILL_USAGE_ANNOTATION: str(current + 1)})
-    cm = _get_cm(kube, namespace, name)
+    await kube.run(
+        _patch_annotations, kube.sync, namespace, name, {SKILL_USAGE_ANNOTATION: str(current + 1)}
+    )
+    cm = await kube.run(_get_cm, kube.sync, namespace, name)
     return _configmap_to_skill(cm)
 
 
@@ -456,10 +461,10 @@ async def get_skill_file(
     namespace: str,
     name: str,
     file_path: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> SkillFile:
     """Get a specific file from a skill."""
-    cm = _get_cm(kube, namespace, name)
+    cm = await kube.run(_get_cm, kube.sync, namespace, name)
     data = cm.data or {}
     annos = cm.metadata.annotations or {}
 
@@ -498,12 +503,14 @@ async def get_skill_file(
 async def delete_skill(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> dict:
     """Delete a skill (ConfigMap) from the cluster."""
     cm_name = _sanitize_k8s_name(name)
     try:
-        kube.core_api.delete_namespaced_config_map(name=cm_name, namespace=namespace)
+        await kube.run(
+            kube.sync.core_api.delete_namespaced_config_map, name=cm_name, namespace=namespace
+        )
         return {
             "success": True,
             "message": f"Skill '{name}' deleted successfully",
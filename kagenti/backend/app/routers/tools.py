@@ -6,21 +6,27 @@
 Tool API endpoints.
 """
 
+import asyncio
+import functools
 import logging
+import json
 import re
-from typing import Any, Dict, List, Literal, Optional
-from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from kubernetes.client import ApiException
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
-from pydantic import BaseModel, field_validator
+from mcp.shared.exceptions import McpError
+from pydantic import BaseModel, Field, field_validator
 
 from app.core.auth import ROLE_OPERATOR, ROLE_VIEWER, require_roles
 from app.core.config import settings
 from app.core.constants import (
+    CONTINUE_TOKEN_EXPIRED_DETAIL,
+    DEFAULT_LIST_PAGE_LIMIT,
+    MAX_LIST_PAGE_LIMIT,
     KAGENTI_TYPE_LABEL,
     PROTOCOL_LABEL_PREFIX,
     KAGENTI_FRAMEWORK_LABEL,
@@ -71,7 +77,21 @@ from app.models.shipwright import (
     ResourceConfigFromBuild,
     ShipwrightBuildListResponse,
 )
-from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kubernetes import KubernetesService
+from app.services.mcp_sessions import (
+    McpPoolExhaustedError,
+    get_mcp_session_pool,
+    session_gone,
+)
+from app.services.tool_catalog import get_tool_catalog
+from app.services.kubernetes_async import (
+    AsyncKubernetesService,
+    as_async,
+    gather_with_deadline,
+    get_async_kubernetes_service,
+    list_page_across_kinds,
+    workload_generation,
+)
 from app.services.shipwright_builds import collect_kagenti_shipwright_builds
 from app.services.shipwright import (
     build_shipwright_build_manifest,
@@ -93,6 +113,7 @@ from app.utils.routes import (
 from app.routers.agents import (
     _ensure_authbridge_configmaps,
     _ensure_authproxy_routes,
+    _list_error_to_http,
     OutboundRoute,
 )
 
@@ -321,6 +342,23 @@ class MCPToolsResponse(BaseModel):
     tools: List[MCPToolSchema]
 
 
+class ToolCatalogItem(BaseModel):
+    """A tool exposed by an MCP server, as recorded in the tool catalog."""
+
+    namespace: str
+    server: str
+    tool: MCPToolSchema
+    fetchedAt: str
+
+
+class ToolCatalogResponse(BaseModel):
+    """Tools matching a catalog search."""
+
+    items: List[ToolCatalogItem]
+    # Tool servers with a cached tool list (servers never connected to are absent)
+    serversIndexed: int
+
+
 class MCPInvokeRequest(BaseModel):
     """Request to invoke an MCP tool."""
 
@@ -334,6 +372,16 @@ class MCPInvokeResponse(BaseModel):
     result: Any
 
 
+class MCPBatchInvokeRequest(BaseModel):
+    """Request to invoke several MCP tools over one session."""
+
+    calls: List[MCPInvokeRequest] = Field(..., min_length=1)
+    # Calls in flight at once (capped by MCP_BATCH_MAX_CONCURRENCY)
+    concurrency: Optional[int] = Field(default=None, ge=1)
+    # Seconds allowed for each call (default MCP_BATCH_CALL_TIMEOUT)
+    timeout: Optional[float] = Field(default=None, gt=0)
+
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tools", tags=["tools"])
 
@@ -595,12 +643,12 @@ async def list_tool_shipwright_builds(
         alias="allNamespaces",
         description="If true, list builds in all kagenti-enabled namespaces",
     ),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ShipwrightBuildListResponse:
     """List Shipwright Build resources for tools only (kagenti.io/type=tool)."""
     namespaces_to_scan: List[str] = []
     if all_namespaces:
-        namespaces_to_scan = kube.list_enabled_namespaces()
+        namespaces_to_scan = await kube.list_enabled_namespaces()
     else:
         if not namespace or not namespace.strip():
             raise HTTPException(
@@ -610,8 +658,12 @@ async def list_tool_shipwright_builds(
         namespaces_to_scan = [namespace.strip()]
 
     try:
-        items = collect_kagenti_shipwright_builds(
-            kube, namespaces_to_scan, RESOURCE_TYPE_TOOL, logger
+        items = await kube.run(
+            collect_kagenti_shipwright_builds,
+            kube.sync,
+            namespaces_to_scan,
+            RESOURCE_TYPE_TOOL,
+            logger,
         )
     except ApiException as e:
         raise HTTPException(status_code=e.status, detail=str(e.reason))
@@ -619,91 +671,159 @@ async def list_tool_shipwright_builds(
     return ShipwrightBuildListResponse(items=items)
 
 
+@router.get(
+    "/catalog",
+    response_model=ToolCatalogResponse,
+    dependencies=[Depends(require_roles(ROLE_VIEWER))],
+)
+async def search_tool_catalog(
+    q: str = Query(default="", description="Tool name (or name/description substring)"),
+    exact: bool = Query(default=False, description="Match the tool name exactly"),
+    namespace: str = Query(
+        default="", description="Limit to one namespace (default: all kagenti-enabled)"
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+) -> ToolCatalogResponse:
+    """
+    Search the cluster-wide MCP tool catalog.
+
+    Answers "which tool servers expose tool X" from the catalog cache without
+    dialing any server. Only servers that have been connected to at least once
+    are indexed.
+    """
+    if namespace.strip():
+        namespaces = [namespace.strip()]
+    else:
+        namespaces = await kube.list_enabled_namespaces()
+
+    catalog = get_tool_catalog()
+    items = [
+        ToolCatalogItem(
+            namespace=entry.namespace,
+            server=entry.name,
+            tool=MCPToolSchema(**tool),
+            fetchedAt=datetime.fromtimestamp(entry.fetched_at, tz=timezone.utc).isoformat(),
+        )
+        for entry, tool in catalog.search(q, namespaces=namespaces, exact=exact)
+    ]
+    indexed = sum(1 for entry in catalog.entries() if entry.namespace in set(namespaces))
+    return ToolCatalogResponse(items=items, serversIndexed=indexed)
+
+
+def _workload_tool_summary(workload: dict, workload_type: str, namespace: str) -> ToolSummary:
+    """Build a ToolSummary from a tool Deployment or StatefulSet."""
+    metadata = workload.get("metadata", {})
+    annotations = metadata.get("annotations", {})
+    return ToolSummary(
+        name=metadata.get("name", ""),
+        namespace=metadata.get("namespace", namespace),
+        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
+        status=_get_workload_status(workload),
+        labels=_extract_labels(metadata.get("labels", {})),
+        createdAt=_format_timestamp(
+            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
+        ),
+        workloadType=workload_type,
+    )
+
+
 @router.get("", response_model=ToolListResponse, dependencies=[Depends(require_roles(ROLE_VIEWER))])
 async def list_tools(
     namespace: str = Query(default="default", description="Kubernetes namespace"),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    all_namespaces: bool = Query(
+        default=False,
+        alias="allNamespaces",
+        description="If true, list tools in all kagenti-enabled namespaces (paginated)",
+    ),
+    limit: int = Query(
+        default=DEFAULT_LIST_PAGE_LIMIT,
+        ge=1,
+        le=MAX_LIST_PAGE_LIMIT,
+        description="Page size in allNamespaces mode",
+    ),
+    continue_token: Optional[str] = Query(
+        default=None,
+        alias="continue",
+        description="continueToken from the previous page (allNamespaces mode)",
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ToolListResponse:
     """
     List all MCP tools in the specified namespace.
 
     Returns tools that have the kagenti.io/type=tool label.
-    Queries both Deployments and StatefulSets.
+    Queries both Deployments and StatefulSets, concurrently. Kinds that fail
+    are named in ``failedKinds``; the request only fails when every kind does.
 
+    With ``allNamespaces=true`` each kind is listed with a single cluster-scoped,
+    label-selected call, results are grouped by namespace, and at most ``limit``
+    items are returned per page. Pass ``continueToken`` back as ``continue`` to
+    fetch the next page.
     """
-    try:
-        label_selector = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}"
-        tools = []
-        existing_names = set()  # Track names to avoid duplicates with legacy CRDs
+    label_selector = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}"
 
-        # Query Deployments with tool label
-        try:
-            deployments = kube.list_deployments(namespace, label_selector)
-            for deploy in deployments:
-                metadata = deploy.get("metadata", {})
-                annotations = metadata.get("annotations", {})
-                name = metadata.get("name", "")
-                existing_names.add(name)
-
-                tools.append(
-                    ToolSummary(
-                        name=name,
-                        namespace=metadata.get("namespace", namespace),
-                        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
-                        status=_get_workload_status(deploy),
-                        labels=_extract_labels(metadata.get("labels", {})),
-                        createdAt=_format_timestamp(
-                            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                        ),
-                        workloadType=WORKLOAD_TYPE_DEPLOYMENT,
-                    )
-                )
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Error listing Deployments: {e}")
-
-        # Query StatefulSets with tool label
+    if all_namespaces:
+        calls = {
+            WORKLOAD_TYPE_DEPLOYMENT: functools.partial(
+                kube.list_deployments_all_namespaces, label_selector=label_selector
+            ),
+            WORKLOAD_TYPE_STATEFULSET: functools.partial(
+                kube.list_statefulsets_all_namespaces, label_selector=label_selector
+            ),
+        }
         try:
-            statefulsets = kube.list_statefulsets(namespace, label_selector)
-            for sts in statefulsets:
-                metadata = sts.get("metadata", {})
-                annotations = metadata.get("annotations", {})
-                name = metadata.get("name", "")
-                existing_names.add(name)
-
-                tools.append(
-                    ToolSummary(
-                        name=name,
-                        namespace=metadata.get("namespace", namespace),
-                        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
-                        status=_get_workload_status(sts),
-                        labels=_extract_labels(metadata.get("labels", {})),
-                        createdAt=_format_timestamp(
-                            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                        ),
-                        workloadType=WORKLOAD_TYPE_STATEFULSET,
-                    )
-                )
+            enabled_namespaces = set(await kube.list_enabled_namespaces())
+            results, next_token = await list_page_across_kinds(calls, limit, continue_token)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Error listing StatefulSets: {e}")
-
-        return ToolListResponse(items=tools)
+            raise _list_error_to_http(e)
+    else:
+        results = await gather_with_deadline(
+            {
+                WORKLOAD_TYPE_DEPLOYMENT: kube.list_deployments(namespace, label_selector),
+                WORKLOAD_TYPE_STATEFULSET: kube.list_statefulsets(namespace, label_selector),
+            }
+        )
+        enabled_namespaces = None
+        next_token = None
+
+    tools = []
+    errors: List[ApiException] = []
+    failed_kinds: List[str] = []
+    queried = len(results)
+    for kind, result in results.items():
+        if isinstance(result, ApiException):
+            if result.status == 410:
+                raise HTTPException(status_code=410, detail=CONTINUE_TOKEN_EXPIRED_DETAIL)
+            if result.status == 404:
+                queried -= 1
+            else:
+                logger.warning(f"Error listing {kind} tools: {result}")
+                errors.append(result)
+                failed_kinds.append(kind)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        for workload in result:
+            summary = _workload_tool_summary(workload, kind, namespace)
+            if enabled_namespaces is not None and summary.namespace not in enabled_namespaces:
+                continue
+            tools.append(summary)
+
+    if errors and len(errors) == queried:
+        raise _list_error_to_http(errors[0])
 
-    except ApiException as e:
-        if e.status == 403:
-            raise HTTPException(
-                status_code=403,
-                detail="Permission denied. Check RBAC configuration.",
-            )
-        raise HTTPException(status_code=e.status, detail=str(e.reason))
+    if all_namespaces:
+        tools.sort(key=lambda t: (t.namespace, t.name))
+    return ToolListResponse(items=tools, failedKinds=failed_kinds, continueToken=next_token)
 
 
 @router.get("/{namespace}/{name}", dependencies=[Depends(require_roles(ROLE_VIEWER))])
 async def get_tool(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> Any:
     """Get detailed information about a specific tool.
 
@@ -715,7 +835,7 @@ async def get_tool(
 
     # Try Deployment first
     try:
-        workload = kube.get_deployment(namespace, name)
+        workload = await kube.get_deployment(namespace, name)
         workload_type = WORKLOAD_TYPE_DEPLOYMENT
     except ApiException as e:
         if e.status != 404:
@@ -724,7 +844,7 @@ async def get_tool(
     # Try StatefulSet if Deployment not found
     if workload is None:
         try:
-            workload = kube.get_statefulset(namespace, name)
+            workload = await kube.get_statefulset(namespace, name)
             workload_type = WORKLOAD_TYPE_STATEFULSET
         except ApiException as e:
             if e.status == 404:
@@ -738,7 +858,7 @@ async def get_tool(
     service_info = None
     service_name = _get_tool_service_name(name)
     try:
-        service = kube.get_service(namespace, service_name)
+        service = await kube.get_service(namespace, service_name)
         # Transform raw K8s Service to ServiceInfo format expected by frontend
         service_info = {
             "name": service.get("metadata", {}).get("name"),
@@ -766,10 +886,10 @@ async def get_tool(
 async def get_tool_route_status(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> dict:
     """Check if an HTTPRoute or Route exists for the tool."""
-    exists = route_exists(kube, name, namespace)
+    exists = await kube.run(route_exists, kube.sync, name, namespace)
     return {"hasRoute": exists}
 
 
@@ -781,7 +901,7 @@ async def get_tool_route_status(
 async def delete_tool(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> DeleteResponse:
     """Delete a tool and associated resources from the cluster.
 
@@ -796,7 +916,7 @@ async def delete_tool(
 
     # Delete BuildRuns first (they reference the Build)
     try:
-        buildruns = kube.list_custom_resources(
+        buildruns = await kube.list_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -807,7 +927,7 @@ async def delete_tool(
             br_name = buildrun.get("metadata", {}).get("name")
             if br_name:
                 try:
-                    kube.delete_custom_resource(
+                    await kube.delete_custom_resource(
                         group=SHIPWRIGHT_CRD_GROUP,
                         version=SHIPWRIGHT_CRD_VERSION,
                         namespace=namespace,
@@ -822,7 +942,7 @@ async def delete_tool(
 
     # Delete Shipwright Build
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -836,7 +956,7 @@ async def delete_tool(
 
     # Delete Deployment (if exists)
     try:
-        kube.delete_deployment(namespace, name)
+        await kube.delete_deployment(namespace, name)
         deleted_resources.append(f"Deployment/{name}")
     except ApiException as e:
         if e.status != 404:
@@ -844,7 +964,7 @@ async def delete_tool(
 
     # Delete StatefulSet (if exists)
     try:
-        kube.delete_statefulset(namespace, name)
+        await kube.delete_statefulset(namespace, name)
         deleted_resources.append(f"StatefulSet/{name}")
     except ApiException as e:
         if e.status != 404:
@@ -853,7 +973,7 @@ async def delete_tool(
     # Delete Service
     service_name = _get_tool_service_name(name)
     try:
-        kube.delete_service(namespace, service_name)
+        await kube.delete_service(namespace, service_name)
         deleted_resources.append(f"Service/{service_name}")
     except ApiException as e:
         if e.status != 404:
@@ -861,7 +981,7 @@ async def delete_tool(
 
     # Delete the HTTPRoute (if exists)
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group="gateway.networking.k8s.io",
             version="v1",
             namespace=namespace,
@@ -875,7 +995,7 @@ async def delete_tool(
 
     # Delete the OpenShift Route (if exists)
     try:
-        kube.delete_custom_resource(
+        await kube.delete_custom_resource(
             group="route.openshift.io",
             version="v1",
             namespace=namespace,
@@ -887,6 +1007,8 @@ async def delete_tool(
         if e.status != 404:
             logger.warning(f"Failed to delete Route '{name}': {e}")
 
+    get_tool_catalog().remove(namespace, name)
+
     if deleted_resources:
         return DeleteResponse(
             success=True,
@@ -1374,7 +1496,7 @@ def _get_tool_service_name(name: str) -> str:
 )
 async def create_tool(
     request: CreateToolRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> CreateToolResponse:
     """
     Create a new MCP tool.
@@ -1408,11 +1530,13 @@ async def create_tool(
                 )
 
             # Step 1: Create Shipwright Build CR
-            clone_secret = resolve_clone_secret(kube.core_api, request.namespace)
+            clone_secret = await kube.run(
+                resolve_clone_secret, kube.sync.core_api, request.namespace
+            )
             build_manifest = _build_tool_shipwright_build_manifest(
                 request, clone_secret_name=clone_secret
             )
-            kube.create_custom_resource(
+            await kube.create_custom_resource(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -1430,7 +1554,7 @@ async def create_tool(
                 namespace=request.namespace,
                 labels=build_labels,
             )
-            created_buildrun = kube.create_custom_resource(
+            created_buildrun = await kube.create_custom_resource(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -1480,17 +1604,19 @@ async def create_tool(
 
             # Ensure a dedicated ServiceAccount exists so the webhook's
             # SPIFFE identity uses the workload name, not the ReplicaSet hash.
-            kube.ensure_service_account(namespace=request.namespace, name=request.name)
+            await kube.ensure_service_account(namespace=request.namespace, name=request.name)
 
             if request.authBridgeEnabled:
-                _ensure_authbridge_configmaps(
-                    kube=kube,
+                await kube.run(
+                    _ensure_authbridge_configmaps,
+                    kube=kube.sync,
                     namespace=request.namespace,
                     spire_enabled=request.spireEnabled,
                 )
                 if request.outboundRoutes:
-                    _ensure_authproxy_routes(
-                        kube=kube,
+                    await kube.run(
+                        _ensure_authproxy_routes,
+                        kube=kube.sync,
                         namespace=request.namespace,
                         routes=request.outboundRoutes,
                     )
@@ -1498,7 +1624,7 @@ async def create_tool(
                     extra = {
                         "DEFAULT_OUTBOUND_POLICY": request.defaultOutboundPolicy,
                     }
-                    kube.upsert_configmap(
+                    await kube.upsert_configmap(
                         namespace=request.namespace,
                         name="authbridge-config",
                         data=extra,
@@ -1530,7 +1656,7 @@ async def create_tool(
                     outbound_ports_exclude=request.outboundPortsExclude,
                     inbound_ports_exclude=request.inboundPortsExclude,
                 )
-                kube.create_statefulset(request.namespace, workload_manifest)
+                await kube.create_statefulset(request.namespace, workload_manifest)
                 logger.info(
                     f"Created StatefulSet '{request.name}' for tool in namespace '{request.namespace}'"
                 )
@@ -1554,7 +1680,7 @@ async def create_tool(
                     outbound_ports_exclude=request.outboundPortsExclude,
                     inbound_ports_exclude=request.inboundPortsExclude,
                 )
-                kube.create_deployment(request.namespace, workload_manifest)
+                await kube.create_deployment(request.namespace, workload_manifest)
                 logger.info(
                     f"Created Deployment '{request.name}' for tool in namespace '{request.namespace}'"
                 )
@@ -1565,7 +1691,7 @@ async def create_tool(
                 namespace=request.namespace,
                 service_ports=service_ports,
             )
-            kube.create_service(request.namespace, service_manifest)
+            await kube.create_service(request.namespace, service_manifest)
             service_name = _get_tool_service_name(request.name)
             logger.info(
                 f"Created Service '{service_name}' for tool in namespace '{request.namespace}'"
@@ -1580,8 +1706,9 @@ async def create_tool(
                     service_ports,
                     default_port=DEFAULT_IN_CLUSTER_PORT,
                 )
-                create_route_for_agent_or_tool(
-                    kube=kube,
+                await kube.run(
+                    create_route_for_agent_or_tool,
+                    kube=kube.sync,
                     name=request.name,
                     namespace=request.namespace,
                     service_name=service_name,
@@ -1622,7 +1749,7 @@ async def create_tool(
 async def get_tool_shipwright_build_info(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> ToolShipwrightBuildInfoResponse:
     """Get full Shipwright Build information including tool config and BuildRun status.
 
@@ -1633,7 +1760,7 @@ async def get_tool_shipwright_build_info(
     """
     try:
         # Get the Build resource
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1671,7 +1798,7 @@ async def get_tool_shipwright_build_info(
 
         # Try to get the latest BuildRun
         try:
-            items = kube.list_custom_resources(
+            items = await kube.list_custom_resources(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=namespace,
@@ -1715,7 +1842,7 @@ async def get_tool_shipwright_build_info(
 async def create_tool_buildrun(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> dict:
     """Trigger a new BuildRun for an existing Shipwright Build.
 
@@ -1724,7 +1851,7 @@ async def create_tool_buildrun(
     """
     try:
         # Verify the Build exists
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1748,7 +1875,7 @@ async def create_tool_buildrun(
         )
 
         # Create the BuildRun
-        created_buildrun = kube.create_custom_resource(
+        created_buildrun = await kube.create_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1782,7 +1909,7 @@ async def finalize_tool_shipwright_build(
     namespace: str,
     name: str,
     request: FinalizeToolBuildRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> CreateToolResponse:
     """Create Deployment/StatefulSet + Service after Shipwright build completes successfully.
 
@@ -1795,9 +1922,11 @@ async def finalize_tool_shipwright_build(
     6. Creates HTTPRoute if createHttpRoute is true
     7. Adds kagenti.io/shipwright-build annotation to workload
     """
+    # The reconciliation loop calls this directly with the blocking service
+    kube = as_async(kube)
     try:
         # Get the Build resource
-        build = kube.get_custom_resource(
+        build = await kube.get_custom_resource(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1806,7 +1935,7 @@ async def finalize_tool_shipwright_build(
         )
 
         # Get the latest BuildRun
-        buildruns = kube.list_custom_resources(
+        buildruns = await kube.list_custom_resources(
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1945,17 +2074,19 @@ async def finalize_tool_shipwright_build(
 
         # Ensure a dedicated ServiceAccount exists so the webhook's
         # SPIFFE identity uses the workload name, not the ReplicaSet hash.
-        kube.ensure_service_account(namespace=namespace, name=name)
+        await kube.ensure_service_account(namespace=namespace, name=name)
 
         if auth_bridge_enabled:
-            _ensure_authbridge_configmaps(
-                kube=kube,
+            await kube.run(
+                _ensure_authbridge_configmaps,
+                kube=kube.sync,
                 namespace=namespace,
                 spire_enabled=spire_enabled,
             )
             if final_outbound_routes:
-                _ensure_authproxy_routes(
-                    kube=kube,
+                await kube.run(
+                    _ensure_authproxy_routes,
+                    kube=kube.sync,
                     namespace=namespace,
                     routes=final_outbound_routes,
                 )
@@ -1963,7 +2094,7 @@ async def finalize_tool_shipwright_build(
                 extra = {
                     "DEFAULT_OUTBOUND_POLICY": final_default_outbound_policy,
                 }
-                kube.upsert_configmap(
+                await kube.upsert_configmap(
                     namespace=namespace,
                     name="authbridge-config",
                     data=extra,
@@ -1998,7 +2129,7 @@ async def finalize_tool_shipwright_build(
                 outbound_ports_exclude=outbound_ports_exclude,
                 inbound_ports_exclude=inbound_ports_exclude,
             )
-            kube.create_statefulset(namespace, workload_manifest)
+            await kube.create_statefulset(namespace, workload_manifest)
             logger.info(
                 f"Created StatefulSet '{name}' in namespace '{namespace}' from Shipwright build"
             )
@@ -2023,7 +2154,7 @@ async def finalize_tool_shipwright_build(
                 outbound_ports_exclude=outbound_ports_exclude,
                 inbound_ports_exclude=inbound_ports_exclude,
             )
-            kube.create_deployment(namespace, workload_manifest)
+            await kube.create_deployment(namespace, workload_manifest)
             logger.info(
                 f"Created Deployment '{name}' in namespace '{namespace}' from Shipwright build"
             )
@@ -2034,7 +2165,7 @@ async def finalize_tool_shipwright_build(
             namespace=namespace,
             service_ports=service_ports,
         )
-        kube.create_service(namespace, service_manifest)
+        await kube.create_service(namespace, service_manifest)
         service_name = _get_tool_service_name(name)
         logger.info(
             f"Created Service '{service_name}' in namespace '{namespace}' from Shipwright build"
@@ -2048,8 +2179,9 @@ async def finalize_tool_shipwright_build(
                 service_ports,
                 default_port=DEFAULT_IN_CLUSTER_PORT,
             )
-            create_route_for_agent_or_tool(
-                kube=kube,
+            await kube.run(
+                create_route_for_agent_or_tool,
+                kube=kube.sync,
                 name=name,
                 namespace=namespace,
                 service_name=service_name,
@@ -2081,9 +2213,9 @@ async def finalize_tool_shipwright_build(
 def _get_tool_url(name: str, namespace: str, kube: KubernetesService) -> str:
     """Get the URL for an MCP tool server.
 
-    Looks up the K8s Service to find the actual port instead of assuming
-    the default.  Falls back to DEFAULT_IN_CLUSTER_PORT when the Service
-    is missing or has no ports.
+    Looks up the K8s Service (through the shared Service port cache) to find
+    the actual port instead of assuming the default.  Falls back to
+    DEFAULT_IN_CLUSTER_PORT when the Service is missing or has no ports.
 
     Service naming convention:
     - Service name: {name}-mcp
@@ -2112,50 +2244,31 @@ def _get_tool_url(name: str, namespace: str, kube: KubernetesService) -> str:
 async def connect_to_tool(
     namespace: str,
     name: str,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    refresh: bool = Query(
+        default=False, description="Re-list tools from the server instead of the catalog"
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> MCPToolsResponse:
     """
     Connect to an MCP server and list available tools.
 
-    This endpoint connects to the MCP server and retrieves the list of
-    available tools using the MCP client library.
+    Tools are served from the tool catalog (see services/tool_catalog.py),
+    which lists them over MCP on first use and again after a rollout, a
+    ``tools/list_changed`` notification, or when ``refresh=true``.
     """
-    tool_url = _get_tool_url(name, namespace, kube)
+    tool_url, generation = await asyncio.gather(
+        kube.run(_get_tool_url, name, namespace, kube.sync),
+        workload_generation(kube, namespace, name),
+    )
     mcp_endpoint = f"{tool_url}/mcp"
 
     logger.info("Connecting to MCP server at %s", sanitize_log(mcp_endpoint))
 
-    exit_stack = AsyncExitStack()
     try:
-        async with exit_stack:
-            # Connect using MCP streamable-http transport
-            streams_context = streamablehttp_client(url=mcp_endpoint, headers={})
-            read_stream, write_stream, _ = await streams_context.__aenter__()
-
-            # Create and initialize MCP session
-            session_context = ClientSession(read_stream, write_stream)
-            session: ClientSession = await session_context.__aenter__()
-            await session.initialize()
-
-            logger.info("MCP session initialized for tool %s", sanitize_log(name))
-
-            # List available tools
-            response = await session.list_tools()
-            tools = []
-            if response and hasattr(response, "tools"):
-                for tool in response.tools:
-                    tools.append(
-                        MCPToolSchema(
-                            name=tool.name,
-                            description=tool.description,
-                            input_schema=(
-                                tool.inputSchema if hasattr(tool, "inputSchema") else None
-                            ),
-                        )
-                    )
-                logger.info("Listed %d tools from MCP server %s", len(tools), sanitize_log(name))
-
-            return MCPToolsResponse(tools=tools)
+        entry = await get_tool_catalog().get(
+            namespace, name, mcp_endpoint, generation, refresh=refresh
+        )
+        return MCPToolsResponse(tools=[MCPToolSchema(**tool) for tool in entry.tools])
 
     except (ConnectionError, httpx.NetworkError):
         logger.error("Connection error to MCP server (connect)")
@@ -2163,7 +2276,10 @@ async def connect_to_tool(
             status_code=502,
             detail=f"Failed to connect to MCP server at {tool_url}",
         )
-    except httpx.TimeoutException:
+    except McpPoolExhaustedError as e:
+        logger.warning("MCP session pool exhausted (connect)")
+        raise HTTPException(status_code=503, detail=str(e))
+    except (httpx.TimeoutException, asyncio.TimeoutError):
         logger.error("Timeout connecting to MCP server (connect)")
         raise HTTPException(
             status_code=504,
@@ -2183,6 +2299,27 @@ async def connect_to_tool(
         )
 
 
+def _content_item_to_dict(content_item: Any) -> Dict[str, Any]:
+    """Convert one MCP content item to a serializable dict."""
+    if hasattr(content_item, "text"):
+        return {"type": "text", "text": content_item.text}
+    if hasattr(content_item, "data"):
+        return {"type": "data", "data": content_item.data}
+    return {"type": "unknown", "value": str(content_item)}
+
+
+def _call_result_to_dict(result: Any) -> Dict[str, Any]:
+    """Convert an MCP CallToolResult to a serializable dict."""
+    result_data: Dict[str, Any] = {}
+    if result:
+        if hasattr(result, "content"):
+            # Extract content from the result
+            result_data["content"] = [_content_item_to_dict(item) for item in result.content]
+        if hasattr(result, "isError"):
+            result_data["isError"] = result.isError
+    return result_data
+
+
 @router.post(
     "/{namespace}/{name}/invoke",
     response_model=MCPInvokeResponse,
@@ -2192,7 +2329,7 @@ async def invoke_tool(
     namespace: str,
     name: str,
     request: MCPInvokeRequest,
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
 ) -> MCPInvokeResponse:
     """
     Invoke an MCP tool with the given arguments.
@@ -2200,23 +2337,12 @@ async def invoke_tool(
     This endpoint calls a specific tool on the MCP server with
     the provided arguments and returns the result.
     """
-    tool_url = _get_tool_url(name, namespace, kube)
+    tool_url = await kube.run(_get_tool_url, name, namespace, kube.sync)
     mcp_endpoint = f"{tool_url}/mcp"
 
-    exit_stack = AsyncExitStack()
     try:
-        async with exit_stack:
-            # Connect using MCP streamable-http transport
-            streams_context = streamablehttp_client(url=mcp_endpoint, headers={})
-            read_stream, write_stream, _ = await streams_context.__aenter__()
-
-            # Create and initialize MCP session
-            session_context = ClientSession(read_stream, write_stream)
-            session: ClientSession = await session_context.__aenter__()
-            await session.initialize()
-
-            logger.info("MCP session initialized for tool invocation on %s", sanitize_log(name))
-
+        # Reuse the pooled, already-initialized MCP session for this tool
+        async with get_mcp_session_pool().session(namespace, name, mcp_endpoint) as session:
             # Call the tool using the MCP client library
             result = await session.call_tool(request.tool_name, request.arguments)
 
@@ -2226,24 +2352,7 @@ async def invoke_tool(
                 sanitize_log(name),
             )
 
-            # Convert the result to a serializable format
-            result_data = {}
-            if result:
-                if hasattr(result, "content"):
-                    # Extract content from the result
-                    content_list = []
-                    for content_item in result.content:
-                        if hasattr(content_item, "text"):
-                            content_list.append({"type": "text", "text": content_item.text})
-                        elif hasattr(content_item, "data"):
-                            content_list.append({"type": "data", "data": content_item.data})
-                        else:
-                            content_list.append({"type": "unknown", "value": str(content_item)})
-                    result_data["content"] = content_list
-                if hasattr(result, "isError"):
-                    result_data["isError"] = result.isError
-
-            return MCPInvokeResponse(result=result_data)
+            return MCPInvokeResponse(result=_call_result_to_dict(result))
 
     except (ConnectionError, httpx.NetworkError):
         logger.error("Connection error to MCP server (invoke)")
@@ -2251,7 +2360,10 @@ async def invoke_tool(
             status_code=502,
             detail=f"Failed to connect to MCP server at {tool_url}",
         )
-    except httpx.TimeoutException:
+    except McpPoolExhaustedError as e:
+        logger.warning("MCP session pool exhausted (invoke)")
+        raise HTTPException(status_code=503, detail=str(e))
+    except (httpx.TimeoutException, asyncio.TimeoutError):
         logger.error("Timeout connecting to MCP server (invoke)")
         raise HTTPException(
             status_code=504,
@@ -2271,3 +2383,308 @@ async def invoke_tool(
             status_code=500,
             detail=f"Error invoking MCP tool: {str(e)}",
         )
+
+
+def _stream_event(payload: Dict[str, Any], fmt: str) -> str:
+    """Encode one streamed event as an NDJSON line or an SSE message."""
+    if fmt == "sse":
+        return f"event: {payload['type']}\ndata: {json.dumps(payload)}\n\n"
+    return json.dumps(payload) + "\n"
+
+
+def _streaming_response(events: AsyncIterator[str], fmt: str) -> StreamingResponse:
+    if fmt == "sse":
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+        )
+    return StreamingResponse(
+        events, media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"}
+    )
+
+
+async def _ensure_mcp_session(
+    namespace: str, name: str, mcp_endpoint: str, tool_url: str, operation: str
+) -> None:
+    """Establish (or health-check) the pooled session before streaming starts.
+
+    Connection failures then map to HTTP status codes instead of an in-stream
+    error. Without pooling the session is opened by the stream itself.
+    """
+    pool = get_mcp_session_pool()
+    if not pool.enabled:
+        return
+    try:
+        async with pool.session(namespace, name, mcp_endpoint):
+            pass
+    except McpPoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except (httpx.TimeoutException, asyncio.TimeoutError):
+        raise HTTPException(
+            status_code=504, detail=f"Timeout connecting to MCP server at {tool_url}"
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.error("Connection error to MCP server (%s)", operation)
+        raise HTTPException(
+            status_code=502, detail=f"Failed to connect to MCP server at {tool_url}"
+        )
+
+
+async def _run_batch(
+    namespace: str,
+    name: str,
+    mcp_endpoint: str,
+    calls: List[MCPInvokeRequest],
+    concurrency: int,
+    timeout: float,
+    fmt: str,
+) -> AsyncIterator[str]:
+    """Run ``calls`` over one MCP session, yielding each result as it completes."""
+    pool = get_mcp_session_pool()
+    semaphore = asyncio.Semaphore(concurrency)
+    transport_failed = False
+    succeeded = failed = 0
+
+    async def call(index: int, request: MCPInvokeRequest, session) -> Dict[str, Any]:
+        nonlocal transport_failed
+        item: Dict[str, Any] = {"type": "result", "index": index, "tool_name": request.tool_name}
+        async with semaphore:
+            try:
+                result = await session.call_tool(
+                    request.tool_name,
+                    request.arguments,
+                    read_timeout_seconds=timedelta(seconds=timeout),
+                )
+                item["result"] = _call_result_to_dict(result)
+            except McpError as e:
+                timed_out = e.error.code == httpx.codes.REQUEST_TIMEOUT
+                transport_failed = transport_failed or session_gone(e)
+                item["error"] = e.error.message
+                item["status"] = 504 if timed_out else 502
+            except Exception as e:  # pylint: disable=broad-except
+                transport_failed = True
+                item["error"] = f"{type(e).__name__}: {e}"
+                item["status"] = 502
+        return item
+
+    try:
+        async with pool.session(namespace, name, mcp_endpoint) as session:
+            tasks = [
+                asyncio.ensure_future(call(index, request, session))
+                for index, request in enumerate(calls)
+            ]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    item = await finished
+                    if "error" in item:
+                        failed += 1
+                    else:
+                        succeeded += 1
+                    yield _stream_event(item, fmt)
+            finally:
+                # Client went away: stop the remaining calls
+                for task in tasks:
+                    task.cancel()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("MCP batch on %s failed: %s", sanitize_log(name), type(e).__name__)
+        yield _stream_event(
+            {"type": "error", "error": f"Failed to run batch on MCP server: {e}", "status": 502},
+            fmt,
+        )
+        return
+    if transport_failed:
+        await pool.invalidate(namespace, name)
+
+    yield _stream_event(
+        {"type": "done", "total": len(calls), "succeeded": succeeded, "failed": failed}, fmt
+    )
+
+
+@router.post(
+    "/{namespace}/{name}/invoke-batch",
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def invoke_tools_batch(
+    namespace: str,
+    name: str,
+    request: MCPBatchInvokeRequest,
+    fmt: Literal["ndjson", "sse"] = Query(
+        default="ndjson", alias="format", description="Stream format: ndjson or sse"
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+) -> StreamingResponse:
+    """
+    Invoke several MCP tools on one server over a single session.
+
+    Calls run concurrently (``concurrency``, capped by
+    MCP_BATCH_MAX_CONCURRENCY), each bounded by ``timeout`` seconds. Results
+    are streamed as they complete, as NDJSON lines or SSE ``result`` events
+    carrying ``index`` (position in ``calls``) and either ``result`` or
+    ``error``/``status``. A final ``done`` event reports the totals.
+
+    Connection problems detected before streaming starts are returned as
+    HTTP errors, like the single invoke endpoint.
+    """
+    if len(request.calls) > settings.mcp_batch_max_calls:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.mcp_batch_max_calls} calls per batch",
+        )
+    concurrency = min(
+        request.concurrency or settings.mcp_batch_default_concurrency,
+        settings.mcp_batch_max_concurrency,
+    )
+    timeout = request.timeout or settings.mcp_batch_call_timeout
+
+    tool_url = await kube.run(_get_tool_url, name, namespace, kube.sync)
+    mcp_endpoint = f"{tool_url}/mcp"
+
+    await _ensure_mcp_session(namespace, name, mcp_endpoint, tool_url, "invoke-batch")
+    return _streaming_response(
+        _run_batch(namespace, name, mcp_endpoint, request.calls, concurrency, timeout, fmt), fmt
+    )
+
+
+def _cap_content_item(
+    item: Dict[str, Any], budget: int
+) -> Tuple[Optional[Dict[str, Any]], int, int]:
+    """Fit a converted content item into ``budget`` bytes.
+
+    Returns the (possibly truncated) item, or None if nothing of it fits, with
+    the bytes it carries and the item's full size. Text is cut on a UTF-8
+    boundary; binary data is never sent partially.
+    """
+    field = {"text": "text", "data": "data"}.get(item["type"], "value")
+    encoded = item[field].encode("utf-8")
+    size = len(encoded)
+    if size <= budget:
+        return item, size, size
+    if item["type"] != "text" or budget <= 0:
+        return None, 0, size
+    text = encoded[:budget].decode("utf-8", errors="ignore")
+    return {**item, field: text}, len(text.encode("utf-8")), size
+
+
+async def _run_streaming_call(
+    namespace: str,
+    name: str,
+    mcp_endpoint: str,
+    request: MCPInvokeRequest,
+    max_bytes: int,
+    fmt: str,
+) -> AsyncIterator[str]:
+    """Call one tool, streaming progress notifications and then content items."""
+    pool = get_mcp_session_pool()
+    progress: asyncio.Queue = asyncio.Queue()
+
+    async def on_progress(value: float, total: Optional[float], message: Optional[str]) -> None:
+        await progress.put(
+            {"type": "progress", "progress": value, "total": total, "message": message}
+        )
+
+    try:
+        async with pool.session(namespace, name, mcp_endpoint) as session:
+            call = asyncio.ensure_future(
+                session.call_tool(
+                    request.tool_name, request.arguments, progress_callback=on_progress
+                )
+            )
+            try:
+                while not call.done():
+                    getter = asyncio.ensure_future(progress.get())
+                    await asyncio.wait({call, getter}, return_when=asyncio.FIRST_COMPLETED)
+                    if getter.done():
+                        yield _stream_event(getter.result(), fmt)
+                    else:
+                        getter.cancel()
+                while not progress.empty():
+                    yield _stream_event(progress.get_nowait(), fmt)
+                result = call.result()
+            finally:
+                call.cancel()
+    except McpError as e:
+        yield _stream_event({"type": "error", "error": e.error.message, "status": 502}, fmt)
+        return
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Streaming invoke on %s failed: %s", sanitize_log(name), type(e).__name__)
+        yield _stream_event(
+            {"type": "error", "error": f"Error invoking MCP tool: {e}", "status": 502}, fmt
+        )
+        return
+
+    # Convert and send one item at a time; never build the whole response
+    content = list(getattr(result, "content", None) or [])
+    is_error = getattr(result, "isError", False)
+    del result
+    sent_bytes = total_bytes = items_sent = 0
+    for index, content_item in enumerate(content):
+        content[index] = None  # release each item once it has been forwarded
+        item, item_bytes, size = _cap_content_item(
+            _content_item_to_dict(content_item), max_bytes - sent_bytes
+        )
+        total_bytes += size
+        if item is None:
+            continue
+        sent_bytes += item_bytes
+        items_sent += 1
+        yield _stream_event(
+            {"type": "content", "index": index, "content": item, "truncated": item_bytes < size},
+            fmt,
+        )
+
+    yield _stream_event(
+        {
+            "type": "done",
+            "isError": is_error,
+            "items": len(content),
+            "itemsSent": items_sent,
+            "bytes": total_bytes,
+            "bytesSent": sent_bytes,
+            "truncated": sent_bytes < total_bytes,
+            "maxBytes": max_bytes,
+        },
+        fmt,
+    )
+
+
+@router.post(
+    "/{namespace}/{name}/invoke-stream",
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def invoke_tool_stream(
+    namespace: str,
+    name: str,
+    request: MCPInvokeRequest,
+    fmt: Literal["ndjson", "sse"] = Query(
+        default="ndjson", alias="format", description="Stream format: ndjson or sse"
+    ),
+    max_bytes: Optional[int] = Query(
+        default=None,
+        alias="maxBytes",
+        ge=1,
+        description="Content byte cap (at most MCP_STREAM_MAX_BYTES)",
+    ),
+    kube: AsyncKubernetesService = Depends(get_async_kubernetes_service),
+) -> StreamingResponse:
+    """
+    Invoke an MCP tool and stream the result.
+
+    Events, as NDJSON lines or SSE messages:
+
+    - ``progress``: MCP progress notifications while the tool runs.
+    - ``content``: one per content item, in the same shape as ``invoke``'s
+      ``content`` list, with ``index`` and ``truncated``.
+    - ``done``: ``isError`` plus byte and item counts. Once ``maxBytes`` of
+      content have been sent, the rest is dropped (text is cut, binary data
+      skipped) and ``truncated`` is true.
+    - ``error``: the call failed after streaming started.
+    """
+    cap = min(max_bytes or settings.mcp_stream_max_bytes, settings.mcp_stream_max_bytes)
+    tool_url = await kube.run(_get_tool_url, name, namespace, kube.sync)
+    mcp_endpoint = f"{tool_url}/mcp"
+
+    await _ensure_mcp_session(namespace, name, mcp_endpoint, tool_url, "invoke-stream")
+    return _streaming_response(
+        _run_streaming_call(namespace, name, mcp_endpoint, request, cap, fmt), fmt
+    )
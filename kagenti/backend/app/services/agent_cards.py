@@ -0,0 +1,194 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Server-side cache of A2A agent cards.
+
+The UI asks for agent cards constantly, and every request used to download
+``/.well-known/agent-card.json`` from the agent pod. AgentCardCache keeps the
+last card per agent:
+
+- Entries are tagged with the agent workload's generation (kind, uid and
+  ``metadata.generation``). A redeploy changes the tag and the old card is
+  discarded rather than revalidated.
+- For ``AGENT_CARD_CACHE_TTL`` seconds a card is served without contacting
+  the agent.
+- For a further ``AGENT_CARD_STALE_TTL`` seconds the stale card is served
+  immediately while one background request revalidates it
+  (stale-while-revalidate).
+- Revalidation is a conditional GET: the agent's ``ETag`` is sent back as
+  ``If-None-Match`` and a ``304 Not Modified`` just refreshes the entry.
+- Concurrent misses for the same agent share a single upstream fetch.
+
+Fetch errors propagate to the caller on a miss; a failed background
+revalidation keeps serving the stale card until it ages out.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.services.agent_http import get_agent_http_clients
+
+logger = logging.getLogger(__name__)
+
+A2A_AGENT_CARD_PATH = "/.well-known/agent-card.json"
+
+CardKey = Tuple[str, str]
+
+_card_requests = registry.counter(
+    "kagenti_agent_card_cache_requests_total",
+    "Agent card lookups by cache result (hit, stale, miss)",
+    ("result",),
+)
+_card_fetches = registry.counter(
+    "kagenti_agent_card_fetches_total",
+    "Agent card requests sent to agents by response (ok, not_modified, error)",
+    ("outcome",),
+)
+
+
+@dataclass
+class CardEntry:
+    """A cached agent card and the validators needed to revalidate it."""
+
+    card: Dict[str, Any]
+    generation: Optional[str]
+    upstream_etag: Optional[str]
+    fetched_at: float
+    # Weak ETag for the card as served to our own clients
+    etag: str = field(init=False)
+
+    def __post_init__(self):
+        digest = hashlib.sha256(json.dumps(self.card, sort_keys=True).encode()).hexdigest()
+        self.etag = f'W/"{digest[:32]}"'
+
+
+class AgentCardCache:
+    """Per-agent card cache with TTL, stale-while-revalidate and conditional GETs."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttl = settings.agent_card_cache_ttl if ttl is None else ttl
+        self.stale_ttl = settings.agent_card_stale_ttl if stale_ttl is None else stale_ttl
+        self.max_entries = max_entries or settings.agent_card_cache_max_entries
+        self._entries: "OrderedDict[CardKey, CardEntry]" = OrderedDict()
+        self._inflight: Dict[CardKey, asyncio.Task] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def invalidate(self, namespace: str, name: str) -> None:
+        self._entries.pop((namespace, name), None)
+
+    async def get(
+        self, namespace: str, name: str, agent_url: str, generation: Optional[str]
+    ) -> CardEntry:
+        """Return the card for an agent, fetching or revalidating as needed."""
+        key = (namespace, name)
+        entry = self._entries.get(key)
+        if entry is not None and entry.generation != generation:
+            self._entries.pop(key, None)
+            entry = None
+
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                _card_requests.inc(result="hit")
+                return entry
+            if age < self.ttl + self.stale_ttl:
+                _card_requests.inc(result="stale")
+                self._start_fetch(key, agent_url, generation, entry)
+                return entry
+
+        _card_requests.inc(result="miss")
+        return await asyncio.shield(self._start_fetch(key, agent_url, generation, entry))
+
+    def _start_fetch(
+        self,
+        key: CardKey,
+        agent_url: str,
+        generation: Optional[str],
+        previous: Optional[CardEntry],
+    ) -> asyncio.Task:
+        """Start (or join) the single in-flight fetch for ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, agent_url, generation, previous))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+        return task
+
+    def _on_fetch_done(self, key: CardKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so background refresh failures are not
+        # reported as "never retrieved"; foreground callers re-raise it.
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Agent card fetch for %s/%s failed: %s", key[0], key[1], task.exception()
+            )
+
+    async def _fetch(
+        self,
+        key: CardKey,
+        agent_url: str,
+        generation: Optional[str],
+        previous: Optional[CardEntry],
+    ) -> CardEntry:
+        card_url = f"{agent_url}{A2A_AGENT_CARD_PATH}"
+        agent_http = get_agent_http_clients()
+        headers = {}
+        if previous is not None and previous.upstream_etag:
+            headers["If-None-Match"] = previous.upstream_etag
+
+        try:
+            async with agent_http.track(card_url):
+                response = await agent_http.client_for(card_url).get(
+                    card_url, headers=headers, timeout=settings.agent_card_timeout
+                )
+                if response.status_code == 304 and previous is not None:
+                    entry = CardEntry(
+                        card=previous.card,
+                        generation=generation,
+                        upstream_etag=response.headers.get("ETag", previous.upstream_etag),
+                        fetched_at=time.monotonic(),
+                    )
+                    _card_fetches.inc(outcome="not_modified")
+                else:
+                    response.raise_for_status()
+                    entry = CardEntry(
+                        card=response.json(),
+                        generation=generation,
+                        upstream_etag=response.headers.get("ETag"),
+                        fetched_at=time.monotonic(),
+                    )
+                    _card_fetches.inc(outcome="ok")
+        except Exception:
+            _card_fetches.inc(outcome="error")
+            raise
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+
+@lru_cache
+def get_agent_card_cache() -> AgentCardCache:
+    """Get the process-wide agent card cache."""
+    return AgentCardCache()
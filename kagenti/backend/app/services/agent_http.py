@@ -0,0 +1,238 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Shared, pooled HTTP clients for A2A calls to agents.
+
+Creating an ``httpx.AsyncClient`` per chat turn pays DNS, TCP and (through
+the mesh) mTLS setup on every request. AgentHttpClients keeps one client per
+agent upstream (scheme, host, port) for the lifetime of the application:
+
+- connections are kept alive between turns (``AGENT_HTTP_KEEPALIVE_EXPIRY``);
+- each upstream gets its own connection limits, so one busy agent cannot
+  starve the others;
+- HTTP/2 is negotiated over TLS when ``AGENT_HTTP2`` is on and the optional
+  ``h2`` package is installed; plain-HTTP agents keep using HTTP/1.1;
+- timeouts are passed per request, so callers keep their own budgets;
+- a client unused for ``AGENT_HTTP_CLIENT_IDLE_TIMEOUT`` seconds is closed,
+  so agents that were deleted or renamed do not keep a client forever.
+
+Clients are created in the FastAPI lifespan handler and closed on shutdown.
+Client and request stats are exported on ``GET /metrics``.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  # pylint: disable=unused-import
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+Upstream = Tuple[str, str, int]
+
+_clients_open = registry.gauge(
+    "kagenti_agent_http_clients",
+    "Pooled HTTP clients currently open to agent upstreams",
+)
+_in_flight = registry.gauge(
+    "kagenti_agent_http_in_flight",
+    "A2A requests to an agent upstream currently in flight",
+    ("upstream",),
+)
+_requests_total = registry.counter(
+    "kagenti_agent_http_requests_total",
+    "A2A requests sent through the shared agent HTTP pool",
+    ("upstream", "outcome"),
+)
+_request_seconds = registry.summary(
+    "kagenti_agent_http_request_seconds",
+    "Duration of A2A requests to an agent upstream, including streamed bodies",
+    ("upstream",),
+)
+_clients_evicted = registry.counter(
+    "kagenti_agent_http_clients_evicted_total",
+    "Agent HTTP clients closed after AGENT_HTTP_CLIENT_IDLE_TIMEOUT without requests",
+)
+
+
+def _upstream(url: str) -> Upstream:
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return (parsed.scheme, parsed.host, port)
+
+
+def _label(upstream: Upstream) -> str:
+    scheme, host, port = upstream
+    return f"{scheme}://{host}:{port}"
+
+
+class AgentHttpClients:  # pylint: disable=too-many-instance-attributes
+    """Per-upstream pooled ``httpx.AsyncClient`` instances."""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        idle_timeout: Optional[float] = None,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections or settings.agent_http_max_connections,
+            max_keepalive_connections=max_keepalive or settings.agent_http_max_keepalive,
+            keepalive_expiry=(
+                settings.agent_http_keepalive_expiry
+                if keepalive_expiry is None
+                else keepalive_expiry
+            ),
+        )
+        wanted = settings.agent_http2 if http2 is None else http2
+        if wanted and not _HTTP2_AVAILABLE:
+            logger.info("AGENT_HTTP2 enabled but the h2 package is not installed; using HTTP/1.1")
+        self._http2 = wanted and _HTTP2_AVAILABLE
+        self.idle_timeout = (
+            settings.agent_http_client_idle_timeout if idle_timeout is None else idle_timeout
+        )
+        self._clients: Dict[Upstream, httpx.AsyncClient] = {}
+        self._in_flight: Dict[Upstream, int] = {}
+        self._last_used: Dict[Upstream, float] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+        _clients_open.set_function(lambda: len(self._clients))
+
+    def start(self) -> None:
+        """Start the idle-client reaper (call from a running event loop)."""
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.create_task(self._reap_forever(), name="agent-http-reaper")
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Return the shared client for the upstream serving ``url``."""
+        if self._closed:
+            raise RuntimeError("Agent HTTP clients are closed")
+        upstream = _upstream(url)
+        client = self._clients.get(upstream)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                http2=self._http2,
+                timeout=httpx.Timeout(
+                    settings.agent_http_default_timeout,
+                    connect=settings.agent_http_connect_timeout,
+                ),
+            )
+            self._clients[upstream] = client
+            self._in_flight[upstream] = 0
+            _in_flight.set_function(
+                lambda: self._in_flight.get(upstream, 0), upstream=_label(upstream)
+            )
+            logger.debug("Created pooled HTTP client for agent upstream %s", _label(upstream))
+        self._last_used[upstream] = time.monotonic()
+        return client
+
+    @asynccontextmanager
+    async def track(self, url: str) -> AsyncIterator[None]:
+        """Count a request to ``url`` as in flight and record its outcome and duration.
+
+        Streaming callers keep this open until the response body has been read.
+        """
+        upstream = _upstream(url)
+        label = _label(upstream)
+        started = time.monotonic()
+        self._in_flight[upstream] = self._in_flight.get(upstream, 0) + 1
+        try:
+            yield
+        except httpx.RequestError:
+            _requests_total.inc(upstream=label, outcome="connect_error")
+            raise
+        except Exception:
+            _requests_total.inc(upstream=label, outcome="error")
+            raise
+        else:
+            _requests_total.inc(upstream=label, outcome="ok")
+        finally:
+            self._in_flight[upstream] -= 1
+            self._last_used[upstream] = time.monotonic()
+            _request_seconds.observe(self._last_used[upstream] - started, upstream=label)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """In-flight requests and idle seconds per upstream."""
+        now = time.monotonic()
+        return {
+            _label(upstream): {
+                "in_flight": self._in_flight.get(upstream, 0),
+                "idle_seconds": round(now - self._last_used.get(upstream, now), 3),
+            }
+            for upstream in self._clients
+        }
+
+    async def evict_idle(self) -> int:
+        """Close clients with no request for longer than the idle timeout."""
+        now = time.monotonic()
+        expired = [
+            upstream
+            for upstream in list(self._clients)
+            if self._in_flight.get(upstream, 0) == 0
+            and now - self._last_used.get(upstream, now) >= self.idle_timeout
+        ]
+        for upstream in expired:
+            _clients_evicted.inc()
+            logger.debug("Closing idle HTTP client for agent upstream %s", _label(upstream))
+            await self._close_client(upstream)
+        return len(expired)
+
+    async def _reap_forever(self) -> None:
+        interval = max(1.0, min(self.idle_timeout / 2, 30.0))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Agent HTTP client reaper failed", exc_info=True)
+
+    async def _close_client(self, upstream: Upstream) -> None:
+        client = self._clients.pop(upstream)
+        self._in_flight.pop(upstream, None)
+        self._last_used.pop(upstream, None)
+        label = _label(upstream)
+        _in_flight.remove(upstream=label)
+        try:
+            await client.aclose()
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Error closing agent HTTP client %s", label, exc_info=True)
+
+    async def aclose(self) -> None:
+        """Stop the reaper and close every pooled client."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        for upstream in list(self._clients):
+            await self._close_client(upstream)
+
+
+@lru_cache
+def get_agent_http_clients() -> AgentHttpClients:
+    """Get the application-wide agent HTTP client pool."""
+    return AgentHttpClients()
+
+
+async def close_agent_http_clients() -> None:
+    """Close the shared pool; the next get_agent_http_clients() builds a fresh one."""
+    if get_agent_http_clients.cache_info().currsize:
+        await get_agent_http_clients().aclose()
+        get_agent_http_clients.cache_clear()
@@ -0,0 +1,113 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Process-wide cache of Kubernetes API discovery.
+
+Platform detection (``route.openshift.io`` present?) and optional-CRD checks
+(agent-sandbox Sandboxes, Shipwright Builds) only change when an operator
+installs or removes an API, yet they used to cost a ``GET /apis`` — a large
+document on OpenShift — or a failed list per request. ApiDiscoveryCache keeps
+the answers for ``API_DISCOVERY_REFRESH_INTERVAL`` seconds:
+
+- ``group_exists(group)`` is answered from one cached ``GET /apis``.
+- ``resource_exists(group, version, plural)`` is answered from a cached
+  ``GET /apis/{group}/{version}`` per group-version; a 404 there means the
+  CRD is not installed and is cached like any other answer.
+- ``sandboxes_served()`` and ``shipwright_builds_served()`` are
+  ``resource_exists`` for the optional CRDs.
+- ``invalidate()`` drops everything, e.g. after installing a CRD.
+
+Discovery errors other than 404 are not cached. ``group_exists`` then reports
+False (the previous behaviour) while ``resource_exists`` reports True, so
+callers fall back to their existing per-request 404 handling.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from kubernetes.client import ApiException
+
+from app.core.constants import (
+    AGENT_SANDBOX_CRD_GROUP,
+    AGENT_SANDBOX_CRD_VERSION,
+    AGENT_SANDBOX_PLURAL,
+    SHIPWRIGHT_BUILDS_PLURAL,
+    SHIPWRIGHT_CRD_GROUP,
+    SHIPWRIGHT_CRD_VERSION,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ApiDiscoveryCache:
+    """TTL cache over API group and group-version resource discovery."""
+
+    def __init__(self, kube: Any, refresh_interval: float):
+        self._kube = kube
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._groups: Optional[Tuple[FrozenSet[str], float]] = None
+        self._resources: Dict[Tuple[str, str], Tuple[FrozenSet[str], float]] = {}
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return time.monotonic() - fetched_at < self.refresh_interval
+
+    def api_groups(self) -> Optional[FrozenSet[str]]:
+        """Names of all served API groups, or None if discovery failed."""
+        with self._lock:
+            if self._groups is not None and self._fresh(self._groups[1]):
+                return self._groups[0]
+        try:
+            response = self._kube.apis_api.get_api_versions(_request_timeout=10)
+        except ApiException as e:
+            logger.warning("Error listing API groups: %s", e)
+            return None
+        groups = frozenset(g.name for g in response.groups or [] if g and g.name)
+        logger.debug("Available API groups: %s", sorted(groups))
+        with self._lock:
+            self._groups = (groups, time.monotonic())
+        return groups
+
+    def group_exists(self, group: str) -> bool:
+        groups = self.api_groups()
+        return groups is not None and group in groups
+
+    def resource_exists(self, group: str, version: str, plural: str) -> bool:
+        """True if ``group/version`` serves ``plural`` (or discovery failed)."""
+        key = (group, version)
+        with self._lock:
+            entry = self._resources.get(key)
+            if entry is not None and self._fresh(entry[1]):
+                return plural in entry[0]
+        try:
+            response = self._kube.custom_api.get_api_resources(group, version, _request_timeout=10)
+            resources = frozenset(r.name for r in response.resources or [] if r and r.name)
+        except ApiException as e:
+            if e.status != 404:
+                logger.warning("Error discovering %s/%s resources: %s", group, version, e)
+                return True
+            resources = frozenset()
+        with self._lock:
+            self._resources[key] = (resources, time.monotonic())
+        return plural in resources
+
+    def sandboxes_served(self) -> bool:
+        """True unless discovery shows the agent-sandbox CRD is not installed."""
+        return self.resource_exists(
+            AGENT_SANDBOX_CRD_GROUP, AGENT_SANDBOX_CRD_VERSION, AGENT_SANDBOX_PLURAL
+        )
+
+    def shipwright_builds_served(self) -> bool:
+        """True unless discovery shows the Shipwright Build CRD is not installed."""
+        return self.resource_exists(
+            SHIPWRIGHT_CRD_GROUP, SHIPWRIGHT_CRD_VERSION, SHIPWRIGHT_BUILDS_PLURAL
+        )
+
+    def invalidate(self) -> None:
+        """Forget all discovery results; the next lookup refetches."""
+        with self._lock:
+            self._groups = None
+            self._resources.clear()
@@ -0,0 +1,197 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Windowed reads of a session's history from the ``events`` table.
+
+Opening a long session must not load its whole transcript, so every read
+here is a keyset query bounded by ``LIMIT``:
+
+- events_page(): a window of a session's events, paging forwards (``after``)
+  or backwards (``before``) by the row ``id``. ``event_index`` restarts at 1
+  for every task (turn), so it cannot order a whole session; ``id`` follows
+  insertion order and is indexed together with ``context_id``
+  (``idx_events_ctx_id``).
+- latest_turns(): the newest turns (tasks) of a session, newest first, each
+  with its first events. Turns are found by walking backwards one turn at a
+  time (a recursive query that touches two index entries per turn), never by
+  grouping all of the session's events.
+- turn_events(): the events of one turn by ``event_index``
+  (``idx_events_task``), for turns longer than the events returned inline.
+
+Queries fetch one row more than requested to tell whether there is more.
+
+session_readable() applies the ``sessions`` table's owner/visibility to
+history reads.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+DEFAULT_TURNS = 5
+MAX_TURNS = 50
+
+# Larger than any BIGSERIAL id; the cursor used when reading from the end
+_END = 2**63 - 1
+
+_COLUMNS = (
+    "id, task_id, event_index, event_type, event_category, langgraph_node,"
+    " payload::text AS payload, created_at"
+)
+
+_EVENTS_AFTER = (
+    f"SELECT {_COLUMNS} FROM events WHERE context_id = $1 AND id > $2 ORDER BY id LIMIT $3"
+)
+
+_EVENTS_BEFORE = (
+    f"SELECT {_COLUMNS} FROM events WHERE context_id = $1 AND id < $2 ORDER BY id DESC LIMIT $3"
+)
+
+# Each step jumps from a turn's first event to the newest event before it,
+# which belongs to the previous turn.
+_LATEST_TURNS = """
+WITH RECURSIVE turns(task_id, first_id, depth) AS (
+    SELECT latest.task_id, head.id, 1
+    FROM (
+        SELECT task_id FROM events
+        WHERE context_id = $1 AND id < $2 ORDER BY id DESC LIMIT 1
+    ) latest
+    CROSS JOIN LATERAL (
+        SELECT id FROM events
+        WHERE task_id = latest.task_id AND context_id = $1 ORDER BY event_index LIMIT 1
+    ) head
+  UNION ALL
+    SELECT prev.task_id, head.id, turns.depth + 1
+    FROM turns
+    CROSS JOIN LATERAL (
+        SELECT task_id FROM events
+        WHERE context_id = $1 AND id < turns.first_id ORDER BY id DESC LIMIT 1
+    ) prev
+    CROSS JOIN LATERAL (
+        SELECT id FROM events
+        WHERE task_id = prev.task_id AND context_id = $1 ORDER BY event_index LIMIT 1
+    ) head
+    WHERE turns.depth < $3
+)
+SELECT task_id, first_id FROM turns ORDER BY depth
+"""
+
+_TURNS_EVENTS = f"""
+SELECT t.task_id AS turn, e.* FROM unnest($2::text[]) AS t(task_id)
+CROSS JOIN LATERAL (
+    SELECT {_COLUMNS} FROM events
+    WHERE task_id = t.task_id AND context_id = $1
+    ORDER BY event_index LIMIT $3
+) e
+ORDER BY e.id
+"""
+
+_TURN_EVENTS = (
+    f"SELECT {_COLUMNS} FROM events"
+    " WHERE task_id = $2 AND context_id = $1 AND event_index > $3"
+    " ORDER BY event_index LIMIT $4"
+)
+
+
+def _event(row) -> Dict[str, Any]:
+    created_at = row["created_at"]
+    return {
+        "id": row["id"],
+        "task_id": row["task_id"],
+        "event_index": row["event_index"],
+        "event_type": row["event_type"],
+        "event_category": row["event_category"],
+        "langgraph_node": row["langgraph_node"],
+        "payload": json.loads(row["payload"]),
+        "created_at": created_at.isoformat() if created_at is not None else None,
+    }
+
+
+async def session_readable(conn, context_id: str, username: str, is_admin: bool) -> bool:
+    """False for another user's private session; sessions without a row are readable."""
+    if is_admin:
+        return True
+    row = await conn.fetchrow(
+        "SELECT owner, visibility FROM sessions WHERE context_id = $1", context_id
+    )
+    if row is None or not row["owner"] or row["visibility"] != "private":
+        return True
+    return row["owner"] == username
+
+
+async def events_page(
+    conn,
+    context_id: str,
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Up to ``limit`` events in order, and whether more exist in the paging direction.
+
+    Pages forwards from ``after``, or else backwards from ``before`` (the
+    newest events when neither is given).
+    """
+    if after is not None:
+        rows = await conn.fetch(_EVENTS_AFTER, context_id, after, limit + 1)
+        return [_event(row) for row in rows[:limit]], len(rows) > limit
+    before = before if before is not None else _END
+    rows = await conn.fetch(_EVENTS_BEFORE, context_id, before, limit + 1)
+    return [_event(row) for row in reversed(rows[:limit])], len(rows) > limit
+
+
+async def latest_turns(
+    conn,
+    context_id: str,
+    before: Optional[int] = None,
+    limit: int = DEFAULT_TURNS,
+    events_per_turn: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """The newest ``limit`` turns starting before event id ``before``, newest first.
+
+    Each turn carries up to ``events_per_turn`` of its first events and
+    ``has_more`` when it is longer. Also returns the cursor for older turns
+    (None when there are none).
+    """
+    before = before if before is not None else _END
+    turn_rows = await conn.fetch(_LATEST_TURNS, context_id, before, limit + 1)
+    seen = set()
+    heads: List[Tuple[str, int]] = []
+    for row in turn_rows:
+        if row["task_id"] not in seen:
+            seen.add(row["task_id"])
+            heads.append((row["task_id"], row["first_id"]))
+    more = len(heads) > limit
+    heads = heads[:limit]
+    if not heads:
+        return [], None
+
+    task_ids = [task_id for task_id, _ in heads]
+    turns: Dict[str, List[Dict[str, Any]]] = {task_id: [] for task_id in task_ids}
+    for row in await conn.fetch(_TURNS_EVENTS, context_id, task_ids, events_per_turn + 1):
+        turns[row["turn"]].append(_event(row))
+
+    result = []
+    for task_id in task_ids:
+        events = sorted(turns[task_id], key=lambda e: e["event_index"])
+        result.append(
+            {
+                "task_id": task_id,
+                "events": events[:events_per_turn],
+                "has_more": len(events) > events_per_turn,
+            }
+        )
+    return result, (min(first_id for _, first_id in heads) if more else None)
+
+
+async def turn_events(
+    conn,
+    context_id: str,
+    task_id: str,
+    after: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Events of one turn with ``event_index`` > ``after``, and whether more exist."""
+    rows = await conn.fetch(_TURN_EVENTS, context_id, task_id, after, limit + 1)
+    return [_event(row) for row in rows[:limit]], len(rows) > limit
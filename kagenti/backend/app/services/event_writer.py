@@ -0,0 +1,225 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Batched writer for the per-event ``events`` table (see models/event.py).
+
+Chat streams must not wait on Postgres for every SSE event, so rows are
+handed to EventWriter.submit(), which only appends them to a bounded queue.
+A background task drains the queue and writes a batch as soon as
+``event_writer_batch_size`` rows are queued or ``event_writer_flush_interval``
+seconds after the first row of the batch arrived, grouping rows by namespace
+(each namespace has its own session database).
+
+- Inserts are idempotent on ``(context_id, task_id, event_index)``
+  (``ON CONFLICT DO NOTHING``), so a replayed or re-submitted event is
+  harmless.
+- When the queue is full the row is dropped rather than blocking the stream.
+- A batch that fails is dropped, and the namespace is not written to for
+  ``event_writer_retry_after`` seconds (e.g. it has no session database).
+  Producers can check accepting() to stop submitting for that namespace.
+
+Metrics: queue depth, flush latency, written/failed batches and dropped rows.
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+INSERT_EVENTS = (
+    "INSERT INTO events (context_id, task_id, event_index, event_type, payload)"
+    " VALUES ($1, $2, $3, $4, $5::jsonb)"
+    " ON CONFLICT (context_id, task_id, event_index) DO NOTHING"
+)
+
+_queue_depth = registry.gauge(
+    "kagenti_event_writer_queue_depth",
+    "Event rows waiting to be written to the events table",
+)
+_flush_seconds = registry.summary(
+    "kagenti_event_writer_flush_seconds",
+    "Time taken to write one batch of event rows",
+)
+_batches = registry.counter(
+    "kagenti_event_writer_batches_total",
+    "Event row batches by result (written, failed)",
+    ("result",),
+)
+_dropped = registry.counter(
+    "kagenti_event_writer_dropped_total",
+    "Event rows not written, by reason (queue_full, failed, unavailable)",
+    ("reason",),
+)
+
+
+class EventRow(NamedTuple):
+    """One row of the events table, with the namespace whose database holds it."""
+
+    namespace: str
+    context_id: str
+    task_id: str
+    event_index: int
+    event_type: str
+    payload: str
+
+
+class EventWriter:  # pylint: disable=too-many-instance-attributes
+    """Bounded queue of event rows written to the events table in batches."""
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        retry_after: float = 30.0,
+    ):
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.retry_after = retry_after
+        self._queue: List[EventRow] = []
+        self._submitted = 0
+        self._completed = 0
+        self._wakeup = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self._progress = asyncio.Event()
+        self._unavailable: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the background writer (also started lazily by submit())."""
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="event-writer")
+            _queue_depth.set_function(lambda: self.depth)
+
+    def accepting(self, namespace: str) -> bool:
+        """False while writes to ``namespace`` are suspended after a failure."""
+        until = self._unavailable.get(namespace)
+        if until is None:
+            return True
+        if time.monotonic() >= until:
+            del self._unavailable[namespace]
+            return True
+        return False
+
+    def submit(self, row: EventRow) -> bool:
+        """Queue ``row`` for writing; returns False if it was dropped."""
+        if self._closed:
+            return False
+        if not self.accepting(row.namespace):
+            _dropped.inc(reason="unavailable")
+            return False
+        if len(self._queue) >= self.max_queue:
+            _dropped.inc(reason="queue_full")
+            return False
+        self.start()
+        self._queue.append(row)
+        self._submitted += 1
+        self._wakeup.set()
+        if len(self._queue) >= self.batch_size:
+            self._flush_now.set()
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every row submitted before this call is written or dropped."""
+        target = self._submitted
+        while self._completed < target:
+            if self._task is None or self._task.done():
+                return
+            progress = self._progress
+            self._flush_now.set()
+            await progress.wait()
+
+    async def aclose(self) -> None:
+        """Write the queued rows and stop the background task."""
+        await self.flush()
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        _queue_depth.remove()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            # Give the batch time to fill unless it is already full or a
+            # flush() is waiting.
+            if len(self._queue) < self.batch_size and not self._flush_now.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._flush_now.clear()
+            batch, self._queue = self._queue[: self.batch_size], self._queue[self.batch_size :]
+            try:
+                await self._write(batch)
+            finally:
+                self._completed += len(batch)
+                self._progress.set()
+                self._progress = asyncio.Event()
+
+    async def _write(self, batch: List[EventRow]) -> None:
+        by_namespace: Dict[str, List[EventRow]] = {}
+        for row in batch:
+            by_namespace.setdefault(row.namespace, []).append(row)
+        for namespace, rows in by_namespace.items():
+            await self._write_namespace(namespace, rows)
+
+    async def _write_namespace(self, namespace: str, rows: List[EventRow]) -> None:
+        start = time.perf_counter()
+        try:
+            from app.services.session_db import get_session_pool
+
+            pool = await get_session_pool(namespace)
+            async with pool.acquire() as conn:
+                await conn.executemany(INSERT_EVENTS, [row[1:] for row in rows])
+        except Exception:
+            _batches.inc(result="failed")
+            _dropped.inc(len(rows), reason="failed")
+            self._unavailable[namespace] = time.monotonic() + self.retry_after
+            logger.warning(
+                "Failed to write %d events for namespace=%s; suspending writes for %.0fs",
+                len(rows),
+                namespace,
+                self.retry_after,
+                exc_info=True,
+            )
+            return
+        _flush_seconds.observe(time.perf_counter() - start)
+        _batches.inc(result="written")
+
+
+@lru_cache
+def get_event_writer() -> EventWriter:
+    return EventWriter(
+        max_queue=settings.event_writer_queue_size,
+        batch_size=settings.event_writer_batch_size,
+        flush_interval=settings.event_writer_flush_interval,
+        retry_after=settings.event_writer_retry_after,
+    )
+
+
+async def close_event_writer() -> None:
+    """Drain the writer; the next get_event_writer() builds a fresh one."""
+    if get_event_writer.cache_info().currsize:
+        await get_event_writer().aclose()
+        get_event_writer.cache_clear()
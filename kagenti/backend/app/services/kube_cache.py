@@ -0,0 +1,537 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Watch-backed in-memory cache for KubernetesService reads.
+
+Each cached resource kind is kept in memory per enabled namespace by a
+ResourceInformer: a daemon thread that does an initial LIST, then WATCHes
+from the returned resourceVersion and applies ADDED/MODIFIED/DELETED events
+to a local store. Reads are served from the store only while the informer
+is *fresh* — it has synced and heard from the API server within
+``kube_cache_max_staleness`` seconds. Otherwise the caller falls back to a
+direct API read, so a cold or broken cache never returns wrong data for
+longer than the staleness bound.
+
+The set of enabled namespaces is itself tracked by a cluster-scoped
+Namespace informer; namespaced informers are started lazily on first read
+and stopped when their namespace loses the kagenti-enabled label.
+"""
+
+import copy
+import functools
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import kubernetes.watch
+from kubernetes.client import ApiException
+
+from app.core.config import settings
+from app.core.constants import (
+    AGENT_SANDBOX_CRD_GROUP,
+    AGENT_SANDBOX_CRD_VERSION,
+    AGENT_SANDBOX_PLURAL,
+    ENABLED_NAMESPACE_LABEL_KEY,
+    ENABLED_NAMESPACE_LABEL_VALUE,
+    SHIPWRIGHT_BUILDRUNS_PLURAL,
+    SHIPWRIGHT_BUILDS_PLURAL,
+    SHIPWRIGHT_CRD_GROUP,
+    SHIPWRIGHT_CRD_VERSION,
+    SKILL_TYPE_LABEL,
+    SKILL_TYPE_VALUE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cached kind keys
+KIND_DEPLOYMENTS = "deployments"
+KIND_STATEFULSETS = "statefulsets"
+KIND_JOBS = "jobs"
+KIND_SERVICES = "services"
+KIND_SANDBOXES = "sandboxes"
+KIND_BUILDS = "builds"
+KIND_BUILDRUNS = "buildruns"
+KIND_SKILL_CONFIGMAPS = "skill-configmaps"
+
+# Custom resources served from the cache, keyed by (group, version, plural)
+CUSTOM_RESOURCE_KINDS: Dict[Tuple[str, str, str], str] = {
+    (AGENT_SANDBOX_CRD_GROUP, AGENT_SANDBOX_CRD_VERSION, AGENT_SANDBOX_PLURAL): KIND_SANDBOXES,
+    (SHIPWRIGHT_CRD_GROUP, SHIPWRIGHT_CRD_VERSION, SHIPWRIGHT_BUILDS_PLURAL): KIND_BUILDS,
+    (SHIPWRIGHT_CRD_GROUP, SHIPWRIGHT_CRD_VERSION, SHIPWRIGHT_BUILDRUNS_PLURAL): KIND_BUILDRUNS,
+}
+
+# Backoff bounds for informer restarts after API errors (seconds)
+_INFORMER_MIN_BACKOFF = 1.0
+_INFORMER_MAX_BACKOFF = 30.0
+
+
+# ---------------------------------------------------------------------------
+# Label selectors
+# ---------------------------------------------------------------------------
+
+_SET_REQUIREMENT = re.compile(r"^([^\s!=(),]+)\s+(in|notin)\s+\(([^)]*)\)$")
+_EQUALITY_REQUIREMENT = re.compile(r"^([^\s!=(),]+)\s*(==|=|!=)\s*([^\s!=(),]*)$")
+_EXISTS_REQUIREMENT = re.compile(r"^(!?)([^\s!=(),]+)$")
+
+
+def parse_label_selector(selector: Optional[str]) -> Optional[frozenset]:
+    """Parse a label selector into a set of normalized requirements.
+
+    Supports equality (``k=v``, ``k==v``, ``k!=v``), existence (``k``,
+    ``!k``) and set-based (``k in (a,b)``, ``k notin (a,b)``) requirements.
+    Returns None when the selector cannot be parsed, so callers can fall
+    back to the API server instead of guessing.
+    """
+    if not selector or not selector.strip():
+        return frozenset()
+
+    # Split on commas that are not inside a set-based value list
+    parts, depth, current = [], 0, ""
+    for char in selector:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+
+    requirements = set()
+    for part in parts:
+        part = part.strip()
+        match = _SET_REQUIREMENT.match(part)
+        if match:
+            values = frozenset(v.strip() for v in match.group(3).split(",") if v.strip())
+            requirements.add((match.group(1), match.group(2), values))
+            continue
+        match = _EQUALITY_REQUIREMENT.match(part)
+        if match:
+            op = "!=" if match.group(2) == "!=" else "="
+            requirements.add((match.group(1), op, match.group(3)))
+            continue
+        match = _EXISTS_REQUIREMENT.match(part)
+        if match:
+            requirements.add((match.group(2), "!" if match.group(1) else "exists", None))
+            continue
+        return None
+    return frozenset(requirements)
+
+
+def _requirement_met(labels: dict, key: str, op: str, value: Any) -> bool:
+    present = key in labels
+    if op == "=":
+        return labels.get(key) == value
+    if op == "!=":
+        return not present or labels[key] != value
+    if op == "exists":
+        return present
+    if op == "!":
+        return not present
+    if op == "in":
+        return present and labels[key] in value
+    return not present or labels[key] not in value  # notin
+
+
+def labels_match(requirements: frozenset, labels: Optional[dict]) -> bool:
+    """Return True if *labels* satisfy every parsed selector requirement."""
+    labels = labels or {}
+    return all(_requirement_met(labels, key, op, value) for key, op, value in requirements)
+
+
+# ---------------------------------------------------------------------------
+# Object accessors (typed models and raw dicts)
+# ---------------------------------------------------------------------------
+
+
+def _metadata_field(obj: Any, field: str) -> Any:
+    """Read a metadata field from a model object or a dict."""
+    if isinstance(obj, dict):
+        return (obj.get("metadata") or {}).get(field)
+    metadata = getattr(obj, "metadata", None)
+    return getattr(metadata, field, None) if metadata is not None else None
+
+
+def _object_name(obj: Any) -> Optional[str]:
+    return _metadata_field(obj, "name")
+
+
+def _object_labels(obj: Any) -> Optional[dict]:
+    return _metadata_field(obj, "labels")
+
+
+def _split_list_result(result: Any) -> Tuple[list, Optional[str]]:
+    """Return (items, resourceVersion) for a typed or custom-object list response."""
+    if isinstance(result, dict):
+        metadata = result.get("metadata") or {}
+        return result.get("items") or [], metadata.get("resourceVersion")
+    return result.items or [], result.metadata.resource_version
+
+
+def _to_dict(obj: Any) -> Any:
+    """Convert typed models the same way KubernetesService direct reads do."""
+    return obj.to_dict() if hasattr(obj, "to_dict") else obj
+
+
+# ---------------------------------------------------------------------------
+# Informer
+# ---------------------------------------------------------------------------
+
+
+class ResourceInformer:  # pylint: disable=too-many-instance-attributes
+    """List+watch loop keeping one resource kind in memory for one namespace."""
+
+    def __init__(
+        self,
+        name: str,
+        list_func: Callable[..., Any],
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        transform: Callable[[Any], Any] = _to_dict,
+        max_staleness: float = 60.0,
+        on_delete: Optional[Callable[[str], None]] = None,
+        on_update: Optional[Callable[[Any], None]] = None,
+        key_func: Callable[[Any], str] = _object_name,
+    ):
+        self.name = name
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self._list_func = list_func
+        self._transform = transform
+        self._max_staleness = max_staleness
+        # Restart each watch well inside the staleness bound so a silently
+        # dead connection is noticed before cached reads go stale.
+        self._watch_timeout = max(1, int(max_staleness // 2))
+        self._on_delete = on_delete
+        self._on_update = on_update
+        self._key = key_func
+        self._store: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watch: Optional[kubernetes.watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+        self._synced = False
+        self._last_contact = 0.0
+
+    def _base_kwargs(self) -> dict:
+        kwargs: Dict[str, Any] = {}
+        if self.namespace is not None:
+            kwargs["namespace"] = self.namespace
+        if self.label_selector:
+            kwargs["label_selector"] = self.label_selector
+        return kwargs
+
+    def start(self) -> None:
+        """Start the list+watch thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"informer-{self.name}-{self.namespace or 'cluster'}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch loop; the daemon thread exits at its next event or timeout."""
+        self._stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def is_fresh(self) -> bool:
+        """True if the store is synced and within the staleness bound."""
+        return self._synced and (time.monotonic() - self._last_contact) <= self._max_staleness
+
+    def items(self) -> List[Any]:
+        with self._lock:
+            return list(self._store.values())
+
+    def lookup(self, name: str) -> Optional[Any]:
+        with self._lock:
+            return self._store.get(name)
+
+    def observe(self, obj: Any) -> None:
+        """Record an object returned by a local write so reads see it immediately."""
+        name = self._key(obj)
+        if name:
+            with self._lock:
+                self._store[name] = obj
+
+    def discard(self, name: str) -> None:
+        """Drop an object removed by a local write."""
+        with self._lock:
+            self._store.pop(name, None)
+
+    def _run(self) -> None:
+        resource_version: Optional[str] = None
+        backoff = _INFORMER_MIN_BACKOFF
+        while not self._stop.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                resource_version = self._watch_once(resource_version)
+                backoff = _INFORMER_MIN_BACKOFF
+            except ApiException as e:
+                resource_version = None
+                if e.status == 410:
+                    logger.debug("Informer %s/%s expired, relisting", self.name, self.namespace)
+                    continue
+                logger.warning(
+                    "Informer %s/%s failed (%s), retrying in %.0fs",
+                    self.name,
+                    self.namespace,
+                    e.status,
+                    backoff,
+                )
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, _INFORMER_MAX_BACKOFF)
+            except Exception:
+                resource_version = None
+                logger.warning(
+                    "Informer %s/%s crashed, retrying in %.0fs",
+                    self.name,
+                    self.namespace,
+                    backoff,
+                    exc_info=True,
+                )
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, _INFORMER_MAX_BACKOFF)
+
+    def _relist(self) -> Optional[str]:
+        result = self._list_func(**self._base_kwargs())
+        items, resource_version = _split_list_result(result)
+        store = {}
+        for item in items:
+            obj = self._transform(item)
+            name = self._key(obj)
+            if name:
+                store[name] = obj
+        with self._lock:
+            removed = set(self._store) - set(store)
+            self._store = store
+        self._synced = True
+        self._last_contact = time.monotonic()
+        if self._on_delete:
+            for name in removed:
+                self._on_delete(name)
+        if self._on_update:
+            for obj in store.values():
+                self._on_update(obj)
+        logger.debug(
+            "Informer %s/%s synced %d objects at rv=%s",
+            self.name,
+            self.namespace,
+            len(store),
+            resource_version,
+        )
+        return resource_version
+
+    def _watch_once(self, resource_version: Optional[str]) -> Optional[str]:
+        """Watch until the server closes the stream; return the last resourceVersion seen."""
+        self._watch = kubernetes.watch.Watch()
+        stream = self._watch.stream(
+            self._list_func,
+            resource_version=resource_version,
+            timeout_seconds=self._watch_timeout,
+            allow_watch_bookmarks=True,
+            _request_timeout=self._watch_timeout + 15,
+            **self._base_kwargs(),
+        )
+        for event in stream:
+            event_type = event.get("type")
+            raw = event.get("raw_object") or {}
+            resource_version = (raw.get("metadata") or {}).get("resourceVersion", resource_version)
+            self._last_contact = time.monotonic()
+            if event_type == "BOOKMARK":
+                continue
+            obj = self._transform(event.get("object"))
+            name = self._key(obj)
+            if not name:
+                continue
+            if event_type == "DELETED":
+                self.discard(name)
+                if self._on_delete:
+                    self._on_delete(name)
+            else:
+                with self._lock:
+                    self._store[name] = obj
+                if self._on_update:
+                    self._on_update(obj)
+            if self._stop.is_set():
+                break
+        # Clean end of a server-side timeout: we were connected throughout
+        self._last_contact = time.monotonic()
+        return resource_version
+
+
+# ---------------------------------------------------------------------------
+# Cache facade used by KubernetesService
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _KindSpec:
+    """How to list/watch a cached kind and which subset of it is kept."""
+
+    list_func: Callable[[Any], Callable[..., Any]]
+    transform: Callable[[Any], Any] = _to_dict
+    scope_selector: Optional[str] = None
+
+
+def _custom_lister(group: str, version: str, plural: str) -> Callable[[Any], Callable[..., Any]]:
+    def _lister(kube):
+        return functools.partial(
+            kube.custom_api.list_namespaced_custom_object,
+            group=group,
+            version=version,
+            plural=plural,
+        )
+
+    return _lister
+
+
+_KIND_SPECS: Dict[str, _KindSpec] = {
+    KIND_DEPLOYMENTS: _KindSpec(lambda kube: kube.apps_api.list_namespaced_deployment),
+    KIND_STATEFULSETS: _KindSpec(lambda kube: kube.apps_api.list_namespaced_stateful_set),
+    KIND_JOBS: _KindSpec(lambda kube: kube.batch_api.list_namespaced_job),
+    KIND_SERVICES: _KindSpec(lambda kube: kube.core_api.list_namespaced_service),
+    KIND_SANDBOXES: _KindSpec(
+        _custom_lister(AGENT_SANDBOX_CRD_GROUP, AGENT_SANDBOX_CRD_VERSION, AGENT_SANDBOX_PLURAL)
+    ),
+    KIND_BUILDS: _KindSpec(
+        _custom_lister(SHIPWRIGHT_CRD_GROUP, SHIPWRIGHT_CRD_VERSION, SHIPWRIGHT_BUILDS_PLURAL)
+    ),
+    KIND_BUILDRUNS: _KindSpec(
+        _custom_lister(SHIPWRIGHT_CRD_GROUP, SHIPWRIGHT_CRD_VERSION, SHIPWRIGHT_BUILDRUNS_PLURAL)
+    ),
+    # Skills consume V1ConfigMap objects, so keep the models as-is and only
+    # watch ConfigMaps labeled as skills.
+    KIND_SKILL_CONFIGMAPS: _KindSpec(
+        lambda kube: kube.core_api.list_namespaced_config_map,
+        transform=lambda obj: obj,
+        scope_selector=f"{SKILL_TYPE_LABEL}={SKILL_TYPE_VALUE}",
+    ),
+}
+
+
+class KubeCache:
+    """Shared informer registry serving KubernetesService reads from memory."""
+
+    def __init__(self, kube, max_staleness: Optional[float] = None):
+        self._kube = kube
+        self._max_staleness = float(
+            max_staleness if max_staleness is not None else settings.kube_cache_max_staleness
+        )
+        self._lock = threading.Lock()
+        self._informers: Dict[Tuple[str, str], ResourceInformer] = {}
+        self._namespaces = ResourceInformer(
+            "namespaces",
+            kube.core_api.list_namespace,
+            label_selector=f"{ENABLED_NAMESPACE_LABEL_KEY}={ENABLED_NAMESPACE_LABEL_VALUE}",
+            max_staleness=self._max_staleness,
+            on_delete=self._forget_namespace,
+        )
+
+    def start(self) -> None:
+        """Warm the enabled-namespace informer."""
+        self._namespaces.start()
+
+    def stop(self) -> None:
+        """Stop every informer (application shutdown)."""
+        self._namespaces.stop()
+        with self._lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop()
+
+    def enabled_namespaces(self) -> Optional[List[str]]:
+        """Sorted enabled namespaces, or None if the namespace informer is not fresh."""
+        self._namespaces.start()
+        if not self._namespaces.is_fresh():
+            return None
+        return sorted(_object_name(ns) for ns in self._namespaces.items())
+
+    def _forget_namespace(self, namespace: str) -> None:
+        with self._lock:
+            keys = [key for key in self._informers if key[1] == namespace]
+            informers = [self._informers.pop(key) for key in keys]
+        for informer in informers:
+            informer.stop()
+        if informers:
+            logger.info("Stopped %d informers for namespace %s", len(informers), namespace)
+
+    def _informer(self, kind: str, namespace: str) -> Optional[ResourceInformer]:
+        """Return the (lazily started) informer for *kind* in an enabled *namespace*."""
+        enabled = self.enabled_namespaces()
+        if enabled is None or namespace not in enabled:
+            return None
+        key = (kind, namespace)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                spec = _KIND_SPECS[kind]
+                informer = ResourceInformer(
+                    kind,
+                    spec.list_func(self._kube),
+                    namespace=namespace,
+                    label_selector=spec.scope_selector,
+                    transform=spec.transform,
+                    max_staleness=self._max_staleness,
+                )
+                self._informers[key] = informer
+                informer.start()
+        return informer
+
+    def list(self, kind: str, namespace: str, label_selector: Optional[str] = None):
+        """Return cached objects matching *label_selector*, or None to read through."""
+        informer = self._informer(kind, namespace)
+        if informer is None or not informer.is_fresh():
+            return None
+        requirements = parse_label_selector(label_selector)
+        if requirements is None:
+            return None
+        scope = parse_label_selector(_KIND_SPECS[kind].scope_selector)
+        if not scope <= requirements:
+            return None  # The informer only holds a subset of what was asked for
+        return [
+            copy.deepcopy(obj)
+            for obj in informer.items()
+            if labels_match(requirements, _object_labels(obj))
+        ]
+
+    def get(self, kind: str, namespace: str, name: str):
+        """Return a cached object, or None to read through.
+
+        Raises a 404 ApiException when a fresh, unscoped informer does not
+        hold the object, mirroring what a direct read would do.
+        """
+        informer = self._informer(kind, namespace)
+        if informer is None or not informer.is_fresh():
+            return None
+        obj = informer.lookup(name)
+        if obj is not None:
+            return copy.deepcopy(obj)
+        if _KIND_SPECS[kind].scope_selector:
+            return None  # Absent from a scoped informer says nothing about the object
+        raise ApiException(status=404, reason="Not Found")
+
+    def observe(self, kind: str, namespace: str, obj: Any) -> None:
+        """Apply the result of a local create/patch to an existing informer."""
+        with self._lock:
+            informer = self._informers.get((kind, namespace))
+        if informer is not None:
+            informer.observe(obj)
+
+    def discard(self, kind: str, namespace: str, name: str) -> None:
+        """Apply a local delete to an existing informer."""
+        with self._lock:
+            informer = self._informers.get((kind, namespace))
+        if informer is not None:
+            informer.discard(name)
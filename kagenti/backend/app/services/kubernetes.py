@@ -4,18 +4,29 @@
 """
 Kubernetes service for API client management and common operations.
 """
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,too-many-lines
 
 import logging
 import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import kubernetes.client
 import kubernetes.config
 from kubernetes.client import ApiException
 from kubernetes.config import ConfigException
 
+from app.core.config import settings
+from app.services.api_discovery import ApiDiscoveryCache
+from app.services.kube_cache import (
+    KIND_DEPLOYMENTS,
+    KIND_JOBS,
+    KIND_SERVICES,
+    KIND_SKILL_CONFIGMAPS,
+    KIND_STATEFULSETS,
+    CUSTOM_RESOURCE_KINDS,
+    KubeCache,
+)
 from app.core.constants import (
     AGENT_SANDBOX_CRD_GROUP,
     AGENT_SANDBOX_CRD_VERSION,
@@ -36,7 +47,7 @@ def _sanitize(value: str) -> str:
     return value.replace("\n", "").replace("\r", "").replace("\x00", "")
 
 
-class KubernetesService:
+class KubernetesService:  # pylint: disable=too-many-instance-attributes
     """Service class for Kubernetes API interactions."""
 
     def __init__(self):
@@ -48,6 +59,11 @@ class KubernetesService:
         self._rbac_api: Optional[kubernetes.client.RbacAuthorizationV1Api] = None
         self._apis_api: Optional[kubernetes.client.ApisApi] = None
         self._discovery_v1_api: Optional[kubernetes.client.DiscoveryV1Api] = None
+        self._coordination_api: Optional[kubernetes.client.CoordinationV1Api] = None
+        self.discovery = ApiDiscoveryCache(self, settings.api_discovery_refresh_interval)
+        self.cache = None
+        if settings.kube_cache_enabled:
+            self.cache = KubeCache(self)
 
     def _load_config(self) -> kubernetes.client.ApiClient:
         """Load Kubernetes configuration (in-cluster or kubeconfig)."""
@@ -114,23 +130,62 @@ class KubernetesService:
             self._discovery_v1_api = kubernetes.client.DiscoveryV1Api(self.api_client)
         return self._discovery_v1_api
 
+    @property
+    def coordination_api(self) -> kubernetes.client.CoordinationV1Api:
+        """Get CoordinationV1Api client for Leases (leader election)."""
+        if self._coordination_api is None:
+            self._coordination_api = kubernetes.client.CoordinationV1Api(self.api_client)
+        return self._coordination_api
+
     def is_running_in_cluster(self) -> bool:
         """Check if running inside a Kubernetes cluster."""
         return bool(os.getenv("KUBERNETES_SERVICE_HOST"))
 
+    # -------------------------------------------------------------------------
+    # Read cache hooks (no-ops unless KUBE_CACHE_ENABLED)
+    # -------------------------------------------------------------------------
+
+    def _cached_list(
+        self, kind: Optional[str], namespace: str, label_selector: Optional[str]
+    ) -> Optional[list]:
+        """Serve a list from the informer cache, or None to read through."""
+        if self.cache is None or kind is None:
+            return None
+        return self.cache.list(kind, namespace, label_selector)
+
+    def _cached_get(self, kind: Optional[str], namespace: str, name: str) -> Optional[dict]:
+        """Serve a get from the informer cache, or None to read through."""
+        if self.cache is None or kind is None:
+            return None
+        return self.cache.get(kind, namespace, name)
+
+    def _cache_observe(self, kind: Optional[str], namespace: str, obj) -> None:
+        if self.cache is not None and kind is not None:
+            self.cache.observe(kind, namespace, obj)
+
+    def _cache_discard(self, kind: Optional[str], namespace: str, name: str) -> None:
+        if self.cache is not None and kind is not None:
+            self.cache.discard(kind, namespace, name)
+
+    @staticmethod
+    def _custom_kind(group: str, version: str, plural: str) -> Optional[str]:
+        return CUSTOM_RESOURCE_KINDS.get((group, version, plural))
+
     def api_group_exists(self, group: str) -> bool:
-        """Return True if the cluster advertises the given API group (GET /apis/)."""
-        try:
-            response = self.apis_api.get_api_versions(_request_timeout=10)
-            groups = response.groups or []
-            logger.debug(
-                "Available API groups: %s",
-                sorted(g.name for g in groups if g and g.name),
-            )
-            return any(g.name == group for g in groups if g and g.name)
-        except ApiException as e:
-            logger.warning("Error listing API groups: %s", e)
-            return False
+        """Return True if the cluster advertises the given API group (cached GET /apis/)."""
+        return self.discovery.group_exists(group)
+
+    def sandboxes_served(self) -> bool:
+        """Return True unless discovery shows the agent-sandbox CRD is not installed."""
+        return self.discovery.sandboxes_served()
+
+    def shipwright_builds_served(self) -> bool:
+        """Return True unless discovery shows the Shipwright Build CRD is not installed."""
+        return self.discovery.shipwright_builds_served()
+
+    def invalidate_api_discovery(self) -> None:
+        """Drop cached API discovery, e.g. after a CRD was installed."""
+        self.discovery.invalidate()
 
     def list_namespaces(self, label_selector: Optional[str] = None) -> List[str]:
         """List namespaces with optional label selector."""
@@ -146,6 +201,10 @@ class KubernetesService:
 
     def list_enabled_namespaces(self) -> List[str]:
         """List namespaces with kagenti-enabled=true label."""
+        if self.cache is not None:
+            cached = self.cache.enabled_namespaces()
+            if cached is not None:
+                return cached
         selector = f"{ENABLED_NAMESPACE_LABEL_KEY}={ENABLED_NAMESPACE_LABEL_VALUE}"
         return self.list_namespaces(label_selector=selector)
 
@@ -158,6 +217,11 @@ class KubernetesService:
         label_selector: Optional[str] = None,
     ) -> List[dict]:
         """List custom resources in a namespace."""
+        cached = self._cached_list(
+            self._custom_kind(group, version, plural), namespace, label_selector
+        )
+        if cached is not None:
+            return cached
         try:
             response = self.custom_api.list_namespaced_custom_object(
                 group=group,
@@ -199,6 +263,9 @@ class KubernetesService:
         name: str,
     ) -> dict:
         """Get a specific custom resource."""
+        cached = self._cached_get(self._custom_kind(group, version, plural), namespace, name)
+        if cached is not None:
+            return cached
         try:
             return self.custom_api.get_namespaced_custom_object(
                 group=group,
@@ -221,13 +288,15 @@ class KubernetesService:
     ) -> dict:
         """Delete a custom resource."""
         try:
-            return self.custom_api.delete_namespaced_custom_object(
+            result = self.custom_api.delete_namespaced_custom_object(
                 group=group,
                 version=version,
                 namespace=namespace,
                 plural=plural,
                 name=name,
             )
+            self._cache_discard(self._custom_kind(group, version, plural), namespace, name)
+            return result
         except ApiException as e:
             logger.error(f"Error deleting {plural}/{name} in {namespace}: {e}")
             raise
@@ -242,13 +311,15 @@ class KubernetesService:
     ) -> dict:
         """Create a custom resource."""
         try:
-            return self.custom_api.create_namespaced_custom_object(
+            result = self.custom_api.create_namespaced_custom_object(
                 group=group,
                 version=version,
                 namespace=namespace,
                 plural=plural,
                 body=body,
             )
+            self._cache_observe(self._custom_kind(group, version, plural), namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error creating {plural} in {namespace}: {e}")
             raise
@@ -264,7 +335,7 @@ class KubernetesService:
     ) -> dict:
         """Patch a custom resource."""
         try:
-            return self.custom_api.patch_namespaced_custom_object(
+            result = self.custom_api.patch_namespaced_custom_object(
                 group=group,
                 version=version,
                 namespace=namespace,
@@ -272,10 +343,117 @@ class KubernetesService:
                 name=name,
                 body=body,
             )
+            self._cache_observe(self._custom_kind(group, version, plural), namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error patching {plural}/{name} in {namespace}: {e}")
             raise
 
+    # -------------------------------------------------------------------------
+    # Cross-namespace paginated listing (one cluster-scoped call per kind)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _list_page(result) -> Tuple[List[dict], Optional[str]]:
+        """Split a list response into (items, continue token or None)."""
+        if isinstance(result, dict):
+            return result.get("items", []), result.get("metadata", {}).get("continue") or None
+        # The client names metadata.continue "_continue" (continue is a keyword)
+        token = result.metadata._continue  # pylint: disable=protected-access
+        return [item.to_dict() for item in result.items], token or None
+
+    def list_deployments_all_namespaces(
+        self,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List one page of Deployments across all namespaces."""
+        try:
+            return self._list_page(
+                self.apps_api.list_deployment_for_all_namespaces(
+                    label_selector=label_selector, limit=limit, _continue=continue_token
+                )
+            )
+        except ApiException as e:
+            logger.error(f"Error listing Deployments across namespaces: {e}")
+            raise
+
+    def list_statefulsets_all_namespaces(
+        self,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List one page of StatefulSets across all namespaces."""
+        try:
+            return self._list_page(
+                self.apps_api.list_stateful_set_for_all_namespaces(
+                    label_selector=label_selector, limit=limit, _continue=continue_token
+                )
+            )
+        except ApiException as e:
+            logger.error(f"Error listing StatefulSets across namespaces: {e}")
+            raise
+
+    def list_jobs_all_namespaces(
+        self,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List one page of Jobs across all namespaces."""
+        try:
+            return self._list_page(
+                self.batch_api.list_job_for_all_namespaces(
+                    label_selector=label_selector, limit=limit, _continue=continue_token
+                )
+            )
+        except ApiException as e:
+            logger.error(f"Error listing Jobs across namespaces: {e}")
+            raise
+
+    def list_custom_resources_all_namespaces(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List one page of a namespaced custom resource across all namespaces."""
+        try:
+            return self._list_page(
+                self.custom_api.list_cluster_custom_object(
+                    group=group,
+                    version=version,
+                    plural=plural,
+                    label_selector=label_selector,
+                    limit=limit,
+                    _continue=continue_token,
+                )
+            )
+        except ApiException as e:
+            logger.error(f"Error listing {plural} across namespaces: {e}")
+            raise
+
+    def list_sandboxes_all_namespaces(
+        self,
+        label_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        continue_token: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List one page of Sandbox custom resources across all namespaces."""
+        return self.list_custom_resources_all_namespaces(
+            AGENT_SANDBOX_CRD_GROUP,
+            AGENT_SANDBOX_CRD_VERSION,
+            AGENT_SANDBOX_PLURAL,
+            label_selector=label_selector,
+            limit=limit,
+            continue_token=continue_token,
+        )
+
     # -------------------------------------------------------------------------
     # ServiceAccount Operations
     # -------------------------------------------------------------------------
@@ -417,14 +595,18 @@ class KubernetesService:
             result = self.apps_api.create_namespaced_deployment(
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_DEPLOYMENTS, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error creating Deployment in {namespace}: {e}")
             raise
 
     def get_deployment(self, namespace: str, name: str) -> dict:
         """Get a Deployment by name."""
+        cached = self._cached_get(KIND_DEPLOYMENTS, namespace, name)
+        if cached is not None:
+            return cached
         try:
             result = self.apps_api.read_namespaced_deployment(
                 name=name,
@@ -437,6 +619,9 @@ class KubernetesService:
 
     def list_deployments(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
         """List Deployments in a namespace with optional label selector."""
+        cached = self._cached_list(KIND_DEPLOYMENTS, namespace, label_selector)
+        if cached is not None:
+            return cached
         try:
             result = self.apps_api.list_namespaced_deployment(
                 namespace=namespace,
@@ -454,6 +639,7 @@ class KubernetesService:
                 name=name,
                 namespace=namespace,
             )
+            self._cache_discard(KIND_DEPLOYMENTS, namespace, name)
         except ApiException as e:
             logger.error(f"Error deleting Deployment {name} in {namespace}: {e}")
             raise
@@ -465,8 +651,9 @@ class KubernetesService:
                 name=name,
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_DEPLOYMENTS, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error patching Deployment {name} in {namespace}: {e}")
             raise
@@ -481,14 +668,18 @@ class KubernetesService:
             result = self.core_api.create_namespaced_service(
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_SERVICES, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error creating Service in {namespace}: {e}")
             raise
 
     def get_service(self, namespace: str, name: str) -> dict:
         """Get a Service by name."""
+        cached = self._cached_get(KIND_SERVICES, namespace, name)
+        if cached is not None:
+            return cached
         try:
             result = self.core_api.read_namespaced_service(
                 name=name,
@@ -516,6 +707,9 @@ class KubernetesService:
 
     def list_services(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
         """List Services in a namespace with optional label selector."""
+        cached = self._cached_list(KIND_SERVICES, namespace, label_selector)
+        if cached is not None:
+            return cached
         try:
             result = self.core_api.list_namespaced_service(
                 namespace=namespace,
@@ -534,6 +728,7 @@ class KubernetesService:
             name=name,
             namespace=namespace,
         )
+        self._cache_discard(KIND_SERVICES, namespace, name)
 
     # -------------------------------------------------------------------------
     # Secret Operations
@@ -616,6 +811,21 @@ class KubernetesService:
                 return result.to_dict()
             raise
 
+    def list_configmaps(self, namespace: str, label_selector: Optional[str] = None) -> list:
+        """List ConfigMaps in a namespace with optional label selector.
+
+        Returns V1ConfigMap model objects (not dicts), which is what the skills
+        router consumes. Skill ConfigMaps are served from the read cache.
+        """
+        cached = self._cached_list(KIND_SKILL_CONFIGMAPS, namespace, label_selector)
+        if cached is not None:
+            return cached
+        result = self.core_api.list_namespaced_config_map(
+            namespace=namespace,
+            label_selector=label_selector,
+        )
+        return result.items
+
     # -------------------------------------------------------------------------
     # StatefulSet Operations
     # -------------------------------------------------------------------------
@@ -626,14 +836,18 @@ class KubernetesService:
             result = self.apps_api.create_namespaced_stateful_set(
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_STATEFULSETS, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error creating StatefulSet in {namespace}: {e}")
             raise
 
     def get_statefulset(self, namespace: str, name: str) -> dict:
         """Get a StatefulSet by name."""
+        cached = self._cached_get(KIND_STATEFULSETS, namespace, name)
+        if cached is not None:
+            return cached
         try:
             result = self.apps_api.read_namespaced_stateful_set(
                 name=name,
@@ -646,6 +860,9 @@ class KubernetesService:
 
     def list_statefulsets(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
         """List StatefulSets in a namespace with optional label selector."""
+        cached = self._cached_list(KIND_STATEFULSETS, namespace, label_selector)
+        if cached is not None:
+            return cached
         try:
             result = self.apps_api.list_namespaced_stateful_set(
                 namespace=namespace,
@@ -663,6 +880,7 @@ class KubernetesService:
                 name=name,
                 namespace=namespace,
             )
+            self._cache_discard(KIND_STATEFULSETS, namespace, name)
         except ApiException as e:
             logger.error(f"Error deleting StatefulSet {name} in {namespace}: {e}")
             raise
@@ -674,8 +892,9 @@ class KubernetesService:
                 name=name,
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_STATEFULSETS, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error patching StatefulSet {name} in {namespace}: {e}")
             raise
@@ -690,14 +909,18 @@ class KubernetesService:
             result = self.batch_api.create_namespaced_job(
                 namespace=namespace,
                 body=body,
-            )
-            return result.to_dict()
+            ).to_dict()
+            self._cache_observe(KIND_JOBS, namespace, result)
+            return result
         except ApiException as e:
             logger.error(f"Error creating Job in {namespace}: {e}")
             raise
 
     def get_job(self, namespace: str, name: str) -> dict:
         """Get a Job by name."""
+        cached = self._cached_get(KIND_JOBS, namespace, name)
+        if cached is not None:
+            return cached
         try:
             result = self.batch_api.read_namespaced_job(
                 name=name,
@@ -710,6 +933,9 @@ class KubernetesService:
 
     def list_jobs(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
         """List Jobs in a namespace with optional label selector."""
+        cached = self._cached_list(KIND_JOBS, namespace, label_selector)
+        if cached is not None:
+            return cached
         try:
             result = self.batch_api.list_namespaced_job(
                 namespace=namespace,
@@ -729,6 +955,7 @@ class KubernetesService:
                 namespace=namespace,
                 propagation_policy="Background",
             )
+            self._cache_discard(KIND_JOBS, namespace, name)
         except ApiException as e:
             logger.error(f"Error deleting Job {name} in {namespace}: {e}")
             raise
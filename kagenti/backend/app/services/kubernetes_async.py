@@ -0,0 +1,394 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Async facade over KubernetesService.
+
+The official ``kubernetes`` client is blocking, so calling it directly from
+``async def`` handlers stalls the event loop (and every in-flight SSE stream)
+for the duration of each API round trip. AsyncKubernetesService runs those
+calls on a dedicated, bounded thread pool instead:
+
+- ``await kube.<method>(...)`` proxies any public KubernetesService method.
+- ``await kube.run(func, *args)`` runs an arbitrary blocking helper (e.g.
+  ``route_exists(kube.sync, ...)``) on the same pool.
+- Every call is bounded by ``KUBE_CALL_TIMEOUT`` (queue wait included) and
+  surfaces as ``ApiException(status=504)`` on expiry so the routers' existing
+  ``ApiException`` -> ``HTTPException`` mapping keeps working.
+- When more than ``KUBE_EXECUTOR_MAX_QUEUE`` calls are waiting for a worker,
+  new calls are rejected with ``ApiException(status=503)``.
+
+A timed-out call cannot interrupt a worker thread that is already talking to
+the API server; it keeps the worker until the client's own socket timeout.
+Calls that are still queued when they time out are cancelled outright.
+"""
+
+import asyncio
+import base64
+import binascii
+import concurrent.futures
+import inspect
+import json
+import logging
+import threading
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+from kubernetes.client import ApiException
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.services.kubernetes import KubernetesService, get_kubernetes_service
+
+logger = logging.getLogger(__name__)
+
+_executor_queued = registry.gauge(
+    "kagenti_kube_executor_queued",
+    "Kubernetes API calls waiting for an executor worker",
+)
+_executor_active = registry.gauge(
+    "kagenti_kube_executor_active",
+    "Kubernetes API calls currently running on an executor worker",
+)
+_executor_workers = registry.gauge(
+    "kagenti_kube_executor_workers",
+    "Size of the Kubernetes API executor thread pool",
+)
+_calls_total = registry.counter(
+    "kagenti_kube_calls_total",
+    "Kubernetes API calls dispatched through the async executor",
+    ("method", "outcome"),
+)
+_call_seconds = registry.summary(
+    "kagenti_kube_call_seconds",
+    "Kubernetes API call latency including executor queue wait",
+    ("method",),
+)
+_queue_wait_seconds = registry.summary(
+    "kagenti_kube_executor_wait_seconds",
+    "Time Kubernetes API calls spent queued before a worker picked them up",
+)
+
+# Public KubernetesService methods that AsyncKubernetesService proxies.
+_PROXIED_METHODS = frozenset(
+    name
+    for name, _ in inspect.getmembers(KubernetesService, inspect.isfunction)
+    if not name.startswith("_")
+)
+
+
+class KubeExecutor:
+    """Bounded thread pool that tracks queue depth and active workers."""
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kube-api"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def submit(self, func: Callable, *args, **kwargs) -> Optional[concurrent.futures.Future]:
+        """Queue ``func`` for a worker, or return None when the queue is full."""
+        with self._lock:
+            if self._queued >= self.max_queue:
+                return None
+            self._queued += 1
+        submitted_at = time.monotonic()
+        started = threading.Event()
+
+        def task():
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            started.set()
+            _queue_wait_seconds.observe(time.monotonic() - submitted_at)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+        def on_done(future: concurrent.futures.Future):
+            # A future cancelled while still queued never runs task()
+            if future.cancelled() and not started.is_set():
+                with self._lock:
+                    self._queued -= 1
+
+        future = self._pool.submit(task)
+        future.add_done_callback(on_done)
+        return future
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache
+def get_kube_executor() -> KubeExecutor:
+    """Get the process-wide Kubernetes API executor."""
+    executor = KubeExecutor(
+        max_workers=settings.kube_executor_workers,
+        max_queue=settings.kube_executor_max_queue,
+    )
+    _executor_workers.set(executor.max_workers)
+    _executor_queued.set_function(lambda: executor.queued)
+    _executor_active.set_function(lambda: executor.active)
+    return executor
+
+
+def shutdown_kube_executor() -> None:
+    """Stop the shared executor; the next get_kube_executor() builds a fresh one."""
+    if get_kube_executor.cache_info().currsize:
+        get_kube_executor().shutdown()
+        get_kube_executor.cache_clear()
+
+
+class AsyncKubernetesService:
+    """Awaitable wrapper that runs KubernetesService calls off the event loop."""
+
+    def __init__(
+        self,
+        kube: KubernetesService,
+        executor: Optional[KubeExecutor] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._kube = kube
+        self._executor = executor or get_kube_executor()
+        self._timeout = settings.kube_call_timeout if timeout is None else timeout
+
+    @property
+    def sync(self) -> KubernetesService:
+        """The underlying blocking service, for helpers passed to ``run``."""
+        return self._kube
+
+    def with_timeout(self, timeout: float) -> "AsyncKubernetesService":
+        """Return a wrapper sharing this executor with a different per-call timeout."""
+        return AsyncKubernetesService(self._kube, self._executor, timeout)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the Kubernetes executor."""
+        return await self._dispatch(getattr(func, "__name__", "call"), func, args, kwargs)
+
+    async def _dispatch(self, method: str, func: Callable, args, kwargs) -> Any:
+        started = time.monotonic()
+        future = self._executor.submit(func, *args, **kwargs)
+        if future is None:
+            _calls_total.inc(method=method, outcome="rejected")
+            logger.warning(
+                "Kubernetes executor queue full (%d waiting); rejecting %s",
+                self._executor.queued,
+                method,
+            )
+            raise ApiException(status=503, reason="Kubernetes API executor is saturated")
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            _calls_total.inc(method=method, outcome="timeout")
+            logger.warning("Kubernetes API call %s timed out after %.1fs", method, self._timeout)
+            raise ApiException(
+                status=504,
+                reason=f"Kubernetes API call {method} timed out after {self._timeout:g}s",
+            )
+        except Exception:
+            _calls_total.inc(method=method, outcome="error")
+            raise
+        finally:
+            _call_seconds.observe(time.monotonic() - started, method=method)
+        _calls_total.inc(method=method, outcome="ok")
+        return result
+
+    def __getattr__(self, name: str):
+        if name not in _PROXIED_METHODS:
+            raise AttributeError(
+                f"{type(self).__name__} has no attribute {name!r}; "
+                f"use .sync.{name} inside kube.run() for blocking access"
+            )
+        func = getattr(self._kube, name)
+
+        async def proxy(*args, **kwargs):
+            return await self._dispatch(name, func, args, kwargs)
+
+        proxy.__name__ = name
+        return proxy
+
+
+def as_async(kube) -> AsyncKubernetesService:
+    """Wrap ``kube`` unless it is already an AsyncKubernetesService."""
+    if isinstance(kube, AsyncKubernetesService):
+        return kube
+    return AsyncKubernetesService(kube)
+
+
+async def gather_with_deadline(
+    calls: Dict[str, Awaitable], timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Await ``calls`` concurrently under one shared deadline.
+
+    Returns a dict with the same keys whose values are either the call's
+    result or the exception it raised. Calls still running when the deadline
+    expires are cancelled and reported as ``ApiException(status=504)``.
+    """
+    timeout = settings.kube_fanout_deadline if timeout is None else timeout
+    tasks = {key: asyncio.ensure_future(call) for key, call in calls.items()}
+    if not tasks:
+        return {}
+    try:
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+
+    results: Dict[str, Any] = {}
+    for key, task in tasks.items():
+        if task in pending:
+            results[key] = ApiException(status=504, reason=f"Deadline of {timeout:g}s exceeded")
+        elif task.exception() is not None:
+            results[key] = task.exception()
+        else:
+            results[key] = task.result()
+    return results
+
+
+# Generations read by workload_generation(), per KubernetesService:
+# {(namespace, name): (expires_at, generation)}
+_GenerationCache = Dict[Tuple[str, str], Tuple[float, Optional[str]]]
+_generations: "weakref.WeakKeyDictionary[Any, _GenerationCache]" = weakref.WeakKeyDictionary()
+_MAX_GENERATIONS = 4096
+
+
+async def workload_generation(
+    kube: AsyncKubernetesService, namespace: str, name: str
+) -> Optional[str]:
+    """Identify the current rollout of an agent or tool workload.
+
+    Returns ``kind:uid:generation`` of the Deployment or StatefulSet named
+    ``name``, or None when neither exists. Caches keyed by this value are
+    invalidated by a redeploy or a spec change.
+
+    The value is cached for ``workload_generation_ttl`` seconds, so card and
+    tool catalog hits do not cost two Kubernetes reads each; a rollout is
+    noticed within that time.
+    """
+    cache = _generations.setdefault(kube.sync, {})
+    key = (namespace, name)
+    now = time.monotonic()
+    cached = cache.get(key)
+    if cached is not None and cached[0] > now and settings.workload_generation_ttl > 0:
+        return cached[1]
+
+    results = await gather_with_deadline(
+        {
+            "deployment": kube.get_deployment(namespace=namespace, name=name),
+            "statefulset": kube.get_statefulset(namespace=namespace, name=name),
+        }
+    )
+    generation = None
+    for kind, result in results.items():
+        if isinstance(result, dict):
+            metadata = result.get("metadata") or {}
+            generation = f"{kind}:{metadata.get('uid')}:{metadata.get('generation')}"
+            break
+    else:
+        if any(
+            isinstance(r, Exception) and getattr(r, "status", None) != 404 for r in results.values()
+        ):
+            return None  # Not known to be absent; do not cache a failed read
+
+    if settings.workload_generation_ttl > 0:
+        if len(cache) >= _MAX_GENERATIONS:
+            for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[stale]
+        if len(cache) < _MAX_GENERATIONS:
+            cache[key] = (now + settings.workload_generation_ttl, generation)
+    return generation
+
+
+def _encode_cursors(cursors: Dict[str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(cursors).encode()).decode().rstrip("=")
+
+
+def _decode_cursors(token: str) -> Dict[str, str]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursors = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Malformed continue token") from e
+    if not isinstance(cursors, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in cursors.items()
+    ):
+        raise ValueError("Malformed continue token")
+    return cursors
+
+
+# List errors that will not go away by retrying the same page
+_PERMANENT_LIST_ERRORS = (403, 404)
+
+
+async def list_page_across_kinds(
+    listers: Dict[str, Callable[..., Awaitable[Tuple[List[dict], Optional[str]]]]],
+    limit: int,
+    continue_token: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Fetch the next page of several cluster-wide list calls under one token.
+
+    ``listers`` map a kind to a callable accepting ``limit`` and
+    ``continue_token`` and returning ``(items, continue)`` (see the
+    ``*_all_namespaces`` methods on KubernetesService). The page budget is
+    split evenly across kinds that still have items, and the returned token
+    packs each kind's Kubernetes continue token. A kind that fails is reported
+    in the results (as its exception) and keeps its incoming cursor, so the
+    next page retries it; only a kind that is absent or forbidden (404, 403)
+    is dropped from later pages.
+
+    Raises ValueError for a malformed ``continue_token``.
+    """
+    if continue_token:
+        cursors = _decode_cursors(continue_token)
+    else:
+        cursors = dict.fromkeys(listers, "")
+    active = [kind for kind in listers if kind in cursors]
+    per_kind = max(1, limit // max(1, len(active)))
+
+    results = await gather_with_deadline(
+        {
+            kind: listers[kind](limit=per_kind, continue_token=cursors[kind] or None)
+            for kind in active
+        },
+        timeout,
+    )
+
+    pages: Dict[str, Any] = {}
+    next_cursors: Dict[str, str] = {}
+    for kind, result in results.items():
+        if isinstance(result, BaseException):
+            pages[kind] = result
+            if getattr(result, "status", None) not in _PERMANENT_LIST_ERRORS:
+                next_cursors[kind] = cursors[kind]
+            continue
+        items, cont = result
+        pages[kind] = items
+        if cont:
+            next_cursors[kind] = cont
+    return pages, _encode_cursors(next_cursors) if next_cursors else None
+
+
+def get_async_kubernetes_service(
+    kube: KubernetesService = Depends(get_kubernetes_service),
+) -> AsyncKubernetesService:
+    """FastAPI dependency returning the async facade over the shared service."""
+    return AsyncKubernetesService(kube)
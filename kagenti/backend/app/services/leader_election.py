@@ -0,0 +1,248 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Lease-based leader election for singleton background work.
+
+When the backend Deployment runs several replicas, work such as build
+reconciliation should run on exactly one of them. LeaderElector implements
+the coordination.k8s.io/v1 Lease protocol used by client-go:
+
+- A replica becomes leader by writing its identity into the Lease's
+  ``holderIdentity``; optimistic concurrency (``resourceVersion``) makes
+  simultaneous attempts safe, since all but one ``replace`` get a 409.
+- The leader renews ``renewTime`` every ``retry_period`` seconds. If it
+  cannot renew for ``renew_deadline`` seconds it steps down locally.
+- Followers only take over once they have seen the same lease record,
+  unchanged, for ``lease_duration`` seconds of their *own* clock, so clock
+  skew between nodes does not cause early takeovers.
+- On shutdown the leader releases the Lease so a standby takes over without
+  waiting for expiry.
+
+``lease_duration`` must exceed ``renew_deadline`` so a leader that loses
+contact stops working before anyone else may start.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import kubernetes.client
+from kubernetes.client import ApiException
+
+from app.core.metrics import registry
+from app.services.kubernetes import KubernetesService
+from app.services.kubernetes_async import as_async
+
+logger = logging.getLogger(__name__)
+
+ROLE_LEADER = "leader"
+ROLE_STANDBY = "standby"
+
+_SERVICE_ACCOUNT_NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
+_is_leader = registry.gauge(
+    "kagenti_leader_election_is_leader",
+    "1 if this replica currently holds the lease",
+    ("lease",),
+)
+_transitions_total = registry.counter(
+    "kagenti_leader_election_transitions_total",
+    "Times this replica acquired or lost the lease",
+    ("lease", "event"),
+)
+
+
+def default_identity() -> str:
+    """Pod name (or hostname) plus a random suffix, unique across restarts."""
+    base = os.getenv("POD_NAME") or socket.gethostname()
+    return f"{base}_{uuid.uuid4().hex[:8]}"
+
+
+def default_namespace() -> str:
+    """Namespace the backend runs in, used to hold the Lease."""
+    namespace = os.getenv("POD_NAMESPACE")
+    if namespace:
+        return namespace
+    try:
+        with open(_SERVICE_ACCOUNT_NAMESPACE_FILE, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return "kagenti-system"
+
+
+class LeaderElector:  # pylint: disable=too-many-instance-attributes
+    """Acquire and renew a coordination.k8s.io/v1 Lease."""
+
+    def __init__(
+        self,
+        kube: KubernetesService,
+        lease_name: str,
+        namespace: str,
+        identity: str,
+        lease_duration: float = 15.0,
+        renew_deadline: float = 10.0,
+        retry_period: float = 2.0,
+    ):
+        if lease_duration <= renew_deadline:
+            raise ValueError("lease_duration must be greater than renew_deadline")
+        self._kube = kube
+        self.lease_name = lease_name
+        self.namespace = namespace
+        self.identity = identity
+        self.lease_duration = lease_duration
+        self.renew_deadline = renew_deadline
+        self.retry_period = retry_period
+        self.holder: Optional[str] = None
+        self._leading = asyncio.Event()
+        self._lost = asyncio.Event()
+        self._last_renew = 0.0
+        # Last lease record seen (holder, renewTime) and when we first saw it
+        self._observed: Optional[Tuple[Optional[str], Any]] = None
+        self._observed_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leading.is_set()
+
+    @property
+    def role(self) -> str:
+        return ROLE_LEADER if self.is_leader else ROLE_STANDBY
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "role": self.role,
+            "identity": self.identity,
+            "holder": self.holder,
+            "lease": f"{self.namespace}/{self.lease_name}",
+        }
+
+    async def wait_for_leadership(self) -> None:
+        await self._leading.wait()
+
+    async def wait_for_loss(self) -> None:
+        await self._lost.wait()
+
+    def _spec(self, now: datetime, acquire_time: Any, transitions: int) -> Any:
+        return kubernetes.client.V1LeaseSpec(
+            holder_identity=self.identity,
+            lease_duration_seconds=int(self.lease_duration),
+            acquire_time=acquire_time or now,
+            renew_time=now,
+            lease_transitions=transitions,
+        )
+
+    def try_acquire_or_renew(self) -> bool:
+        """One blocking acquire/renew attempt; True if we hold the lease afterwards."""
+        api = self._kube.coordination_api
+        now = datetime.now(timezone.utc)
+        try:
+            lease = api.read_namespaced_lease(self.lease_name, self.namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            body = kubernetes.client.V1Lease(
+                metadata=kubernetes.client.V1ObjectMeta(
+                    name=self.lease_name, namespace=self.namespace
+                ),
+                spec=self._spec(now, None, 0),
+            )
+            try:
+                api.create_namespaced_lease(self.namespace, body)
+            except ApiException as create_error:
+                if create_error.status == 409:
+                    return False
+                raise
+            self.holder = self.identity
+            return True
+
+        spec = lease.spec or kubernetes.client.V1LeaseSpec()
+        holder = spec.holder_identity
+        record = (holder, spec.renew_time)
+        if record != self._observed:
+            self._observed = record
+            self._observed_at = time.monotonic()
+        self.holder = holder
+
+        if holder and holder != self.identity:
+            duration = spec.lease_duration_seconds or self.lease_duration
+            if time.monotonic() - self._observed_at < duration:
+                return False
+
+        if holder == self.identity:
+            lease.spec = self._spec(now, spec.acquire_time, spec.lease_transitions or 0)
+        else:
+            lease.spec = self._spec(now, None, (spec.lease_transitions or 0) + 1)
+        try:
+            api.replace_namespaced_lease(self.lease_name, self.namespace, lease)
+        except ApiException as e:
+            if e.status == 409:
+                return False
+            raise
+        self.holder = self.identity
+        self._observed = (self.identity, now)
+        self._observed_at = time.monotonic()
+        return True
+
+    def release(self) -> None:
+        """Blocking best-effort release so a standby can take over immediately."""
+        api = self._kube.coordination_api
+        try:
+            lease = api.read_namespaced_lease(self.lease_name, self.namespace)
+            if lease.spec is None or lease.spec.holder_identity != self.identity:
+                return
+            lease.spec.holder_identity = None
+            lease.spec.lease_duration_seconds = 1
+            lease.spec.renew_time = datetime.now(timezone.utc)
+            api.replace_namespaced_lease(self.lease_name, self.namespace, lease)
+        except ApiException:
+            logger.debug("Failed to release lease %s", self.lease_name, exc_info=True)
+
+    def _set_leading(self, leading: bool) -> None:
+        if leading == self.is_leader:
+            return
+        if leading:
+            self._lost.clear()
+            self._leading.set()
+            _transitions_total.inc(lease=self.lease_name, event="acquired")
+            logger.info(
+                "Acquired lease %s/%s as %s", self.namespace, self.lease_name, self.identity
+            )
+        else:
+            self._leading.clear()
+            self._lost.set()
+            _transitions_total.inc(lease=self.lease_name, event="lost")
+            logger.warning("Lost lease %s/%s", self.namespace, self.lease_name)
+        _is_leader.set(1 if leading else 0, lease=self.lease_name)
+
+    async def run(self) -> None:
+        """Acquire/renew until cancelled, then release the lease if held."""
+        akube = as_async(self._kube)
+        _is_leader.set(0, lease=self.lease_name)
+        try:
+            while True:
+                try:
+                    acquired = await akube.run(self.try_acquire_or_renew)
+                except Exception:
+                    acquired = False
+                    logger.warning(
+                        "Lease %s/%s update failed", self.namespace, self.lease_name, exc_info=True
+                    )
+                if acquired:
+                    self._last_renew = time.monotonic()
+                    self._set_leading(True)
+                elif self.holder != self.identity or (
+                    time.monotonic() - self._last_renew > self.renew_deadline
+                ):
+                    # Someone else holds the lease, or we could not renew in time
+                    self._set_leading(False)
+                await asyncio.sleep(self.retry_period)
+        finally:
+            if self.is_leader:
+                self._set_leading(False)
+                await asyncio.shield(akube.run(self.release))
@@ -0,0 +1,394 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Pool of long-lived MCP client sessions to tool servers.
+
+Opening a streamable-HTTP transport and running ``session.initialize()`` on
+every connect/invoke costs a full MCP handshake per call. McpSessionPool keeps
+one initialized ``ClientSession`` per (namespace, tool) and shares it between
+callers (MCP multiplexes concurrent requests over one session):
+
+- A session unused for ``MCP_SESSION_HEALTH_CHECK_INTERVAL`` seconds is pinged
+  before reuse; a failed ping closes it and a new one is opened.
+- A call that fails with a transport error, is cancelled, or gets an
+  ``McpError`` saying the session is gone (``Session terminated`` after the
+  server restarted, ``Connection closed``) marks the session unhealthy: no new
+  caller gets it, and it is closed once its last borrower returns it, so other
+  callers' requests on it are not cut off. Any other ``McpError`` is a
+  JSON-RPC error from the tool and keeps the session.
+- Sessions idle for ``MCP_SESSION_IDLE_TIMEOUT`` seconds are closed by a
+  background reaper.
+- At most ``MCP_SESSION_MAX`` sessions are open; the least recently used idle
+  session is closed to make room, and McpPoolExhaustedError is raised when every
+  session is busy.
+- If the tool's endpoint changes (e.g. a new Service port) the old session is
+  replaced.
+- ``notifications/tools/list_changed`` from a server is passed to callbacks
+  registered with add_tools_changed_listener() (e.g. the tool catalog).
+
+The anyio task groups inside the MCP transport must be entered and exited by
+the same task, so each pooled session is owned by a dedicated asyncio task
+that opens the transport, signals readiness and then waits to be closed.
+
+With ``MCP_SESSION_POOL_ENABLED=false`` every call gets a one-shot session,
+the previous behaviour.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from mcp import ClientSession, types
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]
+
+# The streamable-HTTP client reports a 404 for its session id (the server
+# forgot the session, e.g. after a restart) with this code
+_SESSION_TERMINATED = 32600
+
+# Callbacks for notifications/tools/list_changed, shared by every pool instance
+_tools_changed_listeners: List[Callable[[str, str], None]] = []
+
+_sessions_open = registry.gauge(
+    "kagenti_mcp_sessions",
+    "Pooled MCP sessions currently open",
+)
+_session_events = registry.counter(
+    "kagenti_mcp_session_events_total",
+    "MCP session pool events (created, reused, unhealthy, discarded, evicted_idle, "
+    "evicted_lru, exhausted)",
+    ("event",),
+)
+
+
+class McpPoolExhaustedError(RuntimeError):
+    """Raised when MCP_SESSION_MAX sessions are open and all are in use."""
+
+
+def add_tools_changed_listener(listener: Callable[[str, str], None]) -> None:
+    """Call ``listener(namespace, tool)`` when a tool server's tool list changes."""
+    if listener not in _tools_changed_listeners:
+        _tools_changed_listeners.append(listener)
+
+
+def remove_tools_changed_listener(listener: Callable[[str, str], None]) -> None:
+    if listener in _tools_changed_listeners:
+        _tools_changed_listeners.remove(listener)
+
+
+def _unwrap(error: BaseException) -> BaseException:
+    """Return the single leaf exception of nested anyio exception groups."""
+    while isinstance(error, BaseExceptionGroup) and len(error.exceptions) == 1:
+        error = error.exceptions[0]
+    return error
+
+
+def session_gone(error: McpError) -> bool:
+    """True if ``error`` means the MCP session itself is unusable (not a tool error)."""
+    return error.error.code in (_SESSION_TERMINATED, CONNECTION_CLOSED)
+
+
+class PooledSession:  # pylint: disable=too-many-instance-attributes
+    """An initialized MCP ClientSession owned by a background task."""
+
+    def __init__(self, key: SessionKey, endpoint: str):
+        self.key = key
+        self.endpoint = endpoint
+        self.session: Optional[ClientSession] = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.unhealthy = False  # handed out no more; closed when in_use drops to 0
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self._task is not None
+            and not self._task.done()
+            and not self._stop.is_set()
+            and not self.unhealthy
+            and self.session is not None
+        )
+
+    async def open(self, timeout: float) -> None:
+        """Start the owner task and wait until the session is initialized."""
+        self._task = asyncio.create_task(
+            self._run(), name=f"mcp-session-{self.key[0]}/{self.key[1]}"
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(self._ready), timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _run(self) -> None:
+        try:
+            async with streamablehttp_client(url=self.endpoint, headers={}) as (
+                read_stream,
+                write_stream,
+                _,
+            ):
+                async with ClientSession(
+                    read_stream, write_stream, message_handler=self._on_message
+                ) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set_result(None)
+                    await self._stop.wait()
+        except BaseException as e:  # pylint: disable=broad-except
+            error = _unwrap(e)
+            if not self._ready.done():
+                self._ready.set_exception(error)
+            elif not isinstance(error, asyncio.CancelledError):
+                logger.debug("MCP session %s/%s ended: %r", *self.key, error)
+        finally:
+            self.session = None
+            if not self._ready.done():
+                self._ready.cancel()
+
+    async def _on_message(self, message) -> None:
+        """Forward ``tools/list_changed`` notifications to registered listeners."""
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            logger.info("Tool list changed on MCP server %s/%s", *self.key)
+            for listener in list(_tools_changed_listeners):
+                try:
+                    listener(*self.key)
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning("tools/list_changed listener failed", exc_info=True)
+        await asyncio.sleep(0)
+
+    async def ping(self, timeout: float) -> bool:
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    async def close(self) -> None:
+        """Ask the owner task to close the transport and wait for it."""
+        self._stop.set()
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), 5.0)
+        except (asyncio.TimeoutError, Exception):  # pylint: disable=broad-except
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class McpSessionPool:  # pylint: disable=too-many-instance-attributes
+    """Long-lived MCP sessions keyed by (namespace, tool)."""
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.max_sessions = max_sessions or settings.mcp_session_max
+        self.idle_timeout = (
+            settings.mcp_session_idle_timeout if idle_timeout is None else idle_timeout
+        )
+        self.health_check_interval = (
+            settings.mcp_session_health_check_interval
+            if health_check_interval is None
+            else health_check_interval
+        )
+        self.connect_timeout = connect_timeout or settings.mcp_session_connect_timeout
+        self.enabled = settings.mcp_session_pool_enabled if enabled is None else enabled
+        self._sessions: Dict[SessionKey, PooledSession] = {}
+        self._locks: Dict[SessionKey, asyncio.Lock] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+        _sessions_open.set_function(lambda: len(self._sessions))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def start(self) -> None:
+        """Start the idle-session reaper (call from a running event loop)."""
+        if self.enabled and self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.create_task(self._reap_forever(), name="mcp-session-reaper")
+
+    @asynccontextmanager
+    async def session(
+        self, namespace: str, tool: str, endpoint: str
+    ) -> AsyncIterator[ClientSession]:
+        """Borrow an initialized session for ``tool`` in ``namespace``."""
+        if not self.enabled:
+            async with self._one_shot(endpoint) as session:
+                yield session
+            return
+
+        pooled = await self._acquire((namespace, tool), endpoint)
+        try:
+            yield pooled.session
+        except McpError as e:
+            # JSON-RPC errors from the tool keep the session
+            if session_gone(e):
+                await self._mark_unhealthy(pooled)
+            raise
+        except GeneratorExit:
+            # A streaming caller closed early: the session is fine
+            raise
+        except BaseException:
+            # Transport failure (or cancellation mid-request): reconnect next time
+            await self._mark_unhealthy(pooled)
+            raise
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+            if pooled.unhealthy and pooled.in_use == 0:
+                await pooled.close()
+
+    @asynccontextmanager
+    async def _one_shot(self, endpoint: str) -> AsyncIterator[ClientSession]:
+        try:
+            async with streamablehttp_client(url=endpoint, headers={}) as (
+                read_stream,
+                write_stream,
+                _,
+            ):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    yield session
+        except BaseExceptionGroup as e:
+            raise _unwrap(e) from e
+
+    async def _acquire(self, key: SessionKey, endpoint: str) -> PooledSession:
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None and (not pooled.alive or pooled.endpoint != endpoint):
+                await self._retire(pooled)
+                pooled = None
+            if pooled is not None and pooled.in_use == 0:
+                idle = time.monotonic() - pooled.last_used
+                if idle >= self.health_check_interval and not await pooled.ping(
+                    self.connect_timeout
+                ):
+                    _session_events.inc(event="unhealthy")
+                    await self._discard(pooled)
+                    pooled = None
+
+            if pooled is None:
+                await self._make_room()
+                pooled = PooledSession(key, endpoint)
+                await pooled.open(self.connect_timeout)
+                self._sessions[key] = pooled
+                _session_events.inc(event="created")
+                logger.info("Opened pooled MCP session for %s/%s", *key)
+            else:
+                _session_events.inc(event="reused")
+            pooled.in_use += 1
+            pooled.last_used = time.monotonic()
+            return pooled
+
+    async def _make_room(self) -> None:
+        if len(self._sessions) < self.max_sessions:
+            return
+        idle = [s for s in self._sessions.values() if s.in_use == 0]
+        if not idle:
+            _session_events.inc(event="exhausted")
+            raise McpPoolExhaustedError(
+                f"All {self.max_sessions} MCP sessions are in use; try again later"
+            )
+        victim = min(idle, key=lambda s: s.last_used)
+        _session_events.inc(event="evicted_lru")
+        await self._discard(victim)
+
+    async def _discard(self, pooled: PooledSession) -> None:
+        if self._sessions.get(pooled.key) is pooled:
+            del self._sessions[pooled.key]
+        await pooled.close()
+
+    async def _retire(self, pooled: PooledSession) -> None:
+        """Stop handing out ``pooled``; close it now if idle, else on its last release."""
+        pooled.unhealthy = True
+        if self._sessions.get(pooled.key) is pooled:
+            del self._sessions[pooled.key]
+        if pooled.in_use == 0:
+            await pooled.close()
+
+    async def _mark_unhealthy(self, pooled: PooledSession) -> None:
+        """Retire a session a borrower found broken without cutting off other borrowers."""
+        if pooled.unhealthy:
+            return
+        _session_events.inc(event="discarded")
+        async with self._locks.setdefault(pooled.key, asyncio.Lock()):
+            await self._retire(pooled)
+
+    async def invalidate(self, namespace: str, tool: str) -> None:
+        """Retire the session for ``tool`` so the next caller reconnects."""
+        pooled = self._sessions.get((namespace, tool))
+        if pooled is not None:
+            await self._mark_unhealthy(pooled)
+
+    async def evict_idle(self) -> int:
+        """Close sessions idle for longer than the idle timeout."""
+        now = time.monotonic()
+        expired = [
+            s
+            for s in list(self._sessions.values())
+            if s.in_use == 0 and now - s.last_used >= self.idle_timeout
+        ]
+        for pooled in expired:
+            _session_events.inc(event="evicted_idle")
+            logger.debug("Closing idle MCP session for %s/%s", *pooled.key)
+            await self._discard(pooled)
+        return len(expired)
+
+    async def _reap_forever(self) -> None:
+        interval = max(1.0, min(self.idle_timeout / 2, 30.0))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("MCP session reaper failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        """Stop the reaper and close every session."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+
+@lru_cache
+def get_mcp_session_pool() -> McpSessionPool:
+    """Get the application-wide MCP session pool."""
+    return McpSessionPool()
+
+
+async def close_mcp_session_pool() -> None:
+    """Close the shared pool; the next get_mcp_session_pool() builds a fresh one."""
+    if get_mcp_session_pool.cache_info().currsize:
+        await get_mcp_session_pool().aclose()
+        get_mcp_session_pool.cache_clear()
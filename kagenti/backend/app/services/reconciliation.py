@@ -4,22 +4,33 @@
 """
 Build reconciliation loop.
 
-Periodically scans for orphaned Shipwright Builds whose BuildRun succeeded
-but whose workload (Deployment/StatefulSet/Job) was never created — typically
-because the user navigated away from the UI build-progress page before
-finalization.
+Finds orphaned Shipwright Builds whose BuildRun succeeded but whose workload
+(Deployment/StatefulSet/Job) was never created — typically because the user
+navigated away from the UI build-progress page before finalization.
 
-The loop calls the existing finalize functions directly, reusing all
+Rather than rescanning every Build in every namespace on a short interval,
+BuildReconciler watches kagenti BuildRuns cluster-wide and enqueues a build
+only when one of its runs reaches Succeeded. Keys go through a deduplicating
+WorkQueue drained by a bounded set of workers; failed keys are retried with
+per-key exponential backoff. A slow periodic resync enqueues every build as a
+safety net for missed events. With the watch disabled, the resync runs at
+``BUILD_RECONCILIATION_INTERVAL`` like the original scan loop.
+
+Workers call the existing finalize functions directly, reusing all
 idempotency checks, config merging, and workload creation logic.
 """
 
 import asyncio
+import functools
 import logging
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
 from kubernetes.client import ApiException
+from kubernetes.config import ConfigException
 
 from app.core.config import settings
+from app.core.metrics import registry
 from app.core.constants import (
     KAGENTI_TYPE_LABEL,
     RESOURCE_TYPE_AGENT,
@@ -30,15 +41,37 @@ from app.core.constants import (
     SHIPWRIGHT_CRD_VERSION,
 )
 from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.kube_cache import ResourceInformer
+from app.services.kubernetes_async import AsyncKubernetesService, as_async
+from app.services.leader_election import LeaderElector, default_identity, default_namespace
 from app.services.shipwright import get_latest_buildrun, is_build_succeeded
 
 logger = logging.getLogger(__name__)
 
+BUILD_NAME_LABEL = "kagenti.io/build-name"
+
+# Reconciliation role reported on /ready when leader election is off
+ROLE_ACTIVE = "active"
+ROLE_DISABLED = "disabled"
+
+# (namespace, build name, resource type)
+BuildKey = Tuple[str, str, str]
+
+_reconciles_total = registry.counter(
+    "kagenti_build_reconciles_total",
+    "Build reconciliation attempts processed by the reconciler workers",
+    ("outcome",),
+)
+_queue_depth = registry.gauge(
+    "kagenti_build_reconcile_queue_depth",
+    "Builds waiting in the reconciliation work queue",
+)
+
 
 def _workload_exists(kube: KubernetesService, namespace: str, name: str) -> bool:
     """Check if any workload (Deployment, StatefulSet, Job, or Sandbox) exists for the given name."""
     getters = [kube.get_deployment, kube.get_statefulset, kube.get_job]
-    if settings.kagenti_feature_flag_agent_sandbox:
+    if settings.kagenti_feature_flag_agent_sandbox and kube.sandboxes_served():
         getters.append(kube.get_sandbox)
     for getter in getters:
         try:
@@ -50,14 +83,12 @@ def _workload_exists(kube: KubernetesService, namespace: str, name: str) -> bool
     return False
 
 
-async def reconcile_builds() -> None:
-    """Single reconciliation pass — find and finalize orphaned builds."""
-    kube = get_kubernetes_service()
-    namespaces = kube.list_enabled_namespaces()
-
-    for namespace in namespaces:
+async def _list_kagenti_builds(akube: AsyncKubernetesService) -> List[BuildKey]:
+    """List (namespace, name, type) for every agent/tool Build in enabled namespaces."""
+    keys: List[BuildKey] = []
+    for namespace in await akube.list_enabled_namespaces():
         try:
-            builds = kube.list_custom_resources(
+            builds = await akube.list_custom_resources(
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=namespace,
@@ -75,19 +106,25 @@ async def reconcile_builds() -> None:
         for build in builds:
             name = build["metadata"]["name"]
             resource_type = build["metadata"].get("labels", {}).get(KAGENTI_TYPE_LABEL)
+            if resource_type in (RESOURCE_TYPE_AGENT, RESOURCE_TYPE_TOOL):
+                keys.append((namespace, name, resource_type))
+    return keys
 
-            if resource_type not in (RESOURCE_TYPE_AGENT, RESOURCE_TYPE_TOOL):
-                continue
 
-            try:
-                await _reconcile_single_build(kube, namespace, name, resource_type)
-            except Exception:
-                logger.warning(
-                    "Failed to reconcile build '%s/%s', will retry next cycle",
-                    namespace,
-                    name,
-                    exc_info=True,
-                )
+async def reconcile_builds() -> None:
+    """Single reconciliation pass — find and finalize orphaned builds."""
+    kube = get_kubernetes_service()
+
+    for namespace, name, resource_type in await _list_kagenti_builds(as_async(kube)):
+        try:
+            await _reconcile_single_build(kube, namespace, name, resource_type)
+        except Exception:
+            logger.warning(
+                "Failed to reconcile build '%s/%s', will retry next cycle",
+                namespace,
+                name,
+                exc_info=True,
+            )
 
 
 async def _reconcile_single_build(
@@ -97,8 +134,9 @@ async def _reconcile_single_build(
     resource_type: str,
 ) -> None:
     """Attempt to finalize a single orphaned build."""
+    akube = as_async(kube)
     # Get latest BuildRun
-    buildruns = kube.list_custom_resources(
+    buildruns = await akube.list_custom_resources(
         group=SHIPWRIGHT_CRD_GROUP,
         version=SHIPWRIGHT_CRD_VERSION,
         namespace=namespace,
@@ -111,7 +149,7 @@ async def _reconcile_single_build(
         return  # Build not done yet, skip
 
     # Quick pre-check: skip if workload already exists
-    if _workload_exists(kube, namespace, name):
+    if await akube.run(_workload_exists, kube, namespace, name):
         return
 
     logger.info(
@@ -166,21 +204,294 @@ async def _reconcile_single_build(
             raise
 
 
-async def run_reconciliation_loop() -> None:
-    """Background loop that periodically reconciles builds.
+class WorkQueue:  # pylint: disable=too-many-instance-attributes
+    """Deduplicating asyncio work queue with per-key exponential backoff.
 
-    The loop is sequential: sleep only starts *after* the current
-    reconciliation pass completes, so there is no risk of overlapping
-    runs even when a pass takes longer than the configured interval.
+    Mirrors the client-go workqueue contract: a key is queued at most once,
+    a key re-added while a worker holds it is queued again only after
+    ``done()``, and ``add_rate_limited()`` delays a retry by
+    ``base_delay * 2**failures`` (capped at ``max_delay``) until ``forget()``
+    resets the failure count. All methods must run on the event loop thread.
     """
-    interval = settings.build_reconciliation_interval
-    # Sleep first — give the cluster time to settle after startup
-    await asyncio.sleep(interval)
 
-    while True:
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 300.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: Set[Hashable] = set()
+        self._processing: Set[Hashable] = set()
+        self._dirty: Set[Hashable] = set()
+        self._failures: Dict[Hashable, int] = {}
+        self._delayed: Dict[Hashable, asyncio.TimerHandle] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: Hashable) -> None:
+        """Queue ``key`` unless it is already waiting."""
+        if key in self._pending:
+            return
+        if key in self._processing:
+            self._dirty.add(key)
+            return
+        self._pending.add(key)
+        self._queue.put_nowait(key)
+
+    def add_after(self, key: Hashable, delay: float) -> None:
+        """Queue ``key`` after ``delay`` seconds; an earlier pending retry wins."""
+        if delay <= 0:
+            self.add(key)
+            return
+        if key in self._delayed:
+            return
+
+        def fire():
+            self._delayed.pop(key, None)
+            self.add(key)
+
+        self._delayed[key] = asyncio.get_running_loop().call_later(delay, fire)
+
+    def add_rate_limited(self, key: Hashable) -> float:
+        """Requeue a failed key with exponential backoff; return the delay used."""
+        failures = self._failures.get(key, 0)
+        self._failures[key] = failures + 1
+        delay = min(self.max_delay, self.base_delay * (2**failures))
+        self.add_after(key, delay)
+        return delay
+
+    def forget(self, key: Hashable) -> None:
+        """Reset the backoff for ``key`` after a successful attempt."""
+        self._failures.pop(key, None)
+
+    async def get(self) -> Hashable:
+        """Wait for the next key and mark it as being processed."""
+        key = await self._queue.get()
+        self._pending.discard(key)
+        self._processing.add(key)
+        return key
+
+    def done(self, key: Hashable) -> None:
+        """Release ``key``; requeue it if it was re-added while processing."""
+        self._processing.discard(key)
+        if key in self._dirty:
+            self._dirty.discard(key)
+            self.add(key)
+
+    def shutdown(self) -> None:
+        """Cancel delayed retries."""
+        for handle in self._delayed.values():
+            handle.cancel()
+        self._delayed.clear()
+
+
+def _buildrun_key(obj: Any) -> Optional[str]:
+    metadata = obj.get("metadata") or {}
+    if not metadata.get("name"):
+        return None
+    return f"{metadata.get('namespace')}/{metadata['name']}"
+
+
+def _slim_buildrun(obj: Any) -> Dict[str, Any]:
+    """Keep only what the reconciler reads from a BuildRun watch event."""
+    metadata = obj.get("metadata") or {}
+    return {
+        "metadata": {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": metadata.get("labels") or {},
+        },
+        "status": {"conditions": (obj.get("status") or {}).get("conditions") or []},
+    }
+
+
+class BuildReconciler:  # pylint: disable=too-many-instance-attributes
+    """Watch-driven build reconciler with a work queue and bounded workers."""
+
+    def __init__(
+        self,
+        kube: KubernetesService,
+        workers: Optional[int] = None,
+        resync_interval: Optional[float] = None,
+        watch: Optional[bool] = None,
+    ):
+        self._kube = kube
+        self._akube = as_async(kube)
+        self._watch = settings.build_reconciliation_watch if watch is None else watch
+        if resync_interval is None:
+            resync_interval = (
+                settings.build_reconciliation_resync_interval
+                if self._watch
+                else settings.build_reconciliation_interval
+            )
+        self._resync_interval = resync_interval
+        self._workers = workers or settings.build_reconciliation_workers
+        self.queue = WorkQueue(
+            base_delay=settings.build_reconciliation_backoff_base,
+            max_delay=settings.build_reconciliation_backoff_max,
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # BuildRuns already enqueued as Succeeded; touched only by the informer thread
+        self._succeeded_runs: Set[str] = set()
+
+    def _on_buildrun_update(self, buildrun: Dict[str, Any]) -> None:
+        """Informer callback: enqueue the owning build when a run first succeeds."""
+        run_key = _buildrun_key(buildrun)
+        if run_key is None or run_key in self._succeeded_runs:
+            return
+        if not is_build_succeeded(buildrun):
+            return
+        labels = buildrun["metadata"]["labels"]
+        build_name = labels.get(BUILD_NAME_LABEL)
+        resource_type = labels.get(KAGENTI_TYPE_LABEL)
+        if not build_name or resource_type not in (RESOURCE_TYPE_AGENT, RESOURCE_TYPE_TOOL):
+            return
+        self._succeeded_runs.add(run_key)
+        key = (buildrun["metadata"]["namespace"], build_name, resource_type)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.queue.add, key)
+
+    def _on_buildrun_delete(self, run_key: str) -> None:
+        self._succeeded_runs.discard(run_key)
+
+    def _start_informer(self) -> ResourceInformer:
+        informer = ResourceInformer(
+            "buildruns",
+            functools.partial(
+                self._kube.custom_api.list_cluster_custom_object,
+                SHIPWRIGHT_CRD_GROUP,
+                SHIPWRIGHT_CRD_VERSION,
+                SHIPWRIGHT_BUILDRUNS_PLURAL,
+            ),
+            label_selector=BUILD_NAME_LABEL,
+            transform=_slim_buildrun,
+            on_update=self._on_buildrun_update,
+            on_delete=self._on_buildrun_delete,
+            key_func=_buildrun_key,
+        )
+        informer.start()
+        return informer
+
+    async def resync(self) -> int:
+        """Enqueue every agent/tool build in enabled namespaces."""
+        keys = await _list_kagenti_builds(self._akube)
+        for key in keys:
+            self.queue.add(key)
+        return len(keys)
+
+    async def process(self, key: BuildKey) -> None:
+        """Reconcile one build if its namespace is still enabled."""
+        namespace, name, resource_type = key
+        if namespace not in await self._akube.list_enabled_namespaces():
+            return
+        await _reconcile_single_build(self._kube, namespace, name, resource_type)
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self.queue.get()
+            try:
+                await self.process(key)
+            except Exception:
+                delay = self.queue.add_rate_limited(key)
+                _reconciles_total.inc(outcome="error")
+                logger.warning(
+                    "Failed to reconcile build '%s/%s', retrying in %.0fs",
+                    key[0],
+                    key[1],
+                    delay,
+                    exc_info=True,
+                )
+            else:
+                self.queue.forget(key)
+                _reconciles_total.inc(outcome="ok")
+            finally:
+                self.queue.done(key)
+
+    async def run(self) -> None:
+        """Run the watch, workers and periodic resync until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        _queue_depth.set_function(lambda: len(self.queue))
+        informer = self._start_informer() if self._watch else None
+        workers = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
         try:
-            await reconcile_builds()
-        except Exception:
-            logger.exception("Build reconciliation error")
+            while True:
+                # Sleep first — with the watch on, its initial list already
+                # enqueues succeeded runs; without it, give the cluster time
+                # to settle after startup.
+                await asyncio.sleep(self._resync_interval)
+                try:
+                    count = await self.resync()
+                    logger.debug("Build reconciliation resync enqueued %d builds", count)
+                except Exception:
+                    logger.exception("Build reconciliation resync error")
+        finally:
+            if informer is not None:
+                informer.stop()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.queue.shutdown()
+
+
+_elector: Optional[LeaderElector] = None
+
+
+def reconciliation_status() -> Dict[str, Any]:
+    """Role of this replica in build reconciliation, for the /ready endpoint."""
+    if not settings.enable_build_reconciliation:
+        return {"role": ROLE_DISABLED}
+    if _elector is None:
+        return {"role": ROLE_ACTIVE}
+    return _elector.status()
+
+
+async def _reconcile_while_leading(kube: KubernetesService, elector: LeaderElector) -> None:
+    """Run the reconciler until it fails or the lease is lost."""
+    reconciler = asyncio.create_task(BuildReconciler(kube).run())
+    lost = asyncio.create_task(elector.wait_for_loss())
+    try:
+        await asyncio.wait({reconciler, lost}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        reconciler.cancel()
+        lost.cancel()
+        await asyncio.gather(reconciler, lost, return_exceptions=True)
+    if not reconciler.cancelled() and reconciler.exception() is not None:
+        logger.error("Build reconciler stopped", exc_info=reconciler.exception())
+        await asyncio.sleep(elector.retry_period)
+
 
-        await asyncio.sleep(interval)
+async def run_reconciliation_loop() -> None:
+    """Background task running the build reconciler until cancelled.
+
+    With BUILD_RECONCILIATION_LEADER_ELECTION enabled, only the replica
+    holding the reconciliation Lease runs the reconciler; the others stand
+    by and take over when the lease is released or expires.
+    """
+    global _elector  # pylint: disable=global-statement
+    try:
+        kube = get_kubernetes_service()
+    except ConfigException:
+        logger.warning("Could not load Kubernetes config; build reconciliation disabled")
+        return
+    if not settings.build_reconciliation_leader_election:
+        await BuildReconciler(kube).run()
+        return
+
+    elector = LeaderElector(
+        kube,
+        lease_name=settings.leader_election_lease_name,
+        namespace=settings.leader_election_namespace or default_namespace(),
+        identity=default_identity(),
+        lease_duration=settings.leader_election_lease_duration,
+        renew_deadline=settings.leader_election_renew_deadline,
+        retry_period=settings.leader_election_retry_period,
+    )
+    _elector = elector
+    election = asyncio.create_task(elector.run())
+    try:
+        while True:
+            await elector.wait_for_leadership()
+            await _reconcile_while_leading(kube, elector)
+    finally:
+        election.cancel()
+        await asyncio.gather(election, return_exceptions=True)
+        _elector = None
@@ -0,0 +1,165 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Paged session lists from the ``sessions`` table.
+
+Lists are ordered newest first by ``(updated_at, context_id)`` and paged
+with an opaque keyset cursor instead of ``OFFSET``, so every page costs the
+same however deep it is. Each filter combination the list views use has a
+matching index (see SCHEMA_MIGRATIONS in session_db.py):
+
+- namespace                   idx_sessions_ns_recent
+- namespace + owner           idx_sessions_ns_owner_recent
+- namespace + visibility      idx_sessions_ns_visibility_recent
+- namespace + agent_name      idx_sessions_ns_agent_recent
+- sessions shared with others idx_sessions_ns_shared_recent (partial)
+
+Non-admins see their own sessions plus shared ones (not ``private``, or
+without an owner; the same rule as event_history.session_readable()). That
+is an ``OR`` no single index can serve, so it runs as two index-ordered
+branches (own and shared) merged by a ``UNION ALL``.
+
+``search`` matches a substring of the title (``ILIKE``); it uses the
+trigram index idx_sessions_title_trgm when the database has ``pg_trgm``.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_COLUMNS = (
+    "context_id, agent_name, title, owner, visibility, created_at, updated_at, last_message_at"
+)
+_ORDER = "ORDER BY updated_at DESC, context_id DESC"
+
+# Must match the predicate of idx_sessions_ns_shared_recent
+SHARED = "(visibility IS DISTINCT FROM 'private' OR COALESCE(owner, '') = '')"
+
+
+def encode_cursor(updated_at: datetime, context_id: str) -> str:
+    raw = json.dumps([updated_at.isoformat(), context_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """The ``(updated_at, context_id)`` of a cursor; ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        updated_at, context_id = json.loads(raw)
+        return datetime.fromisoformat(updated_at), str(context_id)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def build_query(
+    namespace: str,
+    username: str,
+    is_admin: bool,
+    owner: Optional[str] = None,
+    visibility: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    search: Optional[str] = None,
+    after: Optional[Tuple[datetime, str]] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[str, List[Any]]:
+    """The SQL and arguments for one page of ``limit`` sessions after ``after``."""
+    args: List[Any] = [namespace]
+
+    def arg(value: Any) -> str:
+        args.append(value)
+        return f"${len(args)}"
+
+    common = ["namespace = $1"]
+    if agent_name:
+        common.append(f"agent_name = {arg(agent_name)}")
+    if visibility:
+        common.append(f"visibility = {arg(visibility)}")
+    if search:
+        common.append(f"title ILIKE {arg(_like_pattern(search))}")
+    if after is not None:
+        common.append(f"(updated_at, context_id) < ({arg(after[0])}, {arg(after[1])})")
+
+    if is_admin or owner == username:
+        branches = [common + [f"owner = {arg(owner)}"] if owner else common]
+    elif owner:
+        branches = [common + [f"owner = {arg(owner)}", SHARED]]
+    else:
+        me = arg(username)
+        branches = [
+            common + [f"owner = {me}"],
+            common + [SHARED, f"owner IS DISTINCT FROM {me}"],
+        ]
+
+    limit_arg = arg(limit)
+    selects = [
+        f"SELECT {_COLUMNS} FROM sessions WHERE {' AND '.join(where)} {_ORDER} LIMIT {limit_arg}"
+        for where in branches
+    ]
+    if len(selects) == 1:
+        return selects[0], args
+    union = " UNION ALL ".join(f"({select})" for select in selects)
+    return f"SELECT * FROM ({union}) AS page {_ORDER} LIMIT {limit_arg}", args
+
+
+def _session(row) -> Dict[str, Any]:
+    def iso(value):
+        return value.isoformat() if value is not None else None
+
+    return {
+        "context_id": row["context_id"],
+        "agent_name": row["agent_name"],
+        "title": row["title"] or "",
+        "owner": row["owner"] or "",
+        "visibility": row["visibility"],
+        "created_at": iso(row["created_at"]),
+        "updated_at": iso(row["updated_at"]),
+        "last_message_at": iso(row["last_message_at"]),
+    }
+
+
+async def list_sessions(
+    conn,
+    namespace: str,
+    username: str,
+    is_admin: bool,
+    owner: Optional[str] = None,
+    visibility: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Up to ``limit`` sessions, newest first, and the cursor of the next page (or None).
+
+    Raises ValueError for a malformed ``cursor``.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    query, args = build_query(
+        namespace,
+        username,
+        is_admin,
+        owner=owner,
+        visibility=visibility,
+        agent_name=agent_name,
+        search=search,
+        after=after,
+        limit=limit + 1,
+    )
+    rows = await conn.fetch(query, *args)
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(last["updated_at"], last["context_id"])
+    return [_session(row) for row in page], next_cursor
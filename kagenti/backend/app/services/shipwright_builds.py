@@ -106,6 +106,9 @@ def collect_kagenti_shipwright_builds(
         ApiException: On unexpected API errors (403/404 per-namespace are swallowed).
     """
     log = logger or logging.getLogger(__name__)
+    if not kube.shipwright_builds_served():
+        # Shipwright is not installed (cached discovery); skip the per-namespace 404s
+        return []
     label_selector = label_selector_for_kagenti_builds(builds_for)
     items: List[ShipwrightBuildListItem] = []
     for ns in namespaces:
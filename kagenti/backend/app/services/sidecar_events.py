@@ -0,0 +1,183 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Bounded, backpressure-aware event delivery from a session's SSE stream to
+its sidecars.
+
+The chat stream calls ``SidecarManager.fan_out_event`` synchronously for
+every decoded chunk, so delivery must never block and must stay cheap as
+sidecars are added. Each sidecar gets a SidecarEventBuffer:
+
+- a fixed-size ring buffer; when it is full the oldest pending event is
+  dropped, so a slow sidecar sees the most recent activity rather than
+  stalling the stream or losing everything new;
+- an optional ``coalesce`` policy that keeps only the newest pending event
+  of each type and state (e.g. the Looper only needs the latest WORKING
+  update, not every one of them); the newest event takes its place at the
+  tail, so the sidecar still sees events in the order they happened;
+- an optional set of subscribed event types, checked before anything is
+  queued, so an observer that only reads tool results does not pay for
+  every status update;
+- per-sidecar counters (delivered, filtered, coalesced, dropped) and a
+  high-water mark of pending events, exposed through ``stats()`` and the
+  ``kagenti_sidecar_events_total`` metric.
+
+The buffer keeps the small part of the ``asyncio.Queue`` interface the
+sidecar loops use (``get``, ``get_nowait``, ``empty``, ``qsize``).
+"""
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional
+
+from app.core.metrics import registry
+
+_sidecar_events = registry.counter(
+    "kagenti_sidecar_events_total",
+    "Session events offered to sidecars, by sidecar type and outcome "
+    "(delivered, filtered, coalesced, dropped).",
+    ("sidecar", "outcome"),
+)
+
+
+class OverflowPolicy(str, Enum):
+    """What a sidecar's buffer does with events it cannot hold."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+def event_type(event: dict) -> str:
+    """Classify a fanned-out event for subscription filtering.
+
+    Sandbox events carry ``{"event": {"type": ...}}``; raw A2A chunks are
+    classified by the shape of their ``result``.
+    """
+    if event.get("done"):
+        return "done"
+    event_data = event.get("event", event)
+    if isinstance(event_data, dict) and event_data.get("type"):
+        return str(event_data["type"])
+    result = event.get("result")
+    if isinstance(result, dict):
+        if "artifact" in result:
+            return "artifact"
+        status = result.get("status")
+        if isinstance(status, dict):
+            return "hitl_request" if status.get("state") == "INPUT_REQUIRED" else "status"
+        if "parts" in result:
+            return "message"
+    return "other"
+
+
+def _coalesce_key(etype: str, event: dict) -> str:
+    """Status events coalesce per state so a terminal state is never replaced."""
+    event_data = event.get("event", event)
+    state = event_data.get("state") if isinstance(event_data, dict) else None
+    if not state:
+        result = event.get("result")
+        status = result.get("status") if isinstance(result, dict) else None
+        state = status.get("state") if isinstance(status, dict) else None
+    return f"{etype}:{state}" if state else etype
+
+
+class SidecarEventBuffer:  # pylint: disable=too-many-instance-attributes
+    """Per-sidecar ring buffer with subscription filtering and overflow counters."""
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        event_types: Optional[Iterable[str]] = None,
+        name: str = "",
+    ):
+        self.maxsize = max(1, maxsize)
+        self.policy = OverflowPolicy(policy)
+        self.event_types: Optional[FrozenSet[str]] = None
+        self.subscribe(event_types)
+        self.name = name
+        # Pending events in delivery order, keyed by their coalesce key (or a
+        # sequence number when not coalescing), so coalescing can drop the
+        # older pending event without scanning the buffer.
+        self._entries: "OrderedDict[Hashable, dict]" = OrderedDict()
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self.delivered = 0
+        self.filtered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    def subscribe(self, event_types: Optional[Iterable[str]]) -> None:
+        """Restrict delivery to ``event_types``; None delivers everything."""
+        self.event_types = frozenset(event_types) if event_types is not None else None
+
+    def wants(self, etype: str) -> bool:
+        return self.event_types is None or etype in self.event_types
+
+    def offer(self, event: dict, etype: Optional[str] = None) -> bool:
+        """Queue ``event`` without blocking; returns whether it was queued."""
+        if etype is None:
+            etype = event_type(event)
+        if not self.wants(etype):
+            self.filtered += 1
+            _sidecar_events.inc(sidecar=self.name, outcome="filtered")
+            return False
+
+        key: Hashable = next(self._sequence)
+        if self.policy is OverflowPolicy.COALESCE:
+            key = _coalesce_key(etype, event)
+            if self._entries.pop(key, None) is not None:
+                # The newer event goes to the tail, after anything that
+                # happened in between
+                self._entries[key] = event
+                self.coalesced += 1
+                _sidecar_events.inc(sidecar=self.name, outcome="coalesced")
+                return True
+
+        if len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.dropped += 1
+            _sidecar_events.inc(sidecar=self.name, outcome="dropped")
+
+        self._entries[key] = event
+        self.delivered += 1
+        _sidecar_events.inc(sidecar=self.name, outcome="delivered")
+        self.high_water = max(self.high_water, len(self._entries))
+        self._not_empty.set()
+        return True
+
+    def get_nowait(self) -> dict:
+        if not self._entries:
+            raise asyncio.QueueEmpty
+        _, event = self._entries.popitem(last=False)
+        if not self._entries:
+            self._not_empty.clear()
+        return event
+
+    async def get(self) -> dict:
+        while not self._entries:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy.value,
+            "event_types": sorted(self.event_types) if self.event_types is not None else None,
+            "capacity": self.maxsize,
+            "pending": len(self._entries),
+            "high_water": self.high_water,
+            "delivered": self.delivered,
+            "filtered": self.filtered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
@@ -8,8 +8,10 @@ Sidecars are system sub-agents that observe parent sessions and intervene
 when problems are detected (stuck loops, hallucinations, context bloat).
 
 Each sidecar runs as an asyncio.Task in-process, consumes events from the
-parent session's SSE stream (via asyncio.Queue), and has its own LangGraph
-checkpointed state for persistence across restarts.
+parent session's SSE stream (via a bounded SidecarEventBuffer, see
+sidecar_events.py), and has its own LangGraph checkpointed state for
+persistence across restarts. Handles and observations are stored in the
+session database's sidecar tables (see sidecar_store.py).
 """
 # pylint: disable=fixme
 
@@ -21,6 +23,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
+from app.core.metrics import registry
+from app.services.sidecar_events import OverflowPolicy, SidecarEventBuffer, event_type
+
 if TYPE_CHECKING:
     from app.services.sidecars.looper import LooperAnalyzer
 
@@ -48,6 +53,30 @@ SIDECAR_DEFAULTS: dict[SidecarType, dict[str, Any]] = {
     },
 }
 
+# Event delivery per sidecar type: the event types each analyzer reads and
+# what its buffer does when the sidecar falls behind. A sidecar's config may
+# override the subscription with an ``event_types`` list.
+SIDECAR_EVENT_ROUTING: dict[SidecarType, tuple[frozenset[str], OverflowPolicy]] = {
+    SidecarType.LOOPER: (
+        frozenset({"status", "hitl_request", "done"}),
+        OverflowPolicy.COALESCE,
+    ),
+    SidecarType.HALLUCINATION_OBSERVER: (
+        frozenset({"tool_call", "tool_result", "llm_response"}),
+        OverflowPolicy.DROP_OLDEST,
+    ),
+    SidecarType.CONTEXT_GUARDIAN: (
+        frozenset({"tool_call", "tool_result", "llm_response", "status"}),
+        OverflowPolicy.DROP_OLDEST,
+    ),
+}
+
+_event_backlog = registry.gauge(
+    "kagenti_sidecar_event_backlog",
+    "Session events waiting in sidecar buffers, by sidecar type.",
+    ("sidecar",),
+)
+
 
 @dataclass
 class SidecarObservation:
@@ -61,6 +90,17 @@ class SidecarObservation:
     requires_approval: bool = False
 
 
+def _observation_to_dict(o: SidecarObservation) -> dict:
+    return {
+        "id": o.id,
+        "sidecar_type": o.sidecar_type,
+        "timestamp": o.timestamp,
+        "message": o.message,
+        "severity": o.severity,
+        "requires_approval": o.requires_approval,
+    }
+
+
 @dataclass
 class SidecarHandle:  # pylint: disable=too-many-instance-attributes
     """Tracks a running sidecar's state."""
@@ -76,8 +116,10 @@ class SidecarHandle:  # pylint: disable=too-many-instance-attributes
     config: dict = field(default_factory=dict)
     observations: list[SidecarObservation] = field(default_factory=list)
     pending_interventions: list[SidecarObservation] = field(default_factory=list)
-    event_queue: Optional[asyncio.Queue] = None
+    event_queue: Optional[SidecarEventBuffer] = None
     created_at: float = field(default_factory=time.time)
+    # Leading observations already stored in sidecar_observations
+    persisted_observations: int = 0
 
     def to_dict(self) -> dict:
         return {
@@ -92,9 +134,10 @@ class SidecarHandle:  # pylint: disable=too-many-instance-attributes
             "observation_count": len(self.observations),
             "pending_count": len(self.pending_interventions),
             "created_at": self.created_at,
+            "events": self.event_queue.stats() if self.event_queue is not None else None,
         }
 
-    def to_persistable(self) -> dict:
+    def to_persistable(self, include_observations: bool = True) -> dict:
         """Serialize sidecar state for DB persistence (excludes asyncio objects)."""
         return {
             "context_id": self.context_id,
@@ -105,28 +148,10 @@ class SidecarHandle:  # pylint: disable=too-many-instance-attributes
             "enabled": self.enabled,
             "auto_approve": self.auto_approve,
             "config": self.config,
-            "observations": [
-                {
-                    "id": o.id,
-                    "sidecar_type": o.sidecar_type,
-                    "timestamp": o.timestamp,
-                    "message": o.message,
-                    "severity": o.severity,
-                    "requires_approval": o.requires_approval,
-                }
-                for o in self.observations
-            ],
-            "pending_interventions": [
-                {
-                    "id": o.id,
-                    "sidecar_type": o.sidecar_type,
-                    "timestamp": o.timestamp,
-                    "message": o.message,
-                    "severity": o.severity,
-                    "requires_approval": o.requires_approval,
-                }
-                for o in self.pending_interventions
-            ],
+            "observations": (
+                [_observation_to_dict(o) for o in self.observations] if include_observations else []
+            ),
+            "pending_interventions": [_observation_to_dict(o) for o in self.pending_interventions],
             "created_at": self.created_at,
         }
 
@@ -179,21 +204,43 @@ class SidecarManager:
 
     def __init__(self) -> None:
         self._registry: dict[str, dict[SidecarType, SidecarHandle]] = {}
-        # Per-sidecar event queues: each sidecar gets its own queue so
-        # Queue.get() in one sidecar doesn't steal events from another.
+        # Serializes saves per session so an observation is appended once
+        self._persist_locks: dict[str, asyncio.Lock] = {}
+        # Per-sidecar event buffers: each sidecar gets its own buffer so
+        # get() in one sidecar doesn't steal events from another.
         # Fan-out happens in fan_out_event().
+        for sidecar_type in SidecarType:
+            _event_backlog.set_function(
+                lambda st=sidecar_type: self._backlog(st), sidecar=sidecar_type.value
+            )
+
+    def _backlog(self, sidecar_type: SidecarType) -> int:
+        return sum(
+            handle.event_queue.qsize()
+            for session_sidecars in list(self._registry.values())
+            for st, handle in session_sidecars.items()
+            if st == sidecar_type and handle.event_queue is not None
+        )
+
+    @staticmethod
+    def _make_event_buffer(sidecar_type: SidecarType, config: dict) -> SidecarEventBuffer:
+        """Create a sidecar's event buffer with its type's subscription and policy."""
+        from app.core.config import settings
 
-    def _get_or_create_queue(self, handle: "SidecarHandle") -> asyncio.Queue:
-        """Get or create a per-sidecar event queue."""
-        if handle.event_queue is None:
-            handle.event_queue = asyncio.Queue(maxsize=1000)
-        return handle.event_queue
+        event_types, policy = SIDECAR_EVENT_ROUTING[sidecar_type]
+        return SidecarEventBuffer(
+            maxsize=settings.sidecar_event_buffer_size,
+            policy=policy,
+            event_types=config.get("event_types") or event_types,
+            name=sidecar_type.value,
+        )
 
     async def _persist_sidecar_state(self, parent_context_id: str) -> None:
-        """Persist all sidecar handles for a session into the session's task metadata.
+        """Persist all sidecar handles for a session into the sidecar tables.
 
-        Writes a ``sidecar_state`` key into the latest task row's metadata
-        so that sidecar handles survive backend restarts.
+        Upserts each handle's row and appends only the observations recorded
+        since the previous save, so that sidecar handles survive backend
+        restarts without rewriting their whole history.
         """
         session_sidecars = self._registry.get(parent_context_id, {})
         if not session_sidecars:
@@ -202,32 +249,29 @@ class SidecarManager:
         # Determine namespace from any handle
         namespace = next(iter(session_sidecars.values())).namespace
 
-        state_to_persist = {
-            st.value: handle.to_persistable() for st, handle in session_sidecars.items()
-        }
-
         try:
+            from app.services import sidecar_store
             from app.services.session_db import get_session_pool
 
+            lock = self._persist_locks.setdefault(parent_context_id, asyncio.Lock())
             pool = await get_session_pool(namespace)
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT id, metadata FROM tasks WHERE context_id = $1 ORDER BY id DESC LIMIT 1",
-                    parent_context_id,
-                )
-                if row:
-                    meta = json.loads(row["metadata"]) if row["metadata"] else {}
-                    meta["sidecar_state"] = state_to_persist
-                    await conn.execute(
-                        "UPDATE tasks SET metadata = $1::json WHERE id = $2",
-                        json.dumps(meta),
-                        row["id"],
-                    )
-                    logger.debug(
-                        "Persisted sidecar state for session %s (%d sidecars)",
-                        parent_context_id[:12],
-                        len(state_to_persist),
+            async with lock, pool.acquire() as conn:
+                for handle in list(session_sidecars.values()):
+                    count = len(handle.observations)
+                    await sidecar_store.save_handle(
+                        conn,
+                        handle.to_persistable(include_observations=False),
+                        [
+                            _observation_to_dict(o)
+                            for o in handle.observations[handle.persisted_observations : count]
+                        ],
                     )
+                    handle.persisted_observations = count
+            logger.debug(
+                "Persisted sidecar state for session %s (%d sidecars)",
+                parent_context_id[:12],
+                len(session_sidecars),
+            )
         except Exception:
             logger.warning(
                 "Failed to persist sidecar state for session %s",
@@ -236,9 +280,10 @@ class SidecarManager:
             )
 
     async def _restore_sidecars_for_session(self, parent_context_id: str, namespace: str) -> None:
-        """Restore sidecar handles from session metadata (on first access after restart).
+        """Restore sidecar handles from the DB (on first access after restart).
 
-        Reads ``sidecar_state`` from the latest task row's metadata and
+        Reads the session's rows from the sidecar tables — migrating state
+        that older backends kept in ``tasks.metadata`` on the way — and
         re-creates SidecarHandle objects (without spawning asyncio tasks —
         those are only spawned on explicit ``enable()``).
         """
@@ -246,48 +291,44 @@ class SidecarManager:
             return  # Already loaded
 
         try:
+            from app.services import sidecar_store
             from app.services.session_db import get_session_pool
 
             pool = await get_session_pool(namespace)
             async with pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT metadata FROM tasks WHERE context_id = $1 ORDER BY id DESC LIMIT 1",
-                    parent_context_id,
-                )
-                if not row or not row["metadata"]:
-                    return
-
-                meta = json.loads(row["metadata"]) if row["metadata"] else None
-                if not isinstance(meta, dict):
-                    return
-                sidecar_state = meta.get("sidecar_state")
+                sidecar_state = await sidecar_store.load_handles(conn, parent_context_id)
                 if not sidecar_state:
-                    return
+                    sidecar_state = await sidecar_store.migrate_from_metadata(
+                        conn, parent_context_id
+                    )
+            if not sidecar_state:
+                return
 
-                self._registry[parent_context_id] = {}
-                for _type_str, handle_data in sidecar_state.items():
-                    try:
-                        handle = SidecarHandle.from_persisted(handle_data)
-                        stype = SidecarType(handle_data["sidecar_type"])
-                        # Don't auto-spawn tasks — user must re-enable
-                        handle.enabled = False
-                        handle.task = None
-                        self._registry[parent_context_id][stype] = handle
-                    except (ValueError, KeyError) as e:
-                        logger.warning(
-                            "Failed to restore sidecar %s for session %s: %s",
-                            _type_str,
-                            parent_context_id[:12],
-                            e,
-                        )
-
-                restored_count = len(self._registry[parent_context_id])
-                if restored_count:
-                    logger.info(
-                        "Restored %d sidecars from DB for session %s",
-                        restored_count,
+            self._registry[parent_context_id] = {}
+            for _type_str, handle_data in sidecar_state.items():
+                try:
+                    handle = SidecarHandle.from_persisted(handle_data)
+                    stype = SidecarType(handle_data["sidecar_type"])
+                    # Don't auto-spawn tasks — user must re-enable
+                    handle.enabled = False
+                    handle.task = None
+                    handle.persisted_observations = len(handle.observations)
+                    self._registry[parent_context_id][stype] = handle
+                except (ValueError, KeyError) as e:
+                    logger.warning(
+                        "Failed to restore sidecar %s for session %s: %s",
+                        _type_str,
                         parent_context_id[:12],
+                        e,
                     )
+
+            restored_count = len(self._registry[parent_context_id])
+            if restored_count:
+                logger.info(
+                    "Restored %d sidecars from DB for session %s",
+                    restored_count,
+                    parent_context_id[:12],
+                )
         except Exception:
             logger.warning(
                 "Failed to restore sidecars for session %s",
@@ -298,16 +339,18 @@ class SidecarManager:
     def fan_out_event(self, parent_context_id: str, event: dict) -> None:
         """Called by SSE proxy to fan out an event to all sidecars for a session.
 
-        Each sidecar has its own queue, so events are delivered to all
-        sidecars independently (no stealing).
+        Each sidecar has its own buffer, so events are delivered to all
+        sidecars independently (no stealing). The event is classified once
+        and only queued for sidecars subscribed to its type; a full buffer
+        drops its oldest event instead of blocking the stream.
         """
-        session_sidecars = self._registry.get(parent_context_id, {})
+        session_sidecars = self._registry.get(parent_context_id)
+        if not session_sidecars:
+            return
+        etype = event_type(event)
         for handle in session_sidecars.values():
             if handle.enabled and handle.event_queue is not None:
-                try:
-                    handle.event_queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.warning("Event queue full for sidecar %s", handle.sidecar_type.value)
+                handle.event_queue.offer(event, etype)
 
     async def enable(
         self,
@@ -357,7 +400,7 @@ class SidecarManager:
             enabled=True,
             auto_approve=auto_approve,
             config=effective_config,
-            event_queue=asyncio.Queue(maxsize=1000),
+            event_queue=self._make_event_buffer(sidecar_type, effective_config),
         )
 
         # Restore observations from previous enable (if any)
@@ -365,6 +408,7 @@ class SidecarManager:
         if old_handle:
             handle.observations = old_handle.observations
             handle.pending_interventions = old_handle.pending_interventions
+            handle.persisted_observations = old_handle.persisted_observations
 
         # Spawn the sidecar task
         handle.task = asyncio.create_task(
@@ -423,6 +467,10 @@ class SidecarManager:
         handle.config.update(config)
         if "auto_approve" in config:
             handle.auto_approve = config["auto_approve"]
+        if "event_types" in config and handle.event_queue is not None:
+            handle.event_queue.subscribe(
+                config["event_types"] or SIDECAR_EVENT_ROUTING[sidecar_type][0]
+            )
 
         logger.info(
             "Updated config for sidecar %s session %s: %s",
@@ -477,6 +525,7 @@ class SidecarManager:
                     msg_id,
                     sidecar_type.value,
                 )
+                await self._persist_sidecar_state(parent_context_id)
                 return approved
         return None
 
@@ -499,6 +548,7 @@ class SidecarManager:
                     msg_id,
                     sidecar_type.value,
                 )
+                await self._persist_sidecar_state(parent_context_id)
                 return denied
         return None
 
@@ -512,6 +562,7 @@ class SidecarManager:
             await self.disable(parent_context_id, sidecar_type)
 
         self._registry.pop(parent_context_id, None)
+        self._persist_locks.pop(parent_context_id, None)
         logger.info("Cleaned up sidecars for session %s", parent_context_id[:12])
 
     async def shutdown(self) -> None:
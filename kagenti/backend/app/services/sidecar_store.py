@@ -0,0 +1,159 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Reads and writes of sidecar state in the session database.
+
+Works on the dicts produced by ``SidecarHandle.to_persistable()`` (see
+sidecar_manager.py) and the tables in models/sidecar_state.py:
+
+- save_handle() upserts a handle's row and inserts only the observations
+  recorded since its last save.
+- load_handles() returns every handle of a session with its observations.
+- migrate_from_metadata() moves state written by older backends (the
+  ``sidecar_state`` key in ``tasks.metadata``) into the tables once, and
+  removes the key so it is not migrated again.
+"""
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_HANDLE = """
+INSERT INTO sidecar_handles (
+    parent_context_id, sidecar_type, context_id, namespace, agent_name,
+    enabled, auto_approve, config, pending_interventions, created_at
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb, $9::jsonb, $10)
+ON CONFLICT (parent_context_id, sidecar_type) DO UPDATE SET
+    context_id = EXCLUDED.context_id,
+    namespace = EXCLUDED.namespace,
+    agent_name = EXCLUDED.agent_name,
+    enabled = EXCLUDED.enabled,
+    auto_approve = EXCLUDED.auto_approve,
+    config = EXCLUDED.config,
+    pending_interventions = EXCLUDED.pending_interventions,
+    updated_at = NOW()
+"""
+
+_INSERT_OBSERVATION = (
+    "INSERT INTO sidecar_observations (parent_context_id, sidecar_type, observation_id,"
+    " timestamp, message, severity, requires_approval)"
+    " VALUES ($1, $2, $3, $4, $5, $6, $7)"
+)
+
+_SELECT_HANDLES = (
+    "SELECT sidecar_type, context_id, namespace, agent_name, enabled, auto_approve,"
+    " config::text AS config, pending_interventions::text AS pending_interventions,"
+    " created_at FROM sidecar_handles WHERE parent_context_id = $1"
+)
+
+_SELECT_OBSERVATIONS = (
+    "SELECT sidecar_type, observation_id, timestamp, message, severity, requires_approval"
+    " FROM sidecar_observations WHERE parent_context_id = $1 ORDER BY id"
+)
+
+
+async def save_handle(conn, data: dict[str, Any], new_observations: list[dict[str, Any]]) -> None:
+    """Upsert one handle and append ``new_observations``, in one transaction."""
+    async with conn.transaction():
+        await conn.execute(
+            _UPSERT_HANDLE,
+            data["parent_context_id"],
+            data["sidecar_type"],
+            data["context_id"],
+            data["namespace"],
+            data["agent_name"],
+            data["enabled"],
+            data["auto_approve"],
+            json.dumps(data["config"]),
+            json.dumps(data["pending_interventions"]),
+            data["created_at"],
+        )
+        if new_observations:
+            await conn.executemany(
+                _INSERT_OBSERVATION,
+                [
+                    (
+                        data["parent_context_id"],
+                        data["sidecar_type"],
+                        o["id"],
+                        o["timestamp"],
+                        o["message"],
+                        o.get("severity", "info"),
+                        o.get("requires_approval", False),
+                    )
+                    for o in new_observations
+                ],
+            )
+
+
+async def load_handles(conn, parent_context_id: str) -> dict[str, dict[str, Any]]:
+    """Persisted handles of a session by sidecar type, in to_persistable() form."""
+    handles = await conn.fetch(_SELECT_HANDLES, parent_context_id)
+    if not handles:
+        return {}
+    state: dict[str, dict[str, Any]] = {}
+    for row in handles:
+        state[row["sidecar_type"]] = {
+            "context_id": row["context_id"],
+            "sidecar_type": row["sidecar_type"],
+            "parent_context_id": parent_context_id,
+            "namespace": row["namespace"],
+            "agent_name": row["agent_name"],
+            "enabled": row["enabled"],
+            "auto_approve": row["auto_approve"],
+            "config": json.loads(row["config"]),
+            "observations": [],
+            "pending_interventions": json.loads(row["pending_interventions"]),
+            "created_at": row["created_at"],
+        }
+    for row in await conn.fetch(_SELECT_OBSERVATIONS, parent_context_id):
+        handle = state.get(row["sidecar_type"])
+        if handle is not None:
+            handle["observations"].append(
+                {
+                    "id": row["observation_id"],
+                    "sidecar_type": row["sidecar_type"],
+                    "timestamp": row["timestamp"],
+                    "message": row["message"],
+                    "severity": row["severity"],
+                    "requires_approval": row["requires_approval"],
+                }
+            )
+    return state
+
+
+async def migrate_from_metadata(conn, parent_context_id: str) -> dict[str, dict[str, Any]]:
+    """Move a session's legacy ``tasks.metadata.sidecar_state`` into the sidecar tables.
+
+    Returns the migrated state (empty when there was none).
+    """
+    row = await conn.fetchrow(
+        "SELECT metadata FROM tasks WHERE context_id = $1"
+        " AND metadata::jsonb ? 'sidecar_state' ORDER BY id DESC LIMIT 1",
+        parent_context_id,
+    )
+    if not row or not row["metadata"]:
+        return {}
+    meta = json.loads(row["metadata"])
+    sidecar_state = meta.get("sidecar_state") if isinstance(meta, dict) else None
+    if not isinstance(sidecar_state, dict):
+        return {}
+
+    async with conn.transaction():
+        for data in sidecar_state.values():
+            data = {"parent_context_id": parent_context_id, **data}
+            await save_handle(conn, data, data.get("observations", []))
+        await conn.execute(
+            "UPDATE tasks SET metadata = (metadata::jsonb - 'sidecar_state')::json"
+            " WHERE context_id = $1 AND metadata::jsonb ? 'sidecar_state'",
+            parent_context_id,
+        )
+    logger.info(
+        "Migrated %d sidecars from task metadata for session %s",
+        len(sidecar_state),
+        parent_context_id[:12],
+    )
+    return sidecar_state
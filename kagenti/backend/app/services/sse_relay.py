@@ -0,0 +1,256 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Fast translation of agent A2A SSE events into the UI's chat events.
+
+Relaying a long agent run used to decode every SSE line with ``json``, build
+a fresh payload dict and re-encode it, which made chat streaming the
+backend's top CPU consumer. A2ARelay keeps the same output with less work:
+
+- JSON goes through orjson when it is installed (``json`` otherwise).
+- Lines that cannot carry a ``result`` are skipped without being parsed
+  (unless sidecars need every chunk).
+- The ``session_id``/``username`` prefix of each event is encoded once per
+  stream (and again only if the session id changes), and only the small
+  ``event`` object and the content string are encoded per event.
+
+Clients that understand raw A2A events can skip translation entirely with
+``POST /chat/{ns}/{name}/stream?passthrough=true``, which forwards the
+agent's SSE bytes unchanged.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _ORJSON_AVAILABLE = False
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from str or bytes; raises ValueError on bad input."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as compact JSON text."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Two-space indented JSON, as shown to users in ```json blocks."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def extract_text_from_parts(parts: list) -> str:
+    """Extract text content from A2A message parts."""
+    chunks = []
+    for part in parts:
+        if not isinstance(part, dict):
+            continue
+        # Handle simple text field
+        if "text" in part:
+            chunks.append(part["text"])
+        # Handle kind=text format
+        elif part.get("kind") == "text":
+            chunks.append(part.get("text", ""))
+        # Handle data field (for JSON, images, etc.)
+        elif "data" in part:
+            data = part["data"]
+            if isinstance(data, dict):
+                if "content_type" in data and "content" in data:
+                    content_type = data.get("content_type", "")
+                    content_value = data.get("content", "")
+                    if content_type == "application/json" and content_value:
+                        try:
+                            formatted = dumps_pretty(loads(content_value))
+                            chunks.append(f"\n```json\n{formatted}\n```\n")
+                        except (ValueError, TypeError):
+                            chunks.append(f"\n{content_value}\n")
+                    elif not content_type.startswith("image/"):
+                        chunks.append(f"\n{content_value}\n")
+                else:
+                    chunks.append(f"\n```json\n{dumps_pretty(data)}\n```\n")
+            elif isinstance(data, str):
+                try:
+                    chunks.append(f"\n```json\n{dumps_pretty(loads(data))}\n```\n")
+                except (ValueError, TypeError):
+                    chunks.append(f"\n{data}\n")
+            elif isinstance(data, (list, int, float, bool)):
+                chunks.append(f"\n```json\n{dumps_pretty(data)}\n```\n")
+    return "".join(chunks)
+
+
+class A2ARelay:
+    """Per-stream translator from agent SSE lines to UI SSE events."""
+
+    def __init__(
+        self,
+        session_id: str,
+        username: Optional[str] = None,
+        caller_supplied_session_id: bool = False,
+        on_chunk: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
+        self.username = username
+        self.caller_supplied_session_id = caller_supplied_session_id
+        self.on_chunk = on_chunk
+        self.session_id = ""
+        # Type of the event last returned by translate(), done_event() or
+        # error_event(), so recording it does not parse the event again
+        self.event_type = ""
+        self._prefix = ""
+        self._set_session(session_id)
+
+    def _set_session(self, session_id: str) -> None:
+        self.session_id = session_id
+        prefix = '{"session_id":' + dumps(session_id)
+        if self.username:
+            prefix += ',"username":' + dumps(self.username)
+        self._prefix = "data: " + prefix
+
+    def _emit(self, event: Dict[str, Any], content: Optional[str]) -> str:
+        self.event_type = event["type"]
+        text = f'{self._prefix},"event":{dumps(event)}'
+        if content:
+            text += ',"content":' + dumps(content)
+        return text + "}\n\n"
+
+    def done_event(self) -> str:
+        """The UI event marking the end of the stream."""
+        self.event_type = "done"
+        payload = {"done": True, "session_id": self.session_id}
+        if self.username:
+            payload["username"] = self.username
+        return f"data: {dumps(payload)}\n\n"
+
+    def error_event(self, message: str) -> str:
+        """The UI event reporting that the stream failed with ``message``."""
+        self.event_type = "error"
+        return f"data: {dumps({'error': message, 'session_id': self.session_id})}\n\n"
+
+    def translate(self, line: str) -> Tuple[Optional[str], bool]:
+        """Translate one agent SSE line.
+
+        Returns the UI event to send (or None) and whether the stream is done.
+        """
+        if not line.startswith("data: "):
+            return None, False
+        data = line[6:]
+        if data == "[DONE]":
+            return self.done_event(), True
+        chunk = self._parse_chunk(data)
+        if chunk is None:
+            return None, False
+
+        if self.on_chunk is not None:
+            try:
+                self.on_chunk(self.session_id, chunk)
+            except Exception:  # pylint: disable=broad-except
+                logger.debug("Sidecar fan-out failed", exc_info=True)
+
+        result = chunk.get("result")
+        if not isinstance(result, dict):
+            return None, False
+        return self._translate_result(result), False
+
+    def _parse_chunk(self, data: str) -> Optional[Dict[str, Any]]:
+        if self.on_chunk is None and '"result"' not in data:
+            return None
+        try:
+            chunk = loads(data)
+        except ValueError as e:
+            logger.warning("Failed to parse SSE data: %.200s, error: %s", data, e)
+            return None
+        return chunk if isinstance(chunk, dict) else None
+
+    def _translate_result(self, result: Dict[str, Any]) -> Optional[str]:
+        # Adopt the agent's contextId only on the first turn (when the caller
+        # had no session_id yet). Some A2A SDKs mint a fresh contextId on every
+        # response even when the client supplied one; adopting that new ID
+        # every turn would churn the UI's sessionId state and split telemetry
+        # across a new authbridge bucket per message.
+        if not self.caller_supplied_session_id:
+            agent_ctx = result.get("contextId") or result.get("sessionId")
+            if agent_ctx and agent_ctx != self.session_id:
+                self._set_session(agent_ctx)
+
+        if "artifact" in result:
+            return self._artifact_event(result)
+        if "status" in result and "taskId" in result:
+            return self._status_update_event(result)
+        if "id" in result and "status" in result:
+            return self._task_event(result)
+        if "parts" in result:
+            return self._message_event(result)
+        logger.warning("Unknown result structure: keys=%s", list(result.keys()))
+        return None
+
+    def _artifact_event(self, result: Dict[str, Any]) -> str:
+        artifact = result.get("artifact", {})
+        content = extract_text_from_parts(artifact.get("parts", []))
+        event = {
+            "type": "artifact",
+            "taskId": result.get("taskId", ""),
+            "name": artifact.get("name"),
+            "index": artifact.get("index"),
+        }
+        return self._emit(event, content)
+
+    def _status_update_event(self, result: Dict[str, Any]) -> str:
+        status = result["status"]
+        is_final = result.get("final", False)
+        state = status.get("state", "UNKNOWN")
+
+        status_message = ""
+        if "message" in status and status["message"]:
+            status_message = extract_text_from_parts(status["message"].get("parts", []))
+
+        event = {
+            "type": "hitl_request" if state == "INPUT_REQUIRED" else "status",
+            "taskId": result.get("taskId", ""),
+            "state": state,
+            "final": is_final,
+            "message": status_message if status_message else None,
+        }
+        content = status_message if is_final or state in ["COMPLETED", "FAILED"] else None
+        return self._emit(event, content)
+
+    def _task_event(self, result: Dict[str, Any]) -> str:
+        task_status = result["status"]
+        state = task_status.get("state", "UNKNOWN")
+        event = {
+            "type": "status",
+            "taskId": result.get("id", ""),
+            "state": state,
+            "final": state in ["COMPLETED", "FAILED"],
+        }
+        content = None
+        if state in ["COMPLETED", "FAILED"]:
+            if "message" in task_status and task_status["message"]:
+                content = extract_text_from_parts(task_status["message"].get("parts", []))
+        return self._emit(event, content)
+
+    def _message_event(self, result: Dict[str, Any]) -> str:
+        content = extract_text_from_parts(result["parts"])
+        event = {
+            "type": "status",
+            "taskId": result.get("messageId", ""),
+            "state": "WORKING",
+            "final": False,
+            "message": content if content else None,
+        }
+        return self._emit(event, content)
@@ -0,0 +1,130 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+One SSE connection carrying the live chat streams of many sessions.
+
+Operators watching a dozen sessions used to hold a dozen SSE connections.
+``subscribe()`` follows any number of session ids over a single stream: for
+each session it attaches to the session's running chat run (and to every
+run started later), and forwards the run's events tagged with the session
+and run they belong to::
+
+    data: {"session_id": "...", "run_id": "...", "seq": 12, "event": {...}}
+
+Runs are read from the stream replay store (see stream_replay.py), so every
+viewer of a session shares that run's single upstream agent connection, and
+a slow subscriber only falls behind in the run's buffer; it never slows the
+agent down. ``seq`` is null for resync/error notices. A client that loses
+the connection can resume a single run with
+``GET /chat/{ns}/{name}/runs/{run_id}/stream`` and ``Last-Event-ID:
+<run_id>:<seq>``.
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Callable, List, Optional, Set
+
+from app.services import sse_relay
+from app.services.stream_replay import StreamReplayStore, StreamRun
+
+logger = logging.getLogger(__name__)
+
+
+def _envelope(session_id: str, run: StreamRun, seq: Optional[int], data: str) -> str:
+    # ``data`` is already JSON; splice it in rather than decoding it again.
+    return (
+        f'data: {{"session_id":{sse_relay.dumps(session_id)},"run_id":"{run.run_id}",'
+        f'"seq":{seq if seq is not None else "null"},"event":{data}}}\n\n'
+    )
+
+
+async def _forward(session_id: str, run: StreamRun, out: "asyncio.Queue[str]") -> None:
+    async for seq, data in run.events(0):
+        await out.put(_envelope(session_id, run, seq, data))
+
+
+async def _follow(
+    store: StreamReplayStore,
+    session_id: str,
+    can_read: Callable[[StreamRun], bool],
+    since: float,
+    out: "asyncio.Queue[str]",
+) -> None:
+    """Forward the events of every readable run of ``session_id`` into ``out``.
+
+    Each run is forwarded by its own task, so the events of runs that overlap
+    in one session interleave as they happen.
+    """
+    seen = set()
+    forwarders: Set[asyncio.Task] = set()
+    try:
+        while True:
+            changed = store.runs_changed
+            for run in store.runs_for_session(session_id):
+                if run.run_id in seen:
+                    continue
+                seen.add(run.run_id)
+                # Runs that had already finished before the subscription are history
+                if not can_read(run) or (run.finished and run.created_at < since):
+                    continue
+                forwarders.add(
+                    asyncio.create_task(
+                        _forward(session_id, run, out), name=f"chat-subscription-{run.run_id}"
+                    )
+                )
+            waiter = asyncio.ensure_future(changed.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    {waiter, *forwarders}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                waiter.cancel()
+            for task in done - {waiter}:
+                forwarders.discard(task)
+                task.result()  # re-raise a failed forwarder
+    finally:
+        for task in forwarders:
+            task.cancel()
+        await asyncio.gather(*forwarders, return_exceptions=True)
+
+
+async def subscribe(
+    store: StreamReplayStore,
+    session_ids: List[str],
+    can_read: Callable[[StreamRun], bool],
+    heartbeat_interval: float = 15.0,
+    queue_size: int = 1000,
+) -> AsyncIterator[str]:
+    """Yield tagged SSE events for ``session_ids`` until the client disconnects.
+
+    Sends a ``subscribed`` event first and a comment line whenever the
+    connection has been idle for ``heartbeat_interval`` seconds, so proxies
+    keep it open.
+    """
+    session_ids = list(dict.fromkeys(session_ids))
+    out: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+    since = time.time()
+    tasks = [
+        asyncio.create_task(
+            _follow(store, session_id, can_read, since, out),
+            name=f"chat-subscription-{session_id[:12]}",
+        )
+        for session_id in session_ids
+    ]
+    try:
+        yield f"data: {sse_relay.dumps({'subscribed': session_ids})}\n\n"
+        while True:
+            try:
+                yield await asyncio.wait_for(out.get(), timeout=heartbeat_interval)
+            except asyncio.TimeoutError:
+                for task in tasks:
+                    if task.done() and not task.cancelled() and task.exception():
+                        logger.error("Session subscription failed", exc_info=task.exception())
+                        raise task.exception()
+                yield ": keep-alive\n\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,443 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Replay buffers that make chat SSE streams resumable.
+
+Every chat stream (one ``POST /chat/{ns}/{name}/stream`` call) is a
+StreamRun. Each event the run yields gets a monotonic SSE id of the form
+``<run_id>:<seq>`` and is kept in a bounded in-memory buffer. A client that
+loses its connection reconnects with ``Last-Event-ID`` and receives the
+events it missed, followed by the live stream while the run is still going,
+without the agent being invoked again.
+
+The buffer holds the most recent ``chat_replay_buffer_events`` events of a
+run. With ``chat_replay_spill`` enabled, events pushed out of the buffer are
+written to the session database's ``events`` table (see models/event.py,
+``task_id`` = ``stream:<run_id>``) through the batched EventWriter (see
+services/event_writer.py), so a client that fell further behind can still be
+replayed from there. With ``chat_persist_events`` every event is written as
+it is recorded. Without spill, such a client receives a
+``resync`` event telling it to reload the session history instead.
+
+Finished runs stay resumable for ``chat_replay_ttl`` seconds; at most
+``chat_replay_max_runs`` finished runs are kept. Runs that are still
+producing are never evicted.
+
+A run started with ``?detach=true`` is detached from the client connection:
+the store consumes the agent stream to completion in a background task
+(feeding sidecars as usual, and writing every event to the ``events`` table
+when ``chat_run_persist_events`` is set), and clients only ever read the
+run's buffer. Any number of clients can attach and detach, and a slow or
+disconnected client cannot throttle or end the run.
+
+Other runs are consumed the same way, but only while someone is reading
+them: once the last client has been gone for ``chat_stream_grace`` seconds
+the agent stream is closed and the run ends interrupted. A client that
+reconnects with ``Last-Event-ID`` within that time resumes without losing
+the rest of the run.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from app.core.config import settings
+from app.services import sse_relay
+from app.services.event_writer import EventRow, EventWriter, get_event_writer
+
+logger = logging.getLogger(__name__)
+
+
+def parse_event_id(event_id: str) -> Optional[Tuple[str, int]]:
+    """Split a ``<run_id>:<seq>`` SSE id; returns None if it is malformed."""
+    run_id, sep, seq = event_id.strip().rpartition(":")
+    if not sep or not run_id or not seq.isdigit():
+        return None
+    return run_id, int(seq)
+
+
+def _event_type(data: str) -> str:
+    try:
+        payload = sse_relay.loads(data)
+    except ValueError:
+        return "unknown"
+    if payload.get("done"):
+        return "done"
+    if "error" in payload:
+        return "error"
+    event = payload.get("event")
+    return event.get("type", "unknown") if isinstance(event, dict) else "unknown"
+
+
+class StreamRun:  # pylint: disable=too-many-instance-attributes
+    """The replayable event log of one chat stream."""
+
+    def __init__(
+        self,
+        session_id: str,
+        namespace: str,
+        agent_name: str,
+        username: Optional[str] = None,
+        max_events: int = 1000,
+        spill: bool = False,
+        persist: bool = False,
+        run_id: Optional[str] = None,
+        writer: Optional[EventWriter] = None,
+    ):
+        self.run_id = run_id or uuid4().hex[:16]
+        self.session_id = session_id
+        self.session_ids: Set[str] = {session_id}
+        self.namespace = namespace
+        self.agent_name = agent_name
+        self.username = username
+        self.spill = spill
+        self.persist = persist
+        self.detached = False
+        self.task: Optional[asyncio.Task] = None
+        self.cancelled = False
+        self.viewers = 0
+        self.unwatched_since = time.monotonic()
+        self.created_at = time.time()
+        self.finished = False
+        self.interrupted = False
+        self.finished_at: Optional[float] = None
+        # (seq, data, event type) of the most recent events
+        self._events: Deque[Tuple[int, str, str]] = deque(maxlen=max(1, max_events))
+        self._next_seq = 1
+        self._changed = asyncio.Event()
+        self._writer = writer
+
+    @property
+    def last_seq(self) -> int:
+        return self._next_seq - 1
+
+    @property
+    def first_buffered_seq(self) -> int:
+        return self._events[0][0] if self._events else self._next_seq
+
+    @property
+    def state(self) -> str:
+        if not self.finished:
+            return "running"
+        if self.cancelled:
+            return "cancelled"
+        return "interrupted" if self.interrupted else "completed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "session_id": self.session_id,
+            "state": self.state,
+            "detached": self.detached,
+            "events": self.last_seq,
+            "viewers": self.viewers,
+            "created_at": self.created_at,
+        }
+
+    def _frame(self, seq: int, data: str) -> str:
+        return f"id: {self.run_id}:{seq}\ndata: {data}\n\n"
+
+    def append(
+        self, event: str, session_id: Optional[str] = None, event_type: Optional[str] = None
+    ) -> str:
+        """Record one ``data: ...`` SSE event and return it framed with its id.
+
+        ``event_type`` is stored with the event when it is written to the
+        events table; without it the type is read from the event's JSON.
+        """
+        if session_id and session_id != self.session_id:
+            self.session_id = session_id
+            self.session_ids.add(session_id)
+        data = event[6:].rstrip("\n") if event.startswith("data: ") else event.rstrip("\n")
+        seq = self._next_seq
+        self._next_seq += 1
+        entry = (seq, data, event_type or "")
+        if self.persist:
+            self._queue_write(entry)
+        elif self.spill and len(self._events) == self._events.maxlen:
+            self._queue_write(self._events[0])
+        self._events.append(entry)
+        self._notify()
+        return self._frame(seq, data)
+
+    def finish(self, interrupted: bool = False) -> None:
+        """Mark the run complete; ``interrupted`` if it ended without a final event."""
+        if self.finished:
+            return
+        self.finished = True
+        self.interrupted = interrupted
+        self.finished_at = time.monotonic()
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    @property
+    def writer(self) -> EventWriter:
+        return self._writer or get_event_writer()
+
+    def _queue_write(self, event: Tuple[int, str, str]) -> None:
+        if not self.writer.accepting(self.namespace):
+            # Stop writing (e.g. the namespace has no session database);
+            # replay falls back to resync.
+            self.spill = self.persist = False
+            return
+        seq, data, event_type = event
+        self.writer.submit(
+            EventRow(
+                self.namespace,
+                self.session_id,
+                f"stream:{self.run_id}",
+                seq,
+                event_type or _event_type(data),
+                data,
+            )
+        )
+
+    async def _read_written(self, after: int, before: int) -> List[Tuple[int, str]]:
+        await self.writer.flush()
+        try:
+            from app.services.session_db import get_session_pool
+
+            pool = await get_session_pool(self.namespace)
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT event_index, payload::text AS payload FROM events"
+                    " WHERE context_id = ANY($1::text[]) AND task_id = $2"
+                    " AND event_index > $3 AND event_index < $4"
+                    " ORDER BY event_index",
+                    list(self.session_ids),
+                    f"stream:{self.run_id}",
+                    after,
+                    before,
+                )
+            return [(row["event_index"], row["payload"]) for row in rows]
+        except Exception:
+            logger.warning("Failed to read stored events for run %s", self.run_id, exc_info=True)
+            return []
+
+    async def replay(self, after: int) -> AsyncIterator[str]:
+        """Yield framed events with seq > ``after``, then follow the run until it ends."""
+        async for seq, data in self.events(after):
+            yield self._frame(seq, data) if seq is not None else f"data: {data}\n\n"
+
+    async def events(self, after: int) -> AsyncIterator[Tuple[Optional[int], str]]:
+        """Like replay(), as ``(seq, data)`` pairs; seq is None for resync/error notices."""
+        self.viewers += 1
+        try:
+            async for event in self._events_after(after):
+                yield event
+        finally:
+            self.viewers -= 1
+            if not self.viewers:
+                self.unwatched_since = time.monotonic()
+
+    async def _events_after(self, after: int) -> AsyncIterator[Tuple[Optional[int], str]]:
+        seq = after
+        while True:
+            # The reader may be behind the buffer on arrival, or fall behind
+            # it while a slow client consumes the replay.
+            first = self.first_buffered_seq
+            if seq + 1 < first:
+                if self.spill or self.persist:
+                    for stored_seq, data in await self._read_written(seq, first):
+                        yield stored_seq, data
+                        seq = stored_seq
+                if seq + 1 < first:
+                    # Events were lost: the client has to reload the session history.
+                    yield None, sse_relay.dumps({"resync": True, "session_id": self.session_id})
+                    seq = first - 1
+                continue
+
+            for event_seq, data, _ in list(self._events):
+                if event_seq > seq:
+                    yield event_seq, data
+                    seq = event_seq
+            if self.finished:
+                break
+            changed = self._changed
+            if seq >= self.last_seq:
+                await changed.wait()
+
+        if self.interrupted:
+            message = "Run cancelled" if self.cancelled else "Stream interrupted"
+            yield None, sse_relay.dumps({"error": message, "session_id": self.session_id})
+
+
+async def _consume(events: AsyncIterator[str]) -> None:
+    try:
+        async for _ in events:
+            pass
+    finally:
+        await events.aclose()
+
+
+class StreamReplayStore:
+    """Registry of recent StreamRuns, bounded by count and by age once finished.
+
+    Also owns the background tasks of detached runs.
+    """
+
+    def __init__(self, max_runs: int = 256, ttl: float = 600.0):
+        self.max_runs = max(1, max_runs)
+        self.ttl = ttl
+        self._runs: "OrderedDict[str, StreamRun]" = OrderedDict()
+        self._detach_reservations = 0
+        self.runs_changed = asyncio.Event()
+
+    def create(
+        self,
+        session_id: str,
+        namespace: str,
+        agent_name: str,
+        username: Optional[str] = None,
+        persist: bool = False,
+    ) -> StreamRun:
+        self._evict()
+        run = StreamRun(
+            session_id,
+            namespace,
+            agent_name,
+            username=username,
+            max_events=settings.chat_replay_buffer_events,
+            spill=settings.chat_replay_spill,
+            persist=persist,
+        )
+        self._runs[run.run_id] = run
+        self.runs_changed.set()
+        self.runs_changed = asyncio.Event()
+        return run
+
+    def detach(self, run: StreamRun, events: AsyncIterator[str]) -> None:
+        """Consume ``events`` (the run's producer) to completion in a background task."""
+        run.detached = True
+        run.task = asyncio.create_task(_consume(events), name=f"chat-run-{run.run_id}")
+
+    def follow(self, run: StreamRun, events: AsyncIterator[str], grace: float) -> None:
+        """Consume ``events`` in a background task while the run has readers.
+
+        The producer is closed once the run has had no reader for ``grace``
+        seconds, so a client that lost its connection can resume in the
+        meantime.
+        """
+
+        async def watch() -> None:
+            producer = asyncio.create_task(_consume(events))
+            try:
+                while not producer.done():
+                    idle = 0.0 if run.viewers else time.monotonic() - run.unwatched_since
+                    if idle >= grace:
+                        logger.debug("Closing unwatched run %s", run.run_id)
+                        break
+                    await asyncio.wait({producer}, timeout=grace - idle)
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+        run.task = asyncio.create_task(watch(), name=f"chat-run-{run.run_id}")
+
+    def running_detached(self) -> int:
+        """Detached runs still running, and runs that reserved a slot to become one."""
+        running = sum(1 for run in self._runs.values() if run.detached and not run.finished)
+        return running + self._detach_reservations
+
+    def reserve_detached(self, limit: int) -> bool:
+        """Take a slot for a detached run that is being started; False if ``limit`` are taken.
+
+        Release it with release_detached() once the run is detached, or failed to start.
+        """
+        if self.running_detached() >= limit:
+            return False
+        self._detach_reservations += 1
+        return True
+
+    def release_detached(self) -> None:
+        self._detach_reservations -= 1
+
+    def list_runs(
+        self, namespace: str, agent_name: str, username: Optional[str] = None
+    ) -> List[StreamRun]:
+        """Runs of one agent, newest first; only ``username``'s runs when given."""
+        self._evict_expired()
+        return [
+            run
+            for run in reversed(self._runs.values())
+            if run.namespace == namespace
+            and run.agent_name == agent_name
+            and (username is None or run.username == username)
+        ]
+
+    def runs_for_session(self, session_id: str) -> List[StreamRun]:
+        """Runs of a session (by requested or adopted session id), oldest first."""
+        return [run for run in self._runs.values() if session_id in run.session_ids]
+
+    async def cancel(self, run: StreamRun) -> None:
+        """Stop a run; its attached clients receive a final error event."""
+        if run.task is None:
+            return
+        # Let a task that was only just created start its producer, so the
+        # producer's cleanup (closing the agent response) runs on cancel.
+        await asyncio.sleep(0)
+        if run.task.done():
+            return
+        run.cancelled = True
+        run.task.cancel()
+        try:
+            await run.task
+        except asyncio.CancelledError:
+            pass
+        run.finish(interrupted=True)
+
+    def get(self, run_id: str) -> Optional[StreamRun]:
+        self._evict_expired()
+        return self._runs.get(run_id)
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for run_id, run in list(self._runs.items()):
+            if run.finished_at is not None and now - run.finished_at > self.ttl:
+                del self._runs[run_id]
+
+    def _evict(self) -> None:
+        """Make room for a new run by dropping the oldest finished runs.
+
+        Running runs are never evicted: their producer is still consuming the
+        agent stream, and must stay attachable until it finishes.
+        """
+        self._evict_expired()
+        while len(self._runs) >= self.max_runs:
+            victim = next((k for k, r in self._runs.items() if r.finished), None)
+            if victim is None:
+                break
+            self._runs.pop(victim)
+
+    def clear(self) -> None:
+        self._runs.clear()
+
+    async def aclose(self) -> None:
+        """Cancel every running detached run (application shutdown)."""
+        for run in list(self._runs.values()):
+            await self.cancel(run)
+        self._runs.clear()
+
+
+@lru_cache
+def get_stream_replay_store() -> StreamReplayStore:
+    return StreamReplayStore(
+        max_runs=settings.chat_replay_max_runs,
+        ttl=settings.chat_replay_ttl,
+    )
+
+
+async def close_stream_replay_store() -> None:
+    """Cancel detached runs; the next get_stream_replay_store() builds a fresh store."""
+    if get_stream_replay_store.cache_info().currsize:
+        await get_stream_replay_store().aclose()
+        get_stream_replay_store.cache_clear()
@@ -0,0 +1,199 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Cached catalog of the tools exposed by each MCP tool server.
+
+The UI calls ``POST /tools/{namespace}/{name}/connect`` whenever a tool page
+is opened, which used to re-list tools from the server every time.
+ToolCatalog keeps each server's tool list (name, description, input schema):
+
+- An entry is populated on the first connect and tagged with the tool
+  workload's generation (see ``workload_generation``); a rollout changes the
+  tag and the next connect re-lists.
+- ``notifications/tools/list_changed`` from a pooled MCP session marks the
+  entry stale and re-lists it in the background.
+- Entries older than ``MCP_TOOL_CATALOG_TTL`` are re-listed on the next
+  connect, for servers that never send list_changed.
+- ``search()`` answers "which servers expose a tool named X" from memory,
+  without dialing any server.
+
+Entries are dropped when a tool is deleted.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.services.mcp_sessions import add_tools_changed_listener, get_mcp_session_pool
+
+logger = logging.getLogger(__name__)
+
+CatalogKey = Tuple[str, str]
+
+_catalog_requests = registry.counter(
+    "kagenti_mcp_tool_catalog_requests_total",
+    "Tool catalog lookups on connect by result (hit, miss, refresh)",
+    ("result",),
+)
+_catalog_servers = registry.gauge(
+    "kagenti_mcp_tool_catalog_servers",
+    "MCP tool servers with a cached tool list",
+)
+
+
+@dataclass
+class CatalogEntry:
+    """Tool list of one MCP server."""
+
+    namespace: str
+    name: str
+    endpoint: str
+    generation: Optional[str]
+    tools: List[Dict[str, Any]]
+    fetched_at: float  # wall clock, reported to clients
+    stale: bool = False
+
+
+async def list_tool_schemas(session) -> List[Dict[str, Any]]:
+    """List tools on an initialized MCP session as plain dicts."""
+    response = await session.list_tools()
+    tools = []
+    for tool in getattr(response, "tools", None) or []:
+        tools.append(
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": getattr(tool, "inputSchema", None),
+            }
+        )
+    return tools
+
+
+class ToolCatalog:
+    """Per-server tool lists with rollout and list_changed invalidation."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = settings.mcp_tool_catalog_ttl if ttl is None else ttl
+        self._entries: Dict[CatalogKey, CatalogEntry] = {}
+        self._inflight: Dict[CatalogKey, asyncio.Task] = {}
+        _catalog_servers.set_function(lambda: len(self._entries))
+
+    def entries(self) -> List[CatalogEntry]:
+        return list(self._entries.values())
+
+    def _valid(self, entry: CatalogEntry, endpoint: str, generation: Optional[str]) -> bool:
+        return (
+            not entry.stale
+            and entry.endpoint == endpoint
+            and entry.generation == generation
+            and time.time() - entry.fetched_at < self.ttl
+        )
+
+    async def get(
+        self,
+        namespace: str,
+        name: str,
+        endpoint: str,
+        generation: Optional[str],
+        refresh: bool = False,
+    ) -> CatalogEntry:
+        """Return the server's tool list, listing it over MCP if needed."""
+        key = (namespace, name)
+        entry = self._entries.get(key)
+        if entry is not None and not refresh and self._valid(entry, endpoint, generation):
+            _catalog_requests.inc(result="hit")
+            return entry
+        _catalog_requests.inc(result="miss" if entry is None else "refresh")
+        return await asyncio.shield(self._start_fetch(key, endpoint, generation))
+
+    def _start_fetch(
+        self, key: CatalogKey, endpoint: str, generation: Optional[str]
+    ) -> asyncio.Task:
+        """Start (or join) the single in-flight listing for ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, endpoint, generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+        return task
+
+    def _on_fetch_done(self, key: CatalogKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Listing tools on %s/%s failed: %s", key[0], key[1], task.exception())
+
+    async def _fetch(
+        self, key: CatalogKey, endpoint: str, generation: Optional[str]
+    ) -> CatalogEntry:
+        namespace, name = key
+        async with get_mcp_session_pool().session(namespace, name, endpoint) as session:
+            tools = await list_tool_schemas(session)
+        entry = CatalogEntry(
+            namespace=namespace,
+            name=name,
+            endpoint=endpoint,
+            generation=generation,
+            tools=tools,
+            fetched_at=time.time(),
+        )
+        self._entries[key] = entry
+        logger.info("Cached %d tools from MCP server %s/%s", len(tools), namespace, name)
+        return entry
+
+    def on_tools_changed(self, namespace: str, name: str) -> None:
+        """Handle ``tools/list_changed``: mark stale and re-list in the background."""
+        entry = self._entries.get((namespace, name))
+        if entry is None:
+            return
+        entry.stale = True
+        self._start_fetch((namespace, name), entry.endpoint, entry.generation)
+
+    def remove(self, namespace: str, name: str) -> None:
+        self._entries.pop((namespace, name), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def search(
+        self,
+        query: str = "",
+        namespaces: Optional[Iterable[str]] = None,
+        exact: bool = False,
+    ) -> List[Tuple[CatalogEntry, Dict[str, Any]]]:
+        """Find cached tools by name (exact) or by name/description substring.
+
+        Matching is case-insensitive; an empty query matches every tool.
+        Results are ordered by namespace, server and tool name.
+        """
+        needle = query.strip().lower()
+        allowed = set(namespaces) if namespaces is not None else None
+        matches = []
+        for entry in self._entries.values():
+            if allowed is not None and entry.namespace not in allowed:
+                continue
+            for tool in entry.tools:
+                tool_name = (tool.get("name") or "").lower()
+                if exact:
+                    found = not needle or tool_name == needle
+                else:
+                    description = (tool.get("description") or "").lower()
+                    found = needle in tool_name or needle in description
+                if found:
+                    matches.append((entry, tool))
+        matches.sort(key=lambda m: (m[0].namespace, m[0].name, m[1].get("name") or ""))
+        return matches
+
+
+@lru_cache
+def get_tool_catalog() -> ToolCatalog:
+    """Get the process-wide tool catalog."""
+    catalog = ToolCatalog()
+    add_tools_changed_listener(catalog.on_tools_changed)
+    return catalog
@@ -2,19 +2,38 @@
 # Licensed under the Apache License, Version 2.0
 
 """
-Utility functions for creating HTTPRoutes (Kubernetes) and Routes (OpenShift).
+Utility functions for creating HTTPRoutes (Kubernetes) and Routes (OpenShift),
+and for resolving agent/tool URLs from their Service ports.
 """
 
 import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from kubernetes.client import ApiException
 
+from app.services.kube_cache import ResourceInformer
 from app.services.kubernetes import KubernetesService
 from app.core.config import settings
-from app.core.constants import DEFAULT_IN_CLUSTER_PORT, DEFAULT_OFF_CLUSTER_PORT
+from app.core.constants import (
+    DEFAULT_IN_CLUSTER_PORT,
+    DEFAULT_OFF_CLUSTER_PORT,
+    KAGENTI_TYPE_LABEL,
+    RESOURCE_TYPE_AGENT,
+    RESOURCE_TYPE_TOOL,
+)
+from app.core.metrics import registry
 
 logger = logging.getLogger(__name__)
 
+_port_cache_requests = registry.counter(
+    "kagenti_service_port_cache_requests_total",
+    "Service port lookups served from (hit) or missing (miss) the port cache",
+    ("result",),
+)
+
 
 def sanitize_log(value: str) -> str:
     """Strip newlines and control characters to prevent log injection (CWE-117)."""
@@ -61,22 +80,38 @@ def select_route_port(
     return default_port
 
 
+_last_platform: Optional[str] = None
+
+
 def detect_platform(kube: KubernetesService) -> str:
     """
     Detect if running on OpenShift or regular Kubernetes.
 
+    API group discovery is cached on the KubernetesService for
+    API_DISCOVERY_REFRESH_INTERVAL seconds, so repeated calls do not hit
+    ``GET /apis``; use invalidate_platform() to force a fresh lookup.
+
     Returns:
         'openshift' if route.openshift.io API is available, 'kubernetes' otherwise
     """
+    global _last_platform  # pylint: disable=global-statement
     try:
-        if kube.api_group_exists("route.openshift.io"):
-            logger.info("Detected OpenShift platform (route.openshift.io API found)")
-            return "openshift"
-        logger.info("Detected Kubernetes platform (no route.openshift.io API)")
-        return "kubernetes"
+        platform = "openshift" if kube.api_group_exists("route.openshift.io") else "kubernetes"
     except Exception as e:
         logger.warning("Error detecting platform: %s, defaulting to kubernetes", e)
         return "kubernetes"
+    if platform != _last_platform:
+        if platform == "openshift":
+            logger.info("Detected OpenShift platform (route.openshift.io API found)")
+        else:
+            logger.info("Detected Kubernetes platform (no route.openshift.io API)")
+        _last_platform = platform
+    return platform
+
+
+def invalidate_platform(kube: KubernetesService) -> None:
+    """Forget cached API discovery so the next detect_platform() call refetches it."""
+    kube.invalidate_api_discovery()
 
 
 def create_httproute(
@@ -313,18 +348,117 @@ def create_route_for_agent_or_tool(
         create_httproute(kube, name, namespace, service_name, service_port)
 
 
+def _service_key(obj: Any) -> Optional[str]:
+    metadata = obj.get("metadata") or {}
+    if not metadata.get("name"):
+        return None
+    return f"{metadata.get('namespace')}/{metadata['name']}"
+
+
+def _service_identity(obj: Any) -> Dict[str, Any]:
+    """Services are only watched for invalidation, so keep just their identity."""
+    metadata = obj.metadata
+    return {"metadata": {"name": metadata.name, "namespace": metadata.namespace}}
+
+
+# Only agent and tool Services are looked up; other Services are not watched
+SERVICE_WATCH_SELECTOR = f"{KAGENTI_TYPE_LABEL} in ({RESOURCE_TYPE_AGENT},{RESOURCE_TYPE_TOOL})"
+
+
+class ServicePortCache:
+    """TTL cache of (namespace, service) -> port, invalidated by a Service watch.
+
+    Agent and tool Service ports almost never change, so steady-state chat
+    turns and tool calls can resolve their URL without a Kubernetes read.
+    Entries expire after ``SERVICE_PORT_CACHE_TTL`` seconds; when the watch is
+    running, any change to or deletion of an agent or tool Service (by the
+    ``kagenti.io/type`` label) drops its entry immediately. Failed lookups and
+    Services without ports are never cached, since their fallback port
+    depends on the caller.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._informer: Optional[ResourceInformer] = None
+
+    def get(self, namespace: str, service_name: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get((namespace, service_name))
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+            self._entries.pop((namespace, service_name), None)
+        return None
+
+    def put(self, namespace: str, service_name: str, port: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(namespace, service_name)] = (port, time.monotonic() + self.ttl)
+
+    def invalidate(self, namespace: str, service_name: str) -> None:
+        with self._lock:
+            self._entries.pop((namespace, service_name), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _invalidate_key(self, key: str) -> None:
+        namespace, _, service_name = key.partition("/")
+        self.invalidate(namespace, service_name)
+
+    def start_watch(self, kube: KubernetesService) -> None:
+        """Watch agent and tool Services cluster-wide and drop entries as they change."""
+        if self._informer is not None:
+            return
+        self._informer = ResourceInformer(
+            "service-ports",
+            kube.core_api.list_service_for_all_namespaces,
+            label_selector=SERVICE_WATCH_SELECTOR,
+            transform=_service_identity,
+            key_func=_service_key,
+            on_update=lambda obj: self._invalidate_key(_service_key(obj)),
+            on_delete=self._invalidate_key,
+        )
+        self._informer.start()
+
+    def stop_watch(self) -> None:
+        if self._informer is not None:
+            self._informer.stop()
+            self._informer = None
+
+
+@lru_cache
+def get_service_port_cache() -> ServicePortCache:
+    """Get the process-wide Service port cache."""
+    return ServicePortCache(ttl=settings.service_port_cache_ttl)
+
+
 def lookup_service_port(
     service_name: str,
     namespace: str,
     kube: KubernetesService,
     default_port: int,
 ) -> int:
-    """Look up the first port of a K8s Service, falling back to *default_port*."""
+    """Look up the first port of a K8s Service, falling back to *default_port*.
+
+    Successful lookups are served from the shared ServicePortCache.
+    """
+    cache = get_service_port_cache()
+    port = cache.get(namespace, service_name)
+    if port is not None:
+        _port_cache_requests.inc(result="hit")
+        return port
+    _port_cache_requests.inc(result="miss")
     try:
         service = kube.get_service(namespace=namespace, name=service_name)
         ports = service.get("spec", {}).get("ports", [])
         if ports:
-            return ports[0].get("port", default_port)
+            port = ports[0].get("port", default_port)
+            cache.put(namespace, service_name, port)
+            return port
     except ApiException:
         logger.warning(
             "Could not look up Service %s in %s, using default port",
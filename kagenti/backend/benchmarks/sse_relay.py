@@ -0,0 +1,210 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Benchmark: agent SSE relay throughput in events/sec.
+
+Compares, over the same synthetic A2A stream:
+
+- legacy:      the relay loop as it was before services/sse_relay.py
+               (json.loads + payload dict + json.dumps per line)
+- relay-json:  A2ARelay with the stdlib json codec
+- relay-orjson A2ARelay with orjson (skipped if orjson is not installed)
+- passthrough: forwarding raw bytes (what ?passthrough=true does)
+
+Run from kagenti/backend:
+
+    python -m benchmarks.sse_relay --events 20000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Iterable, List, Optional
+from unittest.mock import patch
+
+from app.services import sse_relay
+from app.services.sse_relay import A2ARelay
+
+
+def synthetic_stream(events: int) -> List[str]:
+    """A long agent run: status updates, tool-call JSON artifacts and noise."""
+    lines = []
+    for i in range(events):
+        if i % 10 == 9:
+            result = {
+                "taskId": "task-1",
+                "contextId": "ctx-1",
+                "artifact": {
+                    "name": "tool_output",
+                    "index": i,
+                    "parts": [
+                        {
+                            "kind": "data",
+                            "data": {
+                                "content_type": "application/json",
+                                "content": json.dumps(
+                                    {"rows": [{"id": n, "value": f"v{n}"} for n in range(20)]}
+                                ),
+                            },
+                        }
+                    ],
+                },
+            }
+        else:
+            result = {
+                "taskId": "task-1",
+                "contextId": "ctx-1",
+                "final": False,
+                "status": {
+                    "state": "WORKING",
+                    "message": {
+                        "role": "agent",
+                        "parts": [{"kind": "text", "text": f"Thinking about step {i} " * 8}],
+                    },
+                },
+            }
+        lines.append("data: " + json.dumps({"jsonrpc": "2.0", "id": "1", "result": result}))
+        lines.append("")
+        if i % 25 == 0:
+            lines.append(": keep-alive")
+    lines.append("data: [DONE]")
+    return lines
+
+
+def _legacy_extract_text_from_parts(parts: list) -> str:
+    content = ""
+    for part in parts:
+        if isinstance(part, dict):
+            if "text" in part:
+                content += part["text"]
+            elif part.get("kind") == "text":
+                content += part.get("text", "")
+            elif "data" in part:
+                data = part["data"]
+                if isinstance(data, dict):
+                    if "content_type" in data and "content" in data:
+                        content_type = data.get("content_type", "")
+                        content_value = data.get("content", "")
+                        if content_type == "application/json" and content_value:
+                            try:
+                                formatted = json.dumps(json.loads(content_value), indent=2)
+                                content += f"\n```json\n{formatted}\n```\n"
+                            except json.JSONDecodeError:
+                                content += f"\n{content_value}\n"
+                        elif not content_type.startswith("image/"):
+                            content += f"\n{content_value}\n"
+                    else:
+                        content += f"\n```json\n{json.dumps(data, indent=2)}\n```\n"
+                elif isinstance(data, str):
+                    try:
+                        content += f"\n```json\n{json.dumps(json.loads(data), indent=2)}\n```\n"
+                    except (json.JSONDecodeError, TypeError):
+                        content += f"\n{data}\n"
+    return content
+
+
+def legacy_relay(lines: Iterable[str], session_id: str, username: Optional[str]) -> int:
+    """The pre-A2ARelay loop (status/artifact paths), kept for comparison."""
+    sent = 0
+    for line in lines:
+        if not line or not line.startswith("data: "):
+            continue
+        data = line[6:]
+        if data == "[DONE]":
+            sent += len(f"data: {json.dumps({'done': True, 'session_id': session_id})}\n\n")
+            break
+        chunk = json.loads(data)
+        if "result" not in chunk:
+            continue
+        result = chunk["result"]
+        payload = {"session_id": session_id}
+        if username:
+            payload["username"] = username
+        if "artifact" in result:
+            artifact = result.get("artifact", {})
+            content = _legacy_extract_text_from_parts(artifact.get("parts", []))
+            payload["event"] = {
+                "type": "artifact",
+                "taskId": result.get("taskId", ""),
+                "name": artifact.get("name"),
+                "index": artifact.get("index"),
+            }
+            if content:
+                payload["content"] = content
+        elif "status" in result and "taskId" in result:
+            status = result["status"]
+            status_message = ""
+            if status.get("message"):
+                status_message = _legacy_extract_text_from_parts(status["message"].get("parts", []))
+            payload["event"] = {
+                "type": "status",
+                "taskId": result.get("taskId", ""),
+                "state": status.get("state", "UNKNOWN"),
+                "final": result.get("final", False),
+                "message": status_message or None,
+            }
+        sent += len(f"data: {json.dumps(payload)}\n\n")
+    return sent
+
+
+def fast_relay(lines: Iterable[str], session_id: str, username: Optional[str]) -> int:
+    relay = A2ARelay(session_id, username, caller_supplied_session_id=True)
+    sent = 0
+    for line in lines:
+        if not line:
+            continue
+        event, done = relay.translate(line)
+        if event is not None:
+            sent += len(event)
+        if done:
+            break
+    return sent
+
+
+def passthrough(raw: bytes, chunk_size: int = 65536) -> int:
+    sent = 0
+    for start in range(0, len(raw), chunk_size):
+        sent += len(raw[start : start + chunk_size])
+    return sent
+
+
+def _measure(func: Callable[[], int], events: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return events / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = synthetic_stream(args.events)
+    raw = "\n".join(lines).encode()
+
+    results = {
+        "legacy": _measure(lambda: legacy_relay(lines, "s", "alice"), args.events, args.repeat)
+    }
+    with patch.object(sse_relay, "_ORJSON_AVAILABLE", False):
+        results["relay-json"] = _measure(
+            lambda: fast_relay(lines, "s", "alice"), args.events, args.repeat
+        )
+    if sse_relay.orjson is not None:
+        results["relay-orjson"] = _measure(
+            lambda: fast_relay(lines, "s", "alice"), args.events, args.repeat
+        )
+    results["passthrough"] = _measure(lambda: passthrough(raw), args.events, args.repeat)
+
+    baseline = results["legacy"]
+    print(f"{'mode':<14}{'events/sec':>14}{'speedup':>10}")
+    for mode, rate in results.items():
+        print(f"{mode:<14}{rate:>14,.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
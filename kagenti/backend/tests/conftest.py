@@ -0,0 +1,151 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Shared fixtures:
+- a fake MCP server behind the pooled MCP sessions, and a test client for
+  the tools router using it
+- a test client for the chat router whose session DB is a fake connection
+  (the ``session_db_conn`` fixture of the test module)
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+
+from app.core.auth import TokenData, get_required_user
+from app.routers import chat, tools
+from app.services import mcp_sessions
+from app.services.kubernetes import get_kubernetes_service
+from app.services.mcp_sessions import McpSessionPool
+
+
+class FakeServer:
+    """Records transports and sessions opened by the pool."""
+
+    def __init__(self):
+        self.opened = []  # endpoints, one per transport
+        self.closed = []
+        self.sessions = []
+        self.ping_ok = True
+        self.tools = [Tool(name="get_weather", description="Weather", inputSchema={})]
+        self.fail_connect = False
+        # tool name -> async callable(arguments, **kwargs) overriding call_tool
+        self.call_behaviour = {}
+
+    def transport(self, url, headers=None):
+        server = self
+
+        @asynccontextmanager
+        async def streams():
+            if server.fail_connect:
+                raise httpx.ConnectError("refused")
+            server.opened.append(url)
+            try:
+                yield (url, None, lambda: None)
+            finally:
+                server.closed.append(url)
+
+        return streams()
+
+    def client_session(self, read_stream, write_stream, message_handler=None):
+        server = self
+
+        class FakeSession:
+            def __init__(self):
+                self.endpoint = read_stream
+                self.message_handler = message_handler
+                self.initialized = 0
+                self.calls = 0
+                self.list_calls = 0
+
+            async def __aenter__(self):
+                server.sessions.append(self)
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def initialize(self):
+                self.initialized += 1
+
+            async def send_ping(self):
+                if not server.ping_ok:
+                    raise httpx.ReadError("gone")
+
+            async def list_tools(self):
+                self.list_calls += 1
+                return ListToolsResult(tools=list(server.tools))
+
+            async def call_tool(self, name, arguments, **kwargs):
+                self.calls += 1
+                behaviour = server.call_behaviour.get(name)
+                if behaviour is not None:
+                    return await behaviour(arguments, **kwargs)
+                return CallToolResult(content=[TextContent(type="text", text=f"{name}:ok")])
+
+        return FakeSession()
+
+
+@pytest.fixture
+def mcp_server():
+    fake = FakeServer()
+    with (
+        patch.object(mcp_sessions, "streamablehttp_client", fake.transport),
+        patch.object(mcp_sessions, "ClientSession", fake.client_session),
+    ):
+        yield fake
+
+
+@pytest.fixture
+def mcp_client(mcp_server):
+    """TestClient for the tools router, with tools served by ``mcp_server``."""
+    app = FastAPI()
+    app.include_router(tools.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+    pool = McpSessionPool(max_sessions=8, idle_timeout=300, connect_timeout=1, enabled=True)
+
+    with (
+        patch("app.core.auth.settings") as mock_auth,
+        patch.object(tools, "_get_tool_url", return_value="http://weather-mcp:8000"),
+        patch.object(tools, "get_mcp_session_pool", return_value=pool),
+    ):
+        mock_auth.enable_auth = False
+        with TestClient(app) as test_client:
+            yield test_client
+            test_client.portal.call(pool.aclose)
+
+
+@pytest.fixture
+def session_db_client(session_db_conn):
+    """A chat router TestClient whose session DB connections are ``session_db_conn``.
+
+    Yields ``(client, conn)``; requests are made as the operator "alice".
+    """
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+    app.dependency_overrides[get_required_user] = lambda: TokenData(
+        sub="u", username="alice", email=None, roles=["kagenti-operator"], raw_token={}
+    )
+
+    class Pool:
+        @asynccontextmanager
+        async def acquire(self):
+            yield session_db_conn
+
+    async def get_pool(namespace):
+        return Pool()
+
+    with (
+        patch("app.core.auth.settings") as mock_auth,
+        patch("app.services.session_db.get_session_pool", get_pool),
+    ):
+        mock_auth.enable_auth = False
+        with TestClient(app) as client:
+            yield client, session_db_conn
@@ -0,0 +1,233 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the server-side agent card cache and its chat endpoints.
+
+Tests cover:
+- Fresh hits served without contacting the agent
+- Stale-while-revalidate with If-None-Match / 304 from the agent
+- Discarding cached cards when the workload generation changes
+- Single-flight fetches for concurrent misses
+- ETag / If-None-Match toward clients of the agent-card endpoint
+- The bulk agent-cards endpoint, including agents whose lookup fails
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kubernetes.client import ApiException
+
+from app.routers import chat
+from app.services.agent_cards import AgentCardCache, get_agent_card_cache
+from app.services.kubernetes import get_kubernetes_service
+
+AGENT_URL = "http://weather.team1.svc:8080"
+CARD = {"name": "weather", "version": "1.0", "capabilities": {"streaming": True}}
+
+
+class FakeAgent:
+    """Serves an agent card and honours If-None-Match like a real agent."""
+
+    def __init__(self, card=None, etag='"v1"'):
+        self.card = card or CARD
+        self.etag = etag
+        self.requests = []
+
+    async def send(self, client, request, **kwargs):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag}, request=request)
+        return httpx.Response(200, json=self.card, headers={"ETag": self.etag}, request=request)
+
+
+@pytest.fixture
+def agent():
+    fake = FakeAgent()
+
+    async def send(client, request, **kwargs):
+        return await fake.send(client, request, **kwargs)
+
+    with patch.object(httpx.AsyncClient, "send", send):
+        yield fake
+
+
+@pytest.fixture(autouse=True)
+def _clear_agent_card_cache():
+    get_agent_card_cache().clear()
+    yield
+    get_agent_card_cache().clear()
+
+
+class TestAgentCardCache:
+    async def test_fresh_entry_is_served_from_cache(self, agent):
+        cache = AgentCardCache(ttl=60, stale_ttl=60)
+
+        first = await cache.get("team1", "weather", AGENT_URL, "deployment:u:1")
+        second = await cache.get("team1", "weather", AGENT_URL, "deployment:u:1")
+
+        assert first is second
+        assert first.card == CARD
+        assert len(agent.requests) == 1
+
+    async def test_stale_entry_is_revalidated_in_background(self, agent):
+        cache = AgentCardCache(ttl=0, stale_ttl=60)
+        first = await cache.get("team1", "weather", AGENT_URL, None)
+
+        stale = await cache.get("team1", "weather", AGENT_URL, None)
+        assert stale is first
+        await asyncio.sleep(0.01)
+
+        assert len(agent.requests) == 2
+        assert agent.requests[1].headers["If-None-Match"] == '"v1"'
+        refreshed = cache._entries[("team1", "weather")]
+        assert refreshed is not first
+        assert refreshed.card == CARD
+        assert refreshed.etag == first.etag
+
+    async def test_expired_entry_is_refetched(self, agent):
+        cache = AgentCardCache(ttl=0, stale_ttl=0)
+        await cache.get("team1", "weather", AGENT_URL, None)
+        agent.card = {**CARD, "version": "2.0"}
+        agent.etag = '"v2"'
+
+        entry = await cache.get("team1", "weather", AGENT_URL, None)
+
+        assert entry.card["version"] == "2.0"
+        assert entry.upstream_etag == '"v2"'
+
+    async def test_generation_change_discards_entry(self, agent):
+        cache = AgentCardCache(ttl=60, stale_ttl=60)
+        await cache.get("team1", "weather", AGENT_URL, "deployment:u:1")
+
+        entry = await cache.get("team1", "weather", AGENT_URL, "deployment:u:2")
+
+        assert entry.generation == "deployment:u:2"
+        assert len(agent.requests) == 2
+        assert "If-None-Match" not in agent.requests[1].headers
+
+    async def test_concurrent_misses_share_one_fetch(self, agent):
+        cache = AgentCardCache(ttl=60, stale_ttl=60)
+
+        entries = await asyncio.gather(
+            *(cache.get("team1", "weather", AGENT_URL, None) for _ in range(5))
+        )
+
+        assert len(agent.requests) == 1
+        assert all(entry is entries[0] for entry in entries)
+
+    async def test_fetch_error_propagates_and_is_not_cached(self, agent):
+        cache = AgentCardCache(ttl=60, stale_ttl=60)
+
+        async def failing_send(client, request, **kwargs):
+            return httpx.Response(500, text="boom", request=request)
+
+        with patch.object(httpx.AsyncClient, "send", failing_send):
+            with pytest.raises(httpx.HTTPStatusError):
+                await cache.get("team1", "weather", AGENT_URL, None)
+
+        assert ("team1", "weather") not in cache._entries
+
+    async def test_evicts_least_recently_used(self, agent):
+        cache = AgentCardCache(ttl=60, stale_ttl=60, max_entries=2)
+        for name in ("a", "b", "c"):
+            await cache.get("team1", name, f"http://{name}.team1.svc:8080", None)
+
+        assert list(cache._entries) == [("team1", "b"), ("team1", "c")]
+
+
+@pytest.fixture
+def client(agent):
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+
+    def resolve(name, namespace, kube):
+        if name == "missing":
+            return f"http://{name}.{namespace}.svc:8080/unreachable"
+        if name == "gone":
+            raise ApiException(status=404, reason="Not Found")
+        return f"http://{name}.{namespace}.svc:8080"
+
+    with (
+        patch("app.core.auth.settings") as mock_auth,
+        patch("app.routers.chat.resolve_agent_url", side_effect=resolve),
+    ):
+        mock_auth.enable_auth = False
+        yield TestClient(app)
+
+
+class TestAgentCardEndpoint:
+    def test_returns_etag_and_honours_if_none_match(self, client, agent):
+        r = client.get("/api/v1/chat/team1/weather/agent-card")
+        assert r.status_code == 200
+        assert r.json()["streaming"] is True
+        etag = r.headers["ETag"]
+
+        r = client.get("/api/v1/chat/team1/weather/agent-card", headers={"If-None-Match": etag})
+
+        assert r.status_code == 304
+        assert r.headers["ETag"] == etag
+        assert len(agent.requests) == 1
+
+    def test_bulk_returns_cards_and_per_agent_errors(self, client, agent):
+        async def send(client_, request, **kwargs):
+            if "unreachable" in str(request.url):
+                raise httpx.ConnectError("refused", request=request)
+            return await agent.send(client_, request, **kwargs)
+
+        with patch.object(httpx.AsyncClient, "send", send):
+            r = client.post(
+                "/api/v1/chat/agent-cards",
+                json={
+                    "agents": [
+                        {"namespace": "team1", "name": "weather"},
+                        {"namespace": "team1", "name": "missing"},
+                        {"namespace": "team2", "name": "weather"},
+                    ]
+                },
+            )
+
+        assert r.status_code == 200
+        items = r.json()["items"]
+        assert [(i["namespace"], i["name"]) for i in items] == [
+            ("team1", "weather"),
+            ("team1", "missing"),
+            ("team2", "weather"),
+        ]
+        assert items[0]["card"]["name"] == "weather"
+        assert items[1]["card"] is None
+        assert items[1]["status"] == 503
+        assert items[2]["status"] == 200
+
+    def test_bulk_reports_kubernetes_errors_per_agent(self, client, agent):
+        r = client.post(
+            "/api/v1/chat/agent-cards",
+            json={
+                "agents": [
+                    {"namespace": "team1", "name": "gone"},
+                    {"namespace": "team1", "name": "weather"},
+                ]
+            },
+        )
+
+        assert r.status_code == 200
+        gone, weather = r.json()["items"]
+        assert gone["status"] == 404
+        assert gone["card"] is None
+        assert "Not Found" in gone["error"]
+        assert weather["card"]["name"] == "weather"
+
+    def test_bulk_rejects_oversized_requests(self, client):
+        agents = [
+            {"namespace": "team1", "name": f"a{i}"} for i in range(chat.MAX_BULK_AGENT_CARDS + 1)
+        ]
+
+        r = client.post("/api/v1/chat/agent-cards", json={"agents": agents})
+
+        assert r.status_code == 422
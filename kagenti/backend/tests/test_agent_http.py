@@ -0,0 +1,151 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Tests for the shared agent HTTP client pool used by the chat router.
+
+Tests cover:
+- One pooled client per agent upstream, reused across requests
+- In-flight, outcome and duration accounting exported as metrics
+- Streamed responses staying tracked until their body has been read
+- Closing clients left idle past the idle timeout
+- Closing the pool
+- Chat endpoints reusing the pooled client instead of creating one per call
+"""
+
+from contextlib import AsyncExitStack
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import registry
+from app.routers import chat
+from app.services.agent_cards import get_agent_card_cache
+from app.services.agent_http import AgentHttpClients, get_agent_http_clients
+from app.services.kubernetes import get_kubernetes_service
+
+
+@pytest.fixture
+def clients():
+    return AgentHttpClients(max_connections=4, max_keepalive=2, keepalive_expiry=5)
+
+
+class TestAgentHttpClients:
+    async def test_one_client_per_upstream(self, clients):
+        a = clients.client_for("http://weather.team1.svc:8080/")
+        b = clients.client_for("http://weather.team1.svc:8080/.well-known/agent-card.json")
+        c = clients.client_for("http://other.team1.svc:8080/")
+
+        assert a is b
+        assert a is not c
+        assert set(clients.stats()) == {
+            "http://weather.team1.svc:8080",
+            "http://other.team1.svc:8080",
+        }
+        await clients.aclose()
+
+    async def test_track_counts_in_flight_and_outcomes(self, clients):
+        url = "http://tracked.team1.svc:8080/"
+        clients.client_for(url)
+
+        async with clients.track(url):
+            assert clients.stats()["http://tracked.team1.svc:8080"]["in_flight"] == 1
+        with pytest.raises(httpx.ConnectError):
+            async with clients.track(url):
+                raise httpx.ConnectError("refused")
+
+        assert clients.stats()["http://tracked.team1.svc:8080"]["in_flight"] == 0
+        text = registry.render()
+        assert (
+            'kagenti_agent_http_requests_total{upstream="http://tracked.team1.svc:8080",'
+            'outcome="connect_error"} 1.0'
+        ) in text
+        assert 'kagenti_agent_http_in_flight{upstream="http://tracked.team1.svc:8080"}' in text
+        assert (
+            'kagenti_agent_http_request_seconds_count{upstream="http://tracked.team1.svc:8080"} 2'
+        ) in text
+        await clients.aclose()
+
+    async def test_stream_stays_tracked_until_body_is_read(self, clients):
+        url = "http://streaming.team1.svc:8080/"
+        clients.client_for(url)
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(clients.track(url))
+            tracking = stack.pop_all()
+
+        async def body():
+            yield b"data: {}\n\n"
+            yield b"data: {}\n\n"
+
+        response = httpx.Response(200, content=body())
+
+        stream = chat._passthrough_from_response(response, "s1", tracking)
+        await stream.__anext__()
+        assert clients.stats()["http://streaming.team1.svc:8080"]["in_flight"] == 1
+        async for _ in stream:
+            pass
+
+        assert clients.stats()["http://streaming.team1.svc:8080"]["in_flight"] == 0
+        await clients.aclose()
+
+    async def test_evicts_idle_clients(self, clients):
+        idle = clients.client_for("http://idle.team1.svc:8080/")
+        busy_url = "http://busy.team1.svc:8080/"
+        busy = clients.client_for(busy_url)
+        clients.idle_timeout = 0
+
+        async with clients.track(busy_url):
+            assert await clients.evict_idle() == 1
+
+        assert idle.is_closed
+        assert not busy.is_closed
+        assert set(clients.stats()) == {"http://busy.team1.svc:8080"}
+        assert clients.client_for("http://idle.team1.svc:8080/") is not idle
+        await clients.aclose()
+
+    async def test_closed_pool_rejects_new_clients(self, clients):
+        client = clients.client_for("http://a.team1.svc:8080/")
+
+        await clients.aclose()
+
+        assert client.is_closed
+        assert clients.stats() == {}
+        with pytest.raises(RuntimeError):
+            clients.client_for("http://a.team1.svc:8080/")
+
+
+class TestChatUsesPooledClient:
+    def test_agent_card_requests_share_one_client(self):
+        app = FastAPI()
+        app.include_router(chat.router, prefix="/api/v1")
+        app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+        seen_clients = []
+
+        async def mock_send(self, request, **kwargs):
+            seen_clients.append(self)
+            return httpx.Response(200, json={"name": "weather", "version": "1.0"}, request=request)
+
+        with (
+            patch("app.core.auth.settings") as mock_auth,
+            patch(
+                "app.routers.chat.resolve_agent_url",
+                return_value="http://pooled-agent.team1.svc:8080",
+            ),
+            patch.object(httpx.AsyncClient, "send", mock_send),
+        ):
+            mock_auth.enable_auth = False
+            client = TestClient(app)
+            for _ in range(2):
+                # Bypass the agent card cache so both requests reach the agent
+                get_agent_card_cache().clear()
+                r = client.get("/api/v1/chat/team1/weather/agent-card")
+                assert r.status_code == 200
+
+        assert len(seen_clients) == 2
+        assert seen_clients[0] is seen_clients[1]
+        assert seen_clients[0] is get_agent_http_clients().client_for(
+            "http://pooled-agent.team1.svc:8080"
+        )
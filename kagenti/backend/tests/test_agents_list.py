@@ -0,0 +1,188 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Tests for GET /api/v1/agents and GET /api/v1/agents/{namespace}/{name}.
+
+Tests cover:
+- Concurrent multi-kind listing with name precedence across kinds
+- Partial results reporting failed kinds; failing when every queried kind fails
+- Shared deadline for slow kinds
+- get_agent probing precedence and error propagation
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kubernetes.client import ApiException
+
+from app.routers import agents
+from app.services.kubernetes import get_kubernetes_service
+
+
+def _workload(name: str, **status) -> dict:
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "team1",
+            "labels": {"kagenti.io/type": "agent"},
+        },
+        "spec": {},
+        "status": status,
+    }
+
+
+def _not_found():
+    return ApiException(status=404, reason="Not Found")
+
+
+@pytest.fixture
+def kube():
+    mock = MagicMock()
+    mock.list_deployments.return_value = []
+    mock.list_statefulsets.return_value = []
+    mock.list_jobs.return_value = []
+    mock.list_sandboxes.return_value = []
+    mock.get_deployment.side_effect = _not_found()
+    mock.get_statefulset.side_effect = _not_found()
+    mock.get_job.side_effect = _not_found()
+    mock.get_sandbox.side_effect = _not_found()
+    mock.get_service.side_effect = _not_found()
+    return mock
+
+
+@pytest.fixture
+def client(kube):
+    app = FastAPI()
+    app.include_router(agents.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: kube
+    with patch("app.core.auth.settings") as mock_auth:
+        mock_auth.enable_auth = False
+        yield TestClient(app)
+
+
+class TestListAgents:
+    def test_merges_kinds_with_precedence(self, client, kube):
+        kube.list_deployments.return_value = [_workload("a")]
+        kube.list_statefulsets.return_value = [_workload("a"), _workload("b")]
+        kube.list_jobs.return_value = [_workload("c")]
+
+        r = client.get("/api/v1/agents", params={"namespace": "team1"})
+
+        assert r.status_code == 200
+        body = r.json()
+        assert [(i["name"], i["workloadType"]) for i in body["items"]] == [
+            ("a", "deployment"),
+            ("b", "statefulset"),
+            ("c", "job"),
+        ]
+        assert body["failedKinds"] == []
+
+    def test_partial_results_report_failed_kinds(self, client, kube):
+        kube.list_deployments.return_value = [_workload("a")]
+        kube.list_jobs.side_effect = ApiException(status=500, reason="boom")
+
+        r = client.get("/api/v1/agents", params={"namespace": "team1"})
+
+        assert r.status_code == 200
+        assert [i["name"] for i in r.json()["items"]] == ["a"]
+        assert r.json()["failedKinds"] == ["job"]
+
+    def test_all_kinds_failing_raises(self, client, kube):
+        for lister in (kube.list_deployments, kube.list_statefulsets, kube.list_jobs):
+            lister.side_effect = ApiException(status=403, reason="Forbidden")
+
+        r = client.get("/api/v1/agents", params={"namespace": "team1"})
+
+        assert r.status_code == 403
+        assert "Permission denied" in r.json()["detail"]
+
+    def test_all_queried_kinds_failing_raises_despite_skipped_kinds(self, client, kube):
+        for lister in (kube.list_deployments, kube.list_statefulsets, kube.list_jobs):
+            lister.side_effect = ApiException(status=500, reason="boom")
+        kube.list_sandboxes.side_effect = _not_found()
+        with patch("app.routers.agents.settings") as mock_settings:
+            mock_settings.kagenti_feature_flag_agent_sandbox = True
+            mock_settings.enable_legacy_agent_crd = False
+            r = client.get("/api/v1/agents", params={"namespace": "team1"})
+
+        assert r.status_code == 500
+
+    def test_missing_sandbox_crd_is_not_a_failure(self, client, kube):
+        kube.list_sandboxes.side_effect = _not_found()
+        with patch("app.routers.agents.settings") as mock_settings:
+            mock_settings.kagenti_feature_flag_agent_sandbox = True
+            mock_settings.enable_legacy_agent_crd = False
+            r = client.get("/api/v1/agents", params={"namespace": "team1"})
+
+        assert r.status_code == 200
+        assert r.json()["failedKinds"] == []
+
+    def test_slow_kind_misses_shared_deadline(self, client, kube):
+        release = threading.Event()
+        kube.list_deployments.return_value = [_workload("a")]
+        kube.list_statefulsets.side_effect = lambda **_: release.wait(5) and []
+
+        try:
+            with patch("app.services.kubernetes_async.settings") as mock_settings:
+                mock_settings.kube_fanout_deadline = 0.1
+                mock_settings.kube_call_timeout = 30
+                r = client.get("/api/v1/agents", params={"namespace": "team1"})
+        finally:
+            release.set()
+
+        assert r.status_code == 200
+        assert [i["name"] for i in r.json()["items"]] == ["a"]
+        assert r.json()["failedKinds"] == ["statefulset"]
+
+
+class TestGetAgent:
+    def test_prefers_deployment_over_later_kinds(self, client, kube):
+        kube.get_deployment.side_effect = None
+        kube.get_deployment.return_value = _workload("a")
+        kube.get_job.side_effect = None
+        kube.get_job.return_value = _workload("a")
+
+        r = client.get("/api/v1/agents/team1/a")
+
+        assert r.status_code == 200
+        assert r.json()["workloadType"] == "deployment"
+
+    def test_falls_through_to_job(self, client, kube):
+        kube.get_job.side_effect = None
+        kube.get_job.return_value = _workload("a", succeeded=1)
+
+        r = client.get("/api/v1/agents/team1/a")
+
+        assert r.status_code == 200
+        assert r.json()["workloadType"] == "job"
+        assert "service" not in r.json()
+
+    def test_includes_service(self, client, kube):
+        kube.get_deployment.side_effect = None
+        kube.get_deployment.return_value = _workload("a")
+        kube.get_service.side_effect = None
+        kube.get_service.return_value = {
+            "metadata": {"name": "a"},
+            "spec": {"type": "ClusterIP", "ports": [{"port": 8080}]},
+        }
+
+        r = client.get("/api/v1/agents/team1/a")
+
+        assert r.json()["service"]["ports"] == [{"port": 8080}]
+
+    def test_not_found(self, client):
+        r = client.get("/api/v1/agents/team1/missing")
+        assert r.status_code == 404
+
+    def test_earlier_kind_error_wins(self, client, kube):
+        kube.get_deployment.side_effect = ApiException(status=403, reason="Forbidden")
+        kube.get_job.side_effect = None
+        kube.get_job.return_value = _workload("a")
+
+        r = client.get("/api/v1/agents/team1/a")
+
+        assert r.status_code == 403
@@ -0,0 +1,150 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the cached API discovery used by platform detection and
+optional-CRD checks.
+
+Tests cover:
+- GET /apis fetched once per refresh interval, and refetched after invalidate()
+- Group-version resource discovery, with 404 cached as "CRD not installed"
+- Discovery errors failing open and not being cached
+- detect_platform() served from the cache, and refetched after invalidate_platform()
+- Sandbox listing skipped when the CRD is not installed
+"""
+
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client import ApiException
+
+from app.services.api_discovery import ApiDiscoveryCache
+from app.utils.routes import detect_platform, invalidate_platform
+
+
+def _group(name):
+    group = MagicMock()
+    group.name = name
+    return group
+
+
+def _resource(name):
+    resource = MagicMock()
+    resource.name = name
+    return resource
+
+
+def _kube(groups=("apps", "route.openshift.io")):
+    kube = MagicMock()
+    kube.apis_api.get_api_versions.return_value.groups = [_group(g) for g in groups]
+    return kube
+
+
+class TestApiGroups:
+    def test_groups_are_cached_until_refresh(self):
+        kube = _kube()
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+
+        with patch("app.services.api_discovery.time.monotonic", return_value=100.0):
+            assert cache.group_exists("route.openshift.io")
+            assert not cache.group_exists("missing.io")
+        assert kube.apis_api.get_api_versions.call_count == 1
+
+        with patch("app.services.api_discovery.time.monotonic", return_value=161.0):
+            cache.group_exists("apps")
+        assert kube.apis_api.get_api_versions.call_count == 2
+
+    def test_invalidate_forces_refetch(self):
+        kube = _kube()
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+        cache.group_exists("apps")
+
+        cache.invalidate()
+        cache.group_exists("apps")
+
+        assert kube.apis_api.get_api_versions.call_count == 2
+
+    def test_errors_report_missing_and_are_not_cached(self):
+        kube = _kube()
+        kube.apis_api.get_api_versions.side_effect = ApiException(status=500)
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+
+        assert not cache.group_exists("apps")
+        assert not cache.group_exists("apps")
+        assert kube.apis_api.get_api_versions.call_count == 2
+
+
+class TestResourceDiscovery:
+    def test_served_resources(self):
+        kube = _kube()
+        kube.custom_api.get_api_resources.return_value.resources = [
+            _resource("builds"),
+            _resource("buildruns"),
+        ]
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+
+        assert cache.resource_exists("shipwright.io", "v1beta1", "builds")
+        assert not cache.resource_exists("shipwright.io", "v1beta1", "buildstrategies")
+        kube.custom_api.get_api_resources.assert_called_once()
+
+    def test_missing_group_version_is_cached_as_absent(self):
+        kube = _kube()
+        kube.custom_api.get_api_resources.side_effect = ApiException(status=404)
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+
+        assert not cache.resource_exists("agents.x-k8s.io", "v1alpha1", "sandboxes")
+        assert not cache.resource_exists("agents.x-k8s.io", "v1alpha1", "sandboxes")
+        kube.custom_api.get_api_resources.assert_called_once()
+
+    def test_other_errors_fail_open(self):
+        kube = _kube()
+        kube.custom_api.get_api_resources.side_effect = ApiException(status=403)
+        cache = ApiDiscoveryCache(kube, refresh_interval=60)
+
+        assert cache.resource_exists("agents.x-k8s.io", "v1alpha1", "sandboxes")
+        assert cache.resource_exists("agents.x-k8s.io", "v1alpha1", "sandboxes")
+        assert kube.custom_api.get_api_resources.call_count == 2
+
+
+class TestDetectPlatform:
+    def test_uses_cached_discovery(self):
+        kube = _kube()
+        kube.api_group_exists.side_effect = ApiDiscoveryCache(kube, 60).group_exists
+
+        assert detect_platform(kube) == "openshift"
+        assert detect_platform(kube) == "openshift"
+        assert kube.apis_api.get_api_versions.call_count == 1
+
+    def test_invalidate_platform_refetches(self):
+        kube = _kube()
+        cache = ApiDiscoveryCache(kube, 60)
+        kube.api_group_exists.side_effect = cache.group_exists
+        kube.invalidate_api_discovery.side_effect = cache.invalidate
+
+        assert detect_platform(kube) == "openshift"
+        kube.apis_api.get_api_versions.return_value.groups = [_group("apps")]
+        assert detect_platform(kube) == "openshift"
+
+        invalidate_platform(kube)
+        assert detect_platform(kube) == "kubernetes"
+        assert kube.apis_api.get_api_versions.call_count == 2
+
+    def test_kubernetes_without_routes(self):
+        kube = _kube(groups=("apps",))
+        kube.api_group_exists.side_effect = ApiDiscoveryCache(kube, 60).group_exists
+
+        assert detect_platform(kube) == "kubernetes"
+
+
+class TestSandboxKindSkipped:
+    async def test_agent_kinds_exclude_sandbox_when_crd_missing(self):
+        from app.routers.agents import _agent_workload_kinds
+        from app.services.kubernetes_async import AsyncKubernetesService
+
+        kube = MagicMock()
+        kube.sandboxes_served.return_value = False
+        with patch("app.routers.agents.settings") as mock_settings:
+            mock_settings.kagenti_feature_flag_agent_sandbox = True
+            kinds = await _agent_workload_kinds(AsyncKubernetesService(kube))
+
+        assert "sandbox" not in kinds
+        assert kinds == ["deployment", "statefulset", "job"]
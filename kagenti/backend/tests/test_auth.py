@@ -434,3 +434,48 @@ class TestValidateTokenRoleMapping:
         with mock_jwt_decode(realm_roles=[]):
             token_data = await validate_token("fake-token")
             assert ROLE_VIEWER in token_data.roles
+
+
+class TestMetricsAccess:
+    """GET /metrics is open unless METRICS_REQUIRE_AUTH is set."""
+
+    @pytest.fixture
+    def client(self):
+        from app.main import app as fastapi_app
+
+        return TestClient(fastapi_app)
+
+    def test_open_by_default(self, client):
+        with patch("app.core.auth.settings") as mock_settings:
+            mock_settings.enable_auth = True
+            response = client.get("/metrics")
+        assert response.status_code == 200
+
+    def test_requires_operator_when_enabled(self, client):
+        with (
+            patch("app.core.auth.settings") as mock_settings,
+            patch("app.main.settings.metrics_require_auth", True),
+            patch(
+                "app.core.auth.validate_token",
+                new_callable=AsyncMock,
+                return_value=mock_token_data([ROLE_VIEWER]),
+            ),
+        ):
+            mock_settings.enable_auth = True
+            assert client.get("/metrics").status_code == 401
+            viewer = client.get("/metrics", headers={"Authorization": "Bearer fake-token"})
+            assert viewer.status_code == 403
+
+    def test_operator_can_scrape_when_enabled(self, client):
+        with (
+            patch("app.core.auth.settings") as mock_settings,
+            patch("app.main.settings.metrics_require_auth", True),
+            patch(
+                "app.core.auth.validate_token",
+                new_callable=AsyncMock,
+                return_value=mock_token_data([ROLE_OPERATOR]),
+            ),
+        ):
+            mock_settings.enable_auth = True
+            response = client.get("/metrics", headers={"Authorization": "Bearer fake-token"})
+        assert response.status_code == 200
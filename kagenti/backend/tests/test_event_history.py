@@ -0,0 +1,185 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the session history API over the events table.
+
+The database is replaced by an in-memory connection that answers the
+history queries the way Postgres would.
+
+Tests cover:
+- Paging a session's events backwards and forwards by event id
+- Loading the newest turns, with truncated turns and the older-turns cursor
+- Paging the events of one turn
+- Private sessions of other users
+- The history endpoints
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services import event_history
+
+
+class FakeConn:
+    """Rows of the events and sessions tables, queried like Postgres would."""
+
+    def __init__(self, turns, sessions=None):
+        self.events = []
+        for task_id, count in turns:
+            for index in range(1, count + 1):
+                self.events.append(
+                    {
+                        "id": len(self.events) + 1,
+                        "context_id": "s1",
+                        "task_id": task_id,
+                        "event_index": index,
+                        "event_type": "status",
+                        "event_category": None,
+                        "langgraph_node": None,
+                        "payload": json.dumps({"turn": task_id, "n": index}),
+                        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    }
+                )
+        self.sessions = sessions or {}
+
+    def _ctx(self, context_id):
+        return [e for e in self.events if e["context_id"] == context_id]
+
+    def _head(self, context_id, task_id):
+        rows = [e for e in self._ctx(context_id) if e["task_id"] == task_id]
+        return min(rows, key=lambda e: e["event_index"])["id"]
+
+    async def fetchrow(self, query, context_id):
+        return self.sessions.get(context_id)
+
+    async def fetch(self, query, *args):
+        if query == event_history._EVENTS_AFTER:
+            context_id, after, limit = args
+            return [e for e in self._ctx(context_id) if e["id"] > after][:limit]
+        if query == event_history._EVENTS_BEFORE:
+            context_id, before, limit = args
+            return [e for e in reversed(self._ctx(context_id)) if e["id"] < before][:limit]
+        if query == event_history._LATEST_TURNS:
+            context_id, before, limit = args
+            turns = []
+            while len(turns) < limit:
+                older = [e for e in reversed(self._ctx(context_id)) if e["id"] < before]
+                if not older:
+                    break
+                first_id = self._head(context_id, older[0]["task_id"])
+                turns.append({"task_id": older[0]["task_id"], "first_id": first_id})
+                before = first_id
+            return turns
+        if query == event_history._TURNS_EVENTS:
+            context_id, task_ids, limit = args
+            rows = []
+            for task_id in task_ids:
+                turn = [e for e in self._ctx(context_id) if e["task_id"] == task_id]
+                rows.extend({"turn": task_id, **e} for e in turn[:limit])
+            return sorted(rows, key=lambda e: e["id"])
+        if query == event_history._TURN_EVENTS:
+            context_id, task_id, after, limit = args
+            turn = [e for e in self._ctx(context_id) if e["task_id"] == task_id]
+            return [e for e in turn if e["event_index"] > after][:limit]
+        raise AssertionError(f"unexpected query: {query}")
+
+
+class TestEventHistory:
+    async def test_pages_backwards_from_the_newest_events(self):
+        conn = FakeConn([("t1", 5), ("t2", 5)])
+
+        events, more = await event_history.events_page(conn, "s1", limit=4)
+        assert [e["id"] for e in events] == [7, 8, 9, 10]
+        assert more is True
+
+        events, more = await event_history.events_page(conn, "s1", before=3, limit=4)
+        assert [e["id"] for e in events] == [1, 2]
+        assert more is False
+        assert events[0]["payload"] == {"turn": "t1", "n": 1}
+
+    async def test_pages_forwards(self):
+        conn = FakeConn([("t1", 5)])
+
+        events, more = await event_history.events_page(conn, "s1", after=2, limit=2)
+        assert [e["id"] for e in events] == [3, 4]
+        assert more is True
+
+    async def test_latest_turns_newest_first(self):
+        conn = FakeConn([("t1", 2), ("t2", 3), ("t3", 4)])
+
+        turns, before = await event_history.latest_turns(conn, "s1", limit=2, events_per_turn=3)
+        assert [t["task_id"] for t in turns] == ["t3", "t2"]
+        assert [e["event_index"] for e in turns[0]["events"]] == [1, 2, 3]
+        assert turns[0]["has_more"] is True
+        assert turns[1]["has_more"] is False
+        assert before == 3
+
+        turns, before = await event_history.latest_turns(conn, "s1", before=before, limit=2)
+        assert [t["task_id"] for t in turns] == ["t1"]
+        assert before is None
+
+    async def test_turn_events(self):
+        conn = FakeConn([("t1", 2), ("t2", 5)])
+
+        events, more = await event_history.turn_events(conn, "s1", "t2", after=2, limit=2)
+        assert [e["event_index"] for e in events] == [3, 4]
+        assert more is True
+
+    async def test_private_sessions_of_other_users(self):
+        conn = FakeConn([], sessions={"s1": {"owner": "bob", "visibility": "private"}})
+
+        assert await event_history.session_readable(conn, "s1", "alice", False) is False
+        assert await event_history.session_readable(conn, "s1", "bob", False) is True
+        assert await event_history.session_readable(conn, "s1", "alice", True) is True
+        assert await event_history.session_readable(conn, "s2", "alice", False) is True
+
+
+@pytest.fixture
+def session_db_conn():
+    return FakeConn([("t1", 3), ("t2", 3)])
+
+
+class TestHistoryEndpoints:
+    def test_events_window(self, session_db_client):
+        client, _ = session_db_client
+
+        r = client.get("/api/v1/chat/team1/sessions/s1/events", params={"limit": 2})
+
+        assert r.status_code == 200
+        assert [e["id"] for e in r.json()["events"]] == [5, 6]
+        assert r.json()["has_more"] is True
+
+    def test_turns_and_turn_events(self, session_db_client):
+        client, _ = session_db_client
+
+        r = client.get(
+            "/api/v1/chat/team1/sessions/s1/turns", params={"limit": 1, "events_per_turn": 2}
+        )
+        body = r.json()
+        assert [t["task_id"] for t in body["turns"]] == ["t2"]
+        assert body["turns"][0]["has_more"] is True
+        assert body["before"] == 4
+
+        r = client.get("/api/v1/chat/team1/sessions/s1/turns/t2/events", params={"after": 2})
+        assert [e["event_index"] for e in r.json()["events"]] == [3]
+
+    def test_private_session_of_another_user(self, session_db_client):
+        client, conn = session_db_client
+        conn.sessions["s1"] = {"owner": "bob", "visibility": "private"}
+
+        r = client.get("/api/v1/chat/team1/sessions/s1/events")
+
+        assert r.status_code == 404
+
+    def test_limit_is_bounded(self, session_db_client):
+        client, _ = session_db_client
+
+        r = client.get(
+            "/api/v1/chat/team1/sessions/s1/events",
+            params={"limit": event_history.MAX_PAGE_SIZE + 1},
+        )
+
+        assert r.status_code == 422
@@ -0,0 +1,122 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the batched events table writer.
+
+Tests cover:
+- Writing by batch size and by flush interval
+- Grouping rows by namespace
+- Dropping rows when the queue is full
+- Suspending a namespace after a failed batch
+- Draining queued rows on close
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+from app.services.event_writer import EventRow, EventWriter
+
+
+def _row(n: int, namespace: str = "team1") -> EventRow:
+    return EventRow(namespace, "ctx", "stream:r1", n, "status", '{"n": %d}' % n)
+
+
+class _Database:
+    """Records executemany() batches per namespace."""
+
+    def __init__(self, fail=()):
+        self.batches = []
+        self.fail = set(fail)
+
+    async def get_pool(self, namespace):
+        if namespace in self.fail:
+            raise OSError("no database")
+        database = self
+
+        class Conn:
+            async def executemany(self, query, args):
+                assert "ON CONFLICT (context_id, task_id, event_index) DO NOTHING" in query
+                database.batches.append((namespace, [arg[2] for arg in args]))
+
+        class Pool:
+            @asynccontextmanager
+            async def acquire(self):
+                yield Conn()
+
+        return Pool()
+
+
+class TestEventWriter:
+    async def test_full_batch_is_written_without_waiting(self):
+        db = _Database()
+        writer = EventWriter(batch_size=3, flush_interval=60)
+        with patch("app.services.session_db.get_session_pool", db.get_pool):
+            for n in range(1, 5):
+                assert writer.submit(_row(n)) is True
+            await asyncio.wait_for(_until(lambda: db.batches), 1)
+            assert db.batches == [("team1", [1, 2, 3])]
+            assert writer.depth == 1
+            await writer.aclose()
+
+        assert db.batches == [("team1", [1, 2, 3]), ("team1", [4])]
+
+    async def test_partial_batch_is_written_after_interval(self):
+        db = _Database()
+        writer = EventWriter(batch_size=100, flush_interval=0.01)
+        with patch("app.services.session_db.get_session_pool", db.get_pool):
+            writer.submit(_row(1))
+            writer.submit(_row(2))
+            await asyncio.wait_for(_until(lambda: db.batches), 1)
+            await writer.aclose()
+
+        assert db.batches == [("team1", [1, 2])]
+
+    async def test_groups_rows_by_namespace(self):
+        db = _Database()
+        writer = EventWriter(flush_interval=60)
+        with patch("app.services.session_db.get_session_pool", db.get_pool):
+            writer.submit(_row(1, "team1"))
+            writer.submit(_row(1, "team2"))
+            writer.submit(_row(2, "team1"))
+            await asyncio.wait_for(writer.flush(), 1)
+            await writer.aclose()
+
+        assert sorted(db.batches) == [("team1", [1, 2]), ("team2", [1])]
+
+    async def test_drops_rows_when_queue_is_full(self):
+        db = _Database()
+        writer = EventWriter(max_queue=2, flush_interval=60)
+        with patch("app.services.session_db.get_session_pool", db.get_pool):
+            assert writer.submit(_row(1)) is True
+            assert writer.submit(_row(2)) is True
+            assert writer.submit(_row(3)) is False
+            await writer.aclose()
+
+        assert db.batches == [("team1", [1, 2])]
+
+    async def test_failed_batch_suspends_namespace(self):
+        db = _Database(fail={"team2"})
+        writer = EventWriter(flush_interval=0, retry_after=60)
+        with patch("app.services.session_db.get_session_pool", db.get_pool):
+            writer.submit(_row(1, "team2"))
+            writer.submit(_row(1, "team1"))
+            await writer.flush()
+
+            assert writer.accepting("team2") is False
+            assert writer.submit(_row(2, "team2")) is False
+            assert writer.submit(_row(2, "team1")) is True
+            await writer.aclose()
+
+        assert db.batches == [("team1", [1]), ("team1", [2])]
+
+    async def test_closed_writer_rejects_rows(self):
+        writer = EventWriter()
+        await writer.aclose()
+        assert writer.submit(_row(1)) is False
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.001)
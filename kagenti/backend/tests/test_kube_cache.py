@@ -0,0 +1,236 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the watch-backed Kubernetes read cache.
+
+Tests cover:
+- Label selector parsing and local matching
+- ResourceInformer relist/observe/discard and freshness
+- KubeCache read-through when cold, scoped informers, 404 semantics
+- KubernetesService serving reads from the cache when enabled
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import ApiException
+
+from app.services.kube_cache import (
+    KIND_DEPLOYMENTS,
+    KIND_SKILL_CONFIGMAPS,
+    KubeCache,
+    ResourceInformer,
+    labels_match,
+    parse_label_selector,
+)
+
+
+def _obj(name: str, labels: dict = None) -> dict:
+    return {"metadata": {"name": name, "labels": labels or {}}}
+
+
+def _list_result(*items) -> dict:
+    return {"metadata": {"resourceVersion": "42"}, "items": list(items)}
+
+
+def _synced_informer(*items, **kwargs) -> ResourceInformer:
+    informer = ResourceInformer("test", lambda **_: _list_result(*items), **kwargs)
+    informer._relist()
+    return informer
+
+
+# ---------------------------------------------------------------------------
+# Label selectors
+# ---------------------------------------------------------------------------
+
+
+class TestLabelSelectors:
+    def test_empty_selector_matches_everything(self):
+        assert parse_label_selector(None) == frozenset()
+        assert labels_match(parse_label_selector(""), {"a": "b"})
+
+    def test_equality(self):
+        req = parse_label_selector("kagenti.io/type=agent")
+        assert labels_match(req, {"kagenti.io/type": "agent"})
+        assert not labels_match(req, {"kagenti.io/type": "tool"})
+        assert not labels_match(req, {})
+
+    def test_inequality_and_existence(self):
+        req = parse_label_selector("kagenti.io/type,app!=x,!legacy")
+        assert labels_match(req, {"kagenti.io/type": "agent", "app": "y"})
+        assert not labels_match(req, {"kagenti.io/type": "agent", "app": "x"})
+        assert not labels_match(req, {"kagenti.io/type": "agent", "legacy": "1"})
+        assert not labels_match(req, {"app": "y"})
+
+    def test_set_based(self):
+        req = parse_label_selector("kagenti.io/type in (agent,tool),env notin (prod)")
+        assert labels_match(req, {"kagenti.io/type": "tool", "env": "dev"})
+        assert not labels_match(req, {"kagenti.io/type": "skill"})
+        assert not labels_match(req, {"kagenti.io/type": "agent", "env": "prod"})
+
+    def test_unparsable_selector_returns_none(self):
+        assert parse_label_selector("a in b") is None
+
+
+# ---------------------------------------------------------------------------
+# ResourceInformer
+# ---------------------------------------------------------------------------
+
+
+class TestResourceInformer:
+    def test_not_fresh_before_sync(self):
+        informer = ResourceInformer("test", MagicMock())
+        assert informer.is_fresh() is False
+
+    def test_relist_populates_store(self):
+        informer = _synced_informer(_obj("a"), _obj("b"))
+        assert informer.is_fresh() is True
+        assert sorted(o["metadata"]["name"] for o in informer.items()) == ["a", "b"]
+
+    def test_staleness_bound(self):
+        informer = _synced_informer(_obj("a"), max_staleness=5)
+        informer._last_contact = time.monotonic() - 10
+        assert informer.is_fresh() is False
+
+    def test_relist_reports_removed_objects(self):
+        removed = []
+        items = [_obj("a"), _obj("b")]
+        informer = ResourceInformer(
+            "test", lambda **_: _list_result(*items), on_delete=removed.append
+        )
+        informer._relist()
+        items.pop()
+        informer._relist()
+        assert removed == ["b"]
+
+    def test_observe_and_discard(self):
+        informer = _synced_informer(_obj("a"))
+        informer.observe(_obj("b"))
+        assert informer.lookup("b") is not None
+        informer.discard("a")
+        assert informer.lookup("a") is None
+
+    def test_typed_models_are_converted(self):
+        model = MagicMock()
+        model.to_dict.return_value = _obj("typed")
+        result = MagicMock()
+        result.items = [model]
+        result.metadata.resource_version = "7"
+        informer = ResourceInformer("test", lambda **_: result)
+        assert informer._relist() == "7"
+        assert informer.lookup("typed") == _obj("typed")
+
+
+# ---------------------------------------------------------------------------
+# KubeCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cache():
+    """KubeCache whose informers never start threads."""
+    with patch.object(ResourceInformer, "start"):
+        kube_cache = KubeCache(MagicMock(), max_staleness=60)
+        kube_cache._namespaces._list_func = lambda **_: _list_result(_obj("team1"))
+        kube_cache._namespaces._relist()
+        yield kube_cache
+
+
+def _sync(kube_cache: KubeCache, kind: str, namespace: str, *items) -> None:
+    informer = kube_cache._informer(kind, namespace)
+    informer._list_func = lambda **_: _list_result(*items)
+    informer._relist()
+
+
+class TestKubeCache:
+    def test_enabled_namespaces(self, cache):
+        assert cache.enabled_namespaces() == ["team1"]
+
+    def test_cold_informer_reads_through(self, cache):
+        assert cache.list(KIND_DEPLOYMENTS, "team1") is None
+        assert cache.get(KIND_DEPLOYMENTS, "team1", "a") is None
+
+    def test_non_enabled_namespace_reads_through(self, cache):
+        assert cache.list(KIND_DEPLOYMENTS, "other") is None
+        assert ("deployments", "other") not in cache._informers
+
+    def test_list_filters_by_selector(self, cache):
+        _sync(
+            cache,
+            KIND_DEPLOYMENTS,
+            "team1",
+            _obj("agent", {"kagenti.io/type": "agent"}),
+            _obj("tool", {"kagenti.io/type": "tool"}),
+        )
+        result = cache.list(KIND_DEPLOYMENTS, "team1", "kagenti.io/type=agent")
+        assert [o["metadata"]["name"] for o in result] == ["agent"]
+
+    def test_list_returns_copies(self, cache):
+        _sync(cache, KIND_DEPLOYMENTS, "team1", _obj("a"))
+        cache.list(KIND_DEPLOYMENTS, "team1")[0]["metadata"]["name"] = "mutated"
+        assert cache.get(KIND_DEPLOYMENTS, "team1", "a")["metadata"]["name"] == "a"
+
+    def test_get_missing_raises_404(self, cache):
+        _sync(cache, KIND_DEPLOYMENTS, "team1", _obj("a"))
+        with pytest.raises(ApiException) as exc_info:
+            cache.get(KIND_DEPLOYMENTS, "team1", "missing")
+        assert exc_info.value.status == 404
+
+    def test_scoped_informer_requires_scope_in_selector(self, cache):
+        _sync(cache, KIND_SKILL_CONFIGMAPS, "team1", _obj("s", {"kagenti.io/type": "skill"}))
+        assert cache.list(KIND_SKILL_CONFIGMAPS, "team1", "kagenti.io/type=skill")
+        assert cache.list(KIND_SKILL_CONFIGMAPS, "team1", None) is None
+        assert cache.get(KIND_SKILL_CONFIGMAPS, "team1", "other") is None
+
+    def test_namespace_removal_stops_informers(self, cache):
+        _sync(cache, KIND_DEPLOYMENTS, "team1", _obj("a"))
+        informer = cache._informers[(KIND_DEPLOYMENTS, "team1")]
+        cache._namespaces._list_func = lambda **_: _list_result()
+        cache._namespaces._relist()
+        assert (KIND_DEPLOYMENTS, "team1") not in cache._informers
+        assert informer._stop.is_set()
+
+
+# ---------------------------------------------------------------------------
+# KubernetesService integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cached_kubernetes_service(cache):
+    with (
+        patch("app.services.kubernetes.kubernetes.config.load_incluster_config"),
+        patch("app.services.kubernetes.kubernetes.config.load_kube_config"),
+        patch("app.services.kubernetes.kubernetes.client.ApiClient"),
+    ):
+        from app.services.kubernetes import KubernetesService
+
+        service = KubernetesService()
+        service._apps_api = MagicMock()
+        service.cache = cache
+        return service
+
+
+class TestKubernetesServiceCache:
+    def test_list_deployments_served_from_cache(self, cached_kubernetes_service, cache):
+        _sync(cache, KIND_DEPLOYMENTS, "team1", _obj("a"))
+        result = cached_kubernetes_service.list_deployments("team1")
+        assert [o["metadata"]["name"] for o in result] == ["a"]
+        cached_kubernetes_service._apps_api.list_namespaced_deployment.assert_not_called()
+
+    def test_list_deployments_cold_reads_through(self, cached_kubernetes_service):
+        cached_kubernetes_service._apps_api.list_namespaced_deployment.return_value.items = []
+        assert cached_kubernetes_service.list_deployments("team1") == []
+        cached_kubernetes_service._apps_api.list_namespaced_deployment.assert_called_once()
+
+    def test_create_deployment_is_visible_immediately(self, cached_kubernetes_service, cache):
+        _sync(cache, KIND_DEPLOYMENTS, "team1")
+        created = MagicMock()
+        created.to_dict.return_value = _obj("new")
+        cached_kubernetes_service._apps_api.create_namespaced_deployment.return_value = created
+
+        cached_kubernetes_service.create_deployment("team1", {})
+
+        assert cached_kubernetes_service.get_deployment("team1", "new") == _obj("new")
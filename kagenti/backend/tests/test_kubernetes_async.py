@@ -0,0 +1,187 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the async Kubernetes facade and the metrics registry.
+
+Tests cover:
+- Proxying KubernetesService methods and helpers onto the executor
+- Per-call timeouts surfacing as ApiException(504)
+- Queue saturation surfacing as ApiException(503)
+- Queue depth bookkeeping, including cancelled queued calls
+- Caching workload generations
+- Prometheus text rendering of executor metrics
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import ApiException
+
+from app.core.config import settings
+from app.core.metrics import MetricsRegistry, registry
+from app.services.kubernetes_async import (
+    AsyncKubernetesService,
+    KubeExecutor,
+    as_async,
+    get_kube_executor,
+    workload_generation,
+)
+
+
+@pytest.fixture
+def executor():
+    pool = KubeExecutor(max_workers=1, max_queue=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestAsyncKubernetesService:
+    async def test_proxies_public_methods(self, executor):
+        kube = MagicMock()
+        kube.list_deployments.return_value = [{"metadata": {"name": "a"}}]
+        akube = AsyncKubernetesService(kube, executor)
+
+        result = await akube.list_deployments("team1", label_selector="x=y")
+
+        assert result == [{"metadata": {"name": "a"}}]
+        kube.list_deployments.assert_called_once_with("team1", label_selector="x=y")
+
+    async def test_calls_run_off_the_event_loop(self, executor):
+        loop_thread = threading.get_ident()
+        kube = MagicMock()
+        kube.get_service.side_effect = lambda **_: threading.get_ident()
+
+        worker_thread = await AsyncKubernetesService(kube, executor).get_service(
+            namespace="ns", name="svc"
+        )
+
+        assert worker_thread != loop_thread
+
+    async def test_unknown_attribute_raises(self, executor):
+        akube = AsyncKubernetesService(MagicMock(), executor)
+        with pytest.raises(AttributeError, match="sync.core_api"):
+            _ = akube.core_api
+
+    async def test_run_passes_helper_arguments(self, executor):
+        kube = MagicMock()
+        akube = AsyncKubernetesService(kube, executor)
+
+        def helper(k, name, *, namespace):
+            return (k, name, namespace)
+
+        assert await akube.run(helper, akube.sync, "n", namespace="ns") == (kube, "n", "ns")
+
+    async def test_api_exceptions_propagate(self, executor):
+        kube = MagicMock()
+        kube.get_deployment.side_effect = ApiException(status=404, reason="Not Found")
+
+        with pytest.raises(ApiException) as exc_info:
+            await AsyncKubernetesService(kube, executor).get_deployment(namespace="n", name="x")
+        assert exc_info.value.status == 404
+
+    async def test_timeout_raises_504(self, executor):
+        release = threading.Event()
+        kube = MagicMock()
+        kube.list_namespaces.side_effect = lambda: release.wait(5)
+
+        try:
+            with pytest.raises(ApiException) as exc_info:
+                await AsyncKubernetesService(kube, executor, timeout=0.05).list_namespaces()
+            assert exc_info.value.status == 504
+        finally:
+            release.set()
+
+    async def test_saturated_queue_raises_503(self, executor):
+        release = threading.Event()
+        akube = AsyncKubernetesService(MagicMock(), executor, timeout=5)
+
+        # One call occupies the single worker, two more fill the queue
+        pending = [asyncio.ensure_future(akube.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        try:
+            with pytest.raises(ApiException) as exc_info:
+                await akube.run(release.wait, 5)
+            assert exc_info.value.status == 503
+        finally:
+            release.set()
+            await asyncio.gather(*pending)
+
+    async def test_cancelled_queued_call_releases_slot(self, executor):
+        release = threading.Event()
+        akube = AsyncKubernetesService(MagicMock(), executor, timeout=5)
+        blocker = asyncio.ensure_future(akube.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ApiException):
+            await akube.with_timeout(0.05).run(release.wait, 5)
+        await asyncio.sleep(0)
+
+        assert executor.queued == 0
+        assert executor.active == 1
+        release.set()
+        await blocker
+        assert executor.active == 0
+
+    async def test_workload_generation_is_cached(self, executor):
+        kube = MagicMock()
+        kube.get_deployment.return_value = {"metadata": {"uid": "u", "generation": 1}}
+        kube.get_statefulset.side_effect = ApiException(status=404, reason="Not Found")
+        akube = AsyncKubernetesService(kube, executor)
+
+        assert await workload_generation(akube, "team1", "a") == "deployment:u:1"
+        kube.get_deployment.return_value = {"metadata": {"uid": "u", "generation": 2}}
+        assert await workload_generation(akube, "team1", "a") == "deployment:u:1"
+        assert kube.get_deployment.call_count == 1
+
+        with patch.object(settings, "workload_generation_ttl", 0):
+            assert await workload_generation(akube, "team1", "a") == "deployment:u:2"
+
+    async def test_failed_generation_read_is_not_cached(self, executor):
+        kube = MagicMock()
+        kube.get_deployment.side_effect = ApiException(status=500, reason="Error")
+        kube.get_statefulset.side_effect = ApiException(status=404, reason="Not Found")
+        akube = AsyncKubernetesService(kube, executor)
+
+        assert await workload_generation(akube, "team1", "a") is None
+        assert await workload_generation(akube, "team1", "a") is None
+        assert kube.get_deployment.call_count == 2
+
+    def test_as_async_is_idempotent(self, executor):
+        akube = AsyncKubernetesService(MagicMock(), executor)
+        assert as_async(akube) is akube
+        assert isinstance(as_async(MagicMock()), AsyncKubernetesService)
+
+
+class TestMetrics:
+    def test_counter_and_gauge_render(self):
+        metrics = MetricsRegistry()
+        calls = metrics.counter("calls_total", "Calls", ("method",))
+        depth = metrics.gauge("depth", "Depth")
+        calls.inc(method="list")
+        calls.inc(2, method="list")
+        depth.set_function(lambda: 7)
+
+        text = metrics.render()
+
+        assert '# TYPE calls_total counter\ncalls_total{method="list"} 3.0' in text
+        assert "depth 7.0" in text
+
+    def test_label_values_are_escaped(self):
+        metrics = MetricsRegistry()
+        metrics.counter("c", "C", ("v",)).inc(v='a"b')
+        assert 'c{v="a\\"b"} 1.0' in metrics.render()
+
+    def test_reregistration_returns_same_metric(self):
+        metrics = MetricsRegistry()
+        assert metrics.gauge("g", "G") is metrics.gauge("g", "G")
+        with pytest.raises(ValueError):
+            metrics.counter("g", "G")
+
+    def test_executor_gauges_exposed(self):
+        get_kube_executor()
+        text = registry.render()
+        assert "kagenti_kube_executor_queued " in text
+        assert "kagenti_kube_executor_active " in text
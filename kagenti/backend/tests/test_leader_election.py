@@ -0,0 +1,178 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for Lease-based leader election of the reconciliation loop.
+
+Tests cover:
+- Creating the Lease when none exists, and renewing a held Lease
+- Followers waiting out a live lease, and taking over an expired one
+- Losing a write race (409) without claiming leadership
+- Releasing the Lease on shutdown
+- run() transitions and the role reported by reconciliation_status()
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import kubernetes.client
+import pytest
+from kubernetes.client import ApiException
+
+from app.services.leader_election import LeaderElector
+
+
+class FakeLeaseApi:
+    """In-memory stand-in for CoordinationV1Api with resourceVersion checks."""
+
+    def __init__(self):
+        self.lease = None
+        self.version = 0
+
+    def read_namespaced_lease(self, name, namespace):
+        if self.lease is None:
+            raise ApiException(status=404, reason="Not Found")
+        lease = kubernetes.client.V1Lease(
+            metadata=kubernetes.client.V1ObjectMeta(
+                name=name, namespace=namespace, resource_version=str(self.version)
+            ),
+            spec=kubernetes.client.V1LeaseSpec(**self.lease.spec.to_dict()),
+        )
+        return lease
+
+    def create_namespaced_lease(self, namespace, body):
+        if self.lease is not None:
+            raise ApiException(status=409, reason="AlreadyExists")
+        self.lease = body
+        self.version += 1
+
+    def replace_namespaced_lease(self, name, namespace, body):
+        if body.metadata.resource_version != str(self.version):
+            raise ApiException(status=409, reason="Conflict")
+        self.lease = body
+        self.version += 1
+
+
+@pytest.fixture
+def lease_api():
+    return FakeLeaseApi()
+
+
+def _elector(lease_api, identity, **kwargs):
+    kube = MagicMock()
+    kube.coordination_api = lease_api
+    kwargs.setdefault("retry_period", 0.01)
+    return LeaderElector(kube, "reconciler", "kagenti-system", identity, **kwargs)
+
+
+class TestTryAcquireOrRenew:
+    def test_creates_missing_lease(self, lease_api):
+        elector = _elector(lease_api, "a")
+
+        assert elector.try_acquire_or_renew() is True
+        assert lease_api.lease.spec.holder_identity == "a"
+        assert lease_api.lease.spec.lease_transitions == 0
+
+    def test_renews_own_lease(self, lease_api):
+        elector = _elector(lease_api, "a")
+        elector.try_acquire_or_renew()
+        acquired = lease_api.lease.spec.acquire_time
+
+        assert elector.try_acquire_or_renew() is True
+        assert lease_api.lease.spec.acquire_time == acquired
+        assert lease_api.version == 2
+
+    def test_follower_waits_for_expiry_then_takes_over(self, lease_api):
+        _elector(lease_api, "a").try_acquire_or_renew()
+        follower = _elector(lease_api, "b")
+
+        with patch("app.services.leader_election.time.monotonic", return_value=100.0):
+            assert follower.try_acquire_or_renew() is False
+        assert follower.holder == "a"
+
+        with patch("app.services.leader_election.time.monotonic", return_value=116.0):
+            assert follower.try_acquire_or_renew() is True
+        assert lease_api.lease.spec.holder_identity == "b"
+        assert lease_api.lease.spec.lease_transitions == 1
+
+    def test_renewed_lease_resets_follower_clock(self, lease_api):
+        leader = _elector(lease_api, "a")
+        leader.try_acquire_or_renew()
+        follower = _elector(lease_api, "b")
+
+        with patch("app.services.leader_election.time.monotonic", return_value=100.0):
+            follower.try_acquire_or_renew()
+        leader.try_acquire_or_renew()
+        with patch("app.services.leader_election.time.monotonic", return_value=110.0):
+            assert follower.try_acquire_or_renew() is False
+        with patch("app.services.leader_election.time.monotonic", return_value=120.0):
+            assert follower.try_acquire_or_renew() is False
+
+    def test_lost_write_race_is_not_leadership(self, lease_api):
+        _elector(lease_api, "a").try_acquire_or_renew()
+        lease_api.lease.spec.holder_identity = None
+        original_replace = lease_api.replace_namespaced_lease
+
+        def racing_replace(name, namespace, body):
+            lease_api.version += 1  # another replica wrote first
+            return original_replace(name, namespace, body)
+
+        lease_api.replace_namespaced_lease = racing_replace
+
+        assert _elector(lease_api, "b").try_acquire_or_renew() is False
+
+    def test_release_clears_holder(self, lease_api):
+        elector = _elector(lease_api, "a")
+        elector.try_acquire_or_renew()
+
+        elector.release()
+
+        assert lease_api.lease.spec.holder_identity is None
+        assert _elector(lease_api, "b").try_acquire_or_renew() is True
+
+    def test_duration_must_exceed_renew_deadline(self, lease_api):
+        with pytest.raises(ValueError):
+            _elector(lease_api, "a", lease_duration=5, renew_deadline=10)
+
+
+class TestRun:
+    async def test_acquires_and_releases_on_cancel(self, lease_api):
+        elector = _elector(lease_api, "a")
+        task = asyncio.create_task(elector.run())
+
+        await asyncio.wait_for(elector.wait_for_leadership(), timeout=2)
+        assert elector.status()["role"] == "leader"
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert elector.role == "standby"
+        assert lease_api.lease.spec.holder_identity is None
+
+    async def test_steps_down_when_another_replica_holds_the_lease(self, lease_api):
+        elector = _elector(lease_api, "a")
+        task = asyncio.create_task(elector.run())
+        try:
+            await asyncio.wait_for(elector.wait_for_leadership(), timeout=2)
+            lease_api.lease.spec.holder_identity = "b"
+            lease_api.version += 1
+
+            await asyncio.wait_for(elector.wait_for_loss(), timeout=2)
+            assert elector.holder == "b"
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class TestReconciliationStatus:
+    def test_roles(self, lease_api):
+        from app.services import reconciliation
+
+        with patch.object(reconciliation, "settings") as mock_settings:
+            mock_settings.enable_build_reconciliation = False
+            assert reconciliation.reconciliation_status() == {"role": "disabled"}
+
+            mock_settings.enable_build_reconciliation = True
+            assert reconciliation.reconciliation_status() == {"role": "active"}
+
+            with patch.object(reconciliation, "_elector", _elector(lease_api, "a")):
+                assert reconciliation.reconciliation_status()["role"] == "standby"
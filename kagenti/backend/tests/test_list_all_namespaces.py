@@ -0,0 +1,214 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Tests for allNamespaces mode of GET /api/v1/agents and GET /api/v1/tools.
+
+Tests cover:
+- One cluster-scoped list call per kind, filtered to enabled namespaces
+- Results grouped (sorted) by namespace
+- limit/continue pagination across kinds
+- Name clashes between kinds resolved within a page only
+- Malformed and expired continue tokens
+- Failed kinds: reported, retried on the next page, and a 5xx when all fail
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kubernetes.client import ApiException
+
+from app.routers import agents, tools
+from app.services.kubernetes import get_kubernetes_service
+from app.services.kubernetes_async import _decode_cursors, _encode_cursors
+
+
+def _workload(name: str, namespace: str, rtype: str = "agent") -> dict:
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": {"kagenti.io/type": rtype},
+        },
+        "spec": {},
+        "status": {},
+    }
+
+
+@pytest.fixture
+def kube():
+    mock = MagicMock()
+    mock.list_enabled_namespaces.return_value = ["team1", "team2"]
+    mock.list_deployments_all_namespaces.return_value = ([], None)
+    mock.list_statefulsets_all_namespaces.return_value = ([], None)
+    mock.list_jobs_all_namespaces.return_value = ([], None)
+    return mock
+
+
+@pytest.fixture
+def client(kube):
+    app = FastAPI()
+    app.include_router(agents.router, prefix="/api/v1")
+    app.include_router(tools.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: kube
+    with patch("app.core.auth.settings") as mock_auth:
+        mock_auth.enable_auth = False
+        yield TestClient(app)
+
+
+class TestContinueTokens:
+    def test_round_trip(self):
+        cursors = {"deployment": "abc", "job": "x/y=="}
+        assert _decode_cursors(_encode_cursors(cursors)) == cursors
+
+    @pytest.mark.parametrize("token", ["not-base64!", "bnVsbA", "WzFd"])
+    def test_malformed(self, token):
+        with pytest.raises(ValueError):
+            _decode_cursors(token)
+
+
+class TestListAgentsAllNamespaces:
+    def test_groups_by_namespace_and_filters_disabled(self, client, kube):
+        kube.list_deployments_all_namespaces.return_value = (
+            [_workload("b", "team2"), _workload("a", "team1"), _workload("x", "kube-system")],
+            None,
+        )
+        kube.list_jobs_all_namespaces.return_value = ([_workload("c", "team1")], None)
+
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true"})
+
+        assert r.status_code == 200
+        body = r.json()
+        assert [(i["namespace"], i["name"]) for i in body["items"]] == [
+            ("team1", "a"),
+            ("team1", "c"),
+            ("team2", "b"),
+        ]
+        assert body["continueToken"] is None
+        kube.list_deployments_all_namespaces.assert_called_once()
+        kube.list_deployments.assert_not_called()
+
+    def test_same_name_in_different_namespaces_is_kept(self, client, kube):
+        kube.list_deployments_all_namespaces.return_value = ([_workload("a", "team1")], None)
+        kube.list_statefulsets_all_namespaces.return_value = ([_workload("a", "team2")], None)
+
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true"})
+
+        assert len(r.json()["items"]) == 2
+
+    def test_pagination_splits_limit_and_resumes_unfinished_kinds(self, client, kube):
+        kube.list_deployments_all_namespaces.return_value = ([_workload("a", "team1")], "dep-2")
+
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true", "limit": 30})
+
+        token = r.json()["continueToken"]
+        assert _decode_cursors(token) == {"deployment": "dep-2"}
+        call = kube.list_deployments_all_namespaces.call_args.kwargs
+        assert call["limit"] == 10
+        assert call["continue_token"] is None
+
+        kube.list_deployments_all_namespaces.return_value = ([_workload("b", "team1")], None)
+        kube.list_statefulsets_all_namespaces.reset_mock()
+        r = client.get(
+            "/api/v1/agents", params={"allNamespaces": "true", "limit": 30, "continue": token}
+        )
+
+        assert [i["name"] for i in r.json()["items"]] == ["b"]
+        assert r.json()["continueToken"] is None
+        call = kube.list_deployments_all_namespaces.call_args.kwargs
+        assert call == {
+            "label_selector": "kagenti.io/type=agent",
+            "limit": 30,
+            "continue_token": "dep-2",
+        }
+        kube.list_statefulsets_all_namespaces.assert_not_called()
+
+    def test_name_clashes_are_resolved_within_a_page_only(self, client, kube):
+        kube.list_deployments_all_namespaces.return_value = ([_workload("a", "team1")], "dep-2")
+        kube.list_statefulsets_all_namespaces.side_effect = [
+            ([], "sts-2"),
+            ([_workload("a", "team1")], None),
+        ]
+        kube.list_jobs_all_namespaces.return_value = ([_workload("a", "team1")], None)
+
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true"})
+
+        # The Job clashes with the Deployment on the same page and is dropped
+        assert [(i["name"], i["workloadType"]) for i in r.json()["items"]] == [("a", "deployment")]
+
+        kube.list_deployments_all_namespaces.return_value = ([], None)
+        r = client.get(
+            "/api/v1/agents",
+            params={"allNamespaces": "true", "continue": r.json()["continueToken"]},
+        )
+
+        # The StatefulSet's clash is with an item of the previous page
+        assert [(i["name"], i["workloadType"]) for i in r.json()["items"]] == [("a", "statefulset")]
+        assert r.json()["continueToken"] is None
+
+    def test_malformed_token_is_400(self, client):
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true", "continue": "%%%"})
+        assert r.status_code == 400
+
+    def test_expired_token_is_410(self, client, kube):
+        kube.list_deployments_all_namespaces.side_effect = ApiException(status=410, reason="Gone")
+        token = _encode_cursors({"deployment": "old"})
+
+        r = client.get("/api/v1/agents", params={"allNamespaces": "true", "continue": token})
+
+        assert r.status_code == 410
+
+
+class TestListToolsAllNamespaces:
+    def test_lists_both_kinds_cluster_wide(self, client, kube):
+        kube.list_deployments_all_namespaces.return_value = (
+            [_workload("t2", "team2", "tool"), _workload("hidden", "other", "tool")],
+            None,
+        )
+        kube.list_statefulsets_all_namespaces.return_value = (
+            [_workload("t1", "team1", "tool")],
+            "sts-2",
+        )
+
+        r = client.get("/api/v1/tools", params={"allNamespaces": "true"})
+
+        assert r.status_code == 200
+        body = r.json()
+        assert [(i["namespace"], i["name"], i["workloadType"]) for i in body["items"]] == [
+            ("team1", "t1", "statefulset"),
+            ("team2", "t2", "deployment"),
+        ]
+        assert _decode_cursors(body["continueToken"]) == {"statefulset": "sts-2"}
+
+    def test_failed_kind_is_reported(self, client, kube):
+        kube.list_statefulsets_all_namespaces.side_effect = ApiException(status=500)
+
+        r = client.get("/api/v1/tools", params={"allNamespaces": "true"})
+
+        assert r.status_code == 200
+        assert r.json()["failedKinds"] == ["statefulset"]
+        # The failed kind is retried from where it was on the next page
+        assert _decode_cursors(r.json()["continueToken"]) == {"statefulset": ""}
+
+    def test_failed_kind_keeps_its_cursor(self, client, kube):
+        kube.list_deployments_all_namespaces.side_effect = ApiException(status=504)
+        kube.list_statefulsets_all_namespaces.return_value = (
+            [_workload("t1", "team1", "tool")],
+            None,
+        )
+        token = _encode_cursors({"deployment": "dep-2", "statefulset": "sts-2"})
+
+        r = client.get("/api/v1/tools", params={"allNamespaces": "true", "continue": token})
+
+        assert r.json()["failedKinds"] == ["deployment"]
+        assert _decode_cursors(r.json()["continueToken"]) == {"deployment": "dep-2"}
+
+    def test_every_kind_failing_is_an_error(self, client, kube):
+        kube.list_deployments_all_namespaces.side_effect = ApiException(status=500)
+        kube.list_statefulsets_all_namespaces.side_effect = ApiException(status=500)
+
+        r = client.get("/api/v1/tools", params={"allNamespaces": "true"})
+
+        assert r.status_code == 500
@@ -0,0 +1,244 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the pooled MCP session manager.
+
+Tests cover:
+- Reusing one initialized session per (namespace, tool)
+- Health-check pings before reusing an idle session, and reconnecting
+- Discarding a session after a transport error or a "Session terminated"
+  McpError, keeping it after a tool's JSON-RPC error
+- Keeping a broken session open until its other borrowers return it
+- Idle eviction, LRU eviction and exhaustion at MCP_SESSION_MAX
+- Replacing a session when the tool endpoint changes
+- invoke_tool reusing the pooled session across requests
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from app.services.kubernetes import get_kubernetes_service
+from app.services.mcp_sessions import McpPoolExhaustedError, McpSessionPool
+
+
+def _pool(**kwargs):
+    kwargs.setdefault("max_sessions", 4)
+    kwargs.setdefault("idle_timeout", 300)
+    kwargs.setdefault("health_check_interval", 30)
+    kwargs.setdefault("connect_timeout", 1)
+    kwargs.setdefault("enabled", True)
+    return McpSessionPool(**kwargs)
+
+
+ENDPOINT = "http://weather-mcp.team1.svc.cluster.local:8000/mcp"
+
+
+class TestMcpSessionPool:
+    async def test_reuses_initialized_session(self, mcp_server):
+        pool = _pool()
+
+        for _ in range(3):
+            async with pool.session("team1", "weather", ENDPOINT) as session:
+                await session.call_tool("get_weather", {})
+
+        assert len(mcp_server.sessions) == 1
+        assert mcp_server.sessions[0].initialized == 1
+        assert mcp_server.sessions[0].calls == 3
+        await pool.aclose()
+        assert mcp_server.closed == [ENDPOINT]
+
+    async def test_separate_sessions_per_tool(self, mcp_server):
+        pool = _pool()
+
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+        async with pool.session("team2", "weather", ENDPOINT):
+            pass
+
+        assert len(pool) == 2
+        await pool.aclose()
+
+    async def test_failed_ping_reconnects(self, mcp_server):
+        pool = _pool(health_check_interval=0)
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+
+        mcp_server.ping_ok = False
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+
+        assert len(mcp_server.sessions) == 2
+        assert mcp_server.closed == [ENDPOINT]
+        await pool.aclose()
+
+    async def test_transport_error_discards_session(self, mcp_server):
+        pool = _pool()
+
+        with pytest.raises(httpx.ReadError):
+            async with pool.session("team1", "weather", ENDPOINT):
+                raise httpx.ReadError("reset")
+        assert len(pool) == 0
+
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+        assert len(mcp_server.sessions) == 2
+        await pool.aclose()
+
+    async def test_mcp_error_keeps_session(self, mcp_server):
+        pool = _pool()
+
+        with pytest.raises(McpError):
+            async with pool.session("team1", "weather", ENDPOINT):
+                raise McpError(ErrorData(code=-32602, message="bad arguments"))
+
+        assert len(pool) == 1
+        await pool.aclose()
+
+    async def test_session_terminated_discards_session(self, mcp_server):
+        pool = _pool()
+
+        with pytest.raises(McpError):
+            async with pool.session("team1", "weather", ENDPOINT):
+                raise McpError(ErrorData(code=32600, message="Session terminated"))
+        assert len(pool) == 0
+        assert mcp_server.closed == [ENDPOINT]
+
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+        assert len(mcp_server.sessions) == 2
+        await pool.aclose()
+
+    async def test_failed_borrower_does_not_close_shared_session(self, mcp_server):
+        pool = _pool()
+        other_done = asyncio.Event()
+
+        async def other_borrower():
+            async with pool.session("team1", "weather", ENDPOINT) as session:
+                await other_done.wait()
+                await session.call_tool("get_weather", {})
+
+        other = asyncio.create_task(other_borrower())
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.CancelledError):
+            async with pool.session("team1", "weather", ENDPOINT):
+                raise asyncio.CancelledError()
+
+        # No new borrower gets the broken session, but it stays open for "other"
+        assert len(pool) == 0
+        assert mcp_server.closed == []
+        other_done.set()
+        await other
+        assert mcp_server.closed == [ENDPOINT]
+        assert mcp_server.sessions[0].calls == 1
+
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+        assert len(mcp_server.sessions) == 2
+        await pool.aclose()
+
+    async def test_connect_error_propagates(self, mcp_server):
+        mcp_server.fail_connect = True
+        pool = _pool()
+
+        with pytest.raises(httpx.ConnectError):
+            async with pool.session("team1", "weather", ENDPOINT):
+                pass
+        assert len(pool) == 0
+        await pool.aclose()
+
+    async def test_endpoint_change_replaces_session(self, mcp_server):
+        pool = _pool()
+        other = ENDPOINT.replace("8000", "9000")
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+
+        async with pool.session("team1", "weather", other) as session:
+            assert session.endpoint == other
+
+        assert mcp_server.closed == [ENDPOINT]
+        await pool.aclose()
+
+    async def test_evicts_idle_sessions(self, mcp_server):
+        pool = _pool(idle_timeout=0)
+        async with pool.session("team1", "weather", ENDPOINT):
+            pass
+
+        assert await pool.evict_idle() == 1
+        assert len(pool) == 0
+        assert mcp_server.closed == [ENDPOINT]
+
+    async def test_max_sessions_evicts_lru_or_raises(self, mcp_server):
+        pool = _pool(max_sessions=2)
+        async with pool.session("team1", "a", ENDPOINT):
+            pass
+        async with pool.session("team1", "b", ENDPOINT):
+            async with pool.session("team1", "c", ENDPOINT):
+                # "a" was idle and least recently used
+                assert set(pool._sessions) == {("team1", "b"), ("team1", "c")}
+                with pytest.raises(McpPoolExhaustedError):
+                    async with pool.session("team1", "d", ENDPOINT):
+                        pass
+        await pool.aclose()
+
+    async def test_concurrent_callers_share_one_session(self, mcp_server):
+        pool = _pool()
+
+        async def call():
+            async with pool.session("team1", "weather", ENDPOINT) as session:
+                await asyncio.sleep(0)
+                return session
+
+        sessions = await asyncio.gather(*(call() for _ in range(5)))
+
+        assert len(mcp_server.sessions) == 1
+        assert all(s is sessions[0] for s in sessions)
+        await pool.aclose()
+
+    async def test_disabled_pool_uses_one_shot_sessions(self, mcp_server):
+        pool = _pool(enabled=False)
+
+        for _ in range(2):
+            async with pool.session("team1", "weather", ENDPOINT):
+                pass
+
+        assert len(mcp_server.sessions) == 2
+        assert mcp_server.closed == [ENDPOINT, ENDPOINT]
+        assert len(pool) == 0
+
+
+class TestInvokeUsesPool:
+    def test_invoke_reuses_session(self, mcp_server):
+        from app.routers import tools
+
+        app = FastAPI()
+        app.include_router(tools.router, prefix="/api/v1")
+        app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+        pool = _pool()
+
+        with (
+            patch("app.core.auth.settings") as mock_auth,
+            patch.object(tools, "_get_tool_url", return_value="http://weather-mcp:8000"),
+            patch.object(tools, "get_mcp_session_pool", return_value=pool),
+        ):
+            mock_auth.enable_auth = False
+            # One portal (event loop) for both requests, like the real server
+            with TestClient(app) as client:
+                for _ in range(2):
+                    r = client.post(
+                        "/api/v1/tools/team1/weather/invoke",
+                        json={"tool_name": "get_weather", "arguments": {"city": "Paris"}},
+                    )
+                    assert r.status_code == 200
+                    assert r.json()["result"]["content"][0]["text"] == "get_weather:ok"
+                client.portal.call(pool.aclose)
+
+        assert len(mcp_server.sessions) == 1
+        assert mcp_server.sessions[0].calls == 2
@@ -11,8 +11,13 @@ Tests cover:
 - _reconcile_single_build() calling the correct finalize function
 - Error handling: HTTPException(409/400) suppressed, others re-raised
 - reconcile_builds() continues after per-build failures
+- WorkQueue deduplication, re-add while processing, and backoff
+- BuildReconciler enqueuing builds from BuildRun watch events
+- BuildReconciler workers retrying failed builds
+- The loop exiting quietly when no Kubernetes config can be loaded
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -427,3 +432,170 @@ class TestReconcileBuilds:
             await reconcile_builds()
 
         mock_reconcile.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# WorkQueue
+# ---------------------------------------------------------------------------
+
+
+class TestWorkQueue:
+    """Tests for the deduplicating work queue."""
+
+    async def test_duplicate_adds_are_collapsed(self):
+        from app.services.reconciliation import WorkQueue
+
+        queue = WorkQueue()
+        queue.add("a")
+        queue.add("a")
+        queue.add("b")
+
+        assert len(queue) == 2
+        assert await queue.get() == "a"
+        assert await queue.get() == "b"
+
+    async def test_add_while_processing_requeues_after_done(self):
+        from app.services.reconciliation import WorkQueue
+
+        queue = WorkQueue()
+        queue.add("a")
+        key = await queue.get()
+        queue.add("a")
+
+        assert len(queue) == 0
+        queue.done(key)
+        assert len(queue) == 1
+
+    async def test_backoff_doubles_and_is_capped(self):
+        from app.services.reconciliation import WorkQueue
+
+        queue = WorkQueue(base_delay=1.0, max_delay=3.0)
+        delays = []
+        for _ in range(4):
+            delays.append(queue.add_rate_limited("a"))
+            queue.shutdown()
+        queue.forget("a")
+
+        assert delays == [1.0, 2.0, 3.0, 3.0]
+        assert queue.add_rate_limited("a") == 1.0
+        queue.shutdown()
+
+    async def test_add_after_fires(self):
+        from app.services.reconciliation import WorkQueue
+
+        queue = WorkQueue()
+        queue.add_after("a", 0.01)
+        assert len(queue) == 0
+
+        assert await asyncio.wait_for(queue.get(), timeout=1) == "a"
+
+
+# ---------------------------------------------------------------------------
+# BuildReconciler
+# ---------------------------------------------------------------------------
+
+
+def _watched_buildrun(build_name: str, resource_type: str = RESOURCE_TYPE_AGENT, **kw) -> dict:
+    run = kw.get("run") or _make_succeeded_buildrun(build_name)
+    run["metadata"]["namespace"] = "team1"
+    run["metadata"]["labels"] = {
+        "kagenti.io/build-name": build_name,
+        KAGENTI_TYPE_LABEL: resource_type,
+    }
+    return run
+
+
+class TestBuildReconciler:
+    """Tests for the watch-driven reconciler."""
+
+    async def test_succeeded_buildrun_enqueues_build_once(self, mock_kube):
+        from app.services.reconciliation import BuildReconciler
+
+        reconciler = BuildReconciler(mock_kube, workers=1, resync_interval=600, watch=True)
+        reconciler._loop = asyncio.get_running_loop()
+
+        run = _watched_buildrun("my-agent")
+        reconciler._on_buildrun_update(run)
+        reconciler._on_buildrun_update(run)
+        await asyncio.sleep(0)
+
+        assert len(reconciler.queue) == 1
+        assert await reconciler.queue.get() == ("team1", "my-agent", RESOURCE_TYPE_AGENT)
+
+    async def test_running_or_unlabeled_buildruns_are_ignored(self, mock_kube):
+        from app.services.reconciliation import BuildReconciler
+
+        reconciler = BuildReconciler(mock_kube, workers=1, resync_interval=600, watch=True)
+        reconciler._loop = asyncio.get_running_loop()
+
+        reconciler._on_buildrun_update(_watched_buildrun("a", run=_make_running_buildrun("a")))
+        reconciler._on_buildrun_update(_watched_buildrun("b", resource_type="unknown"))
+        await asyncio.sleep(0)
+
+        assert len(reconciler.queue) == 0
+
+    async def test_resync_enqueues_builds(self, mock_kube):
+        from app.services.reconciliation import BuildReconciler
+
+        mock_kube.list_custom_resources.return_value = [
+            _make_build("a", RESOURCE_TYPE_AGENT),
+            _make_build("t", RESOURCE_TYPE_TOOL),
+        ]
+        reconciler = BuildReconciler(mock_kube, workers=1, resync_interval=600, watch=False)
+
+        assert await reconciler.resync() == 2
+        assert len(reconciler.queue) == 2
+
+    async def test_process_skips_disabled_namespace(self, mock_kube):
+        from app.services.reconciliation import BuildReconciler
+
+        reconciler = BuildReconciler(mock_kube, workers=1, resync_interval=600, watch=False)
+        with patch(
+            "app.services.reconciliation._reconcile_single_build",
+            new_callable=AsyncMock,
+        ) as mock_reconcile:
+            await reconciler.process(("other", "a", RESOURCE_TYPE_AGENT))
+            await reconciler.process(("team1", "a", RESOURCE_TYPE_AGENT))
+
+        mock_reconcile.assert_awaited_once_with(mock_kube, "team1", "a", RESOURCE_TYPE_AGENT)
+
+    async def test_worker_retries_failed_build_with_backoff(self, mock_kube):
+        from app.services.reconciliation import BuildReconciler
+
+        reconciler = BuildReconciler(mock_kube, workers=1, resync_interval=600, watch=False)
+        reconciler.queue.base_delay = 0.01
+        key = ("team1", "a", RESOURCE_TYPE_AGENT)
+        reconciler.queue.add(key)
+
+        with patch(
+            "app.services.reconciliation._reconcile_single_build",
+            new_callable=AsyncMock,
+            side_effect=[RuntimeError("boom"), None],
+        ) as mock_reconcile:
+            worker = asyncio.create_task(reconciler._worker())
+            try:
+                for _ in range(100):
+                    if mock_reconcile.await_count == 2:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                worker.cancel()
+                reconciler.queue.shutdown()
+
+        assert mock_reconcile.await_count == 2
+        assert reconciler.queue._failures == {}
+
+    async def test_loop_exits_without_kubernetes_config(self):
+        from kubernetes.config import ConfigException
+
+        from app.services import reconciliation
+
+        with (
+            patch.object(
+                reconciliation, "get_kubernetes_service", side_effect=ConfigException("no config")
+            ),
+            patch.object(reconciliation, "BuildReconciler") as mock_reconciler,
+        ):
+            await reconciliation.run_reconciliation_loop()
+
+        mock_reconciler.assert_not_called()
@@ -29,6 +29,16 @@ def kubernetes_service():
         return service
 
 
+@pytest.fixture(autouse=True)
+def _clear_service_port_cache():
+    """Service ports are cached process-wide; start each test cold."""
+    from app.utils.routes import get_service_port_cache
+
+    get_service_port_cache().clear()
+    yield
+    get_service_port_cache().clear()
+
+
 class TestResolveAgentUrl:
     """Test cases for resolve_agent_url()."""
 
@@ -105,6 +115,72 @@ class TestResolveAgentUrl:
         assert url == "http://my-agent.team1.localtest.me:9090"
 
 
+class TestServicePortCache:
+    """Test cases for the shared Service port cache."""
+
+    @patch("app.utils.routes.settings")
+    def test_repeat_lookups_skip_the_api(self, mock_settings, kubernetes_service):
+        """A resolved port is served from cache on later calls."""
+        mock_settings.is_running_in_cluster = True
+        mock_result = MagicMock()
+        mock_result.to_dict.return_value = {"spec": {"ports": [{"port": 8082}]}}
+        kubernetes_service._core_api.read_namespaced_service.return_value = mock_result
+
+        from app.utils.routes import resolve_agent_url
+
+        for _ in range(3):
+            url = resolve_agent_url("my-agent", "team1", kubernetes_service)
+        assert url == "http://my-agent.team1.svc.cluster.local:8082"
+        assert kubernetes_service._core_api.read_namespaced_service.call_count == 1
+
+    def test_failed_lookups_are_not_cached(self, kubernetes_service):
+        """A missing Service is looked up again next time."""
+        kubernetes_service._core_api.read_namespaced_service.side_effect = ApiException(
+            status=404, reason="Not Found"
+        )
+
+        from app.utils.routes import lookup_service_port
+
+        lookup_service_port("my-agent", "team1", kubernetes_service, 8080)
+        lookup_service_port("my-agent", "team1", kubernetes_service, 8080)
+        assert kubernetes_service._core_api.read_namespaced_service.call_count == 2
+
+    def test_expiry_and_invalidation(self):
+        """Entries expire after the TTL and can be dropped by watch events."""
+        from app.utils.routes import ServicePortCache
+
+        cache = ServicePortCache(ttl=30)
+        with patch("app.utils.routes.time.monotonic", return_value=100.0):
+            cache.put("team1", "a", 8080)
+            cache.put("team1", "b", 9090)
+        with patch("app.utils.routes.time.monotonic", return_value=129.0):
+            assert cache.get("team1", "a") == 8080
+        with patch("app.utils.routes.time.monotonic", return_value=131.0):
+            assert cache.get("team1", "a") is None
+
+        cache._invalidate_key("team1/b")
+        assert cache.get("team1", "b") is None
+
+    def test_watch_is_limited_to_agent_and_tool_services(self, kubernetes_service):
+        """The Service watch selects agent and tool Services only."""
+        from app.utils.routes import ServicePortCache
+
+        cache = ServicePortCache(ttl=30)
+        with patch("app.utils.routes.ResourceInformer") as informer:
+            cache.start_watch(kubernetes_service)
+
+        assert informer.call_args.kwargs["label_selector"] == "kagenti.io/type in (agent,tool)"
+        informer.return_value.start.assert_called_once()
+
+    def test_zero_ttl_disables_caching(self):
+        """TTL 0 turns the cache off."""
+        from app.utils.routes import ServicePortCache
+
+        cache = ServicePortCache(ttl=0)
+        cache.put("team1", "a", 8080)
+        assert cache.get("team1", "a") is None
+
+
 class TestSelectRoutePort:
     """Test cases for select_route_port()."""
 
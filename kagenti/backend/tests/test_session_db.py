@@ -0,0 +1,318 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the per-namespace session DB pool manager.
+
+asyncpg pools are replaced by in-memory fakes and secret discovery by a
+dict of DSNs.
+
+Tests cover:
+- The global connection budget, LRU eviction of idle pools and busy pools
+- Per-namespace pool size overrides
+- Closing idle pools
+- Cached DSNs and replacing a pool when its Secret changes
+- Connection accounting in acquire(), counting waiters
+- Single-flight pool creation and running the schema migrations once
+- Concurrent index builds outside transactions; releasing the migration lock on failure
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from app.services import session_db
+from app.services.session_db import SessionPoolBudgetError, SessionPoolManager
+
+
+class FakePool:
+    def __init__(self, dsn, min_size, max_size):
+        self.dsn = dsn
+        self.max_size = max_size
+        self._closed = False
+
+    async def acquire(self, **kwargs):
+        return object()
+
+    async def release(self, conn):
+        pass
+
+    async def close(self):
+        self._closed = True
+
+    def is_closing(self):
+        return self._closed
+
+
+@pytest.fixture
+def backend():
+    dsns = {}
+    reads = []
+    created = []
+    migrated = []
+
+    def dsn_for_namespace(namespace):
+        reads.append(namespace)
+        return dsns.get(namespace, f"postgresql://{namespace}")
+
+    async def create_pool(dsn, min_size=1, max_size=10):
+        await asyncio.sleep(0.01)
+        pool = FakePool(dsn, min_size, max_size)
+        created.append(pool)
+        return pool
+
+    async def migrate(pool):
+        migrated.append(pool.dsn)
+        return True
+
+    with (
+        patch.object(session_db, "_dsn_for_namespace", dsn_for_namespace),
+        patch.object(session_db, "_create_pool", create_pool),
+        patch.object(session_db, "_migrate_schema", migrate),
+    ):
+        yield dsns, reads, created, migrated
+
+
+class TestSessionPoolManager:
+    async def test_reuses_pool_and_caches_dsn(self, backend):
+        _, reads, created, _ = backend
+        manager = SessionPoolManager()
+
+        first = await manager.get("team1")
+        second = await manager.get("team1")
+
+        assert first is second
+        assert reads == ["team1"]
+        assert len(created) == 1
+
+    async def test_budget_evicts_least_recently_used_idle_pool(self, backend):
+        manager = SessionPoolManager(max_connections=20, max_size=10)
+        team1 = await manager.get("team1")
+        await manager.get("team2")
+        await manager.get("team1")  # team2 is now least recently used
+
+        await manager.get("team3")
+        await asyncio.sleep(0)
+
+        assert set(manager.pools()) == {"team1", "team3"}
+        assert manager.reserved == 20
+        assert team1.pool._closed is False
+
+    async def test_busy_pools_are_kept_and_budget_limits_new_pools(self, backend):
+        manager = SessionPoolManager(max_connections=15, max_size=10)
+        team1 = await manager.get("team1")
+
+        async with team1.acquire():
+            team2 = await manager.get("team2")
+            assert team2.max_size == 5
+            async with team2.acquire():
+                with pytest.raises(SessionPoolBudgetError):
+                    await manager.get("team3")
+
+        assert set(manager.pools()) == {"team1", "team2"}
+
+    async def test_size_overrides(self, backend):
+        manager = SessionPoolManager(max_size=10, size_overrides={"big": 40})
+
+        assert (await manager.get("big")).max_size == 40
+        assert (await manager.get("small")).max_size == 10
+
+    async def test_closes_idle_pools(self, backend):
+        manager = SessionPoolManager(idle_timeout=60)
+        team1 = await manager.get("team1")
+        team1.last_used -= 120
+
+        await manager.get("team2")
+        await asyncio.sleep(0)
+
+        assert set(manager.pools()) == {"team2"}
+        assert team1.pool._closed is True
+
+    async def test_replaces_pool_when_secret_changes(self, backend):
+        dsns, reads, _, _ = backend
+        manager = SessionPoolManager()
+        old = await manager.get("team1")
+
+        # Unchanged credentials keep the pool
+        manager.dsns.invalidate("team1")
+        assert await manager.get("team1") is old
+
+        dsns["team1"] = "postgresql://rotated"
+        manager.dsns.invalidate("team1")
+        new = await manager.get("team1")
+        await asyncio.sleep(0)
+
+        assert new is not old
+        assert new.dsn == "postgresql://rotated"
+        assert old.pool._closed is True
+        assert reads == ["team1", "team1", "team1"]
+
+    async def test_acquire_tracks_connections_in_use(self, backend):
+        manager = SessionPoolManager()
+        pool = await manager.get("team1")
+
+        async with pool.acquire():
+            assert pool.in_use == 1
+            assert session_db._pool_connections.value(namespace="team1", state="in_use") == 1
+
+        assert pool.in_use == 0
+
+    async def test_waiters_keep_the_pool(self, backend):
+        manager = SessionPoolManager(max_connections=10, max_size=10)
+        team1 = await manager.get("team1")
+        released = asyncio.Event()
+
+        async def acquire(**kwargs):
+            await released.wait()
+            return object()
+
+        team1.pool.acquire = acquire
+        waiter = asyncio.create_task(team1.acquire().__aenter__())
+        await asyncio.sleep(0)
+
+        assert team1.in_use == 1
+        with pytest.raises(SessionPoolBudgetError):
+            await manager.get("team2")
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert team1.in_use == 0
+
+    async def test_close_all(self, backend):
+        _, _, created, _ = backend
+        manager = SessionPoolManager()
+        await manager.get("team1")
+        await manager.get("team2")
+
+        await manager.close_all()
+
+        assert manager.pools() == {}
+        assert all(pool._closed for pool in created)
+
+    async def test_concurrent_callers_share_one_creation(self, backend):
+        _, reads, created, migrated = backend
+        manager = SessionPoolManager()
+
+        pools = await asyncio.gather(*(manager.get("team1") for _ in range(10)))
+
+        assert all(pool is pools[0] for pool in pools)
+        assert reads == ["team1"]
+        assert len(created) == 1
+        assert migrated == ["postgresql://team1"]
+
+    async def test_pools_being_opened_count_against_the_budget(self, backend):
+        manager = SessionPoolManager(max_connections=15, max_size=10)
+
+        team1, team2 = await asyncio.gather(manager.get("team1"), manager.get("team2"))
+
+        assert team1.max_size + team2.max_size == 15
+        assert manager.reserved == 15
+
+    async def test_cancelled_caller_does_not_abort_creation(self, backend):
+        _, _, created, _ = backend
+        manager = SessionPoolManager()
+
+        first = asyncio.create_task(manager.get("team1"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(manager.get("team1"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).pool is created[0]
+        assert len(created) == 1
+
+    async def test_migrates_each_database_once(self, backend):
+        _, _, _, migrated = backend
+        manager = SessionPoolManager(idle_timeout=60)
+        team1 = await manager.get("team1")
+        team1.last_used -= 120
+
+        await manager.get("team2")
+        await manager.get("team1")
+
+        assert migrated == ["postgresql://team1", "postgresql://team2"]
+
+
+class MigrationConn:
+    """Executes nothing; records migrations and the schema_migrations rows."""
+
+    def __init__(self, applied=()):
+        self.applied = set(applied)
+        self.statements = []
+        self.in_transaction = []
+        self._depth = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    async def execute(self, query, *args):
+        if query.startswith("INSERT INTO schema_migrations"):
+            self.applied.add(args[0])
+        else:
+            self.statements.append(query)
+            self.in_transaction.append(self._depth > 0)
+
+    async def fetch(self, query):
+        return [{"version": version} for version in self.applied]
+
+
+class TestMigrateSchema:
+    async def test_applies_pending_migrations_in_order(self):
+        conn = MigrationConn()
+
+        assert await session_db.migrate_schema(conn) == len(session_db.SCHEMA_MIGRATIONS)
+
+        expected = []
+        for migration in session_db.SCHEMA_MIGRATIONS:
+            if migration.transactional:
+                expected.append(migration.sql)
+            else:
+                expected.extend(session_db._statements(migration.sql))
+        assert conn.statements[0] == session_db._MIGRATIONS_LOCK
+        assert conn.statements[-1] == session_db._MIGRATIONS_UNLOCK
+        assert conn.statements[-len(expected) - 1 : -1] == expected
+        assert conn.applied == {m.version for m in session_db.SCHEMA_MIGRATIONS}
+
+    async def test_concurrent_index_builds_run_outside_transactions(self):
+        conn = MigrationConn()
+
+        await session_db.migrate_schema(conn)
+
+        outside = {q for q, in_tx in zip(conn.statements, conn.in_transaction) if not in_tx}
+        builds = session_db._statements(session_db.SESSIONS_LIST_INDEXES)
+        assert builds and all("CONCURRENTLY" in statement for statement in builds)
+        assert set(builds) <= outside
+        assert session_db.SESSIONS_UPDATED_AT_NOT_NULL not in outside
+
+    async def test_releases_lock_when_a_migration_fails(self):
+        conn = MigrationConn()
+        execute = conn.execute
+
+        async def failing(query, *args):
+            if query == session_db.SESSIONS_UPDATED_AT_CHECK:
+                raise RuntimeError("boom")
+            await execute(query, *args)
+
+        conn.execute = failing
+        with pytest.raises(RuntimeError):
+            await session_db.migrate_schema(conn)
+        assert conn.statements[-1] == session_db._MIGRATIONS_UNLOCK
+        assert 4 not in conn.applied
+
+    async def test_skips_applied_migrations(self):
+        conn = MigrationConn(applied={1, 2})
+
+        assert await session_db.migrate_schema(conn) == len(session_db.SCHEMA_MIGRATIONS) - 2
+        assert session_db.SESSIONS_SCHEMA not in conn.statements
+
+        conn.statements.clear()
+        assert await session_db.migrate_schema(conn) == 0
+        assert session_db.SCHEMA_MIGRATIONS[-1].sql not in conn.statements
@@ -0,0 +1,147 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the session list queries.
+
+Queries are checked for their shape (which filters, which branches) and the
+paging logic runs against a connection returning canned rows;
+benchmarks/session_list.py runs them against Postgres.
+
+Tests cover:
+- Keyset cursors
+- Filters and the own/shared branches for non-admins
+- Escaping title search patterns
+- Paging and the list endpoint
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import session_db, session_query
+
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _rows(count):
+    return [
+        {
+            "context_id": f"s{n}",
+            "agent_name": "agent",
+            "title": f"Session {n}",
+            "owner": "alice",
+            "visibility": "private",
+            "created_at": _NOW - timedelta(hours=n + 1),
+            "updated_at": _NOW - timedelta(minutes=n),
+            "last_message_at": None,
+        }
+        for n in range(count)
+    ]
+
+
+class FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows[: args[-1]]
+
+
+class TestBuildQuery:
+    def test_cursor_round_trip(self):
+        cursor = session_query.encode_cursor(_NOW, "ctx-1")
+
+        assert session_query.decode_cursor(cursor) == (_NOW, "ctx-1")
+        with pytest.raises(ValueError):
+            session_query.decode_cursor("not-a-cursor")
+
+    def test_admin_sees_everything_in_one_ordered_scan(self):
+        query, args = session_query.build_query("team1", "root", True, agent_name="a", limit=11)
+
+        assert "UNION" not in query
+        assert "namespace = $1 AND agent_name = $2" in query
+        assert query.endswith("ORDER BY updated_at DESC, context_id DESC LIMIT $3")
+        assert args == ["team1", "a", 11]
+
+    def test_non_admin_merges_own_and_shared_branches(self):
+        after = (_NOW, "ctx-9")
+        query, args = session_query.build_query("team1", "alice", False, after=after)
+
+        own, shared = query.split(" UNION ALL ")
+        assert "owner = $4" in own and session_query.SHARED not in own
+        assert session_query.SHARED in shared and "owner IS DISTINCT FROM $4" in shared
+        assert query.count("(updated_at, context_id) < ($2, $3)") == 2
+        assert args == ["team1", _NOW, "ctx-9", "alice", session_query.DEFAULT_PAGE_SIZE]
+
+    def test_other_owner_is_limited_to_shared_sessions(self):
+        query, args = session_query.build_query("team1", "alice", False, owner="bob")
+
+        assert "UNION" not in query
+        assert f"owner = $2 AND {session_query.SHARED}" in query
+        assert args[1] == "bob"
+
+        query, _ = session_query.build_query("team1", "alice", False, owner="alice")
+        assert session_query.SHARED not in query
+
+    def test_search_is_escaped(self):
+        _, args = session_query.build_query("team1", "root", True, search="100%_done\\")
+
+        assert args[1] == "%100\\%\\_done\\\\%"
+
+    def test_shared_predicate_matches_partial_index(self):
+        assert f"WHERE {session_query.SHARED};" in session_db.SESSIONS_LIST_INDEXES
+
+
+class TestListSessions:
+    async def test_pages_with_cursor(self):
+        conn = FakeConn(_rows(3))
+
+        sessions, cursor = await session_query.list_sessions(conn, "team1", "root", True, limit=2)
+
+        assert [s["context_id"] for s in sessions] == ["s0", "s1"]
+        assert conn.queries[0][1][-1] == 3
+        assert session_query.decode_cursor(cursor) == (_NOW - timedelta(minutes=1), "s1")
+
+        sessions, cursor = await session_query.list_sessions(
+            FakeConn(_rows(2)), "team1", "root", True, cursor=cursor, limit=2
+        )
+        assert cursor is None
+
+
+@pytest.fixture
+def session_db_conn():
+    return FakeConn(_rows(3))
+
+
+class TestListSessionsEndpoint:
+    def test_lists_visible_sessions(self, session_db_client):
+        client, conn = session_db_client
+
+        r = client.get("/api/v1/chat/team1/sessions", params={"limit": 2, "agent_name": "a"})
+
+        assert r.status_code == 200
+        body = r.json()
+        assert [s["context_id"] for s in body["sessions"]] == ["s0", "s1"]
+        assert body["next_cursor"]
+        query, args = conn.queries[0]
+        assert "UNION ALL" in query
+        assert args[:3] == ("team1", "a", "alice")
+
+    def test_invalid_cursor(self, session_db_client):
+        client, _ = session_db_client
+
+        r = client.get("/api/v1/chat/team1/sessions", params={"cursor": "bogus"})
+
+        assert r.status_code == 400
+
+    def test_limit_is_bounded(self, session_db_client):
+        client, _ = session_db_client
+
+        r = client.get(
+            "/api/v1/chat/team1/sessions", params={"limit": session_query.MAX_PAGE_SIZE + 1}
+        )
+
+        assert r.status_code == 422
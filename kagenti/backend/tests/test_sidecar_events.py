@@ -0,0 +1,186 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for sidecar event buffers and SidecarManager fan-out.
+
+Tests cover:
+- Classifying sandbox events and raw A2A chunks
+- Dropping the oldest event when a buffer is full
+- Coalescing pending events per type and state, keeping event order
+- Subscription filtering, in the buffer and in fan-out
+- Waking a waiting consumer
+- Per-sidecar counters in list_sidecars and the backlog metric
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import sidecar_manager
+from app.services.sidecar_events import OverflowPolicy, SidecarEventBuffer, event_type
+from app.services.sidecar_manager import SidecarHandle, SidecarManager, SidecarType
+
+
+def _status(state: str, n: int = 0) -> dict:
+    return {"result": {"taskId": "t1", "status": {"state": state}, "n": n}}
+
+
+def _tool_result(n: int) -> dict:
+    return {"event": {"type": "tool_result", "output": f"out {n}"}}
+
+
+class TestEventType:
+    def test_classifies_events(self):
+        assert event_type(_tool_result(1)) == "tool_result"
+        assert event_type({"done": True}) == "done"
+        assert event_type(_status("WORKING")) == "status"
+        assert event_type(_status("INPUT_REQUIRED")) == "hitl_request"
+        assert event_type({"result": {"artifact": {}}}) == "artifact"
+        assert event_type({"result": {"parts": []}}) == "message"
+        assert event_type({"method": "ping"}) == "other"
+
+
+class TestSidecarEventBuffer:
+    def test_full_buffer_drops_oldest(self):
+        buffer = SidecarEventBuffer(maxsize=3)
+
+        for n in range(5):
+            assert buffer.offer(_tool_result(n)) is True
+
+        assert [buffer.get_nowait()["event"]["output"] for _ in range(3)] == [
+            "out 2",
+            "out 3",
+            "out 4",
+        ]
+        assert buffer.stats()["dropped"] == 2
+        assert buffer.stats()["high_water"] == 3
+        with pytest.raises(asyncio.QueueEmpty):
+            buffer.get_nowait()
+
+    def test_coalesce_keeps_newest_per_type_and_state(self):
+        buffer = SidecarEventBuffer(policy=OverflowPolicy.COALESCE)
+
+        buffer.offer(_status("WORKING", 1))
+        buffer.offer(_status("COMPLETED", 2))
+        buffer.offer(_status("WORKING", 3))
+        buffer.offer(_status("WORKING", 4))
+
+        events = [buffer.get_nowait()["result"] for _ in range(buffer.qsize())]
+        assert [(e["status"]["state"], e["n"]) for e in events] == [
+            ("COMPLETED", 2),
+            ("WORKING", 4),
+        ]
+        assert buffer.coalesced == 2
+
+        # Once consumed, the next event of the same state is queued again
+        buffer.offer(_status("WORKING", 5))
+        assert buffer.qsize() == 1
+
+    def test_coalesce_keeps_event_order(self):
+        buffer = SidecarEventBuffer(policy=OverflowPolicy.COALESCE)
+
+        buffer.offer(_status("WORKING", 1))
+        buffer.offer(_status("COMPLETED", 2))
+        buffer.offer(_status("WORKING", 3))
+        buffer.offer(_tool_result(4))
+
+        assert buffer.get_nowait()["result"]["status"]["state"] == "COMPLETED"
+        assert buffer.get_nowait()["result"]["n"] == 3
+        assert buffer.get_nowait()["event"]["output"] == "out 4"
+
+    def test_filters_unsubscribed_types(self):
+        buffer = SidecarEventBuffer(event_types={"tool_result"})
+
+        assert buffer.offer(_status("WORKING")) is False
+        assert buffer.offer(_tool_result(1)) is True
+        assert buffer.stats()["filtered"] == 1
+        assert buffer.qsize() == 1
+
+        buffer.subscribe(None)
+        assert buffer.offer(_status("WORKING")) is True
+
+    async def test_get_waits_for_an_event(self):
+        buffer = SidecarEventBuffer()
+
+        waiter = asyncio.create_task(buffer.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        buffer.offer(_tool_result(1))
+
+        assert (await asyncio.wait_for(waiter, 1))["event"]["output"] == "out 1"
+        assert buffer.empty()
+
+
+@pytest.fixture
+def manager():
+    manager = SidecarManager()
+    sidecars = {}
+    for sidecar_type in SidecarType:
+        sidecars[sidecar_type] = SidecarHandle(
+            context_id=f"sidecar-{sidecar_type.value}",
+            sidecar_type=sidecar_type,
+            parent_context_id="ctx-1",
+            enabled=True,
+            event_queue=manager._make_event_buffer(sidecar_type, {}),
+        )
+    manager._registry["ctx-1"] = sidecars
+    return manager
+
+
+class TestFanOut:
+    def test_delivers_only_subscribed_types(self, manager):
+        manager.fan_out_event("ctx-1", _tool_result(1))
+        manager.fan_out_event("ctx-1", _status("WORKING"))
+        manager.fan_out_event("ctx-1", {"method": "ping"})
+        manager.fan_out_event("other-session", _tool_result(2))
+
+        looper = manager.get_handle("ctx-1", SidecarType.LOOPER).event_queue
+        observer = manager.get_handle("ctx-1", SidecarType.HALLUCINATION_OBSERVER).event_queue
+        guardian = manager.get_handle("ctx-1", SidecarType.CONTEXT_GUARDIAN).event_queue
+        assert [event_type(looper.get_nowait())] == ["status"] and looper.empty()
+        assert [event_type(observer.get_nowait())] == ["tool_result"] and observer.empty()
+        assert guardian.qsize() == 2
+
+    def test_skips_disabled_sidecars(self, manager):
+        manager.get_handle("ctx-1", SidecarType.HALLUCINATION_OBSERVER).enabled = False
+
+        manager.fan_out_event("ctx-1", _tool_result(1))
+
+        assert manager.get_handle("ctx-1", SidecarType.HALLUCINATION_OBSERVER).event_queue.empty()
+
+    def test_buffer_size_comes_from_settings(self):
+        with patch("app.core.config.settings.sidecar_event_buffer_size", 7):
+            buffer = SidecarManager._make_event_buffer(SidecarType.LOOPER, {})
+
+        assert buffer.maxsize == 7
+        assert buffer.policy is OverflowPolicy.COALESCE
+        assert buffer.name == "looper"
+
+    def test_stats_and_backlog_metric(self, manager):
+        for n in range(3):
+            manager.fan_out_event("ctx-1", _tool_result(n))
+
+        listed = {s["sidecar_type"]: s for s in manager.list_sidecars("ctx-1")}
+        assert listed["hallucination_observer"]["events"]["pending"] == 3
+        assert listed["looper"]["events"]["filtered"] == 3
+        assert sidecar_manager._event_backlog.value(sidecar="context_guardian") == 3
+
+    async def test_update_config_changes_subscription(self, manager):
+        with patch.object(manager, "_persist_sidecar_state", AsyncMock()):
+            await manager.update_config(
+                "ctx-1", SidecarType.HALLUCINATION_OBSERVER, {"event_types": ["status"]}
+            )
+            manager.fan_out_event("ctx-1", _status("WORKING"))
+            observer = manager.get_handle("ctx-1", SidecarType.HALLUCINATION_OBSERVER)
+            assert observer.event_queue.qsize() == 1
+
+            await manager.update_config(
+                "ctx-1", SidecarType.HALLUCINATION_OBSERVER, {"event_types": None}
+            )
+            assert observer.event_queue.stats()["event_types"] == [
+                "llm_response",
+                "tool_call",
+                "tool_result",
+            ]
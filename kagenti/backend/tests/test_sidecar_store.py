@@ -0,0 +1,180 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for sidecar state persistence in the sidecar tables.
+
+The session database is replaced by an in-memory connection that records
+the rows written to sidecar_handles, sidecar_observations and tasks.
+
+Tests cover:
+- Upserting handles and appending only new observations
+- Restoring handles and observations after a restart
+- Migrating state from tasks.metadata once
+"""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from app.services import sidecar_store
+from app.services.sidecar_manager import (
+    SidecarHandle,
+    SidecarManager,
+    SidecarObservation,
+    SidecarType,
+)
+
+
+def _observation(n: int) -> SidecarObservation:
+    return SidecarObservation(
+        id=f"looper-{n}", sidecar_type="looper", timestamp=float(n), message=f"obs {n}"
+    )
+
+
+class FakeConn:
+    """The sidecar tables and a tasks table, held in memory."""
+
+    def __init__(self, tasks=None):
+        self.handles = {}
+        self.observations = []
+        self.tasks = tasks or []
+        self.handle_writes = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        if query == sidecar_store._UPSERT_HANDLE:
+            self.handle_writes += 1
+            keys = (
+                "parent_context_id sidecar_type context_id namespace agent_name enabled"
+                " auto_approve config pending_interventions created_at"
+            ).split()
+            self.handles[(args[0], args[1])] = dict(zip(keys, args, strict=True))
+        elif query.startswith("UPDATE tasks"):
+            for task in self.tasks:
+                if task["context_id"] == args[0]:
+                    meta = json.loads(task["metadata"])
+                    meta.pop("sidecar_state", None)
+                    task["metadata"] = json.dumps(meta)
+        else:
+            raise AssertionError(f"unexpected query: {query}")
+
+    async def executemany(self, query, args):
+        assert query == sidecar_store._INSERT_OBSERVATION
+        self.observations.extend(args)
+
+    async def fetch(self, query, parent_context_id):
+        if query == sidecar_store._SELECT_HANDLES:
+            return [row for (ctx, _), row in self.handles.items() if ctx == parent_context_id]
+        if query == sidecar_store._SELECT_OBSERVATIONS:
+            return [
+                {
+                    "sidecar_type": o[1],
+                    "observation_id": o[2],
+                    "timestamp": o[3],
+                    "message": o[4],
+                    "severity": o[5],
+                    "requires_approval": o[6],
+                }
+                for o in self.observations
+                if o[0] == parent_context_id
+            ]
+        raise AssertionError(f"unexpected query: {query}")
+
+    async def fetchrow(self, query, context_id):
+        rows = [
+            t
+            for t in self.tasks
+            if t["context_id"] == context_id and "sidecar_state" in json.loads(t["metadata"])
+        ]
+        return rows[-1] if rows else None
+
+
+@pytest.fixture
+def database():
+    conn = FakeConn()
+
+    class Pool:
+        @asynccontextmanager
+        async def acquire(self):
+            yield conn
+
+    async def get_pool(namespace):
+        return Pool()
+
+    with patch("app.services.session_db.get_session_pool", get_pool):
+        yield conn
+
+
+def _manager_with_looper():
+    manager = SidecarManager()
+    handle = SidecarHandle(
+        context_id="sidecar-looper-ctx-1",
+        sidecar_type=SidecarType.LOOPER,
+        parent_context_id="ctx-1",
+        config={"counter_limit": 3},
+    )
+    manager._registry["ctx-1"] = {SidecarType.LOOPER: handle}
+    return manager, handle
+
+
+class TestPersistSidecarState:
+    async def test_appends_only_new_observations(self, database):
+        manager, handle = _manager_with_looper()
+        handle.observations.extend([_observation(1), _observation(2)])
+
+        await manager._persist_sidecar_state("ctx-1")
+        handle.observations.append(_observation(3))
+        handle.config["counter_limit"] = 5
+        await manager._persist_sidecar_state("ctx-1")
+
+        assert [o[2] for o in database.observations] == ["looper-1", "looper-2", "looper-3"]
+        assert database.handle_writes == 2
+        row = database.handles[("ctx-1", "looper")]
+        assert json.loads(row["config"]) == {"counter_limit": 5}
+
+    async def test_restores_after_restart(self, database):
+        manager, handle = _manager_with_looper()
+        handle.observations.append(_observation(1))
+        handle.pending_interventions.append(_observation(1))
+        await manager._persist_sidecar_state("ctx-1")
+
+        restarted = SidecarManager()
+        await restarted._restore_sidecars_for_session("ctx-1", "team1")
+
+        restored = restarted.get_handle("ctx-1", SidecarType.LOOPER)
+        assert restored.enabled is False
+        assert restored.config == {"counter_limit": 3}
+        assert [o.id for o in restored.observations] == ["looper-1"]
+        assert [o.id for o in restored.pending_interventions] == ["looper-1"]
+
+        # Restored observations are not inserted again
+        await restarted._persist_sidecar_state("ctx-1")
+        assert len(database.observations) == 1
+
+    async def test_migrates_task_metadata_once(self, database):
+        _, handle = _manager_with_looper()
+        handle.observations.append(_observation(1))
+        database.tasks.append(
+            {
+                "context_id": "ctx-1",
+                "metadata": json.dumps(
+                    {"title": "t", "sidecar_state": {"looper": handle.to_persistable()}}
+                ),
+            }
+        )
+
+        manager = SidecarManager()
+        await manager._restore_sidecars_for_session("ctx-1", "team1")
+
+        assert [o.id for o in manager.get_handle("ctx-1", SidecarType.LOOPER).observations] == [
+            "looper-1"
+        ]
+        assert ("ctx-1", "looper") in database.handles
+        assert [o[2] for o in database.observations] == ["looper-1"]
+        assert json.loads(database.tasks[0]["metadata"]) == {"title": "t"}
@@ -0,0 +1,218 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the A2A SSE relay used by chat streaming.
+
+Tests cover:
+- Translating status, artifact, task and message results into chat events
+- Adopting the agent's contextId only when the caller had no session id
+- Skipping lines without a result, bad JSON and unknown structures
+- Identical events with orjson and the stdlib json codec
+- Pretty-printing JSON data parts
+- The passthrough mode of the stream endpoint, agent errors in it, and
+  rejecting passthrough with detach
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import chat
+from app.services import sse_relay
+from app.services.kubernetes import get_kubernetes_service
+from app.services.sse_relay import A2ARelay, extract_text_from_parts
+from app.services.stream_replay import get_stream_replay_store
+
+
+def _line(result) -> str:
+    return "data: " + json.dumps({"jsonrpc": "2.0", "id": "1", "result": result})
+
+
+def _decode(event: str) -> dict:
+    assert event.startswith("data: ") and event.endswith("\n\n")
+    return json.loads(event[6:])
+
+
+STATUS = {
+    "taskId": "t1",
+    "contextId": "ctx-agent",
+    "final": True,
+    "status": {"state": "COMPLETED", "message": {"parts": [{"kind": "text", "text": "Done"}]}},
+}
+ARTIFACT = {
+    "taskId": "t1",
+    "artifact": {"name": "out", "index": 0, "parts": [{"text": "hello"}]},
+}
+TASK = {"id": "t2", "status": {"state": "FAILED", "message": {"parts": [{"text": "boom"}]}}}
+MESSAGE = {"messageId": "m1", "parts": [{"kind": "text", "text": "partial"}]}
+
+
+class TestA2ARelay:
+    def test_status_event(self):
+        relay = A2ARelay("s1", "alice", caller_supplied_session_id=True)
+
+        event, done = relay.translate(_line(STATUS))
+
+        assert done is False
+        assert _decode(event) == {
+            "session_id": "s1",
+            "username": "alice",
+            "event": {
+                "type": "status",
+                "taskId": "t1",
+                "state": "COMPLETED",
+                "final": True,
+                "message": "Done",
+            },
+            "content": "Done",
+        }
+
+    def test_input_required_is_hitl_request(self):
+        relay = A2ARelay("s1", caller_supplied_session_id=True)
+        result = {"taskId": "t1", "status": {"state": "INPUT_REQUIRED"}}
+
+        event, _ = relay.translate(_line(result))
+
+        payload = _decode(event)
+        assert payload["event"]["type"] == relay.event_type == "hitl_request"
+        assert "content" not in payload
+        assert "username" not in payload
+
+    def test_artifact_task_and_message_events(self):
+        relay = A2ARelay("s1", caller_supplied_session_id=True)
+
+        artifact = _decode(relay.translate(_line(ARTIFACT))[0])
+        task = _decode(relay.translate(_line(TASK))[0])
+        message = _decode(relay.translate(_line(MESSAGE))[0])
+
+        assert artifact["event"] == {"type": "artifact", "taskId": "t1", "name": "out", "index": 0}
+        assert artifact["content"] == "hello"
+        assert task["event"] == {"type": "status", "taskId": "t2", "state": "FAILED", "final": True}
+        assert task["content"] == "boom"
+        assert message["event"]["state"] == "WORKING"
+        assert message["content"] == "partial"
+
+    def test_adopts_agent_context_only_on_first_turn(self):
+        first_turn = A2ARelay("s1", "alice", caller_supplied_session_id=False)
+        later_turn = A2ARelay("s1", "alice", caller_supplied_session_id=True)
+
+        assert _decode(first_turn.translate(_line(STATUS))[0])["session_id"] == "ctx-agent"
+        assert _decode(first_turn.translate("data: [DONE]")[0]) == {
+            "done": True,
+            "session_id": "ctx-agent",
+            "username": "alice",
+        }
+        assert _decode(later_turn.translate(_line(STATUS))[0])["session_id"] == "s1"
+
+    def test_done_and_skipped_lines(self):
+        relay = A2ARelay("s1", caller_supplied_session_id=True)
+
+        assert relay.translate(": keep-alive") == (None, False)
+        assert relay.translate('data: {"jsonrpc": "2.0", "method": "ping"}') == (None, False)
+        assert relay.translate('data: {"result": ') == (None, False)
+        assert relay.translate(_line({"unexpected": True})) == (None, False)
+        assert relay.translate("data: [DONE]")[1] is True
+        assert relay.event_type == "done"
+
+    def test_on_chunk_sees_every_chunk(self):
+        seen = []
+        relay = A2ARelay("s1", on_chunk=lambda sid, chunk: seen.append((sid, chunk)))
+
+        relay.translate('data: {"method": "ping"}')
+        relay.translate(_line(MESSAGE))
+
+        assert [chunk for _, chunk in seen][0] == {"method": "ping"}
+        assert len(seen) == 2
+
+    @pytest.mark.skipif(sse_relay.orjson is None, reason="orjson not installed")
+    def test_codecs_produce_the_same_events(self):
+        lines = [_line(r) for r in (STATUS, ARTIFACT, TASK, MESSAGE)] + ["data: [DONE]"]
+
+        def run():
+            relay = A2ARelay("s1", "alice")
+            return [_decode(relay.translate(line)[0]) for line in lines]
+
+        with_orjson = run()
+        with patch.object(sse_relay, "_ORJSON_AVAILABLE", False):
+            with_json = run()
+
+        assert with_orjson == with_json
+
+
+class TestExtractTextFromParts:
+    def test_pretty_prints_json_data(self):
+        parts = [
+            {"kind": "text", "text": "Result:"},
+            {"data": {"content_type": "application/json", "content": '{"a": [1, 2]}'}},
+            {"data": {"content_type": "image/png", "content": "..."}},
+            {"data": '{"b": true}'},
+            {"data": "not json"},
+            {"data": [1]},
+        ]
+
+        text = extract_text_from_parts(parts)
+
+        assert text == (
+            'Result:\n```json\n{\n  "a": [\n    1,\n    2\n  ]\n}\n```\n'
+            '\n```json\n{\n  "b": true\n}\n```\n'
+            "\nnot json\n"
+            "\n```json\n[\n  1\n]\n```\n"
+        )
+
+
+class TestPassthrough:
+    def _post(self, status, body, **params):
+        app = FastAPI()
+        app.include_router(chat.router, prefix="/api/v1")
+        app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+        from app.core.auth import TokenData, get_required_user
+
+        app.dependency_overrides[get_required_user] = lambda: TokenData(
+            sub="u", username="alice", email=None, roles=["kagenti-operator"], raw_token={}
+        )
+
+        async def mock_send(self, request, **kwargs):
+            return httpx.Response(
+                status,
+                stream=httpx.ByteStream(body),
+                headers={"content-type": "text/event-stream"},
+                request=request,
+            )
+
+        with (
+            patch("app.core.auth.settings") as mock_auth,
+            patch.object(chat, "resolve_agent_url", return_value="http://weather.team1:8080"),
+            patch.object(httpx.AsyncClient, "send", mock_send),
+        ):
+            mock_auth.enable_auth = False
+            return TestClient(app).post(
+                "/api/v1/chat/team1/weather/stream",
+                params={"passthrough": True, **params},
+                json={"message": "hi", "session_id": "s1"},
+            )
+
+    def test_relays_agent_bytes_unchanged(self):
+        body = (_line(STATUS) + "\n\n" + ": keep-alive\n\ndata: [DONE]\n\n").encode()
+
+        r = self._post(200, body)
+
+        assert r.status_code == 200
+        assert r.content == body
+        assert r.headers["X-Session-Id"] == "s1"
+
+    def test_detach_is_rejected(self):
+        r = self._post(200, b"data: [DONE]\n\n", detach=True)
+
+        assert r.status_code == 400
+        assert get_stream_replay_store().running_detached() == 0
+
+    def test_agent_error_is_not_relayed_as_a_stream(self):
+        r = self._post(500, b"Internal Server Error")
+
+        assert r.status_code == 502
+        assert r.json()["detail"] == "Agent error: 500"
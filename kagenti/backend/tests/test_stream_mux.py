@@ -0,0 +1,146 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for multiplexed session subscriptions.
+
+Tests cover:
+- Tagging events with session, run and seq
+- Interleaving concurrent runs of one session
+- Following runs that start after the subscription, and skipping runs
+  that had finished before it
+- Skipping runs the subscriber may not read
+- Keep-alive comments on idle connections
+- Validation of the subscription endpoint
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import chat
+from app.services.kubernetes import get_kubernetes_service
+from app.services.stream_mux import subscribe
+from app.services.stream_replay import StreamReplayStore
+
+
+def _event(n: int) -> str:
+    return f"data: {json.dumps({'n': n})}\n\n"
+
+
+async def _take(stream, count: int):
+    frames = []
+    while len(frames) < count:
+        frame = await asyncio.wait_for(stream.__anext__(), 1)
+        if not frame.startswith(":"):
+            frames.append(json.loads(frame[6:]))
+    return frames
+
+
+class TestSubscribe:
+    async def test_tags_events_from_many_sessions(self):
+        store = StreamReplayStore()
+        old = store.create("s1", "team1", "weather")
+        old.append(_event(0))
+        old.finish()
+        running = store.create("s1", "team1", "weather")
+        running.append(_event(1))
+
+        stream = subscribe(store, ["s1", "s2", "s1"], lambda run: True)
+        assert await _take(stream, 2) == [
+            {"subscribed": ["s1", "s2"]},
+            {"session_id": "s1", "run_id": running.run_id, "seq": 1, "event": {"n": 1}},
+        ]
+
+        later = store.create("s2", "team1", "weather")
+        later.append(_event(2))
+        running.append(_event(3))
+        later.finish(interrupted=True)
+
+        frames = await _take(stream, 3)
+        await stream.aclose()
+
+        assert {"session_id": "s2", "run_id": later.run_id, "seq": 1, "event": {"n": 2}} in frames
+        assert {"session_id": "s1", "run_id": running.run_id, "seq": 2, "event": {"n": 3}} in frames
+        assert {
+            "session_id": "s2",
+            "run_id": later.run_id,
+            "seq": None,
+            "event": {"error": "Stream interrupted", "session_id": "s2"},
+        } in frames
+        assert running.viewers == 0
+
+    async def test_interleaves_concurrent_runs_of_one_session(self):
+        store = StreamReplayStore()
+        first = store.create("s1", "team1", "weather")
+        second = store.create("s1", "team1", "weather")
+
+        stream = subscribe(store, ["s1"], lambda run: True)
+        await _take(stream, 1)
+        second.append(_event(1))
+        assert (await _take(stream, 1))[0]["run_id"] == second.run_id
+        first.append(_event(2))
+        assert (await _take(stream, 1))[0]["run_id"] == first.run_id
+        second.append(_event(3))
+        frames = await _take(stream, 1)
+        await stream.aclose()
+
+        assert frames == [
+            {"session_id": "s1", "run_id": second.run_id, "seq": 2, "event": {"n": 3}}
+        ]
+        assert first.viewers == 0 and second.viewers == 0
+
+    async def test_follows_adopted_session_ids(self):
+        store = StreamReplayStore()
+        run = store.create("client-id", "team1", "weather")
+        run.append(_event(1), session_id="ctx-agent")
+
+        stream = subscribe(store, ["ctx-agent"], lambda run: True)
+        frames = await _take(stream, 2)
+        await stream.aclose()
+
+        assert frames[1]["run_id"] == run.run_id
+
+    async def test_skips_unreadable_runs(self):
+        store = StreamReplayStore()
+        hidden = store.create("s1", "team1", "weather", username="bob")
+        hidden.append(_event(1))
+        visible = store.create("s1", "team1", "weather", username="alice")
+        visible.append(_event(2))
+
+        stream = subscribe(store, ["s1"], lambda run: run.username == "alice")
+        frames = await _take(stream, 2)
+        await stream.aclose()
+
+        assert frames[1]["run_id"] == visible.run_id
+
+    async def test_sends_keep_alive_when_idle(self):
+        stream = subscribe(StreamReplayStore(), ["s1"], lambda run: True, heartbeat_interval=0.01)
+
+        await stream.__anext__()
+        assert await asyncio.wait_for(stream.__anext__(), 1) == ": keep-alive\n\n"
+        await stream.aclose()
+
+
+class TestSubscribeEndpoint:
+    def test_validates_session_count(self):
+        app = FastAPI()
+        app.include_router(chat.router, prefix="/api/v1")
+        app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+
+        with (
+            patch("app.core.auth.settings") as mock_auth,
+            patch.object(chat.settings, "chat_subscribe_max_sessions", 2),
+        ):
+            mock_auth.enable_auth = False
+            client = TestClient(app)
+            missing = client.get("/api/v1/chat/team1/subscribe")
+            too_many = client.get(
+                "/api/v1/chat/team1/subscribe", params={"session_id": ["a", "b", "c"]}
+            )
+
+        assert missing.status_code == 422
+        assert too_many.status_code == 400
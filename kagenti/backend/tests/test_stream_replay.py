@@ -0,0 +1,503 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for resumable chat streams.
+
+Tests cover:
+- Event ids and replay after a Last-Event-ID
+- Following a live stream after the replay
+- Overflowing the in-memory buffer, with and without spill to the events table
+- Interrupted streams
+- Store eviction by age and count
+- The resume endpoints: GET /stream and POST /stream with Last-Event-ID
+- Detached runs: running without viewers, cancelling, persisting events,
+  and the detach/list/attach/cancel endpoints
+- Attached runs outliving a disconnected client for the grace period
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.auth import TokenData, get_required_user
+from app.routers import chat
+from app.services.event_writer import EventWriter
+from app.services.kubernetes import get_kubernetes_service
+from app.services.stream_replay import StreamReplayStore, StreamRun, parse_event_id
+
+
+def _event(n: int) -> str:
+    return f"data: {json.dumps({'session_id': 's1', 'n': n})}\n\n"
+
+
+def _ids(frames):
+    return [f.split("\n", 1)[0] for f in frames if f.startswith("id: ")]
+
+
+async def _collect(run: StreamRun, after: int):
+    return [frame async for frame in run.replay(after)]
+
+
+async def _collect_after_finish(run: StreamRun, after: int):
+    run.finish()
+    return await _collect(run, after)
+
+
+class TestStreamRun:
+    async def test_replays_events_after_id(self):
+        run = StreamRun("s1", "team1", "weather", run_id="r1")
+
+        first = run.append(_event(1))
+        for n in range(2, 5):
+            run.append(_event(n))
+        run.finish()
+
+        assert first == 'id: r1:1\ndata: {"session_id": "s1", "n": 1}\n\n'
+        assert parse_event_id("r1:1") == ("r1", 1)
+        assert _ids(await _collect(run, 2)) == ["id: r1:3", "id: r1:4"]
+        assert await _collect(run, 4) == []
+
+    async def test_follows_a_live_stream(self):
+        run = StreamRun("s1", "team1", "weather", run_id="r1")
+        run.append(_event(1))
+
+        reader = asyncio.create_task(_collect(run, 0))
+        await asyncio.sleep(0)
+        run.append(_event(2))
+        await asyncio.sleep(0)
+        run.append(_event(3))
+        run.finish()
+
+        assert _ids(await asyncio.wait_for(reader, 1)) == ["id: r1:1", "id: r1:2", "id: r1:3"]
+
+    async def test_overflow_without_spill_asks_for_resync(self):
+        run = StreamRun("s1", "team1", "weather", max_events=2, run_id="r1")
+        for n in range(1, 6):
+            run.append(_event(n))
+        run.finish()
+
+        frames = await _collect(run, 1)
+
+        assert json.loads(frames[0][6:]) == {"resync": True, "session_id": "s1"}
+        assert _ids(frames) == ["id: r1:4", "id: r1:5"]
+
+    async def test_overflow_spills_to_events_table(self):
+        rows = {}
+
+        class Conn:
+            async def executemany(self, query, args):
+                for context_id, task_id, seq, event_type, payload in args:
+                    rows[seq] = (context_id, task_id, event_type, payload)
+
+            async def fetch(self, query, context_ids, task_id, after, before):
+                return [
+                    {"event_index": seq, "payload": row[3]}
+                    for seq, row in sorted(rows.items())
+                    if row[0] in context_ids and row[1] == task_id and after < seq < before
+                ]
+
+        class Pool:
+            @asynccontextmanager
+            async def acquire(self):
+                yield Conn()
+
+        async def get_pool(namespace):
+            return Pool()
+
+        run = StreamRun(
+            "s1", "team1", "weather", max_events=2, spill=True, run_id="r1", writer=EventWriter()
+        )
+        with patch("app.services.session_db.get_session_pool", get_pool):
+            for n in range(1, 6):
+                run.append(_event(n))
+            frames = await asyncio.wait_for(_collect_after_finish(run, 0), 1)
+
+        assert _ids(frames) == [f"id: r1:{n}" for n in range(1, 6)]
+        assert rows[1][:3] == ("s1", "stream:r1", "unknown")
+
+    async def test_interrupted_stream_ends_with_error(self):
+        run = StreamRun("s1", "team1", "weather", run_id="r1")
+        run.append(_event(1))
+        run.finish(interrupted=True)
+
+        frames = await _collect(run, 1)
+
+        assert json.loads(frames[-1][6:]) == {"error": "Stream interrupted", "session_id": "s1"}
+
+    def test_adopted_session_id(self):
+        run = StreamRun("s1", "team1", "weather")
+
+        run.append(_event(1), session_id="ctx-agent")
+
+        assert run.session_id == "ctx-agent"
+        assert run.session_ids == {"s1", "ctx-agent"}
+
+    def test_parse_event_id_rejects_malformed(self):
+        assert parse_event_id("nope") is None
+        assert parse_event_id("r1:x") is None
+        assert parse_event_id(":3") is None
+
+
+class TestStreamReplayStore:
+    def test_evicts_finished_runs_first(self):
+        store = StreamReplayStore(max_runs=2)
+        first = store.create("s1", "team1", "weather")
+        second = store.create("s2", "team1", "weather")
+        second.finish()
+
+        third = store.create("s3", "team1", "weather")
+
+        assert store.get(second.run_id) is None
+        assert store.get(first.run_id) is first
+        assert store.get(third.run_id) is third
+
+    def test_expires_finished_runs(self):
+        store = StreamReplayStore(ttl=0)
+        run = store.create("s1", "team1", "weather")
+        assert store.get(run.run_id) is run
+
+        run.finish()
+        run.finished_at -= 1
+
+        assert store.get(run.run_id) is None
+
+
+STATUS_LINES = [
+    json.dumps({"result": {"taskId": "t1", "status": {"state": "WORKING"}}}),
+    json.dumps(
+        {
+            "result": {
+                "taskId": "t1",
+                "final": True,
+                "status": {"state": "COMPLETED", "message": {"parts": [{"text": "Done"}]}},
+            }
+        }
+    ),
+]
+
+
+@pytest.fixture
+def app_state():
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/v1")
+    app.dependency_overrides[get_kubernetes_service] = lambda: MagicMock()
+    user = {"username": "alice", "roles": ["kagenti-operator"]}
+    app.dependency_overrides[get_required_user] = lambda: TokenData(
+        sub="u", username=user["username"], email=None, roles=user["roles"], raw_token={}
+    )
+    store = StreamReplayStore()
+    calls = []
+    body = "".join(f"data: {line}\n\n" for line in STATUS_LINES).encode()
+
+    async def mock_send(self, request, **kwargs):
+        calls.append(request)
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(body),
+            headers={"content-type": "text/event-stream"},
+            request=request,
+        )
+
+    with (
+        patch("app.core.auth.settings") as mock_auth,
+        patch.object(chat, "resolve_agent_url", return_value="http://weather.team1:8080"),
+        patch.object(chat, "get_stream_replay_store", return_value=store),
+        patch.object(httpx.AsyncClient, "send", mock_send),
+    ):
+        mock_auth.enable_auth = False
+        with TestClient(app) as client:
+            yield client, user, calls
+
+
+def _frames(response):
+    return [f for f in response.text.split("\n\n") if f]
+
+
+class TestResumeEndpoints:
+    def _start(self, client):
+        r = client.post(
+            "/api/v1/chat/team1/weather/stream", json={"message": "hi", "session_id": "s1"}
+        )
+        assert r.status_code == 200
+        return _frames(r)
+
+    def test_events_carry_ids_and_resume_with_header(self, app_state):
+        client, _, calls = app_state
+        frames = self._start(client)
+        first_id = frames[0].split("\n")[0][4:]
+
+        r = client.get("/api/v1/chat/team1/weather/stream", headers={"Last-Event-ID": first_id})
+
+        assert all(f.startswith("id: ") for f in frames)
+        assert r.status_code == 200
+        assert _frames(r) == frames[1:]
+        assert r.headers["X-Session-Id"] == "s1"
+        assert len(calls) == 1
+
+    def test_post_with_last_event_id_does_not_call_agent(self, app_state):
+        client, _, calls = app_state
+        frames = self._start(client)
+
+        r = client.post(
+            "/api/v1/chat/team1/weather/stream",
+            headers={"Last-Event-ID": frames[0].split("\n")[0][4:]},
+            json={"message": "hi", "session_id": "s1"},
+        )
+
+        assert _frames(r) == frames[1:]
+        assert len(calls) == 1
+
+    def test_query_parameter_and_errors(self, app_state):
+        client, user, _ = app_state
+        frames = self._start(client)
+        event_id = frames[0].split("\n")[0][4:]
+
+        by_query = client.get("/api/v1/chat/team1/weather/stream", params={"lastEventId": event_id})
+        missing = client.get("/api/v1/chat/team1/weather/stream")
+        unknown = client.get(
+            "/api/v1/chat/team1/weather/stream", headers={"Last-Event-ID": "gone:1"}
+        )
+        other_agent = client.get(
+            "/api/v1/chat/team1/other/stream", headers={"Last-Event-ID": event_id}
+        )
+        user["username"] = "bob"
+        other_user = client.get(
+            "/api/v1/chat/team1/weather/stream", headers={"Last-Event-ID": event_id}
+        )
+        user["roles"] = ["kagenti-admin"]
+        admin = client.get("/api/v1/chat/team1/weather/stream", headers={"Last-Event-ID": event_id})
+
+        assert _frames(by_query) == frames[1:]
+        assert missing.status_code == 400
+        assert unknown.status_code == 404
+        assert other_agent.status_code == 404
+        assert other_user.status_code == 404
+        assert admin.status_code == 200
+
+
+async def _produce(run: StreamRun, count: int, gate: asyncio.Event = None):
+    """Stand-in for _stream_from_response: records events into ``run``."""
+    ended = False
+    try:
+        for n in range(1, count + 1):
+            if gate is not None:
+                await gate.wait()
+            await asyncio.sleep(0)
+            yield run.append(_event(n))
+        ended = True
+    finally:
+        run.finish(interrupted=not ended)
+
+
+class TestDetachedRuns:
+    async def test_runs_to_completion_without_viewers(self):
+        store = StreamReplayStore()
+        run = store.create("s1", "team1", "weather")
+        gate = asyncio.Event()
+        store.detach(run, _produce(run, 5, gate))
+
+        # A viewer that disconnects early does not stop the run
+        viewer = run.replay(0)
+        gate.set()
+        assert (await viewer.__anext__()).startswith(f"id: {run.run_id}:1")
+        assert run.viewers == 1
+        await viewer.aclose()
+        await asyncio.wait_for(run.task, 1)
+
+        assert run.viewers == 0
+        assert run.state == "completed"
+        assert run.last_seq == 5
+        assert store.running_detached() == 0
+
+    async def test_cancel(self):
+        store = StreamReplayStore()
+        run = store.create("s1", "team1", "weather")
+        store.detach(run, _produce(run, 5, asyncio.Event()))
+        await asyncio.sleep(0)
+        assert store.running_detached() == 1
+
+        await store.cancel(run)
+
+        frames = await _collect(run, 0)
+        assert run.state == "cancelled"
+        assert json.loads(frames[-1][6:]) == {"error": "Run cancelled", "session_id": "s1"}
+
+    async def test_persist_writes_every_event(self):
+        rows = []
+
+        class Conn:
+            async def executemany(self, query, args):
+                rows.extend(seq for _, _, seq, _, _ in args)
+
+        class Pool:
+            @asynccontextmanager
+            async def acquire(self):
+                yield Conn()
+
+        async def get_pool(namespace):
+            return Pool()
+
+        run = StreamRun("s1", "team1", "weather", persist=True, writer=EventWriter())
+        with patch("app.services.session_db.get_session_pool", get_pool):
+            for n in range(3):
+                run.append(_event(n))
+            run.finish()
+            await run.writer.flush()
+
+        assert rows == [1, 2, 3]
+
+    def test_persist_uses_the_relayed_event_type(self):
+        writer = MagicMock()
+        writer.accepting.return_value = True
+        run = StreamRun("s1", "team1", "weather", persist=True, writer=writer)
+
+        run.append(_event(1), event_type="status")
+        run.append('data: {"done": true}\n\n')
+
+        rows = [call.args[0] for call in writer.submit.call_args_list]
+        assert [row.event_type for row in rows] == ["status", "done"]
+
+    async def test_write_failure_stops_persisting(self):
+        async def get_pool(namespace):
+            raise OSError("no database")
+
+        run = StreamRun("s1", "team1", "weather", persist=True, writer=EventWriter())
+        with patch("app.services.session_db.get_session_pool", get_pool):
+            run.append(_event(1))
+            await run.writer.flush()
+            run.append(_event(2))
+
+        assert run.persist is False
+
+    async def test_reservations_count_against_the_limit(self):
+        store = StreamReplayStore()
+
+        assert store.reserve_detached(2) is True
+        assert store.reserve_detached(2) is True
+        assert store.reserve_detached(2) is False
+
+        run = store.create("s1", "team1", "weather")
+        store.detach(run, _produce(run, 1, asyncio.Event()))
+        store.release_detached()
+        store.release_detached()
+        assert store.running_detached() == 1
+        assert store.reserve_detached(2) is True
+        await store.aclose()
+
+    async def test_running_detached_runs_are_not_evicted(self):
+        store = StreamReplayStore(max_runs=1)
+        run = store.create("s1", "team1", "weather")
+        store.detach(run, _produce(run, 1, asyncio.Event()))
+
+        other = store.create("s2", "team1", "weather")
+
+        assert store.get(run.run_id) is run
+        assert store.get(other.run_id) is other
+        await store.aclose()
+        assert run.state == "cancelled"
+
+    async def test_running_followed_runs_are_not_evicted(self):
+        store = StreamReplayStore(max_runs=1)
+        run = store.create("s1", "team1", "weather")
+        release = asyncio.Event()
+        store.follow(run, _produce(run, 1, release), grace=30)
+
+        other = store.create("s2", "team1", "weather")
+
+        assert store.get(run.run_id) is run
+        assert store.get(other.run_id) is other
+        release.set()
+        await run.task
+        assert run.state == "completed"
+        await store.aclose()
+
+
+class TestFollowedRuns:
+    async def test_outlives_a_disconnected_client(self):
+        store = StreamReplayStore()
+        run = store.create("s1", "team1", "weather")
+        gate = asyncio.Event()
+        store.follow(run, _produce(run, 5, gate), grace=60)
+
+        viewer = run.replay(0)
+        gate.set()
+        assert (await viewer.__anext__()).startswith(f"id: {run.run_id}:1")
+        await viewer.aclose()
+        await asyncio.wait_for(run.task, 1)
+
+        # The reconnecting client gets everything after its last event
+        frames = await _collect(run, 1)
+        assert run.state == "completed"
+        assert _ids(frames) == [f"id: {run.run_id}:{n}" for n in range(2, 6)]
+
+    async def test_closes_the_agent_stream_after_the_grace_period(self):
+        store = StreamReplayStore()
+        run = store.create("s1", "team1", "weather")
+        store.follow(run, _produce(run, 5, asyncio.Event()), grace=0.05)
+
+        await asyncio.wait_for(run.task, 1)
+
+        assert run.state == "interrupted"
+
+
+class TestRunEndpoints:
+    def test_detach_list_attach_and_cancel(self, app_state):
+        client, _, calls = app_state
+
+        r = client.post(
+            "/api/v1/chat/team1/weather/stream",
+            params={"detach": True},
+            json={"message": "hi", "session_id": "s1"},
+        )
+        frames = _frames(r)
+        run_id = r.headers["X-Run-Id"]
+
+        runs = client.get("/api/v1/chat/team1/weather/runs").json()
+        attached = client.get(f"/api/v1/chat/team1/weather/runs/{run_id}/stream")
+        resumed = client.get(
+            f"/api/v1/chat/team1/weather/runs/{run_id}/stream",
+            headers={"Last-Event-ID": f"{run_id}:1"},
+        )
+        cancelled = client.delete(f"/api/v1/chat/team1/weather/runs/{run_id}")
+
+        assert len(frames) == 2 and frames[0].startswith(f"id: {run_id}:1")
+        assert runs[0]["run_id"] == run_id
+        assert runs[0]["state"] == "completed"
+        assert runs[0]["detached"] is True
+        assert runs[0]["events"] == 2
+        assert _frames(attached) == frames
+        assert _frames(resumed) == frames[1:]
+        assert cancelled.status_code == 204
+        assert len(calls) == 1
+
+    def test_runs_are_private_to_their_user(self, app_state):
+        client, user, _ = app_state
+        client.post("/api/v1/chat/team1/weather/stream", json={"message": "hi", "session_id": "s1"})
+
+        user["username"] = "bob"
+        as_bob = client.get("/api/v1/chat/team1/weather/runs").json()
+        user["roles"] = ["kagenti-admin"]
+        as_admin = client.get("/api/v1/chat/team1/weather/runs").json()
+
+        assert as_bob == []
+        assert len(as_admin) == 1
+
+    def test_limits_detached_runs(self, app_state):
+        client, _, calls = app_state
+
+        with patch.object(chat.settings, "chat_max_detached_runs", 0):
+            r = client.post(
+                "/api/v1/chat/team1/weather/stream",
+                params={"detach": True},
+                json={"message": "hi"},
+            )
+
+        assert r.status_code == 429
+        assert calls == []
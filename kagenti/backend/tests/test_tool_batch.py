@@ -0,0 +1,150 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the batch MCP tool invocation endpoint.
+
+Tests cover:
+- Running every call over one session and streaming NDJSON as calls complete
+- SSE framing with result and done events
+- Per-call timeouts and tool errors reported in-stream
+- Concurrency limits
+- Request validation and connection errors before streaming starts
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+from mcp.shared.exceptions import McpError
+from mcp.types import CallToolResult, ErrorData, TextContent
+
+from app.routers import tools
+
+
+def _calls(*names):
+    return [{"tool_name": n, "arguments": {"n": i}} for i, n in enumerate(names)]
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+class TestInvokeBatch:
+    def test_streams_results_over_one_session(self, mcp_client, mcp_server):
+        async def slow(arguments, **kwargs):
+            await asyncio.sleep(0.05)
+            return CallToolResult(content=[TextContent(type="text", text="slow:ok")])
+
+        mcp_server.call_behaviour["slow"] = slow
+
+        r = mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            json={"calls": _calls("slow", "get_weather", "get_weather"), "concurrency": 3},
+        )
+
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        events = _ndjson(r)
+        results = [e for e in events if e["type"] == "result"]
+        # The slow call finishes last even though it was submitted first
+        assert [e["index"] for e in results][-1] == 0
+        assert results[-1]["result"]["content"][0]["text"] == "slow:ok"
+        assert events[-1] == {"type": "done", "total": 3, "succeeded": 3, "failed": 0}
+        assert len(mcp_server.sessions) == 1
+        assert mcp_server.sessions[0].calls == 3
+
+    def test_sse_format(self, mcp_client):
+        r = mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            params={"format": "sse"},
+            json={"calls": _calls("get_weather")},
+        )
+
+        assert r.headers["content-type"].startswith("text/event-stream")
+        messages = [m for m in r.text.split("\n\n") if m]
+        assert messages[0].startswith("event: result\ndata: ")
+        assert messages[-1].startswith("event: done\ndata: ")
+
+    def test_reports_timeouts_and_tool_errors_per_call(self, mcp_client, mcp_server):
+        async def timeout(arguments, read_timeout_seconds=None, **kwargs):
+            raise McpError(ErrorData(code=httpx.codes.REQUEST_TIMEOUT, message="Timed out"))
+
+        async def invalid(arguments, **kwargs):
+            raise McpError(ErrorData(code=-32602, message="Unknown tool"))
+
+        mcp_server.call_behaviour.update({"hang": timeout, "missing": invalid})
+
+        r = mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            json={"calls": _calls("hang", "missing", "get_weather"), "timeout": 0.5},
+        )
+
+        by_index = {e["index"]: e for e in _ndjson(r) if e["type"] == "result"}
+        assert by_index[0]["status"] == 504
+        assert by_index[1] == {
+            "type": "result",
+            "index": 1,
+            "tool_name": "missing",
+            "error": "Unknown tool",
+            "status": 502,
+        }
+        assert "result" in by_index[2]
+        assert _ndjson(r)[-1]["failed"] == 2
+
+    def test_passes_per_call_timeout(self, mcp_client, mcp_server):
+        seen = []
+
+        async def record(arguments, read_timeout_seconds=None, **kwargs):
+            seen.append(read_timeout_seconds.total_seconds())
+            return CallToolResult(content=[])
+
+        mcp_server.call_behaviour["record"] = record
+
+        mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            json={"calls": _calls("record"), "timeout": 2.5},
+        )
+
+        assert seen == [2.5]
+
+    def test_respects_concurrency(self, mcp_client, mcp_server):
+        active = 0
+        peak = 0
+
+        async def track(arguments, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return CallToolResult(content=[])
+
+        mcp_server.call_behaviour["track"] = track
+
+        mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            json={"calls": _calls(*["track"] * 6), "concurrency": 2},
+        )
+
+        assert peak == 2
+
+    def test_rejects_oversized_batches(self, mcp_client):
+        with patch.object(tools.settings, "mcp_batch_max_calls", 2):
+            r = mcp_client.post(
+                "/api/v1/tools/team1/weather/invoke-batch",
+                json={"calls": _calls("a", "b", "c")},
+            )
+
+        assert r.status_code == 400
+
+    def test_connection_error_is_http_error(self, mcp_client, mcp_server):
+        mcp_server.fail_connect = True
+
+        r = mcp_client.post(
+            "/api/v1/tools/team1/weather/invoke-batch",
+            json={"calls": _calls("get_weather")},
+        )
+
+        assert r.status_code == 502
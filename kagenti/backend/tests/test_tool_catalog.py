@@ -0,0 +1,147 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the cached MCP tool catalog.
+
+Tests cover:
+- Populating the catalog on first connect and serving later connects from it
+- Re-listing after a rollout (generation change) or refresh=true
+- Re-listing in the background on tools/list_changed notifications
+- Searching by exact name or substring, scoped to namespaces
+- The connect and catalog search endpoints
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mcp import types
+from mcp.types import Tool
+
+from app.services import tool_catalog
+from app.services.kubernetes import get_kubernetes_service
+from app.services.mcp_sessions import McpSessionPool
+from app.services.tool_catalog import ToolCatalog
+
+ENDPOINT = "http://weather-mcp.team1.svc.cluster.local:8000/mcp"
+
+
+@pytest.fixture
+async def pool(mcp_server):
+    pool = McpSessionPool(max_sessions=8, idle_timeout=300, connect_timeout=1, enabled=True)
+    with patch.object(tool_catalog, "get_mcp_session_pool", return_value=pool):
+        yield pool
+    await pool.aclose()
+
+
+def _list_calls(server):
+    return sum(s.list_calls for s in server.sessions)
+
+
+class TestToolCatalog:
+    async def test_first_get_lists_then_hits(self, mcp_server, pool):
+        catalog = ToolCatalog(ttl=3600)
+
+        first = await catalog.get("team1", "weather", ENDPOINT, "deployment:u:1")
+        second = await catalog.get("team1", "weather", ENDPOINT, "deployment:u:1")
+
+        assert first is second
+        assert [t["name"] for t in first.tools] == ["get_weather"]
+        assert _list_calls(mcp_server) == 1
+
+    async def test_rollout_and_refresh_relist(self, mcp_server, pool):
+        catalog = ToolCatalog(ttl=3600)
+        await catalog.get("team1", "weather", ENDPOINT, "deployment:u:1")
+
+        mcp_server.tools = [Tool(name="get_forecast", inputSchema={})]
+        entry = await catalog.get("team1", "weather", ENDPOINT, "deployment:u:2")
+        assert [t["name"] for t in entry.tools] == ["get_forecast"]
+
+        await catalog.get("team1", "weather", ENDPOINT, "deployment:u:2", refresh=True)
+        assert _list_calls(mcp_server) == 3
+
+    async def test_expired_entry_is_relisted(self, mcp_server, pool):
+        catalog = ToolCatalog(ttl=0)
+        await catalog.get("team1", "weather", ENDPOINT, None)
+        await catalog.get("team1", "weather", ENDPOINT, None)
+
+        assert _list_calls(mcp_server) == 2
+
+    async def test_list_changed_notification_relists(self, mcp_server, pool):
+        catalog = ToolCatalog(ttl=3600)
+        with patch(
+            "app.services.mcp_sessions._tools_changed_listeners", [catalog.on_tools_changed]
+        ):
+            await catalog.get("team1", "weather", ENDPOINT, None)
+            mcp_server.tools = [Tool(name="get_forecast", inputSchema={})]
+
+            notification = types.ServerNotification(
+                types.ToolListChangedNotification(method="notifications/tools/list_changed")
+            )
+            await mcp_server.sessions[0].message_handler(notification)
+            await asyncio.sleep(0.01)
+
+        entry = await catalog.get("team1", "weather", ENDPOINT, None)
+        assert [t["name"] for t in entry.tools] == ["get_forecast"]
+        assert _list_calls(mcp_server) == 2
+
+    async def test_search(self, mcp_server, pool):
+        catalog = ToolCatalog(ttl=3600)
+        await catalog.get("team1", "weather", ENDPOINT, None)
+        mcp_server.tools = [
+            Tool(name="get_weather", description="Weather v2", inputSchema={}),
+            Tool(name="get_weather_alerts", inputSchema={}),
+        ]
+        await catalog.get("team2", "weather", ENDPOINT, None)
+
+        exact = catalog.search("GET_WEATHER", exact=True)
+        assert [(e.namespace, t["name"]) for e, t in exact] == [
+            ("team1", "get_weather"),
+            ("team2", "get_weather"),
+        ]
+        assert len(catalog.search("weather")) == 3
+        assert len(catalog.search("v2")) == 1
+        assert [e.namespace for e, _ in catalog.search("alerts", namespaces=["team1"])] == []
+
+        catalog.remove("team2", "weather")
+        assert len(catalog.search("")) == 1
+
+
+class TestCatalogEndpoints:
+    def test_connect_then_search(self, mcp_server):
+        from app.routers import tools
+
+        app = FastAPI()
+        app.include_router(tools.router, prefix="/api/v1")
+        kube = MagicMock()
+        kube.list_enabled_namespaces.return_value = ["team1"]
+        app.dependency_overrides[get_kubernetes_service] = lambda: kube
+        pool = McpSessionPool(max_sessions=8, idle_timeout=300, connect_timeout=1, enabled=True)
+        catalog = ToolCatalog(ttl=3600)
+
+        with (
+            patch("app.core.auth.settings") as mock_auth,
+            patch.object(tools, "_get_tool_url", return_value="http://weather-mcp:8000"),
+            patch.object(tools, "get_tool_catalog", return_value=catalog),
+            patch.object(tool_catalog, "get_mcp_session_pool", return_value=pool),
+        ):
+            mock_auth.enable_auth = False
+            with TestClient(app) as client:
+                for _ in range(2):
+                    r = client.post("/api/v1/tools/team1/weather/connect")
+                    assert r.status_code == 200
+                    assert r.json()["tools"][0]["name"] == "get_weather"
+
+                r = client.get("/api/v1/tools/catalog", params={"q": "get_weather", "exact": True})
+                client.portal.call(pool.aclose)
+
+        assert _list_calls(mcp_server) == 1
+        assert r.status_code == 200
+        body = r.json()
+        assert body["serversIndexed"] == 1
+        assert [(i["namespace"], i["server"], i["tool"]["name"]) for i in body["items"]] == [
+            ("team1", "weather", "get_weather")
+        ]
@@ -0,0 +1,107 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the streaming MCP tool invocation endpoint.
+
+Tests cover:
+- Forwarding progress notifications before the result
+- One content event per content item, in invoke's item shape
+- The byte cap: cutting text on a UTF-8 boundary, skipping binary data,
+  and reporting truncation in the done event
+- Tool errors after streaming has started
+"""
+
+import json
+from unittest.mock import patch
+
+from mcp.shared.exceptions import McpError
+from mcp.types import CallToolResult, ErrorData, ImageContent, TextContent
+
+from app.routers import tools
+
+
+def _invoke(client, **params):
+    r = client.post(
+        "/api/v1/tools/team1/logs/invoke-stream",
+        params=params,
+        json={"tool_name": "dump", "arguments": {}},
+    )
+    assert r.status_code == 200
+    return [json.loads(line) for line in r.text.splitlines() if line]
+
+
+def _result(*items):
+    async def behaviour(arguments, progress_callback=None, **kwargs):
+        if progress_callback is not None:
+            await progress_callback(1, 2, "halfway")
+            await progress_callback(2, 2, None)
+        return CallToolResult(content=list(items))
+
+    return behaviour
+
+
+class TestInvokeStream:
+    def test_streams_progress_then_content(self, mcp_client, mcp_server):
+        mcp_server.call_behaviour["dump"] = _result(
+            TextContent(type="text", text="line 1"),
+            ImageContent(type="image", data="aGVsbG8=", mimeType="image/png"),
+        )
+
+        events = _invoke(mcp_client)
+
+        assert [e["type"] for e in events] == ["progress", "progress", "content", "content", "done"]
+        assert events[0] == {"type": "progress", "progress": 1, "total": 2, "message": "halfway"}
+        assert events[2]["content"] == {"type": "text", "text": "line 1"}
+        assert events[3]["content"] == {"type": "data", "data": "aGVsbG8="}
+        assert events[-1]["truncated"] is False
+        assert events[-1]["bytes"] == events[-1]["bytesSent"] == 14
+
+    def test_byte_cap_truncates_text_and_skips_data(self, mcp_client, mcp_server):
+        mcp_server.call_behaviour["dump"] = _result(
+            TextContent(type="text", text="abcdé"),  # 6 bytes
+            TextContent(type="text", text="more"),
+            ImageContent(type="image", data="aGVsbG8=", mimeType="image/png"),
+        )
+
+        events = _invoke(mcp_client, maxBytes=8)
+
+        content = [e for e in events if e["type"] == "content"]
+        assert content[0]["content"]["text"] == "abcdé"
+        assert content[0]["truncated"] is False
+        assert content[1]["content"]["text"] == "mo"
+        assert content[1]["truncated"] is True
+        assert len(content) == 2
+        done = events[-1]
+        assert done["truncated"] is True
+        assert done["items"] == 3
+        assert done["itemsSent"] == 2
+        assert done["bytesSent"] == 8
+        assert done["bytes"] == 18
+
+    def test_cut_respects_utf8_boundaries(self, mcp_client, mcp_server):
+        mcp_server.call_behaviour["dump"] = _result(TextContent(type="text", text="abcdé"))
+
+        events = _invoke(mcp_client, maxBytes=5)
+
+        assert events[-2]["content"]["text"] == "abcd"
+        assert events[-1]["bytesSent"] == 4
+
+    def test_cap_is_bounded_by_setting(self, mcp_client, mcp_server):
+        mcp_server.call_behaviour["dump"] = _result(TextContent(type="text", text="x" * 10))
+
+        with patch.object(tools.settings, "mcp_stream_max_bytes", 3):
+            events = _invoke(mcp_client, maxBytes=100)
+
+        assert events[-1]["maxBytes"] == 3
+        assert events[-1]["bytesSent"] == 3
+
+    def test_tool_error_is_reported_in_stream(self, mcp_client, mcp_server):
+        async def fail(arguments, **kwargs):
+            raise McpError(ErrorData(code=-32602, message="Unknown tool"))
+
+        mcp_server.call_behaviour["dump"] = fail
+
+        events = _invoke(mcp_client, format="ndjson")
+
+        assert events == [{"type": "error", "error": "Unknown tool", "status": 502}]
@@ -31,6 +31,16 @@ def kubernetes_service():
         return service
 
 
+@pytest.fixture(autouse=True)
+def _clear_service_port_cache():
+    """Service ports are cached process-wide; start each test cold."""
+    from app.utils.routes import get_service_port_cache
+
+    get_service_port_cache().clear()
+    yield
+    get_service_port_cache().clear()
+
+
 class TestLookupServicePort:
     """Test cases for lookup_service_port()."""
 